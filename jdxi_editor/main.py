@@ -17,8 +17,11 @@ Functions:
     main(): Main entry point to initialize and run the JD-Xi Editor application,
     set up the window, and handle MIDI message listening.
 
+Startup is timed by phase (imports, QApplication, window build, MIDI auto-connect)
+and logged once the event loop is running, see `jdxi_editor.startup`.
 """
 
+from jdxi_editor.startup import STARTUP_TIMER
 
 import os
 import sys
@@ -28,11 +31,10 @@ from logging.handlers import RotatingFileHandler
 from pathlib import Path
 import mido
 from pubsub import pub
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon, QPixmap, QColor
 
-from jdxi_editor.ui.windows.jdxi.instrument import JdxiInstrument
-
 os.environ["QT_LOGGING_RULES"] = "qt.qpa.fonts=false"
 
 
@@ -114,48 +116,56 @@ def main():
         # Set up logging first
         log_file = setup_logging()
 
-        # Create application
-        app = QApplication(sys.argv)
-
-        # Set application metadata
-        app.setApplicationName("JD-Xi Editor")
-        app.setApplicationVersion("0.30")
-        app.setOrganizationName("jdxieditor")
-        app.setOrganizationDomain("com.mabinc")
-
-        logging.debug("Application initialized")
-
-        # Set application icon
-        icon_locations = [
-            Path(__file__).parent / "resources" / "jdxi_icon.png",  # Package location
-            Path(__file__).parent.parent
-            / "resources"
-            / "jdxi_icon.png",  # Development location
-        ]
-
-        icon_found = False
-        for icon_path in icon_locations:
-            if icon_path.exists():
-                app.setWindowIcon(QIcon(str(icon_path)))
-                logging.debug(f"Loaded icon from {icon_path}")
-                icon_found = True
-                break
-
-        if not icon_found:
-            logging.warning(
-                f"Icon not found in any of: {[str(p) for p in icon_locations]}"
-            )
-            # Create address fallback icon
-            icon = QIcon()
-            pixmap = QPixmap(128, 128)
-            pixmap.fill(QColor("#2897B7"))  # Use the app's theme color
-            icon.addPixmap(pixmap)
-            app.setWindowIcon(icon)
-            logging.info("Using fallback icon")
-
-        window = JdxiInstrument()
-        window.show()
+        with STARTUP_TIMER.phase("imports"):
+            # Imported here rather than at the top so the timer covers it
+            from jdxi_editor.ui.windows.jdxi.instrument import JdxiInstrument
+
+        with STARTUP_TIMER.phase("QApplication"):
+            # Create application
+            app = QApplication(sys.argv)
+
+            # Set application metadata
+            app.setApplicationName("JD-Xi Editor")
+            app.setApplicationVersion("0.30")
+            app.setOrganizationName("jdxieditor")
+            app.setOrganizationDomain("com.mabinc")
+
+            logging.debug("Application initialized")
+
+            # Set application icon
+            icon_locations = [
+                Path(__file__).parent / "resources" / "jdxi_icon.png",  # Package location
+                Path(__file__).parent.parent
+                / "resources"
+                / "jdxi_icon.png",  # Development location
+            ]
+
+            icon_found = False
+            for icon_path in icon_locations:
+                if icon_path.exists():
+                    app.setWindowIcon(QIcon(str(icon_path)))
+                    logging.debug(f"Loaded icon from {icon_path}")
+                    icon_found = True
+                    break
+
+            if not icon_found:
+                logging.warning(
+                    f"Icon not found in any of: {[str(p) for p in icon_locations]}"
+                )
+                # Create address fallback icon
+                icon = QIcon()
+                pixmap = QPixmap(128, 128)
+                pixmap.fill(QColor("#2897B7"))  # Use the app's theme color
+                icon.addPixmap(pixmap)
+                app.setWindowIcon(icon)
+                logging.info("Using fallback icon")
+
+        with STARTUP_TIMER.phase("window build"):
+            window = JdxiInstrument()
+            window.show()
         window.set_log_file(log_file)
+        # Runs once the event loop has started
+        QTimer.singleShot(0, STARTUP_TIMER.finish)
         # Start event loop
         return app.exec()
 
@@ -22,6 +22,7 @@ Constants:
 - `DT1_COMMAND`, `RQ1_COMMAND` – SysEx commands for data transfer and requests
 - `TEMPORARY_AREAS` – List of memory areas for temporary data storage
 - `TEMPORARY_TONES` – Addresses for digital, analog, and drum synthesis parts
+- `TEMPORARY_AREA_MAPPING` – Names of the temporary areas by their first two address bytes
 - `PROGRAM_GROUP`, `COMMON_GROUP`, `PARTIAL_GROUP`, `EFFECTS_GROUP` – MIDI parameter groups
 - `BANK_MSB` – Bank Select MSB for JD-Xi
 
@@ -107,6 +108,15 @@ TEMPORARY_AREAS = [
     TEMPORARY_SYSTEM_AREA,
 ]
 
+# Temporary areas by the first two bytes of a parameter address
+TEMPORARY_AREA_MAPPING = {
+    (0x18, 0x00): "TEMPORARY_PROGRAM_AREA",
+    (0x19, 0x42): "TEMPORARY_ANALOG_SYNTH_AREA",
+    (0x19, 0x01): "TEMPORARY_DIGITAL_SYNTH_1_AREA",
+    (0x19, 0x21): "TEMPORARY_DIGITAL_SYNTH_2_AREA",
+    (0x19, 0x70): "TEMPORARY_DRUM_KIT_AREA",
+}
+
 
 # Part Numbers AKA "Temporary Tone"
 DIGITAL_PART_1 = 0x01  # Digital synth 1 address
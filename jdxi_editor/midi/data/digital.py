@@ -1,21 +1,22 @@
+from concurrent.futures import Future
 from dataclasses import dataclass
 from enum import IntEnum
 from typing import Dict, List, Tuple, Optional
 import logging
+import threading
 
 from jdxi_editor.midi.data.parameter.digital import DigitalParameter
 from jdxi_editor.midi.data.parameter.digital_common import DigitalCommonParameter
+from jdxi_editor.midi.data.parameter.registry import PARAMETER_REGISTRY
 from jdxi_editor.midi.data.constants.digital import DIGITAL_SYNTH_1_AREA, PART_1, OSC_1_GROUP
 
 
 def get_digital_parameter_by_address(address: Tuple[int, int]):
-    """Retrieve the DigitalParameter by its address."""
-    logging.info(f"address: {address}")
-    for param in DigitalParameter:
-        if (param.group, param.address) == address:
-            logging.info(f"param found: {param}")
-            return param
-    return None
+    """Retrieve the digital synth parameter at a (group, offset) address."""
+    if len(address) < 2:
+        return None
+    group, offset = address[0], address[1]
+    return PARAMETER_REGISTRY.get("TEMPORARY_DIGITAL_SYNTH_1_AREA", group, offset)
 
 
 DIGITAL_PARTIAL_NAMES = [
@@ -511,39 +512,56 @@ def set_partial_state(
         return False
 
 
-def get_partial_state(midi_helper, partial: DigitalPartial) -> Tuple[bool, bool]:
+def get_partial_state(midi_helper, partial: DigitalPartial) -> Future:
     """Get the current state of address partial
 
+    The switch and select parameters are requested together and resolved
+    from the JD-Xi's replies, without blocking.
+
     Args:
         midi_helper: MIDI helper instance
         partial: The partial to query
 
     Returns:
-        Tuple of (enabled, selected)
+        Future resolving to a tuple of (enabled, selected)
     """
+    state = Future()
     try:
-        # Get switch state
-        switch_value = midi_helper.get_parameter(
+        # Request switch and select state, both in flight at once
+        switch_future = midi_helper.get_parameter(
             area=DIGITAL_SYNTH_1_AREA,
             part=PART_1,
             group=0x00,
             param=partial.switch_param.address,
         )
-
-        # Get select state
-        select_value = midi_helper.get_parameter(
+        select_future = midi_helper.get_parameter(
             area=DIGITAL_SYNTH_1_AREA,
             part=PART_1,
             group=0x00,
             param=partial.select_param.address,
         )
-
-        # Handle None returns (communication error)
-        if switch_value is None or select_value is None:
-            return (False, False)
-
-        return (switch_value == 1, select_value == 1)
-
     except Exception as e:
         logging.error(f"Error getting partial {partial.name} state: {str(e)}")
-        return (False, False)
+        state.set_result((False, False))
+        return state
+
+    resolve_lock = threading.Lock()
+    resolved = []
+
+    def _resolve(_) -> None:
+        # Both futures may complete at once, on different threads
+        with resolve_lock:
+            if resolved or not (switch_future.done() and select_future.done()):
+                return
+            resolved.append(True)
+        switch_value = switch_future.result()
+        select_value = select_future.result()
+        # Handle None results (communication error)
+        if switch_value is None or select_value is None:
+            state.set_result((False, False))
+        else:
+            state.set_result((switch_value == 1, select_value == 1))
+
+    switch_future.add_done_callback(_resolve)
+    select_future.add_done_callback(_resolve)
+    return state
@@ -128,25 +128,6 @@ class AnalogParameter(SynthParameter):
         super().__init__(address, min_val, max_val)
         self.display_min = display_min if display_min is not None else min_val
         self.display_max = display_max if display_max is not None else max_val
-        self.switches = [
-            "FILTER_SWITCH",
-            "PORTAMENTO_SWITCH",
-            "LEGATO_SWITCH",
-            "LFO_TEMPO_SYNC_SWITCH",
-        ]
-        self.bipolar_parameters = [
-            "FILTER_ENV_VELOCITY_SENS",
-            "AMP_LEVEL_KEYFOLLOW",
-            "OSC_PITCH_ENV_VELOCITY_SENS",
-            "OSC_PITCH_COARSE",
-            "OSC_PITCH_FINE",
-            "LFO_PITCH_MODULATION_CONTROL",
-            "LFO_AMP_MODULATION_CONTROL",
-            "LFO_FILTER_MODULATION_CONTROL",
-            "OSC_PITCH_ENV_DEPTH",
-            "LFO_RATE_MODULATION_CONTROL",
-            "FILTER_ENV_DEPTH",
-        ]
 
     def validate_value(self, value: int) -> int:
         """Validate and convert parameter value to MIDI range (0-127)"""
@@ -166,14 +147,6 @@ class AnalogParameter(SynthParameter):
         # Return the parameter member by name, or None if not found
         return AnalogParameter.__members__.get(param_name, None)
 
-    @staticmethod
-    def get_name_by_address(address: int):
-        """Return the parameter name for address given address."""
-        for param in AnalogParameter:
-            if param.address == address:
-                return param.name
-        return None  # Return None if the address is not found
-
     @property
     def display_name(self) -> str:
         """Get display name for the parameter"""
@@ -309,3 +282,23 @@ class AnalogParameter(SynthParameter):
             return param.convert_to_midi(value)
         return None
 
+
+AnalogParameter.SWITCHES = frozenset({
+    "FILTER_SWITCH",
+    "PORTAMENTO_SWITCH",
+    "LEGATO_SWITCH",
+    "LFO_TEMPO_SYNC_SWITCH",
+})
+AnalogParameter.BIPOLAR_PARAMETERS = frozenset({
+    "FILTER_ENV_VELOCITY_SENS",
+    "AMP_LEVEL_KEYFOLLOW",
+    "OSC_PITCH_ENV_VELOCITY_SENS",
+    "OSC_PITCH_COARSE",
+    "OSC_PITCH_FINE",
+    "LFO_PITCH_MODULATION_CONTROL",
+    "LFO_AMP_MODULATION_CONTROL",
+    "LFO_FILTER_MODULATION_CONTROL",
+    "OSC_PITCH_ENV_DEPTH",
+    "LFO_RATE_MODULATION_CONTROL",
+    "FILTER_ENV_DEPTH",
+})
@@ -0,0 +1,251 @@
+"""
+Parameter Conversion Tables
+===========================
+
+This module precomputes the conversions between the MIDI values and the display
+values of the parameter enums. The `convert_from_midi` and `convert_from_display`
+methods of a parameter are evaluated once for every value in range and kept in a
+tuple, so converting a value is an index instead of a chain of enum comparisons.
+Tables are built on first use of a parameter, the methods stay the reference.
+
+Tables cover every single byte MIDI value, 0-127, and the display range of the
+parameter. Values outside a table, values the method raised for, and display
+ranges too large to tabulate are converted by calling the method, as before.
+
+`BatchConverter` stacks the tables of the parameters of a decoded tone into a
+numpy array and converts all of its values with one indexing operation.
+
+Classes:
+    - ConversionTable: Precomputed conversions of one parameter.
+    - BatchConverter: Vectorized conversion of many parameters at once.
+    - LayoutConverter: BatchConverter of the parameters of a ParameterLayout.
+
+Functions:
+    - conversion_table(param) -> ConversionTable
+    - convert_from_midi(param, value) -> int
+    - convert_from_display(param, display_value) -> int
+    - batch_converter(layout, parameter_type) -> LayoutConverter
+    - convert_record(record, parameter_type) -> Dict[str, int]
+
+Usage Example:
+    >>> convert_from_midi(DigitalParameter.OSC_PITCH, 40)
+    -24
+    >>> display_values = convert_record(parse_sysex(sysex_data), DigitalParameter)
+    >>> display_values["OSC_PITCH"]
+    0
+"""
+
+from functools import lru_cache
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Type
+
+import numpy as np
+
+from jdxi_editor.midi.data.parameter.synth import SynthParameter
+from jdxi_editor.midi.sysex.layout import ParameterLayout, SysExRecord
+
+MIDI_TABLE_SIZE = 128
+MAX_DISPLAY_TABLE_SIZE = 1024
+
+
+def _tabulate(function: Callable[[int], object], values: range) -> Tuple[object, ...]:
+    """Results of a function for each value, None where it raised."""
+    table = []
+    for value in values:
+        try:
+            table.append(function(value))
+        except Exception:
+            table.append(None)
+    return tuple(table)
+
+
+class ConversionTable:
+    """Precomputed MIDI and display conversions of a parameter."""
+
+    __slots__ = ("parameter", "from_midi", "to_midi", "display_min")
+
+    def __init__(self, parameter: SynthParameter):
+        """
+        Evaluate the conversions of a parameter over its ranges.
+
+        :param parameter: SynthParameter to tabulate.
+        """
+        self.parameter = parameter
+        self.from_midi = _tabulate(parameter.convert_from_midi, range(MIDI_TABLE_SIZE))
+        self.to_midi: Optional[Tuple[object, ...]] = None
+        self.display_min = 0
+        if hasattr(parameter, "convert_from_display"):
+            if hasattr(parameter, "get_display_value"):
+                display_min, display_max = parameter.get_display_value()
+            else:
+                display_min, display_max = parameter.min_val, parameter.max_val
+            if display_max - display_min < MAX_DISPLAY_TABLE_SIZE:
+                self.display_min = display_min
+                self.to_midi = _tabulate(
+                    parameter.convert_from_display, range(display_min, display_max + 1)
+                )
+
+    def convert_from_midi(self, value: int) -> int:
+        """Convert a MIDI value to the display value."""
+        if value.__class__ is int and 0 <= value < MIDI_TABLE_SIZE:
+            result = self.from_midi[value]
+            if result is not None:
+                return result
+        return self.parameter.convert_from_midi(value)
+
+    def convert_from_display(self, display_value: int) -> int:
+        """Convert a display value to the MIDI value."""
+        if self.to_midi is not None and display_value.__class__ is int:
+            index = display_value - self.display_min
+            if 0 <= index < len(self.to_midi):
+                result = self.to_midi[index]
+                if result is not None:
+                    return result
+        return self.parameter.convert_from_display(display_value)
+
+
+# Tables by parameter class and name, hashing a str rather than an Enum member
+_tables: Dict[Tuple[type, str], ConversionTable] = {}
+
+
+def conversion_table(param: SynthParameter) -> ConversionTable:
+    """
+    Return the conversion table of a parameter, building it on first use.
+
+    :param param: SynthParameter.
+    :return: ConversionTable
+    """
+    key = (param.__class__, param._name_)
+    table = _tables.get(key)
+    if table is None:
+        table = _tables[key] = ConversionTable(param)
+    return table
+
+
+def convert_from_midi(param: SynthParameter, value: int) -> int:
+    """
+    Convert a MIDI value to the display value of a parameter.
+
+    :param param: SynthParameter.
+    :param value: int MIDI value.
+    :return: int display value, as param.convert_from_midi(value)
+    """
+    return conversion_table(param).convert_from_midi(value)
+
+
+def convert_from_display(param: SynthParameter, display_value: int) -> int:
+    """
+    Convert a display value to the MIDI value of a parameter.
+
+    :param param: SynthParameter with a convert_from_display method.
+    :param display_value: int display value.
+    :return: int MIDI value, as param.convert_from_display(display_value)
+    """
+    return conversion_table(param).convert_from_display(display_value)
+
+
+class BatchConverter:
+    """Vectorized MIDI to display conversion of a fixed list of parameters."""
+
+    def __init__(self, parameters: Sequence[SynthParameter]):
+        """
+        Stack the tables of the parameters.
+
+        :param parameters: SynthParameters, in the order values will be given.
+        """
+        self.parameters: Tuple[SynthParameter, ...] = tuple(parameters)
+        self.names: Tuple[str, ...] = tuple(param.name for param in self.parameters)
+        count = len(self.parameters)
+        self._rows = np.arange(count)
+        # Table entries, and whether each is a usable int rather than a failure
+        self._table = np.zeros((count, MIDI_TABLE_SIZE), dtype=np.int64)
+        self._exact = np.zeros((count, MIDI_TABLE_SIZE), dtype=bool)
+        for row, param in enumerate(self.parameters):
+            for value, result in enumerate(conversion_table(param).from_midi):
+                if isinstance(result, int):
+                    self._table[row, value] = result
+                    self._exact[row, value] = True
+
+    def from_midi(self, values: Sequence[int]) -> List[Optional[int]]:
+        """
+        Convert MIDI values to display values.
+
+        :param values: int MIDI values, one per parameter.
+        :return: List of display values, None where the conversion raised
+        """
+        # Viewed as unsigned, negative values are past the table too
+        raw = np.asarray(values, dtype=np.int64).view(np.uint64)
+        clipped = np.minimum(raw, MIDI_TABLE_SIZE - 1)
+        results = self._table[self._rows, clipped].tolist()
+        exact = self._exact[self._rows, clipped] & (raw == clipped)
+        if exact.all():
+            return results
+        for row in np.flatnonzero(~exact).tolist():
+            results[row] = None
+            if raw[row] != clipped[row]:
+                # Past the table, e.g. a four-nibble value, converted by the method
+                try:
+                    results[row] = self.parameters[row].convert_from_midi(int(values[row]))
+                except Exception:
+                    pass
+        return results
+
+
+class LayoutConverter:
+    """BatchConverter of the parameters of a layout, with their positions in it."""
+
+    __slots__ = ("converter", "indices")
+
+    def __init__(self, layout: ParameterLayout, parameter_type: Type[SynthParameter]):
+        members = parameter_type.__members__
+        names = [name for name in layout.names if name in members]
+        self.converter = BatchConverter([members[name] for name in names])
+        self.indices = np.array([layout.index[name] for name in names], dtype=np.intp)
+
+    def convert(self, values: Sequence[int]) -> List[Optional[int]]:
+        """Display values of the parameters, from the values of a whole record."""
+        return self.converter.from_midi(np.asarray(values, dtype=np.int64)[self.indices])
+
+
+@lru_cache(maxsize=None)
+def batch_converter(layout: ParameterLayout, parameter_type: Type[SynthParameter]) -> LayoutConverter:
+    """
+    Return the converter of the parameters of a layout, once per layout and class.
+
+    :param layout: ParameterLayout of the decoded tone.
+    :param parameter_type: SynthParameter subclass whose parameters are converted.
+    :return: LayoutConverter
+    """
+    return LayoutConverter(layout, parameter_type)
+
+
+def convert_record(
+    record: Mapping[str, object], parameter_type: Type[SynthParameter]
+) -> Dict[str, int]:
+    """
+    Convert every parameter of a decoded tone to its display value, in one call.
+
+    :param record: SysExRecord from parse_sysex, or a dict of names to MIDI values.
+    :param parameter_type: SynthParameter subclass whose parameters are converted.
+    :return: Dict of display values by name; parameters whose conversion raised
+        are left out, so callers can convert them individually to see the error.
+    """
+    if isinstance(record, SysExRecord) and record.layout is not None:
+        layout_converter = batch_converter(record.layout, parameter_type)
+        results = layout_converter.convert(record.values)
+        display_values = dict(zip(layout_converter.converter.names, results))
+        if None in results:
+            display_values = {name: value for name, value in display_values.items() if value is not None}
+        return display_values
+    members = parameter_type.__members__
+    display_values = {}
+    for name, value in record.items():
+        param = members.get(name)
+        if param is None:
+            continue
+        try:
+            display_value = convert_from_midi(param, value)
+        except Exception:
+            continue
+        if display_value is not None:
+            display_values[name] = display_value
+    return display_values
@@ -80,31 +80,6 @@ class DigitalParameter(SynthParameter):
         super().__init__(address, min_val, max_val)
         self.display_min = display_min if display_min is not None else min_val
         self.display_max = display_max if display_max is not None else max_val
-        self.bipolar_parameters = [
-            # Oscillator parameters
-            "OSC_PITCH",
-            "OSC_DETUNE",
-            "OSC_PITCH_ENV_DEPTH",
-            # Filter parameters
-            "FILTER_CUTOFF_KEYFOLLOW",
-            "FILTER_ENV_VELOCITY_SENSITIVITY",
-            "FILTER_ENV_DEPTH",
-            # Amplifier parameters
-            "AMP_VELOCITY",
-            "AMP_PAN",
-            "AMP_LEVEL_KEYFOLLOW",
-            # LFO parameters
-            "LFO_PITCH_DEPTH",
-            "LFO_FILTER_DEPTH",
-            "LFO_AMP_DEPTH",
-            "LFO_PAN_DEPTH",
-            # Mod LFO parameters
-            "MOD_LFO_PITCH_DEPTH",
-            "MOD_LFO_FILTER_DEPTH",
-            "MOD_LFO_AMP_DEPTH",
-            "MOD_LFO_PAN",
-            "MOD_LFO_RATE_CTRL",
-        ]
 
     def get_display_value(self) -> Tuple[int, int]:
         """Get the display range for the parameter"""
@@ -516,3 +491,30 @@ class DigitalParameter(SynthParameter):
         elif self == self.LEVEL_AFTERTOUCH:
             return slider_value + 64  # 0 to 127 -> -63 to +63
         return slider_value
+
+
+DigitalParameter.BIPOLAR_PARAMETERS = frozenset({
+    # Oscillator parameters
+    "OSC_PITCH",
+    "OSC_DETUNE",
+    "OSC_PITCH_ENV_DEPTH",
+    # Filter parameters
+    "FILTER_CUTOFF_KEYFOLLOW",
+    "FILTER_ENV_VELOCITY_SENSITIVITY",
+    "FILTER_ENV_DEPTH",
+    # Amplifier parameters
+    "AMP_VELOCITY",
+    "AMP_PAN",
+    "AMP_LEVEL_KEYFOLLOW",
+    # LFO parameters
+    "LFO_PITCH_DEPTH",
+    "LFO_FILTER_DEPTH",
+    "LFO_AMP_DEPTH",
+    "LFO_PAN_DEPTH",
+    # Mod LFO parameters
+    "MOD_LFO_PITCH_DEPTH",
+    "MOD_LFO_FILTER_DEPTH",
+    "MOD_LFO_AMP_DEPTH",
+    "MOD_LFO_PAN",
+    "MOD_LFO_RATE_CTRL",
+})
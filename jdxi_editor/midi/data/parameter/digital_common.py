@@ -101,24 +101,6 @@ class DigitalCommonParameter(SynthParameter):
             self.UNISON_SIZE: "Uni Size",
         }.get(self, self.name.replace("_", " ").title())
 
-    @property
-    def is_switch(self) -> bool:
-        """Returns True if parameter is address binary/enum switch"""
-        return self in [
-            self.PORTAMENTO_SWITCH,
-            self.MONO_SWITCH,
-            self.PARTIAL1_SWITCH,
-            self.PARTIAL1_SELECT,
-            self.PARTIAL2_SWITCH,
-            self.PARTIAL2_SELECT,
-            self.PARTIAL3_SWITCH,
-            self.PARTIAL3_SELECT,
-            self.RING_SWITCH,
-            self.UNISON_SWITCH,
-            self.PORTAMENTO_MODE,
-            self.LEGATO_SWITCH,
-        ]
-
     def get_switch_text(self, value: int) -> str:
         """Get display text for switch values"""
         if self == self.RING_SWITCH:
@@ -170,3 +152,19 @@ class DigitalCommonParameter(SynthParameter):
 
     def get_address_for_partial(self, partial_num: int = 0):
         return PROGRAM_GROUP, 0
+
+
+DigitalCommonParameter.SWITCHES = frozenset({
+    "PORTAMENTO_SWITCH",
+    "MONO_SWITCH",
+    "PARTIAL1_SWITCH",
+    "PARTIAL1_SELECT",
+    "PARTIAL2_SWITCH",
+    "PARTIAL2_SELECT",
+    "PARTIAL3_SWITCH",
+    "PARTIAL3_SELECT",
+    "RING_SWITCH",
+    "UNISON_SWITCH",
+    "PORTAMENTO_MODE",
+    "LEGATO_SWITCH",
+})
@@ -103,31 +103,6 @@ class DrumParameter(SynthParameter):
         super().__init__(address, min_val, max_val)
         self.display_min = display_min if display_min is not None else min_val
         self.display_max = display_max if display_max is not None else max_val
-        self.bipolar_parameters = [
-            "PARTIAL_FINE_TUNE",
-            "PARTIAL_FINE_TUNE",
-            "PARTIAL_PAN",
-            "PARTIAL_ALTERNATE_PAN_DEPTH",
-            "TVA_ENV_TIME_1_VELOCITY_SENS",
-            "TVA_ENV_TIME_4_VELOCITY_SENS",
-            "TVF_CUTOFF_VELOCITY_SENS",
-            "TVF_ENV_DEPTH",
-            "TVF_ENV_VELOCITY_SENS",
-            "TVF_ENV_TIME_1_VELOCITY_SENS",
-            "TVF_ENV_TIME_4_VELOCITY_SENS",
-            "WMT1_WAVE_COARSE_TUNE",
-            "WMT1_WAVE_FINE_TUNE",
-            "WMT1_WAVE_PAN",
-            "WMT2_WAVE_COARSE_TUNE",
-            "WMT2_WAVE_FINE_TUNE",
-            "WMT2_WAVE_PAN",
-            "WMT3_WAVE_COARSE_TUNE",
-            "WMT3_WAVE_FINE_TUNE",
-            "WMT3_WAVE_PAN",
-            "WMT4_WAVE_COARSE_TUNE",
-            "WMT4_WAVE_FINE_TUNE",
-            "WMT4_WAVE_PAN",
-        ]
 
     # Partial Name parameters
     PARTIAL_NAME_1 = (0x00, 32, 127)
@@ -762,24 +737,6 @@ class DrumCommonParameter(SynthParameter):
         group = group_map.get(partial_num, 0x00)  # Default to 0x20 if partial_name is not 1, 2, or 3
         return group
 
-    @property
-    def is_switch(self) -> bool:
-        """Returns True if parameter is address binary/enum switch"""
-        return self in [
-            self.PORTAMENTO_SWITCH,
-            self.MONO_SWITCH,
-            self.PARTIAL1_SWITCH,
-            self.PARTIAL1_SELECT,
-            self.PARTIAL2_SWITCH,
-            self.PARTIAL2_SELECT,
-            self.PARTIAL3_SWITCH,
-            self.PARTIAL3_SELECT,
-            self.RING_SWITCH,
-            self.UNISON_SWITCH,
-            self.PORTAMENTO_MODE,
-            self.LEGATO_SWITCH,
-        ]
-
     def get_switch_text(self, value: int) -> str:
         """Get display text for switch values"""
         if self == self.RING_SWITCH:
@@ -819,3 +776,27 @@ class DrumCommonParameter(SynthParameter):
         return partial_params.get(self)
 
 
+DrumParameter.BIPOLAR_PARAMETERS = frozenset({
+    "PARTIAL_FINE_TUNE",
+    "PARTIAL_PAN",
+    "PARTIAL_ALTERNATE_PAN_DEPTH",
+    "TVA_ENV_TIME_1_VELOCITY_SENS",
+    "TVA_ENV_TIME_4_VELOCITY_SENS",
+    "TVF_CUTOFF_VELOCITY_SENS",
+    "TVF_ENV_DEPTH",
+    "TVF_ENV_VELOCITY_SENS",
+    "TVF_ENV_TIME_1_VELOCITY_SENS",
+    "TVF_ENV_TIME_4_VELOCITY_SENS",
+    "WMT1_WAVE_COARSE_TUNE",
+    "WMT1_WAVE_FINE_TUNE",
+    "WMT1_WAVE_PAN",
+    "WMT2_WAVE_COARSE_TUNE",
+    "WMT2_WAVE_FINE_TUNE",
+    "WMT2_WAVE_PAN",
+    "WMT3_WAVE_COARSE_TUNE",
+    "WMT3_WAVE_FINE_TUNE",
+    "WMT3_WAVE_PAN",
+    "WMT4_WAVE_COARSE_TUNE",
+    "WMT4_WAVE_FINE_TUNE",
+    "WMT4_WAVE_PAN",
+})
@@ -133,10 +133,10 @@ class EffectParameter(SynthParameter):
     @classmethod
     def get_by_address(cls, address):
         """Look up an effect parameter by its address"""
-        for param in cls:
-            if isinstance(param.value, tuple) and param.value[0] == address:
-                return param
-        return None  # Return None if no match is found
+        # Imported here, the registry imports every parameter module
+        from jdxi_editor.midi.data.parameter.registry import PARAMETER_REGISTRY
+
+        return PARAMETER_REGISTRY.get_by_address(cls, address)
 
     @classmethod
     def get_by_name(cls, name):
@@ -83,11 +83,6 @@ class ProgramCommonParameter(SynthParameter):
         group = group_map.get(partial_num, 0x00)  # Default to 0x20 if partial_name is not 1, 2, or 3
         return group, self.address
 
-    @property
-    def is_switch(self) -> bool:
-        """Returns True if parameter is address binary/enum switch"""
-        return self in []
-
     def get_switch_text(self, value: int) -> str:
         """Get display text for switch values"""
         if self == self.AUTO_NOTE_SWITCH:
@@ -66,11 +66,6 @@ class ProgramZoneParameter(SynthParameter):
         group = group_map.get(partial_num, 0x30)  # Default to 0x30 if partial_name is not 1, 2, or 3
         return group, self.address
 
-    @property
-    def is_switch(self) -> bool:
-        """Returns True if parameter is address binary/enum switch"""
-        return self in [self.ARPEGGIO_SWITCH]
-
     def get_switch_text(self, value: int) -> str:
         """Get display text for switch values"""
         if self == self.ARPEGGIO_SWITCH:
@@ -106,3 +101,8 @@ class ProgramZoneParameter(SynthParameter):
         """Get the Parameter by name."""
         # Return the parameter member by name, or None if not found
         return ProgramZoneParameter.__members__.get(param_name, None)
+
+
+ProgramZoneParameter.SWITCHES = frozenset({
+    "ARPEGGIO_SWITCH",
+})
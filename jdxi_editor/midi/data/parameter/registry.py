@@ -0,0 +1,187 @@
+"""
+Parameter Registry
+==================
+
+This module provides the `ParameterRegistry` class, which indexes every
+`SynthParameter` enum once, at import time, so that the parser, the editors and
+the MIDI debugger resolve a parameter with a dict lookup instead of scanning an
+enum member by member.
+
+Parameters are indexed:
+    - by temporary area, group and offset, i.e. the last three parts of a
+      parameter address, e.g. ("TEMPORARY_ANALOG_SYNTH_AREA", 0x00, 0x0E);
+    - by parameter class and address, for `SynthParameter.get_name_by_address`;
+    - by name, across every parameter class.
+
+Offsets are 7-bit: a parameter at 0x102 in a drum partial at group 0x2E is sent
+at group 0x2F, offset 0x02, and can be looked up either way.
+
+Switch and bipolar parameters are not indexed here, they are listed in the
+`SWITCHES` and `BIPOLAR_PARAMETERS` frozensets of each parameter class.
+
+Classes:
+    - ParameterRegistry: Reverse indexes of the parameter enums.
+
+Usage Example:
+    >>> PARAMETER_REGISTRY.get("TEMPORARY_ANALOG_SYNTH_AREA", 0x00, 0x0E)
+    <AnalogParameter.LFO_RATE: (14, 0, 127)>
+    >>> PARAMETER_REGISTRY.from_address([0x19, 0x70, 0x2F, 0x02])
+    <DrumParameter.WMT4_WAVE_NUMBER_R: (258, 0, 16384, 0, 16384)>
+"""
+
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Tuple, Type
+
+from jdxi_editor.midi.data.constants.sysex import TEMPORARY_AREA_MAPPING, TONE_MODIFY
+from jdxi_editor.midi.data.parameter.analog import AnalogParameter
+from jdxi_editor.midi.data.parameter.arpeggio import ArpeggioParameter
+from jdxi_editor.midi.data.parameter.digital import DigitalParameter
+from jdxi_editor.midi.data.parameter.digital_common import DigitalCommonParameter
+from jdxi_editor.midi.data.parameter.digital_modify import DigitalModifyParameter
+from jdxi_editor.midi.data.parameter.drums import DrumCommonParameter, DrumParameter
+from jdxi_editor.midi.data.parameter.effects import EffectParameter
+from jdxi_editor.midi.data.parameter.program_common import ProgramCommonParameter
+from jdxi_editor.midi.data.parameter.program_zone import ProgramZoneParameter
+from jdxi_editor.midi.data.parameter.synth import SynthParameter
+from jdxi_editor.midi.data.parameter.vocal_fx import VocalFXParameter
+
+DIGITAL_SYNTH_GROUPS = {
+    0x00: DigitalCommonParameter,
+    0x20: DigitalParameter,
+    0x21: DigitalParameter,
+    0x22: DigitalParameter,
+    TONE_MODIFY: DigitalModifyParameter,
+}
+
+# Parameter class of each group, by temporary area
+AREA_GROUPS: Dict[str, Dict[int, Type[SynthParameter]]] = {
+    "TEMPORARY_PROGRAM_AREA": {0x00: ProgramCommonParameter},
+    "TEMPORARY_DIGITAL_SYNTH_1_AREA": DIGITAL_SYNTH_GROUPS,
+    "TEMPORARY_DIGITAL_SYNTH_2_AREA": DIGITAL_SYNTH_GROUPS,
+    "TEMPORARY_ANALOG_SYNTH_AREA": {0x00: AnalogParameter},
+    "TEMPORARY_DRUM_KIT_AREA": {
+        0x00: DrumCommonParameter,
+        # One partial every two groups, BD1 at 0x2E to C#5 at 0x78
+        **{group: DrumParameter for group in range(0x2E, 0x79, 2)},
+    },
+}
+
+PARAMETER_TYPES: Tuple[Type[SynthParameter], ...] = (
+    ProgramCommonParameter,
+    ProgramZoneParameter,
+    DigitalCommonParameter,
+    DigitalParameter,
+    DigitalModifyParameter,
+    AnalogParameter,
+    DrumCommonParameter,
+    DrumParameter,
+    EffectParameter,
+    ArpeggioParameter,
+    VocalFXParameter,
+)
+
+
+def _wire_key(group: int, offset: int) -> Tuple[int, int]:
+    """Group and offset bytes a parameter is sent at, e.g. (0x2E, 0x102) -> (0x2F, 0x02)."""
+    return group + (offset >> 8), offset & 0x7F
+
+
+class ParameterRegistry:
+    """Reverse indexes of the parameter enums, by address and by name."""
+
+    def __init__(
+        self,
+        area_groups: Mapping[str, Mapping[int, Type[SynthParameter]]],
+        parameter_types: Iterable[Type[SynthParameter]] = (),
+    ):
+        """
+        Build the indexes.
+
+        A name or address shared by several parameters resolves to the first one
+        defined, as a scan of the enum would.
+
+        :param area_groups: Parameter class of each group, by temporary area name.
+        :param parameter_types: Parameter classes to index by address and name.
+        """
+        self.addresses: Dict[Tuple[str, int, int], SynthParameter] = {}
+        self.type_addresses: Dict[Type[SynthParameter], Dict[int, SynthParameter]] = {}
+        self.names: Dict[str, Tuple[SynthParameter, ...]] = {}
+        for parameter_type in parameter_types:
+            self._index_type(parameter_type)
+        for area, groups in area_groups.items():
+            for group, parameter_type in groups.items():
+                for param in self._index_type(parameter_type).values():
+                    self.addresses.setdefault((area, *_wire_key(group, param.address)), param)
+
+    def _index_type(self, parameter_type: Type[SynthParameter]) -> Dict[int, SynthParameter]:
+        """Index a parameter class by address and name, once."""
+        addresses = self.type_addresses.get(parameter_type)
+        if addresses is not None:
+            return addresses
+        addresses = {}
+        for param in parameter_type:
+            addresses.setdefault(param.address, param)
+        self.type_addresses[parameter_type] = addresses
+        for name, param in parameter_type.__members__.items():
+            self.names[name] = self.names.get(name, ()) + (param,)
+        return addresses
+
+    def get(self, temporary_area: str, group: int, offset: int) -> Optional[SynthParameter]:
+        """
+        Return the parameter at an address.
+
+        :param temporary_area: TEMPORARY_AREA name, e.g. "TEMPORARY_DRUM_KIT_AREA".
+        :param group: int group byte, e.g. 0x2E for BD1.
+        :param offset: int parameter address, as in the enum or as sent.
+        :return: SynthParameter, or None if nothing is defined there
+        """
+        if offset > 0x7F:
+            group, offset = _wire_key(group, offset)
+        return self.addresses.get((temporary_area, group, offset))
+
+    def from_address(self, address: Sequence[int]) -> Optional[SynthParameter]:
+        """
+        Return the parameter at a four byte SysEx address.
+
+        :param address: Address bytes, e.g. [0x19, 0x42, 0x00, 0x0C].
+        :return: SynthParameter, or None if the address is unknown or too short
+        """
+        if len(address) < 4:
+            return None
+        temporary_area = TEMPORARY_AREA_MAPPING.get((address[0], address[1]))
+        if temporary_area is None:
+            return None
+        return self.addresses.get((temporary_area, address[2], address[3]))
+
+    def get_by_address(
+        self, parameter_type: Type[SynthParameter], address: int
+    ) -> Optional[SynthParameter]:
+        """
+        Return the parameter of a class at an address.
+
+        :param parameter_type: SynthParameter subclass, indexed on first use if needed.
+        :param address: int parameter address.
+        :return: SynthParameter, or None if the class has no parameter there
+        """
+        addresses = self.type_addresses.get(parameter_type)
+        if addresses is None:
+            addresses = self._index_type(parameter_type)
+        return addresses.get(address)
+
+    def get_by_name(
+        self, name: str, parameter_type: Optional[Type[SynthParameter]] = None
+    ) -> Optional[SynthParameter]:
+        """
+        Return a parameter by name.
+
+        :param name: str parameter name, e.g. "LFO_RATE".
+        :param parameter_type: Optional class to look in, the first class defining
+            the name otherwise.
+        :return: SynthParameter, or None if the name is unknown
+        """
+        for param in self.names.get(name, ()):
+            if parameter_type is None or isinstance(param, parameter_type):
+                return param
+        return None
+
+
+PARAMETER_REGISTRY = ParameterRegistry(AREA_GROUPS, PARAMETER_TYPES)
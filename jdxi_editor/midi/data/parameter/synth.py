@@ -20,6 +20,10 @@ Methods:
                                        corresponding to address given address.
     get_by_name(param_name: str): Static method that returns the `SynthParameter` member
                                   corresponding to address given name.
+
+Switch and bipolar parameters are listed by name in the `SWITCHES` and
+`BIPOLAR_PARAMETERS` frozensets of each parameter class. They are set after the
+class body, as any attribute assigned inside an Enum body becomes a member.
 """
 
 from enum import Enum
@@ -34,18 +38,16 @@ class SynthParameter(Enum):
         self.address = address
         self.min_val = min_val
         self.max_val = max_val
-        self.switches = []  # override in subclasses
-        self.bipolar_parameters = []
 
     @property
     def is_switch(self) -> bool:
         """Returns True if parameter is address binary/enum switch"""
-        return self.get_by_name(self.name) in self.switches
-    
+        return self._name_ in self.SWITCHES
+
     @property
     def is_bipolar(self) -> bool:
         """Returns True if parameter is bipolar"""
-        return self.get_by_name(self.name) in self.bipolar_parameters
+        return self._name_ in self.BIPOLAR_PARAMETERS
 
     @property
     def display_name(self) -> str:
@@ -65,13 +67,14 @@ class SynthParameter(Enum):
 
         return value
 
-    @staticmethod
-    def get_name_by_address(address: int):
+    @classmethod
+    def get_name_by_address(cls, address: int):
         """Return the parameter name for address given address."""
-        for param in SynthParameter:
-            if param.address == address:
-                return param.name
-        return None  # Return None if the address is not found
+        # Imported here, the registry imports every parameter module
+        from jdxi_editor.midi.data.parameter.registry import PARAMETER_REGISTRY
+
+        param = PARAMETER_REGISTRY.get_by_address(cls, address)
+        return param.name if param is not None else None
 
     @staticmethod
     def get_by_name(param_name):
@@ -94,4 +97,9 @@ class SynthParameter(Enum):
         """Get display text for switch values"""
         if self.is_switch:
             return "ON" if value else "OFF"
-        return str(value)
\ No newline at end of file
+        return str(value)
+
+
+# Overridden by the subclasses, by name so that lookups hash a str, not a member
+SynthParameter.SWITCHES = frozenset()
+SynthParameter.BIPOLAR_PARAMETERS = frozenset()
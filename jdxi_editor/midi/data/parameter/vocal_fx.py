@@ -50,27 +50,11 @@ class VocalFXParameter(SynthParameter):
         # Return the parameter member by name, or None if not found
         return VocalFXParameter.__members__.get(param_name, None)
 
-    @staticmethod
-    def get_name_by_address(address: int):
-        """Return the parameter name for address given address."""
-        for param in VocalFXParameter:
-            if param.address == address:
-                return param.name
-        return None  # Return None if the address is not found
-
     @property
     def display_name(self) -> str:
         """Get display name for the parameter"""
         return self.name.replace("_", " ").title()
 
-    @property
-    def is_switch(self) -> bool:
-        """Returns True if parameter is address binary/enum switch"""
-        return self in [
-            self.AUTO_PITCH_SWITCH,
-            self.VOCODER_SWITCH,
-        ]
-
     def get_switch_text(self, value: int) -> str:
         """Get display text for switch values"""
         if self.is_switch:
@@ -176,3 +160,9 @@ class VocalFXParameter(SynthParameter):
         if param:
             return param.convert_to_midi(value)
         return None
+
+
+VocalFXParameter.SWITCHES = frozenset({
+    "AUTO_PITCH_SWITCH",
+    "VOCODER_SWITCH",
+})
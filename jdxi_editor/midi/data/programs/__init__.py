@@ -1,5 +1,23 @@
-from .programs import PROGRAM_LIST
+"""
+Program and Preset Catalogs
+===========================
 
-all = [
-    PROGRAM_LIST
-]
\ No newline at end of file
+Catalogs of the JD-Xi preset programs, digital and analog synth tones and drum
+kits, read from the compiled `catalogs.json` on first use. See `catalog` and
+`build`; the lists themselves live in `programs`, `presets`, `analog` and `drum`.
+"""
+
+from jdxi_editor.midi.data.programs.catalog import Catalog, compiled_catalog
+
+PROGRAM_CATALOG = compiled_catalog("programs", tone_keys=("digital_1", "digital_2", "drum", "analog"))
+DIGITAL_PRESET_CATALOG = compiled_catalog("digital_presets")
+ANALOG_PRESET_CATALOG = compiled_catalog("analog_presets")
+DRUM_KIT_CATALOG = compiled_catalog("drum_kits")
+
+__all__ = [
+    "Catalog",
+    "PROGRAM_CATALOG",
+    "DIGITAL_PRESET_CATALOG",
+    "ANALOG_PRESET_CATALOG",
+    "DRUM_KIT_CATALOG",
+]
@@ -1,3 +1,5 @@
+from jdxi_editor.midi.data.programs import ANALOG_PRESET_CATALOG
+
 ANALOG_PRESET_LIST_OLD = [
   {
     "id":"001",
@@ -437,7 +439,7 @@ ANALOG_PRESET_LIST = ANALOG_PRESET_LIST = [
 
 
 def get_preset_by_program_number(program_number):
-    return next((preset for preset in ANALOG_PRESET_LIST if preset["pc"] == program_number), None)
+    return ANALOG_PRESET_CATALOG.get("pc", program_number)
 
 def get_preset_parameters(program_number):
     preset = get_preset_by_program_number(program_number)
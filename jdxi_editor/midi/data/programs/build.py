@@ -0,0 +1,85 @@
+"""
+Compile Program and Preset Catalogs
+===================================
+
+This module compiles the program, preset and drum kit lists in this package into
+`catalogs.json`, which the editors read on first use instead of importing the
+source modules. Run it after editing any of the lists:
+
+    python -m jdxi_editor.midi.data.programs.build
+
+Each list is stored as its field names and one row of values per entry, with
+msb, lsb and pc as ints.
+
+Functions:
+    - compile_catalogs: Build the compiled form of every catalog.
+    - write_catalogs: Write the compiled catalogs to a file.
+
+Usage Example:
+    >>> write_catalogs()
+    PosixPath('.../jdxi_editor/midi/data/programs/catalogs.json')
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict
+
+from jdxi_editor.midi.data.programs.catalog import (
+    CATALOG_FORMAT,
+    CATALOG_PATH,
+    CATALOG_SOURCES,
+    CATALOG_VERSION,
+    load_source,
+)
+
+
+def _dumps(value: Any) -> str:
+    """Compact JSON of a value."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def compile_catalogs() -> Dict[str, Any]:
+    """
+    Build the compiled form of every catalog from the source modules.
+
+    :return: dict ready to be written as JSON
+    """
+    catalogs = {}
+    for name in CATALOG_SOURCES:
+        entries = load_source(name)
+        fields = list(entries[0])
+        for entry in entries:
+            if list(entry) != fields:
+                raise ValueError(f"{name} entry {entry.get('id')} does not have the fields {fields}")
+        catalogs[name] = {
+            "fields": fields,
+            "rows": [list(entry.values()) for entry in entries],
+        }
+    return {"format": CATALOG_FORMAT, "version": CATALOG_VERSION, "catalogs": catalogs}
+
+
+def write_catalogs(path: Path = CATALOG_PATH) -> Path:
+    """
+    Write the compiled catalogs to a file.
+
+    :param path: Path to write, catalogs.json in this package by default.
+    :return: Path written
+    """
+    compiled = compile_catalogs()
+    lines = [f'{{"format":{json.dumps(compiled["format"])},"version":{compiled["version"]},"catalogs":{{']
+    for index, (name, table) in enumerate(compiled["catalogs"].items()):
+        # One row per line, so changes to the lists read as small diffs
+        rows = ",\n".join(_dumps(row) for row in table["rows"])
+        separator = "," if index < len(compiled["catalogs"]) - 1 else ""
+        lines.append(f'{_dumps(name)}:{{"fields":{_dumps(table["fields"])},"rows":[\n{rows}\n]}}{separator}')
+    lines.append("}}")
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("\n".join(lines) + "\n")
+    logging.info(f"Wrote compiled catalogs to {path}")
+    return path
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    write_catalogs()
@@ -0,0 +1,340 @@
+"""
+Program and Preset Catalog
+==========================
+
+This module provides the `Catalog` class, which indexes a list of program or
+preset dicts (`PROGRAM_LIST`, `DIGITAL_PRESET_LIST`, ...) so that lookups are
+dict lookups instead of scans with `next(...)`.
+
+The catalogs used by the editors are read from `catalogs.json`, which
+`python -m jdxi_editor.midi.data.programs.build` compiles from the source lists
+with msb, lsb and pc stored as ints. Nothing is read until a catalog is first
+used, so importing them costs nothing at startup. Without the compiled file the
+source modules are imported instead.
+
+Entries are indexed:
+    - by any field, e.g. "id" or "name", on first lookup of that field;
+    - by bank select MSB, LSB and program change, as ints;
+    - by the tones each program uses, e.g. "digital_1" or "drum";
+    - by the 1, 2 and 3 character substrings of their names, lower case, for
+      as-you-type search. Longer queries intersect the entries of their
+      trigrams and check the candidates, and a query extending the previous one
+      only checks the previous results.
+
+A value shared by several entries resolves to the first one, as a scan would.
+
+Classes:
+    - Catalog: Indexed list of program or preset entries.
+
+Functions:
+    - compiled_catalog: Catalog loaded from the compiled file on first use.
+    - load_compiled: Read the entries of every catalog from the compiled file.
+    - load_source: Import the entries of a catalog from its source module.
+
+Usage Example:
+    >>> PROGRAM_CATALOG = compiled_catalog("programs", tone_keys=("digital_1", "drum"))
+    >>> PROGRAM_CATALOG.get_by_id("A01")["name"]
+    'Unleash Xi'
+    >>> [program["id"] for program in PROGRAM_CATALOG.search("seq")][:2]
+    ['A02', 'A18']
+    >>> PROGRAM_CATALOG.using("TR-909 Kit 4", "drum")[0]["id"]
+    'A01'
+"""
+
+import json
+import logging
+from bisect import bisect_left
+from functools import lru_cache
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+MAX_GRAM_LENGTH = 3
+
+CATALOG_PATH = Path(__file__).with_name("catalogs.json")
+CATALOG_FORMAT = "jdxi-catalogs"
+CATALOG_VERSION = 1
+
+# Catalog name -> source module and list
+CATALOG_SOURCES = {
+    "programs": ("jdxi_editor.midi.data.programs.programs", "PROGRAM_LIST"),
+    "digital_presets": ("jdxi_editor.midi.data.programs.presets", "DIGITAL_PRESET_LIST"),
+    "analog_presets": ("jdxi_editor.midi.data.programs.analog", "ANALOG_PRESET_LIST"),
+    "drum_kits": ("jdxi_editor.midi.data.programs.drum", "DRUM_KIT_LIST"),
+}
+INT_FIELDS = ("msb", "lsb", "pc")
+
+Entries = Sequence[Mapping[str, Any]]
+
+
+def _grams(text: str, length: int) -> Iterable[str]:
+    """Substrings of text of a given length."""
+    return (text[start:start + length] for start in range(len(text) - length + 1))
+
+
+class Catalog:
+    """Program or preset entries with hash, tone and substring indexes."""
+
+    def __init__(
+        self,
+        entries: Union[Entries, Callable[[], Entries]],
+        tone_keys: Sequence[str] = (),
+    ):
+        """
+        Initialize the catalog, indexing the entries on first use.
+
+        :param entries: Program or preset dicts, with at least "id" and "name",
+            or a function returning them.
+        :param tone_keys: Fields naming the tones a program uses, e.g. "digital_1".
+        """
+        self._source = entries
+        self.tone_keys = tuple(tone_keys)
+        self._entries: Optional[Tuple[Mapping[str, Any], ...]] = None
+        self._fields: Dict[str, Dict[Any, int]] = {}
+        self._midi: Optional[Dict[Tuple[int, int, int], int]] = None
+        self._tones: Optional[Dict[Tuple[str, str], List[int]]] = None
+        self._names_lower: Tuple[str, ...] = ()
+        self._grams: Dict[str, List[int]] = {}
+        self._sorted_names: List[Tuple[str, int]] = []
+        self._last_query: Optional[str] = None
+        self._last_matches: List[int] = []
+
+    @property
+    def loaded(self) -> bool:
+        """True once the entries have been read and indexed."""
+        return self._entries is not None
+
+    @property
+    def entries(self) -> Tuple[Mapping[str, Any], ...]:
+        """The entries, in source order."""
+        if self._entries is None:
+            self._load()
+        return self._entries
+
+    @property
+    def names_lower(self) -> Tuple[str, ...]:
+        """Lower case names of the entries."""
+        if self._entries is None:
+            self._load()
+        return self._names_lower
+
+    def _load(self) -> None:
+        """Read the entries and build the name indexes."""
+        source = self._source
+        entries = tuple(source() if callable(source) else source)
+        self._names_lower = tuple(str(entry["name"]).lower() for entry in entries)
+        for index, name in enumerate(self._names_lower):
+            for length in range(1, MAX_GRAM_LENGTH + 1):
+                for gram in set(_grams(name, length)):
+                    self._grams.setdefault(gram, []).append(index)
+        self._sorted_names = sorted((name, index) for index, name in enumerate(self._names_lower))
+        self._entries = entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __getitem__(self, index):
+        return self.entries[index]
+
+    def index_of(self, field: str, value: Any) -> Optional[int]:
+        """
+        Return the position of the first entry whose field equals value.
+
+        :param field: str field name, e.g. "id".
+        :param value: Value to look up.
+        :return: int position in entries, or None
+        """
+        index = self._fields.get(field)
+        if index is None:
+            index = {}
+            for position, entry in enumerate(self.entries):
+                if field in entry:
+                    index.setdefault(entry[field], position)
+            self._fields[field] = index
+        return index.get(value)
+
+    def get(self, field: str, value: Any) -> Optional[Mapping[str, Any]]:
+        """
+        Return the first entry whose field equals value.
+
+        :param field: str field name, e.g. "id".
+        :param value: Value to look up.
+        :return: Entry dict, or None
+        """
+        position = self.index_of(field, value)
+        return None if position is None else self.entries[position]
+
+    def get_by_id(self, entry_id: str) -> Optional[Mapping[str, Any]]:
+        """Return the entry with an id, e.g. "A01" or "001"."""
+        return self.get("id", entry_id)
+
+    def get_by_name(self, name: str) -> Optional[Mapping[str, Any]]:
+        """Return the entry with exactly this name."""
+        return self.get("name", name)
+
+    def get_by_midi(self, msb: int, lsb: int, pc: int) -> Optional[Mapping[str, Any]]:
+        """
+        Return the entry selected by a bank select and program change.
+
+        :param msb: int bank select MSB (CC# 0).
+        :param lsb: int bank select LSB (CC# 32).
+        :param pc: int program change, as listed in the entries.
+        :return: Entry dict, or None
+        """
+        if self._midi is None:
+            self._midi = {}
+            for position, entry in enumerate(self.entries):
+                try:
+                    key = (int(entry["msb"]), int(entry["lsb"]), int(entry["pc"]))
+                except (KeyError, TypeError, ValueError):
+                    continue
+                self._midi.setdefault(key, position)
+        position = self._midi.get((int(msb), int(lsb), int(pc)))
+        return None if position is None else self.entries[position]
+
+    def using(self, tone: str, part: Optional[str] = None) -> List[Mapping[str, Any]]:
+        """
+        Return the programs using a tone.
+
+        :param tone: str tone name, e.g. "TR-909 Kit 4".
+        :param part: Optional tone key to look in, e.g. "drum", every tone key otherwise.
+        :return: List of entries, in catalog order
+        """
+        if self._tones is None:
+            self._tones = {}
+            for position, entry in enumerate(self.entries):
+                for key in self.tone_keys:
+                    if key in entry:
+                        self._tones.setdefault((key, entry[key]), []).append(position)
+        parts = self.tone_keys if part is None else (part,)
+        positions = sorted({
+            position for key in parts for position in self._tones.get((key, tone), ())
+        })
+        return [self.entries[position] for position in positions]
+
+    def _matches(self, query: str) -> List[int]:
+        """Positions of the entries whose lower case name contains query."""
+        if len(query) <= MAX_GRAM_LENGTH:
+            return list(self._grams.get(query, ()))
+        if self._last_query and self._last_query in query:
+            # Typing extends the previous query, its matches are the only candidates
+            candidates: Iterable[int] = self._last_matches
+        else:
+            posting_lists = [self._grams.get(gram, ()) for gram in set(_grams(query, MAX_GRAM_LENGTH))]
+            shortest = min(posting_lists, key=len)
+            others = [set(posting) for posting in posting_lists if posting is not shortest]
+            candidates = [position for position in shortest if all(position in other for other in others)]
+        names = self.names_lower
+        return [position for position in candidates if query in names[position]]
+
+    def search(self, text: str) -> List[Mapping[str, Any]]:
+        """
+        Return the entries whose name contains text, ignoring case.
+
+        :param text: str search text, every entry if empty.
+        :return: List of entries, in catalog order
+        """
+        query = text.lower()
+        if self._entries is None:
+            self._load()
+        if not query:
+            return list(self._entries)
+        if query == self._last_query:
+            matches = self._last_matches
+        else:
+            matches = self._matches(query)
+            self._last_query, self._last_matches = query, matches
+        return [self.entries[position] for position in matches]
+
+    def search_prefix(self, text: str) -> List[Mapping[str, Any]]:
+        """
+        Return the entries whose name starts with text, ignoring case.
+
+        :param text: str name prefix.
+        :return: List of entries, in catalog order
+        """
+        query = text.lower()
+        if self._entries is None:
+            self._load()
+        start = bisect_left(self._sorted_names, (query, -1))
+        positions = []
+        for name, position in self._sorted_names[start:]:
+            if not name.startswith(query):
+                break
+            positions.append(position)
+        return [self.entries[position] for position in sorted(positions)]
+
+    def first_containing(self, text: str) -> Optional[Mapping[str, Any]]:
+        """
+        Return the first entry whose name contains text, matching case.
+
+        :param text: str part of a name.
+        :return: Entry dict, or None
+        """
+        for entry in self.search(text):
+            if text in entry["name"]:
+                return entry
+        return None
+
+
+def _typed(entry: Mapping[str, Any]) -> Dict[str, Any]:
+    """Entry with the bank select and program change values as ints."""
+    return {
+        field: int(float(value)) if field in INT_FIELDS else value
+        for field, value in entry.items()
+    }
+
+
+def load_source(name: str) -> List[Dict[str, Any]]:
+    """
+    Import the entries of a catalog from its source module.
+
+    :param name: str catalog name, a key of CATALOG_SOURCES.
+    :return: List of entries, msb, lsb and pc as ints
+    """
+    module_name, list_name = CATALOG_SOURCES[name]
+    return [_typed(entry) for entry in getattr(import_module(module_name), list_name)]
+
+
+@lru_cache(maxsize=None)
+def load_compiled(path: Path = CATALOG_PATH) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Read the entries of every catalog from the compiled file.
+
+    :param path: Path of the file written by the build step.
+    :return: dict of catalog name -> entries, empty if the file is missing or stale
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            compiled = json.load(file)
+    except (OSError, ValueError) as ex:
+        logging.warning(f"Could not read compiled catalogs {path}: {ex}")
+        return {}
+    if (compiled.get("format"), compiled.get("version")) != (CATALOG_FORMAT, CATALOG_VERSION):
+        logging.warning(f"Ignoring compiled catalogs {path} of an unknown version")
+        return {}
+    return {
+        name: [dict(zip(table["fields"], row)) for row in table["rows"]]
+        for name, table in compiled["catalogs"].items()
+    }
+
+
+def compiled_catalog(name: str, tone_keys: Sequence[str] = ()) -> Catalog:
+    """
+    Return a catalog loaded from the compiled file on first use.
+
+    :param name: str catalog name, a key of CATALOG_SOURCES.
+    :param tone_keys: Fields naming the tones a program uses, e.g. "digital_1".
+    :return: Catalog
+    """
+
+    def entries() -> List[Dict[str, Any]]:
+        compiled = load_compiled()
+        if name in compiled:
+            return compiled[name]
+        return load_source(name)
+
+    return Catalog(entries, tone_keys=tone_keys)
@@ -1,7 +1,7 @@
-import json
 import csv
 from io import StringIO
-import pandas as pd
+
+from jdxi_editor.midi.data.programs import DIGITAL_PRESET_CATALOG
 
 # Raw data as a string
 RAW_PRESETS_CSV = """
@@ -249,9 +249,6 @@ id,name,category,msb,lsb,pc
 255,Voc:Noise,FX/Other,95,65,127
 256,Init Tone,FX/Other,95,65,128
 """
-data = pd.read_csv(StringIO(RAW_PRESETS_CSV))
-data.head()
-data.to_json(orient='records', indent=2, path_or_buf='presets.json')
 
 
 # Preset data as structured JSON
@@ -2443,7 +2440,6 @@ def generate_preset_list():
     reader = csv.DictReader(csv_file)
     
     for row in reader:
-        print(row)
         # Convert numeric fields to integers
         msb = int(row['msb'])
         lsb = int(row['lsb'])
@@ -2471,7 +2467,7 @@ def get_preset_by_program_number(program_number):
         None: If preset not found
     """
     program_number = str(program_number).zfill(3)
-    return next((preset for preset in DIGITAL_PRESET_LIST if preset["id"] == program_number), None)
+    return DIGITAL_PRESET_CATALOG.get_by_id(program_number)
 
 
 def get_preset_parameters(program_number):
@@ -0,0 +1,421 @@
+"""
+MIDI Event Index
+================
+
+This module provides the `MidiEventIndex` class. It parses a loaded MIDI file
+once into NumPy arrays that the editors query, so a feature does not walk
+every track and message again to find tempo, notes or channels.
+
+Each event is one element of a structured array of `EVENT_DTYPE`:
+    - tick: absolute time in ticks;
+    - seconds: absolute time in seconds, through the tempo map;
+    - type: `EventType`, the status of a channel message without its channel,
+      or the type byte of a meta message;
+    - channel: 0-15, -1 for meta and SysEx events;
+    - note, velocity: the data bytes. For a control change they hold the
+      controller and value, for a program change the program, and for pitch
+      bend the LSB and MSB;
+    - track: index of the track in the file.
+
+Events are sorted by tick. Events at the same tick keep file order, track by
+track, as `mido.merge_tracks` orders them. The tempo map has one element per
+tempo change, of `TEMPO_DTYPE`, starting at tick 0 with 120 BPM unless the
+file sets another tempo there.
+
+Each track is read in a single loop and the events are sorted with NumPy,
+instead of merged message by message, and the seconds of every event come
+from the tempo map in one vectorised step. `event_index()` caches the index of
+each file, so loading, playback and the piano roll share one parse.
+
+Classes:
+    - EventType: Event type codes of the index.
+    - NoteArrays: Notes of a MIDI file as parallel arrays.
+    - MidiEventIndex: Events and tempo map of a MIDI file as NumPy arrays.
+
+Functions:
+    - event_index: Cached MidiEventIndex of a MIDI file.
+    - fingerprint: Cheap check that a file has not been edited.
+
+Usage Example:
+    >>> index = event_index(MidiFile("song.mid"))
+    >>> index.note_ons(channels=[9])["tick"][:4]
+    array([  0, 240, 480, 720])
+    >>> mido.tempo2bpm(index.tempo)
+    120.0
+"""
+
+import weakref
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import mido
+import numpy as np
+
+NUM_CHANNELS = 16
+NUM_NOTES = 128
+DEFAULT_TEMPO = 500000  # microseconds per beat, 120 BPM
+DEFAULT_VOLUME = 100
+DEFAULT_EXPRESSION = 127
+CC_VOLUME = 7
+CC_EXPRESSION = 11
+PITCHWHEEL_CENTER = 8192
+
+EVENT_DTYPE = np.dtype([
+    ("tick", np.int64),
+    ("seconds", np.float64),
+    ("type", np.uint8),
+    ("channel", np.int8),
+    ("note", np.uint8),
+    ("velocity", np.uint8),
+    ("track", np.uint16),
+])
+TEMPO_DTYPE = np.dtype([
+    ("tick", np.int64),
+    ("seconds", np.float64),
+    ("tempo", np.int64),
+])
+
+
+class EventType(IntEnum):
+    """Event type codes: channel message status, or meta message type byte."""
+
+    NOTE_OFF = 0x80
+    NOTE_ON = 0x90
+    POLYTOUCH = 0xA0
+    CONTROL_CHANGE = 0xB0
+    PROGRAM_CHANGE = 0xC0
+    AFTERTOUCH = 0xD0
+    PITCHWHEEL = 0xE0
+    SYSEX = 0xF0
+    SET_TEMPO = 0x51
+    TIME_SIGNATURE = 0x58
+
+
+# Channel message types with one data byte
+ONE_DATA_BYTE = (EventType.PROGRAM_CHANGE, EventType.AFTERTOUCH)
+
+
+@dataclass(frozen=True)
+class NoteArrays:
+    """Notes of a MIDI file as parallel arrays, one element per note, by start."""
+
+    channel: np.ndarray  # uint8
+    note: np.ndarray  # uint8
+    start: np.ndarray  # int64 ticks
+    end: np.ndarray  # int64 ticks
+    intensity: np.ndarray  # uint8, velocity scaled by volume and expression
+    total_ticks: int
+    ticks_per_beat: int
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    @classmethod
+    def from_midi_file(cls, midi_file: mido.MidiFile) -> "NoteArrays":
+        """
+        Collect the notes of a MIDI file.
+
+        :param midi_file: mido.MidiFile
+        :return: NoteArrays
+        """
+        return event_index(midi_file).notes()
+
+    @classmethod
+    def from_events(
+        cls,
+        ticks: np.ndarray,
+        keys: np.ndarray,
+        values: np.ndarray,
+        is_on: np.ndarray,
+        total_ticks: int,
+        ticks_per_beat: int,
+    ) -> "NoteArrays":
+        """
+        Pair note-on and note-off events into notes.
+
+        A note-on ends at the next event of the same channel and key, so a
+        retriggered note ends where the new one starts, and a note left on ends
+        with the file.
+
+        :param ticks: int array, absolute tick of each event.
+        :param keys: int array, channel * 128 + note of each event.
+        :param values: uint8 array, intensity of each note-on.
+        :param is_on: bool array, True for note-ons.
+        :param total_ticks: int length of the file, where notes left on end.
+        :param ticks_per_beat: int resolution of the file.
+        :return: NoteArrays
+        """
+        # By key, then time, a note-off before a note-on at the same tick
+        order = np.lexsort((is_on, ticks, keys))
+        keys, ticks, values, is_on = keys[order], ticks[order], values[order], is_on[order]
+        ends = np.full(len(ticks), total_ticks, dtype=np.int64)
+        same_key = keys[1:] == keys[:-1]
+        ends[:-1][same_key] = ticks[1:][same_key]
+        keys, starts, ends, values = keys[is_on], ticks[is_on], ends[is_on], values[is_on]
+        by_start = np.argsort(starts, kind="stable")
+        keys = keys[by_start]
+        return cls(
+            channel=(keys // NUM_NOTES).astype(np.uint8),
+            note=(keys % NUM_NOTES).astype(np.uint8),
+            start=starts[by_start],
+            end=ends[by_start],
+            intensity=values[by_start],
+            total_ticks=int(total_ticks),
+            ticks_per_beat=ticks_per_beat,
+        )
+
+
+def _read_track(track: mido.MidiTrack, columns: Tuple[List[int], ...], tempos: List[Tuple[int, int]]) -> int:
+    """Append the events of a track to the columns, return its length in ticks."""
+    ticks, types, channels, notes, velocities = columns
+    tick = 0
+    for message in track:
+        tick += message.time
+        kind = message.type
+        if kind == "note_on" or kind == "note_off":
+            code = EventType.NOTE_ON if kind == "note_on" else EventType.NOTE_OFF
+            channel, data1, data2 = message.channel, message.note, message.velocity
+        elif kind == "control_change":
+            code, channel, data1, data2 = EventType.CONTROL_CHANGE, message.channel, message.control, message.value
+        elif kind == "program_change":
+            code, channel, data1, data2 = EventType.PROGRAM_CHANGE, message.channel, message.program, 0
+        elif kind == "pitchwheel":
+            value = message.pitch + PITCHWHEEL_CENTER
+            code, channel, data1, data2 = EventType.PITCHWHEEL, message.channel, value & 0x7F, value >> 7
+        elif kind == "aftertouch":
+            code, channel, data1, data2 = EventType.AFTERTOUCH, message.channel, message.value, 0
+        elif kind == "polytouch":
+            code, channel, data1, data2 = EventType.POLYTOUCH, message.channel, message.note, message.value
+        elif kind == "set_tempo":
+            code, channel, data1, data2 = EventType.SET_TEMPO, -1, 0, 0
+            tempos.append((tick, message.tempo))
+        elif kind == "time_signature":
+            code, channel, data1, data2 = EventType.TIME_SIGNATURE, -1, message.numerator, message.denominator
+        elif kind == "sysex":
+            code, channel, data1, data2 = EventType.SYSEX, -1, 0, 0
+        else:
+            continue
+        ticks.append(tick)
+        types.append(code)
+        channels.append(channel)
+        notes.append(data1)
+        velocities.append(data2)
+    return tick
+
+
+class MidiEventIndex:
+    """Events and tempo map of a MIDI file as NumPy arrays."""
+
+    def __init__(self, events: np.ndarray, tempo_map: np.ndarray, ticks_per_beat: int, total_ticks: int):
+        """
+        Initialize the index, see `from_midi_file`.
+
+        :param events: EVENT_DTYPE array, sorted by tick.
+        :param tempo_map: TEMPO_DTYPE array, sorted by tick, starting at tick 0.
+        :param ticks_per_beat: int resolution of the file.
+        :param total_ticks: int length of the longest track.
+        """
+        self.events = events
+        self.tempo_map = tempo_map
+        self.ticks_per_beat = ticks_per_beat
+        self.total_ticks = total_ticks
+        self.duration = float(self.seconds_at(total_ticks))
+        tempo_events = events["type"] == EventType.SET_TEMPO
+        self.tempo: Optional[int] = None
+        if tempo_events.any():
+            first = events["tick"][np.argmax(tempo_events)]
+            self.tempo = int(self.tempo_map["tempo"][np.searchsorted(self.tempo_map["tick"], first, "right") - 1])
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    @classmethod
+    def from_midi_file(cls, midi_file: mido.MidiFile) -> "MidiEventIndex":
+        """
+        Parse a MIDI file into an index.
+
+        :param midi_file: mido.MidiFile
+        :return: MidiEventIndex
+        """
+        columns: Tuple[List[int], ...] = ([], [], [], [], [])
+        tracks: List[int] = []
+        tempos: List[Tuple[int, int]] = []
+        total_ticks = 0
+        for track in midi_file.tracks:
+            total_ticks = max(total_ticks, _read_track(track, columns, tempos))
+            tracks.append(len(columns[0]))
+        ticks = np.array(columns[0], dtype=np.int64)
+        order = np.argsort(ticks, kind="stable")
+        events = np.empty(len(ticks), dtype=EVENT_DTYPE)
+        events["tick"] = ticks[order]
+        for name, column in zip(("type", "channel", "note", "velocity"), columns[1:]):
+            events[name] = np.array(column, dtype=EVENT_DTYPE[name])[order]
+        # Track of each event, from where each track's events end
+        events["track"] = np.searchsorted(np.array(tracks), order, side="right")
+        tempo_map = cls._tempo_map(tempos, midi_file.ticks_per_beat)
+        index = cls(events, tempo_map, midi_file.ticks_per_beat, total_ticks)
+        events["seconds"] = index.seconds_at(events["tick"])
+        return index
+
+    @staticmethod
+    def _tempo_map(tempos: List[Tuple[int, int]], ticks_per_beat: int) -> np.ndarray:
+        """Tempo map from (tick, tempo) changes in file order."""
+        changes = sorted(tempos, key=lambda change: change[0])  # stable, the last at a tick wins
+        merged: Dict[int, int] = {0: DEFAULT_TEMPO}
+        for tick, tempo in changes:
+            merged[tick] = tempo
+        tempo_map = np.empty(len(merged), dtype=TEMPO_DTYPE)
+        tempo_map["tick"] = list(merged)
+        tempo_map["tempo"] = list(merged.values())
+        spans = np.diff(tempo_map["tick"]) * tempo_map["tempo"][:-1] / (1e6 * ticks_per_beat)
+        tempo_map["seconds"] = np.concatenate(([0.0], np.cumsum(spans)))
+        return tempo_map
+
+    def seconds_at(self, ticks):
+        """
+        Convert ticks to seconds through the tempo map.
+
+        :param ticks: int or int array of absolute ticks.
+        :return: float or float array of seconds
+        """
+        tempo_map = self.tempo_map
+        segment = np.searchsorted(tempo_map["tick"], ticks, side="right") - 1
+        return tempo_map["seconds"][segment] + (ticks - tempo_map["tick"][segment]) * tempo_map["tempo"][
+            segment
+        ] / (1e6 * self.ticks_per_beat)
+
+    def beats_at(self, seconds):
+        """
+        Convert seconds to beats through the tempo map.
+
+        :param seconds: float or float array of seconds.
+        :return: float or float array of beats
+        """
+        tempo_map = self.tempo_map
+        segment = np.maximum(np.searchsorted(tempo_map["seconds"], seconds, side="right") - 1, 0)
+        return (
+            tempo_map["tick"][segment] / self.ticks_per_beat
+            + (seconds - tempo_map["seconds"][segment]) * 1e6 / tempo_map["tempo"][segment]
+        )
+
+    def select(
+        self,
+        types: Optional[Iterable[int]] = None,
+        channels: Optional[Iterable[int]] = None,
+        tracks: Optional[Iterable[int]] = None,
+    ) -> np.ndarray:
+        """
+        Return the events of some types, channels or tracks, by tick.
+
+        :param types: Optional EventTypes to keep, every type if None.
+        :param channels: Optional 0-based channels to keep, every channel if None.
+        :param tracks: Optional track indexes to keep, every track if None.
+        :return: EVENT_DTYPE array
+        """
+        mask = np.ones(len(self.events), dtype=bool)
+        for name, values in (("type", types), ("channel", channels), ("track", tracks)):
+            if values is not None:
+                mask &= np.isin(self.events[name], list(values))
+        return self.events[mask]
+
+    def note_ons(
+        self, channels: Optional[Iterable[int]] = None, tracks: Optional[Iterable[int]] = None
+    ) -> np.ndarray:
+        """
+        Return the note-ons with a velocity, by tick.
+
+        :param channels: Optional 0-based channels to keep, every channel if None.
+        :param tracks: Optional track indexes to keep, every track if None.
+        :return: EVENT_DTYPE array
+        """
+        events = self.select([EventType.NOTE_ON], channels, tracks)
+        return events[events["velocity"] > 0]
+
+    def channels(self) -> List[int]:
+        """Return the channels that play notes."""
+        return np.unique(self.note_ons()["channel"]).tolist()
+
+    def _controller_values(self, controller: int, default: int, positions: np.ndarray) -> np.ndarray:
+        """Value of a controller, per channel, at each of the events at positions."""
+        events = self.events
+        values = np.full(len(positions), default, dtype=np.int64)
+        changes = np.flatnonzero(
+            (events["type"] == EventType.CONTROL_CHANGE) & (events["note"] == controller)
+        )
+        for channel in np.unique(events["channel"][changes]):
+            in_channel = changes[events["channel"][changes] == channel]
+            targets = events["channel"][positions] == channel
+            latest = np.searchsorted(in_channel, positions[targets], side="right") - 1
+            values[targets] = np.where(
+                latest >= 0, events["velocity"][in_channel[np.maximum(latest, 0)]], default
+            )
+        return values
+
+    def notes(self) -> NoteArrays:
+        """
+        Return the notes, with the volume and expression in effect at each note-on.
+
+        :return: NoteArrays
+        """
+        events = self.events
+        note_types = events["type"]
+        positions = np.flatnonzero((note_types == EventType.NOTE_ON) | (note_types == EventType.NOTE_OFF))
+        notes = events[positions]
+        is_on = (notes["type"] == EventType.NOTE_ON) & (notes["velocity"] > 0)
+        volume = self._controller_values(CC_VOLUME, DEFAULT_VOLUME, positions)
+        expression = self._controller_values(CC_EXPRESSION, DEFAULT_EXPRESSION, positions)
+        values = np.where(is_on, notes["velocity"] * volume * expression // (127 * 127), 0)
+        return NoteArrays.from_events(
+            notes["tick"],
+            notes["channel"].astype(np.int64) * NUM_NOTES + notes["note"],
+            values.astype(np.uint8),
+            is_on,
+            total_ticks=self.total_ticks,
+            ticks_per_beat=self.ticks_per_beat,
+        )
+
+    def channel_messages(self) -> Tuple[np.ndarray, np.ndarray, List[List[int]]]:
+        """
+        Return the channel messages, ready to send.
+
+        :return: (seconds, channels, message bytes), by time
+        """
+        events = self.events[self.events["channel"] >= 0]
+        status = (events["type"] | events["channel"].astype(np.uint8)).tolist()
+        data1 = events["note"].tolist()
+        data2 = events["velocity"].tolist()
+        one_byte = np.isin(events["type"], ONE_DATA_BYTE).tolist()
+        messages = [
+            [status, first] if short else [status, first, second]
+            for status, first, second, short in zip(status, data1, data2, one_byte)
+        ]
+        return events["seconds"], events["channel"], messages
+
+
+def fingerprint(midi_file: mido.MidiFile) -> Tuple:
+    """Cheap check that a file has not been edited since it was indexed."""
+    return midi_file.ticks_per_beat, tuple(len(track) for track in midi_file.tracks)
+
+
+_INDEX_CACHE: "weakref.WeakKeyDictionary[mido.MidiFile, Tuple[Tuple, MidiEventIndex]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def event_index(midi_file: mido.MidiFile) -> MidiEventIndex:
+    """
+    Return the event index of a MIDI file, parsed once per file.
+
+    The index is rebuilt when messages are added to or removed from the file.
+    It is kept for as long as the file is.
+
+    :param midi_file: mido.MidiFile
+    :return: MidiEventIndex
+    """
+    cached = _INDEX_CACHE.get(midi_file)
+    if cached is not None and cached[0] == fingerprint(midi_file):
+        return cached[1]
+    index = MidiEventIndex.from_midi_file(midi_file)
+    _INDEX_CACHE[midi_file] = (fingerprint(midi_file), index)
+    return index
@@ -0,0 +1,178 @@
+"""
+Piano Roll
+==========
+
+This module builds the piano roll of a MIDI file with NumPy instead of filling
+it note by note in Python.
+
+The notes come from the file's `MidiEventIndex` as parallel arrays,
+`NoteArrays`, note-offs paired with their note-ons by sorting on key and time.
+`PianoRoll` fills every note into a 128-key roll with one vectorised
+assignment. Each column keeps the intensity of the loudest note and its
+channel. The colour of a pixel comes from the channel, so the roll is 256
+bytes per column, not the 2 KB a dense layer per channel needs. Halved levels
+(mipmaps) are built from it, each column the louder of the two below it, so a
+view of any zoom is a slice of the nearest level and costs only its visible
+columns. Short notes stay visible when zoomed out.
+
+`piano_roll()` caches the roll of each file, so redraws reuse it.
+
+Classes:
+    - PianoRoll: Roll of note intensities and channels, with halved levels.
+
+Functions:
+    - piano_roll: Cached PianoRoll of a MIDI file.
+
+Usage Example:
+    >>> roll = piano_roll(MidiFile("song.mid"))
+    >>> intensity, channels, ticks_per_column = roll.view(0, roll.total_ticks, width=800)
+    >>> intensity.shape
+    (128, 800)
+"""
+
+import math
+import weakref
+from typing import Dict, List, Tuple
+
+import mido
+import numpy as np
+
+from jdxi_editor.midi.file.index import NUM_CHANNELS, NUM_NOTES, NoteArrays, event_index, fingerprint
+
+DEFAULT_COLUMNS_PER_BEAT = 24  # 1/96 notes
+NO_CHANNEL = 0xFF
+
+
+class PianoRoll:
+    """Note intensities and channels by key and time, with halved levels."""
+
+    def __init__(self, notes: NoteArrays, columns_per_beat: int = DEFAULT_COLUMNS_PER_BEAT):
+        """
+        Build the roll and its levels.
+
+        :param notes: NoteArrays to draw.
+        :param columns_per_beat: int columns per beat at full resolution.
+        """
+        self.notes = notes
+        self.total_ticks = notes.total_ticks
+        self.ticks_per_column = max(notes.ticks_per_beat // columns_per_beat, 1)
+        intensity, channels = self._fill(notes)
+        # Level n has 2 ** n times the ticks per column of level 0
+        self.intensity: List[np.ndarray] = [intensity]
+        self.channels: List[np.ndarray] = [channels]
+        while self.intensity[-1].shape[1] > 1:
+            intensity, channels = self._halve(self.intensity[-1], self.channels[-1])
+            self.intensity.append(intensity)
+            self.channels.append(channels)
+
+    def _fill(self, notes: NoteArrays) -> Tuple[np.ndarray, np.ndarray]:
+        """Full resolution roll, every note at least one column long."""
+        columns = self.ticks_per_column
+        first = notes.start // columns
+        last = np.maximum(-(-notes.end // columns), first + 1)
+        width = max(-(-self.total_ticks // columns), int(last.max()) if len(last) else 0, 1)
+        intensity = np.zeros((NUM_NOTES, width), dtype=np.uint8)
+        channels = np.full((NUM_NOTES, width), NO_CHANNEL, dtype=np.uint8)
+        if not len(notes):
+            return intensity, channels
+        # Quietest first, so where notes share a column the loudest is written last
+        order = np.argsort(notes.intensity, kind="stable")
+        first, last = first[order], last[order]
+        lengths = last - first
+        starts = notes.note[order].astype(np.int64) * width + first
+        # Flat index of every column of every note
+        offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        cells = offsets + np.arange(int(lengths.sum()))
+        intensity.reshape(-1)[cells] = np.repeat(notes.intensity[order], lengths)
+        channels.reshape(-1)[cells] = np.repeat(notes.channel[order], lengths)
+        return intensity, channels
+
+    @staticmethod
+    def _halve(intensity: np.ndarray, channels: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Next level: each column the louder of a pair, with its channel."""
+        if intensity.shape[1] % 2:
+            intensity = np.pad(intensity, ((0, 0), (0, 1)))
+            channels = np.pad(channels, ((0, 0), (0, 1)), constant_values=NO_CHANNEL)
+        left, right = intensity[:, 0::2], intensity[:, 1::2]
+        louder = right > left
+        return (
+            np.where(louder, right, left),
+            np.where(louder, channels[:, 1::2], channels[:, 0::2]),
+        )
+
+    @property
+    def width(self) -> int:
+        """Columns at full resolution."""
+        return self.intensity[0].shape[1]
+
+    def level_for(self, ticks_per_pixel: float) -> int:
+        """
+        Return the coarsest level with no more ticks per column than a pixel shows.
+
+        :param ticks_per_pixel: float ticks each pixel of the view covers.
+        :return: int level, 0 for full resolution
+        """
+        if ticks_per_pixel <= self.ticks_per_column:
+            return 0
+        level = int(math.log2(ticks_per_pixel / self.ticks_per_column))
+        return min(level, len(self.intensity) - 1)
+
+    def view(self, start_tick: int, end_tick: int, width: int) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        Return the columns covering a range of ticks, at about width columns.
+
+        The arrays are views of a level, nothing is copied.
+
+        :param start_tick: int first tick of the view.
+        :param end_tick: int tick after the view.
+        :param width: int pixels across the view.
+        :return: (intensity, channels, ticks per column), arrays of 128 rows by key
+        """
+        level = self.level_for((end_tick - start_tick) / max(width, 1))
+        ticks_per_column = self.ticks_per_column << level
+        first = max(start_tick // ticks_per_column, 0)
+        last = -(-end_tick // ticks_per_column)
+        return (
+            self.intensity[level][:, first:last],
+            self.channels[level][:, first:last],
+            ticks_per_column,
+        )
+
+    def layers(self, level: int = 0) -> np.ndarray:
+        """
+        Return a level as one intensity layer per channel.
+
+        :param level: int level.
+        :return: uint8 array of 16 channels by 128 keys by columns
+        """
+        channels = self.channels[level]
+        intensity = self.intensity[level]
+        return np.stack(
+            [np.where(channels == channel, intensity, 0) for channel in range(NUM_CHANNELS)]
+        )
+
+
+_ROLL_CACHE: "weakref.WeakKeyDictionary[mido.MidiFile, Dict[int, Tuple[Tuple, PianoRoll]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def piano_roll(midi_file: mido.MidiFile, columns_per_beat: int = DEFAULT_COLUMNS_PER_BEAT) -> PianoRoll:
+    """
+    Return the piano roll of a MIDI file, built once per file.
+
+    The roll is rebuilt when messages are added to or removed from the file.
+    It is kept for as long as the file is.
+
+    :param midi_file: mido.MidiFile
+    :param columns_per_beat: int columns per beat at full resolution.
+    :return: PianoRoll
+    """
+    rolls = _ROLL_CACHE.setdefault(midi_file, {})
+    current = fingerprint(midi_file)
+    cached = rolls.get(columns_per_beat)
+    if cached is not None and cached[0] == current:
+        return cached[1]
+    roll = PianoRoll(event_index(midi_file).notes(), columns_per_beat)
+    rolls[columns_per_beat] = (current, roll)
+    return roll
@@ -0,0 +1,201 @@
+"""
+Bulk Data Fetch
+===============
+
+This module provides the `BulkFetcher` class, which requests a snapshot of the
+JD-Xi's temporary areas (program, tones, partials, drum kit) as a set of RQ1
+address ranges.
+
+Requests are deduplicated: a range already queued or in flight is not sent again,
+even when two snapshots overlap, for instance when a program change and a control
+change both ask for a refresh. At most `window` requests are in flight at once,
+on the bulk output lane, and each is correlated with its DT1 reply by the
+`RequestCorrelator`. When every range of a snapshot has been answered or has timed
+out, a single `snapshot_complete` signal is emitted with the per-request latency,
+so a view can refresh once rather than once per reply.
+
+Classes:
+    - BulkSnapshot: Result of a bulk fetch.
+    - BulkFetcher: Sends RQ1 requests through an in-flight window.
+
+Functions:
+    - parse_request(request) -> (address, size)
+
+Usage Example:
+    >>> fetcher = BulkFetcher(midi_helper.request_correlator)
+    >>> fetcher.snapshot_complete.connect(lambda snapshot: print(snapshot.latency))
+    >>> fetcher.fetch(["F0 41 10 00 00 00 0E 11 18 00 00 00 00 00 00 40 26 F7"])
+"""
+
+import logging
+import time
+from collections import deque
+from concurrent.futures import CancelledError, Future
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple, Union
+
+from PySide6.QtCore import QObject, Signal
+
+from jdxi_editor.midi.data.constants.sysex import RQ1_COMMAND_11
+from jdxi_editor.midi.io.correlator import RequestCorrelator, RequestResponse
+from jdxi_editor.midi.io.output_scheduler import OutputLane
+from jdxi_editor.midi.utils.byte import address_to_offset
+
+DEFAULT_WINDOW = 4
+
+AddressRange = Tuple[Tuple[int, ...], int]
+Request = Union[str, bytes, AddressRange]
+
+
+@lru_cache(maxsize=None)
+def _parse_rq1(message: bytes) -> AddressRange:
+    """Address and size of an RQ1 frame."""
+    if len(message) != 18 or message[7] != RQ1_COMMAND_11:
+        raise ValueError(f"Not an RQ1 request: {message.hex(' ').upper()}")
+    return tuple(message[8:12]), address_to_offset(message[12:16])
+
+
+@lru_cache(maxsize=None)
+def _parse_rq1_hex(message: str) -> AddressRange:
+    """Address and size of an RQ1 frame given as a hex string."""
+    return _parse_rq1(bytes.fromhex(message))
+
+
+def parse_request(request: Request) -> AddressRange:
+    """
+    Return the (address, size) range of a request.
+
+    :param request: An RQ1 frame as a hex string or bytes, or an (address, size) tuple.
+    :return: Tuple of the 4-byte address and the size in bytes
+    """
+    if isinstance(request, str):
+        return _parse_rq1_hex(request)
+    if isinstance(request, (bytes, bytearray)):
+        return _parse_rq1(bytes(request))
+    address, size = request
+    return tuple(address), size
+
+
+@dataclass(frozen=True)
+class BulkSnapshot:
+    """Result of a bulk fetch."""
+
+    responses: Dict[AddressRange, RequestResponse]
+    latency: Dict[AddressRange, float]
+    failed: List[AddressRange]
+    elapsed: float
+
+    @property
+    def complete(self) -> bool:
+        """True if every range was answered."""
+        return not self.failed
+
+
+@dataclass
+class _BulkJob:
+    """A snapshot waiting for its ranges."""
+
+    ranges: List[AddressRange]
+    started_at: float
+    future: Future = field(default_factory=Future)
+    responses: Dict[AddressRange, RequestResponse] = field(default_factory=dict)
+    failed: List[AddressRange] = field(default_factory=list)
+
+    @property
+    def done(self) -> bool:
+        return len(self.responses) + len(self.failed) == len(self.ranges)
+
+
+class BulkFetcher(QObject):
+    """Fetches sets of address ranges with deduplication and an in-flight window."""
+
+    snapshot_complete = Signal(object)  # BulkSnapshot
+    _request_done = Signal(object, object)  # address range, Future
+
+    def __init__(
+        self, correlator: RequestCorrelator, window: int = DEFAULT_WINDOW, parent=None
+    ):
+        """
+        Initialize the fetcher.
+
+        :param correlator: RequestCorrelator sending the requests.
+        :param window: int maximum number of requests in flight.
+        :param parent: Optional parent QObject.
+        """
+        super().__init__(parent)
+        self.correlator = correlator
+        self.window = max(1, window)
+        self._queue = deque()
+        self._in_flight = set()
+        self._waiters: Dict[AddressRange, List[_BulkJob]] = {}
+        # Correlator futures complete on the MIDI input thread; hop back to ours.
+        self._request_done.connect(self._on_request_done)
+
+    def fetch(self, requests: Iterable[Request]) -> Future:
+        """
+        Fetch a snapshot of address ranges. Call from the GUI thread.
+
+        :param requests: RQ1 frames as hex strings or bytes, or (address, size) tuples.
+        :return: Future resolving to a BulkSnapshot
+        """
+        ranges = list(dict.fromkeys(parse_request(request) for request in requests))
+        job = _BulkJob(ranges=ranges, started_at=time.monotonic())
+        if not ranges:
+            self._finish(job)
+            return job.future
+        for address_range in ranges:
+            if address_range not in self._waiters:
+                self._waiters[address_range] = []
+                self._queue.append(address_range)
+            self._waiters[address_range].append(job)
+        self._pump()
+        return job.future
+
+    @property
+    def pending(self) -> int:
+        """Number of ranges queued or in flight."""
+        return len(self._waiters)
+
+    def _pump(self) -> None:
+        """Send queued requests while the window has room."""
+        while self._queue and len(self._in_flight) < self.window:
+            address_range = self._queue.popleft()
+            self._in_flight.add(address_range)
+            address, size = address_range
+            request = self.correlator.request(address, size, lane=OutputLane.BULK)
+            request.add_done_callback(
+                lambda future, key=address_range: self._request_done.emit(key, future)
+            )
+
+    def _on_request_done(self, address_range: AddressRange, request: Future) -> None:
+        """Record a reply or failure for every snapshot waiting on the range."""
+        self._in_flight.discard(address_range)
+        try:
+            response = request.result()
+        except (TimeoutError, CancelledError) as ex:
+            logging.warning(f"Bulk request {address_range} failed: {ex!r}")
+            response = None
+        for job in self._waiters.pop(address_range, []):
+            if response is None:
+                job.failed.append(address_range)
+            else:
+                job.responses[address_range] = response
+            if job.done:
+                self._finish(job)
+        self._pump()
+
+    def _finish(self, job: _BulkJob) -> None:
+        """Publish a completed snapshot."""
+        snapshot = BulkSnapshot(
+            responses=dict(job.responses),
+            latency={key: response.latency for key, response in job.responses.items()},
+            failed=list(job.failed),
+            elapsed=time.monotonic() - job.started_at,
+        )
+        logging.info(
+            f"Bulk snapshot of {len(job.ranges)} ranges in {snapshot.elapsed * 1000:.1f} ms, "
+            f"{len(snapshot.failed)} failed"
+        )
+        job.future.set_result(snapshot)
+        self.snapshot_complete.emit(snapshot)
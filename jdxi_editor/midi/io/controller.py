@@ -11,9 +11,12 @@ Features:
 - Open and close MIDI input and output ports by name or index.
 - Check the status of open MIDI ports.
 - Set a callback for incoming MIDI messages.
+- Accept injected ports, such as the JD-Xi emulator, in place of rtmidi ports.
+- Keep a shadow copy of the JD-Xi temporary areas (`shadow_memory`).
+- Record latency histograms of the input and output paths (`latency_monitor`).
 
 Dependencies:
-- `rtmidi` for MIDI communication.
+- `rtmidi` for MIDI communication, imported only when no ports are injected.
 - `PyQt6.QtCore` for QObject-based structure.
 
 Example Usage:
@@ -26,19 +29,35 @@ Example Usage:
 import logging
 from typing import Optional, List, Tuple
 
-import rtmidi
 from PySide6.QtCore import QObject
 
+from jdxi_editor.midi.io.latency import LatencyMonitor
+from jdxi_editor.midi.sysex.memory import ShadowMemory
+
 
 class MidiIOController(QObject):
     """Helper class for MIDI communication with the JD-Xi"""
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, midi_in=None, midi_out=None):
+        """
+        Initialize the controller.
+
+        :param parent: Optional parent object.
+        :param midi_in: Optional input port with the rtmidi MidiIn interface, such as an
+            EmulatedMidiIn; an rtmidi MidiIn by default.
+        :param midi_out: Optional output port with the rtmidi MidiOut interface.
+        """
         super().__init__(parent)
-        self.midi_in = rtmidi.MidiIn()
-        self.midi_out = rtmidi.MidiOut()
+        if midi_in is None or midi_out is None:
+            # Imported here so injected ports work without the rtmidi backend
+            import rtmidi
+        self.midi_in = midi_in if midi_in is not None else rtmidi.MidiIn()
+        self.midi_out = midi_out if midi_out is not None else rtmidi.MidiOut()
         self.input_port_number: Optional[int] = None
         self.output_port_number: Optional[int] = None
+        # Device state, written by incoming DT1 frames and outgoing edits
+        self.shadow_memory = ShadowMemory()
+        self.latency_monitor = LatencyMonitor()
 
     @property
     def current_in_port(self) -> Optional[str]:
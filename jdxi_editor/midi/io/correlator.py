@@ -0,0 +1,278 @@
+"""
+RQ1 Request Correlator
+======================
+
+This module provides the `RequestCorrelator` class, which matches RQ1 data requests
+sent to the JD-Xi with the DT1 replies that answer them, without blocking.
+
+`request` sends an RQ1 frame and returns a `concurrent.futures.Future`. The input
+handler feeds every incoming SysEx frame to `feed`, on the rtmidi thread, and the
+future whose address range is covered by the reply is resolved with a
+`RequestResponse`. Requests that are not answered in time are re-sent up to
+`retries` times and then fail with `TimeoutError`. Any number of requests may be in
+flight; concurrent requests for the same address share one future.
+
+Front ends:
+    - concurrent.futures: `request(...)` returns a Future.
+    - Qt: `response_received` and `request_failed` signals, delivered on the GUI thread.
+    - asyncio: `await correlator.request_async(...)`.
+
+Classes:
+    - RequestResponse: Data returned for a request.
+    - CorrelatorStats: Snapshot of the correlator counters.
+    - RequestCorrelator: Sends RQ1 requests and resolves them from DT1 replies.
+
+Usage Example:
+    >>> correlator = RequestCorrelator(midi_helper.send_raw_message)
+    >>> future = correlator.request([0x19, 0x01, 0x00, 0x2E])
+    >>> future.add_done_callback(lambda f: print(f.result().data))
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from jdxi_editor.midi.data.constants.sysex import DT1_COMMAND_12
+from jdxi_editor.midi.io.output_scheduler import OutputLane
+from jdxi_editor.midi.message.template import render_request
+from jdxi_editor.midi.utils.byte import address_to_offset
+
+DEFAULT_TIMEOUT = 0.5  # seconds per attempt
+DEFAULT_RETRIES = 2
+TIMEOUT_CHECK_INTERVAL_MS = 10
+DT1_MIN_LENGTH = 14  # header, command, address, checksum and F7
+
+
+@dataclass(frozen=True)
+class RequestResponse:
+    """Data returned by the JD-Xi for an RQ1 request."""
+
+    address: Tuple[int, ...]
+    data: bytes
+    latency: float
+    attempts: int
+
+
+@dataclass(frozen=True)
+class CorrelatorStats:
+    """Counters for the request correlator."""
+
+    requested: int
+    resolved: int
+    retried: int
+    timed_out: int
+    in_flight: int
+
+
+@dataclass
+class _PendingRequest:
+    """An RQ1 request waiting for its reply."""
+
+    address: Tuple[int, ...]
+    size: int
+    offset: int
+    message: bytes
+    lane: Optional[OutputLane]
+    timeout: float
+    retries: int
+    future: Future = field(default_factory=Future)
+    first_sent_at: float = 0.0
+    deadline: float = 0.0
+    attempts: int = 0
+
+
+class RequestCorrelator(QObject):
+    """Correlates RQ1 requests with DT1 replies, with timeouts and retries."""
+
+    response_received = Signal(object)  # RequestResponse
+    request_failed = Signal(list, str)  # address, reason
+
+    def __init__(
+        self,
+        send: Callable[[List[int], Optional[OutputLane]], bool],
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        parent=None,
+    ):
+        """
+        Initialize the correlator.
+
+        :param send: Callable sending a message on an output lane.
+        :param timeout: float seconds to wait for each attempt.
+        :param retries: int number of times an unanswered request is re-sent.
+        :param parent: Optional parent QObject.
+        """
+        super().__init__(parent)
+        self.send = send
+        self.timeout = timeout
+        self.retries = retries
+        self._pending: Dict[Tuple[Tuple[int, ...], int], _PendingRequest] = {}
+        self._lock = threading.Lock()
+        self._timer = QTimer(self)
+        self._timer.setInterval(TIMEOUT_CHECK_INTERVAL_MS)
+        self._timer.timeout.connect(self._check_timeouts)
+        self.requested = 0
+        self.resolved = 0
+        self.retried = 0
+        self.timed_out = 0
+
+    def request(
+        self,
+        address: Sequence[int],
+        size: int = 1,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+        lane: Optional[OutputLane] = OutputLane.INTERACTIVE,
+    ) -> Future:
+        """
+        Send an RQ1 request. Call from the GUI thread.
+
+        :param address: The 4-byte start address.
+        :param size: int number of bytes requested.
+        :param timeout: float seconds per attempt, defaults to self.timeout.
+        :param retries: int re-sends before failing, defaults to self.retries.
+        :param lane: OutputLane to send the request on.
+        :return: Future resolving to a RequestResponse, or raising TimeoutError.
+        """
+        address = tuple(address)
+        key = (address, size)
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                return pending.future
+            pending = _PendingRequest(
+                address=address,
+                size=size,
+                offset=address_to_offset(address),
+                message=render_request(address, size),
+                lane=lane,
+                timeout=self.timeout if timeout is None else timeout,
+                retries=self.retries if retries is None else retries,
+            )
+            self._pending[key] = pending
+            self.requested += 1
+        pending.first_sent_at = time.monotonic()
+        self._send(pending)
+        if not self._timer.isActive():
+            self._timer.start()
+        return pending.future
+
+    async def request_async(
+        self,
+        address: Sequence[int],
+        size: int = 1,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+        lane: Optional[OutputLane] = OutputLane.INTERACTIVE,
+    ) -> RequestResponse:
+        """
+        Send an RQ1 request and await its reply.
+
+        :return: RequestResponse
+        :raises TimeoutError: if the request was not answered.
+        """
+        return await asyncio.wrap_future(
+            self.request(address, size, timeout, retries, lane)
+        )
+
+    def feed(self, sysex_data: bytes) -> bool:
+        """
+        Resolve the requests answered by an incoming SysEx frame. Thread safe.
+
+        :param sysex_data: The SysEx message bytes, including F0 and F7.
+        :return: True if the frame answered at least one request.
+        """
+        if not self._pending:
+            return False
+        if len(sysex_data) < DT1_MIN_LENGTH or sysex_data[7] != DT1_COMMAND_12:
+            return False
+        reply_offset = address_to_offset(sysex_data[8:12])
+        data = bytes(sysex_data[12:-2])
+        reply_end = reply_offset + len(data)
+        with self._lock:
+            answered = [
+                (key, pending)
+                for key, pending in self._pending.items()
+                if reply_offset <= pending.offset
+                and pending.offset + pending.size <= reply_end
+            ]
+            for key, _ in answered:
+                del self._pending[key]
+            self.resolved += len(answered)
+        now = time.monotonic()
+        for _, pending in answered:
+            start = pending.offset - reply_offset
+            response = RequestResponse(
+                address=pending.address,
+                data=data[start:start + pending.size],
+                latency=now - pending.first_sent_at,
+                attempts=pending.attempts,
+            )
+            pending.future.set_result(response)
+            self.response_received.emit(response)
+        return bool(answered)
+
+    def cancel_all(self) -> int:
+        """
+        Cancel every outstanding request.
+
+        :return: int number of requests cancelled
+        """
+        with self._lock:
+            pending, self._pending = list(self._pending.values()), {}
+        for request in pending:
+            request.future.cancel()
+        self._timer.stop()
+        return len(pending)
+
+    def stats(self) -> CorrelatorStats:
+        """Return a snapshot of the correlator counters."""
+        return CorrelatorStats(
+            requested=self.requested,
+            resolved=self.resolved,
+            retried=self.retried,
+            timed_out=self.timed_out,
+            in_flight=len(self._pending),
+        )
+
+    def _send(self, pending: _PendingRequest) -> None:
+        """Send, or re-send, a request and arm its deadline."""
+        pending.attempts += 1
+        pending.deadline = time.monotonic() + pending.timeout
+        if not self.send(list(pending.message), pending.lane):
+            logging.warning(f"Could not send RQ1 request for {pending.address}")
+
+    def _check_timeouts(self) -> None:
+        """Re-send or fail requests whose deadline has passed."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                (key, pending)
+                for key, pending in self._pending.items()
+                if pending.deadline <= now
+            ]
+            failed = []
+            for key, pending in expired:
+                if pending.attempts > pending.retries:
+                    del self._pending[key]
+                    failed.append(pending)
+            self.timed_out += len(failed)
+            idle = not self._pending
+        for _, pending in expired:
+            if pending in failed:
+                continue
+            self.retried += 1
+            self._send(pending)
+        for pending in failed:
+            reason = f"No reply after {pending.attempts} attempts"
+            logging.warning(f"RQ1 request for {pending.address} timed out: {reason}")
+            pending.future.set_exception(TimeoutError(reason))
+            self.request_failed.emit(list(pending.address), reason)
+        if idle:
+            self._timer.stop()
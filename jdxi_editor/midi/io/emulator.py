@@ -0,0 +1,254 @@
+"""
+JD-Xi Device Emulator
+=====================
+
+This module provides a software stand-in for a Roland JD-Xi, exposed as a pair of
+ports with the subset of the rtmidi `MidiIn` / `MidiOut` interface used by
+`MidiIOController`. It allows the whole MIDI input and output pipeline to run, and
+to be benchmarked, without the hardware or an ALSA/CoreMIDI backend.
+
+The emulator implements:
+    - The Identity Reply to a Universal Identity Request.
+    - DT1 (Data Set 1): data is written to the emulated temporary areas.
+    - RQ1 (Data Request 1): answered with one DT1 frame of the requested size.
+      Sizes are four 7-bit bytes, so `19 70 2E 00` with size `00 00 01 43` returns
+      the 195 bytes of a drum partial.
+    - The DIN link: each direction carries MIDI_BYTES_PER_SECOND bytes per second,
+      and every reply is delayed by a fixed processing latency.
+
+Classes:
+    - JDXiEmulator: The emulated device and its link.
+    - EmulatedMidiIn: Input port delivering the device's replies.
+    - EmulatedMidiOut: Output port delivering messages to the device.
+
+Usage Example:
+    >>> emulator = JDXiEmulator(latency=0.002)
+    >>> midi_in, midi_out = emulator.create_ports()
+    >>> midi_helper = MidiIOHelper(midi_in=midi_in, midi_out=midi_out)
+    >>> midi_helper.open_ports(EMULATOR_PORT_NAME, EMULATOR_PORT_NAME)
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from jdxi_editor.midi.data.constants.sysex import (
+    DEVICE_ID,
+    DT1_COMMAND_12,
+    END_OF_SYSEX,
+    JD_XI_HEADER_LIST,
+    ROLAND_ID,
+    RQ1_COMMAND_11,
+    START_OF_SYSEX,
+)
+from jdxi_editor.midi.io.output_scheduler import MIDI_BYTES_PER_SECOND
+from jdxi_editor.midi.sysex.memory import JDXI_MEMORY_BLOCKS, ShadowMemory
+from jdxi_editor.midi.utils.byte import address_to_offset, offset_to_address
+
+EMULATOR_PORT_NAME = "JD-Xi Emulator"
+DEFAULT_LATENCY = 0.002  # seconds of processing time per reply
+IDENTITY_REQUEST = (START_OF_SYSEX, 0x7E, 0x7F, 0x06, 0x01, END_OF_SYSEX)
+IDENTITY_REPLY_HEADER = (START_OF_SYSEX, 0x7E, DEVICE_ID, 0x06, 0x02, ROLAND_ID, 0x0E, 0x03, 0x00, 0x00)
+FIRMWARE_VERSION = (0x01, 0x03, 0x00, 0x00)
+RQ1_LENGTH = 18
+
+
+class _Link:
+    """One direction of the emulated DIN link."""
+
+    def __init__(self, bytes_per_second: Optional[float]):
+        self.bytes_per_second = bytes_per_second
+        self.free_at = 0.0
+
+    def arrival(self, size: int, now: float) -> float:
+        """Time at which a message of size bytes sent at now has fully arrived."""
+        start = max(now, self.free_at)
+        if self.bytes_per_second:
+            self.free_at = start + size / self.bytes_per_second
+        else:
+            self.free_at = start
+        return self.free_at
+
+
+class JDXiEmulator:
+    """Emulated JD-Xi answering identity, DT1 and RQ1 messages over a paced link."""
+
+    def __init__(
+        self,
+        latency: float = DEFAULT_LATENCY,
+        bytes_per_second: Optional[float] = MIDI_BYTES_PER_SECOND,
+        memory: Optional[ShadowMemory] = None,
+    ):
+        """
+        Initialize the emulator.
+
+        :param latency: float seconds between receiving a request and replying.
+        :param bytes_per_second: Optional link speed, None for an unpaced link.
+        :param memory: Optional ShadowMemory holding the emulated temporary areas.
+        """
+        self.latency = latency
+        self.memory = memory or ShadowMemory(JDXI_MEMORY_BLOCKS)
+        self.received: List[List[int]] = []
+        self._to_device = _Link(bytes_per_second)
+        self._to_host = _Link(bytes_per_second)
+        self._events: List[Tuple[float, int, Callable[[], None]]] = []
+        self._order = itertools.count()
+        self._condition = threading.Condition()
+        self._callback: Optional[Callable[[Tuple[List[int], float], Any], None]] = None
+        self._callback_data: Any = None
+        self._last_delivery = time.monotonic()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="JDXiEmulator", daemon=True)
+        self._thread.start()
+
+    def create_ports(self) -> Tuple["EmulatedMidiIn", "EmulatedMidiOut"]:
+        """Return an input and an output port connected to the emulator."""
+        return EmulatedMidiIn(self), EmulatedMidiOut(self)
+
+    def close(self) -> None:
+        """Stop the delivery thread."""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        self._thread.join()
+
+    def set_callback(self, callback: Optional[Callable], data: Any = None) -> None:
+        """Set the function receiving the emulator's messages, as rtmidi does."""
+        self._callback = callback
+        self._callback_data = data
+
+    def receive(self, message: Sequence[int]) -> None:
+        """
+        Accept a message from the host. It is processed once it has crossed the link.
+
+        :param message: The MIDI message bytes.
+        """
+        message = list(message)
+        with self._condition:
+            arrival = self._to_device.arrival(len(message), time.monotonic())
+            self._schedule(arrival, lambda: self._process(message))
+
+    def _schedule(self, when: float, action: Callable[[], None]) -> None:
+        """Queue an action; the caller holds the condition."""
+        heapq.heappush(self._events, (when, next(self._order), action))
+        self._condition.notify()
+
+    def _reply(self, message: List[int]) -> None:
+        """Send a message to the host after the processing latency and link delay."""
+        with self._condition:
+            ready = time.monotonic() + self.latency
+            arrival = self._to_host.arrival(len(message), ready)
+            self._schedule(arrival, lambda: self._deliver(message))
+
+    def _deliver(self, message: List[int]) -> None:
+        """Hand a message to the input port callback."""
+        now = time.monotonic()
+        delta, self._last_delivery = now - self._last_delivery, now
+        if self._callback is not None:
+            self._callback((message, delta), self._callback_data)
+
+    def _run(self) -> None:
+        """Run queued actions at their scheduled times."""
+        while True:
+            with self._condition:
+                while self._running and (
+                    not self._events or self._events[0][0] > time.monotonic()
+                ):
+                    timeout = self._events[0][0] - time.monotonic() if self._events else None
+                    self._condition.wait(timeout)
+                if not self._running:
+                    return
+                _, _, action = heapq.heappop(self._events)
+            try:
+                action()
+            except Exception as ex:
+                logging.error(f"JD-Xi emulator error: {ex}")
+
+    def _process(self, message: List[int]) -> None:
+        """Handle a message that has reached the device."""
+        self.received.append(message)
+        if tuple(message) == IDENTITY_REQUEST:
+            self._reply(list(IDENTITY_REPLY_HEADER + FIRMWARE_VERSION) + [END_OF_SYSEX])
+            return
+        if len(message) < 14 or message[:7] != JD_XI_HEADER_LIST:
+            return
+        if -sum(message[8:-1]) & 0x7F:
+            logging.warning("JD-Xi emulator ignored a message with a bad checksum")
+            return
+        command = message[7]
+        if command == DT1_COMMAND_12:
+            self.memory.write(message[8:12], bytes(message[12:-2]), source="host")
+        elif command == RQ1_COMMAND_11 and len(message) == RQ1_LENGTH:
+            self._reply(self.data_set(message[8:12], address_to_offset(message[12:16])))
+
+    def data_set(self, address: Sequence[int], size: int) -> List[int]:
+        """
+        Build the DT1 reply for size bytes starting at address.
+
+        Addresses outside the emulated areas read as zero.
+
+        :param address: The 4-byte start address.
+        :param size: int number of bytes.
+        :return: List of the DT1 message bytes
+        """
+        offset = address_to_offset(address)
+        data = [self.memory.value(offset_to_address(offset + i)) or 0 for i in range(size)]
+        checksum = -sum(list(address) + data) & 0x7F
+        return JD_XI_HEADER_LIST + [DT1_COMMAND_12] + list(address) + data + [checksum, END_OF_SYSEX]
+
+
+class EmulatedMidiIn:
+    """rtmidi-compatible input port receiving from a JDXiEmulator."""
+
+    def __init__(self, emulator: JDXiEmulator):
+        self.emulator = emulator
+        self._open = False
+
+    def get_ports(self) -> List[str]:
+        return [EMULATOR_PORT_NAME]
+
+    def open_port(self, port: int = 0, name: Optional[str] = None) -> None:
+        self._open = True
+
+    def close_port(self) -> None:
+        self._open = False
+
+    def is_port_open(self) -> bool:
+        return self._open
+
+    def set_callback(self, callback: Callable, data: Any = None) -> None:
+        self.emulator.set_callback(callback, data)
+
+    def cancel_callback(self) -> None:
+        self.emulator.set_callback(None)
+
+    def ignore_types(self, sysex: bool = True, timing: bool = True, active_sense: bool = True) -> None:
+        """The emulator sends neither timing nor active sensing; SysEx is always delivered."""
+
+
+class EmulatedMidiOut:
+    """rtmidi-compatible output port sending to a JDXiEmulator."""
+
+    def __init__(self, emulator: JDXiEmulator):
+        self.emulator = emulator
+        self._open = False
+
+    def get_ports(self) -> List[str]:
+        return [EMULATOR_PORT_NAME]
+
+    def open_port(self, port: int = 0, name: Optional[str] = None) -> None:
+        self._open = True
+
+    def close_port(self) -> None:
+        self._open = False
+
+    def is_port_open(self) -> bool:
+        return self._open
+
+    def send_message(self, message: Sequence[int]) -> None:
+        if not self._open:
+            raise OSError("Emulated MIDI output port is not open")
+        self.emulator.receive(message)
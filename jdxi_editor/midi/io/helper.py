@@ -32,13 +32,15 @@ class MidiIOHelper(MidiInHandler, MidiOutHandler):
     signal for convenient handling of SysEx messages.
     """
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, midi_in=None, midi_out=None):
         """
         Initialize the MIDIHelper.
 
         :param parent: Optional parent widget or object.
+        :param midi_in: Optional input port, an rtmidi MidiIn by default.
+        :param midi_out: Optional output port, an rtmidi MidiOut by default.
         """
-        super().__init__(parent)
+        super().__init__(parent, midi_in=midi_in, midi_out=midi_out)
         self.midi_messages = []
         self.parent = parent
 
@@ -60,6 +62,3 @@ class MidiIOHelper(MidiInHandler, MidiOutHandler):
             self.send_raw_message(sysex_list)
         except Exception as ex:
             logging.info(f"Error {ex} sending sysex list")
-
-    def midi_callback(self, event):
-        self.midi_callback(event=event)
@@ -20,42 +20,52 @@ Dependencies:
     - jdxi_manager modules for data handling, parsing, and MIDI processing.
 """
 
-import json
 import logging
+import time
 import mido
-from typing import Any, Callable, Dict, List, Optional
-from PySide6.QtCore import Signal
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+from PySide6.QtCore import QCoreApplication, QMetaMethod, Signal
 from pubsub import pub
 
 from jdxi_editor.midi.data.constants.constants import ROLAND_ID
-from jdxi_editor.midi.data.constants.sysex import DEVICE_ID
+from jdxi_editor.midi.data.constants.sysex import DEVICE_ID, START_OF_SYSEX
 from jdxi_editor.midi.data.presets.digital import DIGITAL_PRESETS_ENUMERATED
 from jdxi_editor.midi.preset.type import SynthType
 from jdxi_editor.midi.io.controller import MidiIOController
+from jdxi_editor.midi.io.latency import LatencyStage, message_type
+from jdxi_editor.midi.sysex.cache import DecodedDumpCache
+from jdxi_editor.midi.sysex.decoder import SysExDecodeWorker
 from jdxi_editor.midi.sysex.device import DeviceInfo
+from jdxi_editor.midi.sysex.parsed import ParsedSysEx
+from jdxi_editor.midi.sysex.router import SysExRouter
 from jdxi_editor.midi.message.sysex import SysexParameter
-from jdxi_editor.midi.utils.json import log_json
-from jdxi_editor.midi.sysex.parsers import parse_sysex
 from jdxi_editor.midi.sysex.utils import get_parameter_from_address
 from jdxi_editor.midi.preset.data import PresetData
 
+# Raw status bytes dispatched by MidiInHandler.midi_callback
+NOTE_OFF = 0x80
+NOTE_ON = 0x90
+CONTROL_CHANGE = 0xB0
+PROGRAM_CHANGE = 0xC0
+TIMING_CLOCK = 0xF8
 
-def _parse_sysex_data(sysex_data: bytes) -> dict:
-    """Parses SysEx data and logs the result."""
-    try:
-        parsed_data = parse_sysex(sysex_data)
-        log_json(parsed_data)
-        return parsed_data
-    except Exception as parse_ex:
-        logging.warning("Failed to parse JD-Xi tone data: %s", parse_ex)
-        return {}
+# Frames longer than this carry tone data rather than a single parameter
+TONE_DATA_MIN_LENGTH = 23
+
+PRESET_BANK_MSB_MAPPING: Dict[int, SynthType] = {
+    95: SynthType.DIGITAL_1,
+    94: SynthType.ANALOG,
+    86: SynthType.DRUMS,
+}
 
 
-def _extract_command_info(message: Any) -> None:
+def _extract_command_info(sysex_data: bytes) -> None:
     """Extracts and logs command type and address offset."""
+    if not logging.getLogger().isEnabledFor(logging.DEBUG):
+        return
     try:
-        command_type = message.data[6]
-        address_offset = "".join(f"{byte:02X}" for byte in message.data[7:11])
+        command_type = sysex_data[7]
+        address_offset = sysex_data[8:12].hex().upper()
         command_name = SysexParameter.get_command_name(command_type)
 
         logging.debug(
@@ -85,21 +95,51 @@ class MidiInHandler(MidiIOController):
     midi_parameter_changed = Signal(object, int)  # Emit parameter and value
     midi_parameter_received = Signal(list, int)  # address, value
     midi_control_changed = Signal(int, int, int)  # channel, control, value
-    midi_sysex_json = Signal(str)  # Signal emitting SysEx data as address JSON string
 
-    def __init__(self, parent: Optional[Any] = None) -> None:
+    def __init__(
+        self, parent: Optional[Any] = None, midi_in: Any = None, midi_out: Any = None
+    ) -> None:
         """
         Initialize the MIDIInHandler.
 
         :param parent: Optional parent widget or object.
+        :param midi_in: Optional input port, an rtmidi MidiIn by default.
+        :param midi_out: Optional output port, an rtmidi MidiOut by default.
         """
-        super().__init__(parent)
+        super().__init__(parent, midi_in=midi_in, midi_out=midi_out)
         self.parent = parent
         self.callbacks: List[Callable] = []
         self.channel: int = 1
         self.preset_number: int = 0
         self.cc_msb_value: int = 0
         self.cc_lsb_value: int = 0
+        self.nrpn_msb: Optional[int] = None
+        self.nrpn_lsb: Optional[int] = None
+        self._incoming_message_signal = QMetaMethod.fromSignal(
+            self.midi_incoming_message
+        )
+        self._status_dispatch = self._build_status_dispatch()
+        self._callback_histograms = tuple(
+            self.latency_monitor.histogram(LatencyStage.CALLBACK, message_type([status]))
+            for status in range(256)
+        )
+        self._type_dispatch: Dict[str, Callable[[Any, PresetData], None]] = {
+            "sysex": self._handle_sysex_message,
+            "control_change": self._handle_control_change,
+            "program_change": self._handle_program_change,
+            "note_on": self._handle_note_change,
+            "note_off": self._handle_note_change,
+            "clock": self._handle_clock,
+        }
+        self.sysex_router = SysExRouter()
+        self.dump_cache = DecodedDumpCache()
+        self.shadow_memory.memory_changed.connect(self.dump_cache.on_memory_changed)
+        self.sysex_decoder = SysExDecodeWorker(cache=self.dump_cache)
+        self.sysex_decoder.frame_decoded.connect(self._on_sysex_frame_decoded)
+        self.sysex_decoder.start()
+        application = QCoreApplication.instance()
+        if application is not None:
+            application.aboutToQuit.connect(self.sysex_decoder.stop)
         self.set_callback(self.midi_callback)
         pub.subscribe(self.pub_handle_incoming_midi_message, "midi_incoming_message")
 
@@ -107,6 +147,26 @@ class MidiInHandler(MidiIOController):
         """Convert an rtmidi message to address mido message."""
         return mido.Message.from_bytes(rtmidi_message)
 
+    def _build_status_dispatch(self) -> tuple:
+        """
+        Build the raw status byte dispatch table used by midi_callback.
+
+        The table is indexed directly by the status byte of the incoming rtmidi
+        message, so dispatch costs one tuple lookup and no allocations.
+
+        :return: tuple of 256 raw handlers
+        """
+        table = [self._handle_raw_unhandled] * 256
+        for status in range(NOTE_OFF, NOTE_ON + 0x10):
+            table[status] = self._handle_raw_note
+        for status in range(CONTROL_CHANGE, CONTROL_CHANGE + 0x10):
+            table[status] = self._handle_raw_control_change
+        for status in range(PROGRAM_CHANGE, PROGRAM_CHANGE + 0x10):
+            table[status] = self._handle_raw_program_change
+        table[START_OF_SYSEX] = self._handle_raw_sysex
+        table[TIMING_CLOCK] = self._handle_raw_clock
+        return tuple(table)
+
     def register_callback(self, callback: Callable) -> None:
         """
         Register address callback function for MIDI messages.
@@ -116,47 +176,31 @@ class MidiInHandler(MidiIOController):
         if callback not in self.callbacks:
             self.callbacks.append(callback)
 
-    def midi_callback(self, event: Callable) -> None:
+    def midi_callback(self, event: Tuple[List[int], float], data: Any = None) -> None:
         """
         Handle incoming MIDI messages and route them to appropriate handlers.
 
-        This method provides an alternative entry point for processing messages.
+        Messages are dispatched on their raw status byte. A mido message is only
+        built when something is connected to midi_incoming_message. The time spent
+        here is added to the latency_monitor's CALLBACK histogram for the status,
+        except for clock messages, which are ignored.
 
-        :param event: The MIDI message.
-        :param timestamp: Optional timestamp for the message.
+        :param event: The rtmidi event, a tuple of (message bytes, delta time).
+        :param data: Optional user data passed by rtmidi.
         """
+        received_at = time.monotonic()
         try:
-            logging.info(f"midi_callback: message preset_type: {type(event)}")
-            if type(event) == tuple:
-                message_data, _ = event
-                message = self.rtmidi_to_mido(message_data)
-                if message.type == "program_change":
-                    logging.info(
-                        "Program Change - Channel: %d, Program: %d",
-                        message.channel,
-                        message.program,
-                    )
-                if message.type != "clock":
-                    self.midi_incoming_message.emit(message)
-                    logging.info(
-                        "MIDI message of preset_type %s incoming: %s",
-                        message.type,
-                        message,
-                    )
-                preset_data = PresetData(modified=0)
-                message_handlers: Dict[str, Callable[[Any, Dict[str, Any]], None]] = {
-                    "sysex": self._handle_sysex_message,
-                    "control_change": self._handle_control_change,
-                    "program_change": self._handle_program_change,
-                    "note_on": self._handle_note_change,
-                    "note_off": self._handle_note_change,
-                    "clock": self._handle_clock,
-                }
-                handler = message_handlers.get(message.type)
-                if handler:
-                    handler(message, preset_data)
-                else:
-                    logging.info("Unhandled MIDI message preset_type: %s", message.type)
+            message_data = event[0]
+            if not message_data:
+                return
+            status = message_data[0]
+            if status != TIMING_CLOCK and self.isSignalConnected(
+                self._incoming_message_signal
+            ):
+                self.midi_incoming_message.emit(self.rtmidi_to_mido(message_data))
+            self._status_dispatch[status](message_data)
+            if status != TIMING_CLOCK:
+                self._callback_histograms[status].add(time.monotonic() - received_at)
         except Exception as exc:
             logging.error("Error handling incoming MIDI message: %s", str(exc))
 
@@ -176,17 +220,8 @@ class MidiInHandler(MidiIOController):
 
         :param message: The incoming MIDI message.
         """
-        # logging.info(f"handle_incoming_midi_message: {message}")
         preset_data = PresetData(modified=0)
-        message_handlers: Dict[str, Callable[[Any, Dict[str, Any]], None]] = {
-            "sysex": self._handle_sysex_message,
-            "control_change": self._handle_control_change,
-            "program_change": self._handle_program_change,
-            "note_on": self._handle_note_change,
-            "note_off": self._handle_note_change,
-            "clock": self._handle_clock,
-        }
-        handler = message_handlers.get(message.type)
+        handler = self._type_dispatch.get(message.type)
         try:
             if handler:
                 handler(message, preset_data)
@@ -195,6 +230,56 @@ class MidiInHandler(MidiIOController):
         except Exception as exc:
             logging.error("Error handling incoming MIDI message: %s", str(exc))
 
+    def _handle_raw_note(self, message_data: List[int]) -> None:
+        """
+        Handle raw Note On and Note Off messages.
+
+        Notes are only of interest to midi_incoming_message subscribers.
+
+        :param message_data: The raw MIDI message bytes.
+        """
+
+    def _handle_raw_clock(self, message_data: List[int]) -> None:
+        """
+        Handle raw MIDI Clock messages quietly.
+
+        :param message_data: The raw MIDI message bytes.
+        """
+
+    def _handle_raw_unhandled(self, message_data: List[int]) -> None:
+        """
+        Handle raw messages without a dedicated handler.
+
+        :param message_data: The raw MIDI message bytes.
+        """
+        logging.debug("Unhandled MIDI status byte: 0x%02X", message_data[0])
+
+    def _handle_raw_control_change(self, message_data: List[int]) -> None:
+        """
+        Handle raw Control Change messages.
+
+        :param message_data: The raw MIDI message bytes.
+        """
+        self._process_control_change(
+            message_data[0] & 0x0F, message_data[1], message_data[2]
+        )
+
+    def _handle_raw_program_change(self, message_data: List[int]) -> None:
+        """
+        Handle raw Program Change messages.
+
+        :param message_data: The raw MIDI message bytes.
+        """
+        self._process_program_change(message_data[0] & 0x0F, message_data[1])
+
+    def _handle_raw_sysex(self, message_data: List[int]) -> None:
+        """
+        Handle raw SysEx messages.
+
+        :param message_data: The raw MIDI message bytes, including F0 and F7.
+        """
+        self._process_sysex(bytes(message_data))
+
     def _handle_note_change(self, message: Any, preset_data) -> None:
         """
         Handle Note On and Note Off MIDI messages.
@@ -226,48 +311,7 @@ class MidiInHandler(MidiIOController):
         )
         return message_byte_list
 
-    def _handle_sysex_message_new(self, message: Any, preset_data) -> None:
-        """
-        Handle SysEx MIDI messages from the Roland JD-Xi.
-
-        Processes SysEx data, attempts to parse tone data, and extracts command
-        and parameter information for further processing.
-
-        :param message: The MIDI SysEx message.
-        :param preset_data: Dictionary for preset data modifications.
-        """
-        logging.debug(f"handle_incoming_midi_message via pub: {message}")
-
-        try:
-            if not (message.type == 'sysex' and len(message.data) > 6):
-                return
-
-            if message.data[3] == 0x02:  # Identity request
-                self._handle_identity_request(message)
-                return
-
-            hex_string = " ".join(f"{byte:02X}" for byte in message.data)
-            logging.debug("SysEx message received (%d bytes)", len(message.data))
-
-            # Convert SysEx data
-            sysex_message_byte_list = bytes([0xF0] + [int(byte, 16) for byte in hex_string.split()] + [0xF7])
-
-            # Attempt to parse the SysEx data
-            parsed_data = _parse_sysex_data(sysex_message_byte_list)
-
-            if not parsed_data:
-                return
-
-            # Extract and emit tone name if present
-            self._emit_tone_name(parsed_data)
-
-            # Extract command and parameter details
-            _extract_command_info(message)
-
-        except Exception as ex:
-            logging.error(f"Unexpected error {ex} while handling SysEx message")
-
-    def _emit_tone_name(self, parsed_data: dict) -> None:
+    def _emit_tone_name(self, parsed_data: Mapping[str, Any]) -> None:
         """Extracts and emits the tone name if applicable."""
         tone_name = parsed_data.get("TONE_NAME")
 
@@ -295,107 +339,89 @@ class MidiInHandler(MidiIOController):
         """
         Handle SysEx MIDI messages from the Roland JD-Xi.
 
-        Processes SysEx data, attempts to parse tone data, and extracts command
-        and parameter information for further processing.
-
         :param message: The MIDI SysEx message.
         :param preset_data: Dictionary for preset data modifications.
         """
-        logging.debug(f"handle_incoming_midi_message via pub: {message}")
+        self._process_sysex(bytes(message.bin()))
+
+    def _process_sysex(self, sysex_data: bytes) -> None:
+        """
+        Process a complete SysEx frame from the Roland JD-Xi.
+
+        Identity replies are handled immediately; replies to pending RQ1 requests
+        resolve them through request_correlator; all other frames are queued for
+        the SysEx decode worker, which publishes the decoded frames back to
+        _on_sysex_frame_decoded on the GUI thread.
+
+        :param sysex_data: The SysEx message bytes, including F0 and F7.
+        """
         try:
-            if message.type == 'sysex' and len(message.data) > 6 and message.data[3] == 0x02:  # Identity request
-                self._handle_identity_request(message)
-            # Convert raw SysEx data to address hex string
-            hex_string = " ".join(f"{byte:02X}" for byte in message.data)
-            logging.debug("SysEx message received (%d bytes)", len(message.data))
-
-            # Reconstruct SysEx message bytes
-            sysex_message_byte_list = bytes(
-                [0xF0] + [int(byte, 16) for byte in hex_string.split()] + [0xF7]
-            )
+            if len(sysex_data) > 7 and sysex_data[4] == 0x02:  # Identity reply
+                self._handle_identity_request(sysex_data)
+                return
 
-            # If the message contains tone data, attempt to parse it
-            if len(message.data) > 20:
-                try:
-                    parsed_data = parse_sysex(sysex_message_byte_list)
-                    self.midi_sysex_json.emit(json.dumps(parsed_data))
-                    log_json(parsed_data)
-                    tone_name = parsed_data["TONE_NAME"] if parsed_data.get("ADDRESS") in [
-                        "12180000",
-                        "12190100",
-                        "12192100",
-                        "12194200",
-                        "12197000"  # Drums Common
-                    ] else None
-                    if tone_name:
-                        if parsed_data["TEMPORARY_AREA"] == "TEMPORARY_PROGRAM_AREA":
-                            print(f"@@@@@Emitting tone name: {tone_name}")
-                            self.update_program_name.emit(tone_name)
-                        if parsed_data["TEMPORARY_AREA"] == "TEMPORARY_DIGITAL_SYNTH_1_AREA":
-                            print(f"@@@@@Emitting tone name: {tone_name}")
-                            self.update_digital1_tone_name.emit(tone_name)
-                        if parsed_data["TEMPORARY_AREA"] == "TEMPORARY_DIGITAL_SYNTH_2_AREA":
-                            print(f"@@@@@Emitting tone name: {tone_name}")
-                            self.update_digital2_tone_name.emit(tone_name)
-                        if parsed_data["TEMPORARY_AREA"] == "TEMPORARY_ANALOG_SYNTH_AREA":
-                            print(f"@@@@@Emitting tone name: {tone_name}")
-                            self.update_analog_tone_name.emit(tone_name)
-                        if parsed_data["TEMPORARY_AREA"] == "TEMPORARY_DRUM_KIT_AREA":
-                            print(f"@@@@@Emitting drums tone name: {tone_name}")
-                            self.update_drums_tone_name.emit(tone_name)
-                except Exception as parse_ex:
-                    logging.warning("Failed to parse JD-Xi tone data: %s", parse_ex)
-            else:
-                # PROGRAM common data but not to be emitted
-                try:
-                    parsed_data = parse_sysex(sysex_message_byte_list)
-                    log_json(parsed_data)
-                    # Extract TONE_NAME if ADDRESS is "12180000"
-                    tone_name = parsed_data["TONE_NAME"] if parsed_data.get("ADDRESS") == "12180000" else None
-                    if tone_name:
-                        logging.info(f"@@@@@Emitting tone name: {tone_name}")
-                        self.update_program_name.emit(tone_name)
-
-                    # Print the result
-                    print(tone_name)
-                except Exception as parse_ex:
-                    logging.warning("Failed to parse JD-Xi tone data: %s", parse_ex)
-
-            # Extract command preset_type and parameter address
-            try:
-                command_type = message.data[6]
-                address_offset = "".join(f"{byte:02X}" for byte in message.data[7:11])
-                command_name = SysexParameter.get_command_name(command_type)
+            request_correlator = getattr(self, "request_correlator", None)
+            if request_correlator is not None:
+                request_correlator.feed(sysex_data)
+
+            if not self.sysex_decoder.submit(sysex_data):
                 logging.debug(
-                    "Command: %s (0x%02X), Address Offset: %s",
-                    command_name,
-                    command_type,
-                    address_offset,
-                )
-            except Exception as ex:
-                logging.warning(
-                    f"Unable to extract command or parameter address due to {ex}"
+                    "SysEx decode queue full, dropped %d frames so far",
+                    self.sysex_decoder.dropped,
                 )
+            _extract_command_info(sysex_data)
 
         except Exception as ex:
             logging.error(f"Unexpected error {ex} while handling SysEx message")
 
-    def _handle_identity_request(self, message):
-        """Handles an incoming Identity Request and sends an Identity Reply."""
-        byte_list = self.mido_message_data_to_byte_list(message)
-        device_info = DeviceInfo.from_identity_reply(byte_list)
-        if device_info:
-            logging.info(device_info.to_string)
+    def _on_sysex_frame_decoded(self, decoded_frames: List[ParsedSysEx]) -> None:
+        """
+        Route SysEx frames decoded by the worker, once per display frame.
+
+        Every DT1 frame is written to shadow_memory. Tone data is delivered
+        through sysex_router, only to the editors subscribed to the frame's
+        TEMPORARY_AREA, unless dump_cache holds the same bytes as the last frame
+        applied at that address. While a frame is routed its arrival time is the
+        latency_monitor's active origin, so the editors' update schedulers can
+        record when the resulting control updates are applied.
+
+        :param decoded_frames: ParsedSysEx frames decoded since the last frame.
+        """
+        monitor = self.latency_monitor
+        for parsed in decoded_frames:
+            area = parsed.temporary_area
+            monitor.record(LatencyStage.DECODE, area, parsed.received_at, parsed.decoded_at)
+            self.shadow_memory.write_sysex(parsed.raw)
+            # If the message contains tone data, route it
+            if len(parsed.raw) >= TONE_DATA_MIN_LENGTH:
+                if self.dump_cache.is_applied(parsed, self.sysex_router.generation):
+                    continue
+                monitor.active_origin = (area, parsed.received_at)
+                try:
+                    if self.sysex_router.dispatch(parsed):
+                        self.dump_cache.mark_applied(parsed, self.sysex_router.generation)
+                finally:
+                    monitor.active_origin = None
+                monitor.record(LatencyStage.ROUTE, area, parsed.received_at)
+                self._emit_tone_name(parsed.parameters)
+
+    def _handle_identity_request(self, sysex_data: bytes):
+        """Handles an incoming Identity Reply and logs the device details."""
+        device_info = DeviceInfo.from_identity_reply(sysex_data)
+        if not device_info:
+            logging.warning("Invalid identity reply received")
+            return None
+        logging.info(device_info.to_string)
         device_id = device_info.device_id
         manufacturer_id = device_info.manufacturer
-        version = message.data[9:12]  # Extract firmware version bytes
+        version = sysex_data[10:13]  # Extract firmware version bytes
 
         version_str = ".".join(str(byte) for byte in version)
         if device_id == DEVICE_ID:
             device_name = "JD-XI"
         else:
             device_name = "Unknown"
-        if manufacturer_id == ROLAND_ID:
+        if manufacturer_id == [ROLAND_ID]:
             manufacturer_name = "Roland"
         else:
             manufacturer_name = "Unknown"
@@ -408,17 +434,25 @@ class MidiInHandler(MidiIOController):
             "firmware_version": version_str
         }
 
-    def _handle_control_change(self, message: Any, preset_data) -> None: # @@
+    def _handle_control_change(self, message: Any, preset_data) -> None:
         """
         Handle Control Change (CC) MIDI messages.
 
         :param message: The MIDI Control Change message.
         :param preset_data: Dictionary for preset data modifications.
         """
-        channel = message.channel + 1
-        control = message.control
-        value = message.value
-        logging.info(
+        self._process_control_change(message.channel, message.control, message.value)
+
+    def _process_control_change(self, channel: int, control: int, value: int) -> None:
+        """
+        Process a Control Change (CC) message.
+
+        :param channel: 0-based MIDI channel.
+        :param control: Controller number.
+        :param value: Controller value.
+        """
+        channel += 1
+        logging.debug(
             "Control Change - Channel: %d, Control: %d, Value: %d",
             channel,
             control,
@@ -447,28 +481,34 @@ class MidiInHandler(MidiIOController):
         """
         Handle Program Change (PC) MIDI messages.
 
-        Processes program changes and maps them to preset changes based on
-        CC values.
-
         :param message: The MIDI Program Change message.
         :param preset_data: Dictionary for preset data modifications.
         """
-        channel = message.channel + 1
-        program_number = message.program
+        self._process_program_change(message.channel, message.program, preset_data)
+
+    def _process_program_change(
+        self, channel: int, program_number: int, preset_data: Optional[PresetData] = None
+    ) -> None:
+        """
+        Process a Program Change (PC) message.
+
+        Maps program changes to preset changes based on CC values.
+
+        :param channel: 0-based MIDI channel.
+        :param program_number: Program number.
+        :param preset_data: Optional preset data to update with the preset type.
+        """
+        channel += 1
         logging.info(
             "Program Change - Channel: %d, Program: %d", channel, program_number
         )
 
         self.midi_program_changed.emit(channel, program_number)
 
-        preset_mapping: Dict[int, SynthType] = {
-            95: SynthType.DIGITAL_1,
-            94: SynthType.ANALOG,
-            86: SynthType.DRUMS,
-        }
-
-        if self.cc_msb_value in preset_mapping:
-            preset_data.type = preset_mapping[self.cc_msb_value]
+        preset_type = PRESET_BANK_MSB_MAPPING.get(self.cc_msb_value)
+        if preset_type is not None:
+            if preset_data is not None:
+                preset_data.type = preset_type
             # Adjust preset number based on LSB value
             self.preset_number = program_number + (
                 128 if self.cc_lsb_value == 65 else 0
@@ -494,12 +534,12 @@ class MidiInHandler(MidiIOController):
 
         :param data: List of integers representing the DT1 message data.
         """
-        if len(data) < 4:
+        if len(data) < 5:
             return
 
-        # Extract address (first three bytes) and value (fourth byte)
-        address = data[:3]
-        value = data[3]
+        # Extract address (first four bytes) and value (fifth byte)
+        address = data[:4]
+        value = data[4]
         logging.debug("Parameter update received: Address=%s, Value=%d", address, value)
 
         # Retrieve the parameter using the address and emit the change signal if found
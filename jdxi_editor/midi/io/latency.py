@@ -0,0 +1,259 @@
+"""
+MIDI Latency Monitor
+====================
+
+This module provides the `LatencyMonitor` class, which records how long MIDI takes
+to travel through the editor, from rtmidi arrival to a control moving on screen and
+from an edit to its bytes being written to the port.
+
+Timestamps are `time.monotonic()` values. Each sample is added to a fixed-size
+histogram per (stage, message type) with power-of-two microsecond buckets, so
+recording costs a subtraction, a `bit_length()` and a few increments, and memory
+does not grow however long the editor runs. Hot paths fetch their histograms once
+with `histogram()` and add to them directly; `reset()` clears histograms in place
+so those references stay valid. Recording is always on; formatting only happens
+when a report is requested, e.g. by the MIDI debugger while it is visible, or
+when the histograms are dumped to a file.
+
+Stages:
+    Incoming, each measured from the frame's arrival unless noted:
+    - CALLBACK: time spent in the rtmidi callback (a duration).
+    - DECODE: SysEx frame decoded by the decode worker.
+    - ROUTE: frame delivered to the subscribed editors on the GUI thread.
+    - UI_APPLY: the resulting control updates applied by the editor.
+    Outgoing, measured from the call to send_raw_message:
+    - ENQUEUE: message validated and queued on the output scheduler.
+    - SEND: message written to the port, after pacing and coalescing.
+
+Classes:
+    - LatencyStage: The instrumented stages.
+    - LatencyHistogram: Fixed-size histogram of latencies.
+    - LatencyMonitor: Histograms per stage and message type.
+
+Functions:
+    - message_type(message) -> str
+
+Usage Example:
+    >>> monitor = LatencyMonitor()
+    >>> start = time.monotonic()
+    >>> monitor.record(LatencyStage.CALLBACK, "control_change", start)
+    >>> print(monitor.report())
+    >>> monitor.dump("latency.json")
+"""
+
+import json
+import logging
+import time
+from enum import IntEnum
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from tabulate import tabulate
+
+from jdxi_editor.midi.data.constants.sysex import (
+    DT1_COMMAND_12,
+    RQ1_COMMAND_11,
+    START_OF_SYSEX,
+)
+
+# Bucket i holds latencies below 2**i microseconds; 64 buckets cover any int
+# microsecond count, so adding a sample needs no range check.
+HISTOGRAM_BUCKETS = 64
+
+# Message type by the high nibble of the status byte
+_CHANNEL_MESSAGE_TYPES = {
+    0x80: "note_off",
+    0x90: "note_on",
+    0xA0: "aftertouch",
+    0xB0: "control_change",
+    0xC0: "program_change",
+    0xD0: "channel_pressure",
+    0xE0: "pitchwheel",
+}
+_SYSEX_COMMAND_TYPES = {DT1_COMMAND_12: "sysex_dt1", RQ1_COMMAND_11: "sysex_rq1"}
+_SYSTEM_MESSAGE_TYPES = {0xF8: "clock", 0xFA: "start", 0xFB: "continue", 0xFC: "stop"}
+
+
+def message_type(message: Sequence[int]) -> str:
+    """
+    Name the type of a raw MIDI message, e.g. "note_on" or "sysex_dt1".
+
+    :param message: The MIDI message bytes.
+    :return: str message type
+    """
+    status = message[0]
+    if status == START_OF_SYSEX:
+        if len(message) > 7:
+            return _SYSEX_COMMAND_TYPES.get(message[7], "sysex")
+        return "sysex"
+    if status < 0xF0:
+        return _CHANNEL_MESSAGE_TYPES.get(status & 0xF0, "other")
+    return _SYSTEM_MESSAGE_TYPES.get(status, "other")
+
+
+class LatencyStage(IntEnum):
+    """Instrumented stages of the MIDI paths, in the order a message meets them."""
+
+    CALLBACK = 0
+    DECODE = 1
+    ROUTE = 2
+    UI_APPLY = 3
+    ENQUEUE = 4
+    SEND = 5
+
+    @property
+    def label(self) -> str:
+        """Name used in reports, e.g. "ui_apply"."""
+        return self.name.lower()
+
+
+class LatencyHistogram:
+    """Fixed-size histogram of latencies with power-of-two microsecond buckets."""
+
+    __slots__ = ("counts", "total", "maximum")
+
+    def __init__(self):
+        self.counts: List[int] = [0] * HISTOGRAM_BUCKETS
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def add(self, seconds: float) -> None:
+        """Add a latency in seconds."""
+        self.counts[int(seconds * 1e6).bit_length()] += 1
+        self.total += seconds
+        if seconds > self.maximum:
+            self.maximum = seconds
+
+    def clear(self) -> None:
+        """Discard every sample."""
+        self.counts[:] = [0] * HISTOGRAM_BUCKETS
+        self.total = 0.0
+        self.maximum = 0.0
+
+    @property
+    def count(self) -> int:
+        """Number of samples."""
+        return sum(self.counts)
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in seconds."""
+        count = self.count
+        return self.total / count if count else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Upper bound of the bucket holding the given fraction of samples.
+
+        :param fraction: float between 0 and 1, e.g. 0.99.
+        :return: float seconds, never more than the largest sample
+        """
+        count = self.count
+        if not count:
+            return 0.0
+        target = fraction * count
+        seen = 0
+        for bucket, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return min(2**bucket / 1e6, self.maximum)
+        return self.maximum
+
+    def to_dict(self) -> dict:
+        """Return the histogram as a JSON-serializable dict."""
+        return {
+            "count": self.count,
+            "mean_us": round(self.mean * 1e6, 1),
+            "max_us": round(self.maximum * 1e6, 1),
+            "buckets": {f"<{2**bucket}us": count for bucket, count in enumerate(self.counts) if count},
+        }
+
+
+class LatencyMonitor:
+    """Latency histograms per stage and message type."""
+
+    def __init__(self):
+        self.histograms: Dict[Tuple[LatencyStage, str], LatencyHistogram] = {}
+        self.started_at = time.monotonic()
+        # Origin of the incoming frame being routed on the GUI thread, if any
+        self.active_origin: Optional[Tuple[str, float]] = None
+
+    def record(
+        self, stage: LatencyStage, kind: str, start: float, end: Optional[float] = None
+    ) -> None:
+        """
+        Record the latency of a stage.
+
+        :param stage: LatencyStage being recorded.
+        :param kind: str message type, see message_type().
+        :param start: time.monotonic() timestamp the latency is measured from.
+        :param end: Optional time.monotonic() timestamp, now by default.
+        """
+        if end is None:
+            end = time.monotonic()
+        histogram = self.histograms.get((stage, kind))
+        if histogram is None:
+            histogram = self.histogram(stage, kind)
+        histogram.add(end - start)
+
+    def histogram(self, stage: LatencyStage, kind: str) -> LatencyHistogram:
+        """
+        Return the histogram of a stage and message type, creating it if needed.
+
+        The histogram lives as long as the monitor, so hot paths can keep it.
+
+        :param stage: LatencyStage.
+        :param kind: str message type.
+        :return: LatencyHistogram
+        """
+        return self.histograms.setdefault((stage, kind), LatencyHistogram())
+
+    def reset(self) -> None:
+        """Discard every sample, keeping the histograms."""
+        for histogram in list(self.histograms.values()):
+            histogram.clear()
+        self.started_at = time.monotonic()
+
+    def rows(self) -> List[list]:
+        """Summary rows, in stage order: stage, type, count, mean, p50, p99 and max in us."""
+        rows = []
+        for (stage, kind), histogram in sorted(list(self.histograms.items())):
+            if not histogram.count:
+                continue
+            rows.append(
+                [
+                    stage.label,
+                    kind,
+                    histogram.count,
+                    round(histogram.mean * 1e6, 1),
+                    round(histogram.percentile(0.5) * 1e6, 1),
+                    round(histogram.percentile(0.99) * 1e6, 1),
+                    round(histogram.maximum * 1e6, 1),
+                ]
+            )
+        return rows
+
+    def report(self) -> str:
+        """Return the summary as a text table."""
+        return tabulate(
+            self.rows(),
+            headers=["Stage", "Type", "Count", "Mean us", "p50 us", "p99 us", "Max us"],
+        )
+
+    def to_dict(self) -> dict:
+        """Return every histogram as a JSON-serializable dict."""
+        stages: Dict[str, Dict[str, dict]] = {}
+        for (stage, kind), histogram in list(self.histograms.items()):
+            if not histogram.count:
+                continue
+            stages.setdefault(stage.label, {})[kind] = histogram.to_dict()
+        return {"duration_s": round(time.monotonic() - self.started_at, 3), "stages": stages}
+
+    def dump(self, path: Union[str, Path]) -> None:
+        """
+        Write the histograms to a JSON file.
+
+        :param path: str or Path of the file to write.
+        """
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2) + "\n")
+        logging.info(f"Latency histograms written to {path}")
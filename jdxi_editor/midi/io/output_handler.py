@@ -5,6 +5,13 @@ MIDI Output Handler
 This module provides the `MIDIOutHandler` class for managing MIDI output, allowing users to send
 note-on, note-off, and control change messages through address specified MIDI output port.
 
+Messages are not written to the port directly: they are queued on the
+`MidiOutputScheduler`, which prioritises notes over parameter edits over bulk
+transfers, coalesces DT1 writes per address and paces sends to the MIDI link.
+Parameter reads are RQ1 requests correlated with their DT1 replies by the
+`RequestCorrelator`, and return futures rather than blocking; snapshots of whole
+areas are fetched through the `BulkFetcher`.
+
 Dependencies:
     - rtmidi: A library for working with MIDI messages and ports.
 
@@ -19,25 +26,25 @@ Example usage:
 
 import logging
 import time
+from concurrent.futures import CancelledError, Future
 from typing import List, Optional
 
-from rtmidi.midiconstants import NOTE_ON, NOTE_OFF
+from PySide6.QtCore import QCoreApplication
 
-from jdxi_editor.midi.data.constants.sysex import (
-    ROLAND_ID,
-    DEVICE_ID,
-    RQ1_COMMAND_11,
-    END_OF_SYSEX,
-)
+from jdxi_editor.midi.io.bulk import BulkFetcher
 from jdxi_editor.midi.io.controller import MidiIOController
+from jdxi_editor.midi.io.correlator import RequestCorrelator
+from jdxi_editor.midi.io.latency import LatencyStage, message_type
+from jdxi_editor.midi.io.output_scheduler import MidiOutputScheduler, OutputLane
 from jdxi_editor.midi.message.identity_request import IdentityRequestMessage
 from jdxi_editor.midi.message.midi import MidiMessage
 from jdxi_editor.midi.message.program_change import ProgramChangeMessage
 from jdxi_editor.midi.message.control_change import ControlChangeMessage
 from jdxi_editor.midi.message.channel import ChannelMessage
-from jdxi_editor.midi.message.roland import RolandSysEx
-from jdxi_editor.midi.message.sysex import SysExMessage
-from jdxi_editor.midi.utils.byte import split_value_to_nibbles
+from jdxi_editor.midi.message.template import render_parameter
+
+NOTE_OFF = 0x80
+NOTE_ON = 0x90
 
 
 def format_midi_message_to_hex_string(message):
@@ -62,21 +69,39 @@ def increment_group(group, param):
 class MidiOutHandler(MidiIOController):
     """Helper class for MIDI communication with the JD-Xi."""
 
-    def __init__(self, parent=None):
-        super().__init__(parent)
+    def __init__(self, parent=None, midi_in=None, midi_out=None):
+        super().__init__(parent, midi_in=midi_in, midi_out=midi_out)
         self.parent = parent
         self.channel = 1
-
-    def send_raw_message(self, message: List[int]) -> bool:
+        self.output_scheduler = MidiOutputScheduler(
+            self._write_to_port, latency_monitor=self.latency_monitor
+        )
+        self.output_scheduler.start()
+        application = QCoreApplication.instance()
+        if application is not None:
+            application.aboutToQuit.connect(self.output_scheduler.stop)
+        self.request_correlator = RequestCorrelator(self.send_raw_message)
+        self.bulk_fetcher = BulkFetcher(self.request_correlator)
+
+    def _write_to_port(self, message: List[int]) -> None:
+        """Write a message to the output port, called by the output scheduler."""
+        self.midi_out.send_message(message)
+
+    def send_raw_message(
+        self, message: List[int], lane: Optional[OutputLane] = None
+    ) -> bool:
         """
         Send a raw MIDI message with validation.
 
         Args:
             message: List of integer values representing the MIDI message.
+            lane: Output lane, by default notes for channel messages, interactive
+                for DT1 and bulk for RQ1 messages.
 
         Returns:
-            True if the message was sent successfully, False otherwise.
+            True if the message was queued for sending, False otherwise.
         """
+        called_at = time.monotonic()
         logging.info(f"attempting to send message: {type(message)} {message}")
         try:
             if not message:
@@ -96,16 +121,16 @@ class MidiOutHandler(MidiIOController):
             logging.info("MIDI output port is not open.")
             return False
 
-        try:
-            logging.info(
-                f"Validation passed, sending MIDI message: "
-                f"{type(formatted_message)} {formatted_message}"
-            )
-            self.midi_out.send_message(message)
-            return True
-        except (ValueError, TypeError, OSError, IOError) as ex:
-            logging.info(f"Error sending MIDI message: {ex}")
+        logging.info(
+            f"Validation passed, queueing MIDI message: "
+            f"{type(formatted_message)} {formatted_message}"
+        )
+        if not self.output_scheduler.submit(message, lane):
+            logging.info(f"MIDI output queue full, dropped: {formatted_message}")
             return False
+        self.latency_monitor.record(LatencyStage.ENQUEUE, message_type(message), called_at)
+        self.shadow_memory.write_sysex(message, source="editor")
+        return True
 
     def send_note_on(self, note: int = 60, velocity: int = 127, channel: int = 1):
         """Send address 'Note On' message."""
@@ -208,7 +233,7 @@ class MidiOutHandler(MidiIOController):
         self, area: int, part: int, group: int, param: int, value: int, size: int = 1
     ) -> bool:
         """
-        Send address parameter change message using RolandSysEx.
+        Send address parameter change message using a precompiled SysEx template.
 
         Args:
             area: Parameter area (e.g., Program, Digital Synth).
@@ -224,19 +249,15 @@ class MidiOutHandler(MidiIOController):
             f"send_parameter: \tarea={hex(area)}, \tpart={hex(part)}, \tgroup={hex(group)}, "
             f"\tparam={hex(param)}, \tvalue={value}, \tsize={size}"
         )
+        if size not in (1, 4, 5):
+            logging.error(f"Unsupported parameter size: {size}")
+            return False
         try:
             group = increment_group(group, param)
-            address = construct_address(area, group, param, part)
-            if size == 1:
-                data_bytes = [value & 0x7F]  # Single byte format (0-127)
-            elif size in [4, 5]:
-                data_bytes = split_value_to_nibbles(value, size)  # Convert to nibbles
-            else:
-                logging.error(f"Unsupported parameter size: {size}")
-                return False
-            sysex_message = RolandSysEx()
-            message = sysex_message.construct_sysex(address, *data_bytes)
-            return self.send_raw_message(message)
+            area, part, group, param = construct_address(area, group, param, part)
+            # Single byte values are sent as 0-127, 4 and 5 byte values as nibbles
+            message = render_parameter(area, part, group, param, value, size)
+            return self.send_raw_message(list(message))
 
         except (ValueError, TypeError, OSError, IOError) as ex:
             logging.error(f"Error sending parameter: {ex}")
@@ -378,58 +399,43 @@ class MidiOutHandler(MidiIOController):
             logging.info(f"Error {ex} occurred sending bank and program change message")
 
     def get_parameter(
-        self, area: int, part: int, group: int, param: int
-    ) -> Optional[int]:
+        self, area: int, part: int, group: int, param: int, size: int = 1
+    ) -> Future:
         """
-        Get parameter value via MIDI System Exclusive message.
+        Request a parameter value via an RQ1 System Exclusive message.
+
+        The request is correlated with the JD-Xi's DT1 reply by
+        request_correlator, so this returns immediately.
 
         Args:
             area: Parameter area (e.g., Digital Synth 1).
             part: Part number.
             group: Parameter area.
             param: Parameter number.
+            size: Number of bytes requested.
         Returns:
-            Parameter value (0-127) or None if an error occurs.
+            Future resolving to the first data byte (0-127), or to None if the
+            ports are closed or the request timed out.
         """
         logging.info(
             f"Requesting parameter: area={area}, part={part}, "
             f"group={group}, param={param}"
         )
-
+        result = Future()
         if not self.midi_out.is_port_open() or not self.midi_in.is_port_open():
             logging.error("MIDI ports not open")
-            return None
-
-        try:
-            # Construct SysEx request using SysExMessage
-            request = SysExMessage(
-                manufacturer_id=[ROLAND_ID],
-                device_id=DEVICE_ID,
-                model_id=[0x00, 0x00, 0x3B, 0x00],  # Example model ID
-                command=RQ1_COMMAND_11,  # RQ1 (Request Data) command for Roland
-                address=[area, part, group, param],  # Address of parameter
-                data=[],  # No payload for request
-            )
-
-            self.midi_out.send_raw_message(request.to_bytes())
-
-            # Wait for response with a timeout of 100ms.
-            start_time = time.time()
-            while time.time() - start_time < 0.1:
-                message = self.midi_in.get_message()
-                if message:
-                    msg, _ = message
-                    if len(msg) >= 11 and msg[0] == 0xF0 and msg[-1] == END_OF_SYSEX:
-                        # Parse response
-                        response = SysExMessage.from_bytes(bytes(msg))
-                        # Extract parameter value
-                        return response.data[0] if response.data else None
-
-                time.sleep(0.001)
-
-            logging.warning("Timeout waiting for parameter response")
-            raise TimeoutError
-
-        except (TimeoutError, OSError, IOError) as ex:
-            logging.error(f"Error getting parameter: {ex}")
-            return None
+            result.set_result(None)
+            return result
+
+        def _resolve(request: Future) -> None:
+            try:
+                response = request.result()
+                result.set_result(response.data[0] if response.data else None)
+            except (TimeoutError, CancelledError) as ex:
+                logging.error(f"Error getting parameter: {ex!r}")
+                result.set_result(None)
+
+        self.request_correlator.request([area, part, group, param], size).add_done_callback(
+            _resolve
+        )
+        return result
@@ -0,0 +1,278 @@
+"""
+MIDI Output Scheduler
+=====================
+
+This module provides the `MidiOutputScheduler` class, which sits behind
+`MidiOutHandler` and paces outgoing MIDI to the bandwidth of the JD-Xi's
+31.25 kbaud MIDI link instead of writing every message to the port as soon as it
+is produced.
+
+Messages are queued on one of three priority lanes:
+
+- NOTES: channel messages (notes, control and program changes), always sent first
+  and never coalesced.
+- INTERACTIVE: DT1 parameter edits from the editors. Writes to the same 4-byte
+  address are coalesced, the last value wins, so a slider drag sends only the
+  values the link has time for.
+- BULK: RQ1 data requests and bulk DT1 transfers, sent only when the other lanes
+  are idle. Identical requests are merged.
+
+A DT1 write replaces any pending write to the same address on either SysEx lane,
+so a late bulk value never overwrites a newer interactive edit.
+
+With a `LatencyMonitor`, the time from a message being queued to it being written
+to the port is recorded as the SEND stage. A coalesced write keeps the time of
+the first write it replaced, so the latency shows how stale the edit had become.
+
+Classes:
+    - OutputLane: Priority lanes, highest first.
+    - OutputStats: Snapshot of the scheduler counters.
+    - MidiOutputScheduler: QThread pacing queued messages onto the port.
+
+Usage Example:
+    >>> scheduler = MidiOutputScheduler(midi_out.send_message)
+    >>> scheduler.start()
+    >>> scheduler.submit([0x90, 60, 100])
+    >>> scheduler.stats()
+    OutputStats(submitted=1, sent=1, merged=0, dropped=0, ...)
+"""
+
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Callable, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple
+
+from PySide6.QtCore import QThread
+
+from jdxi_editor.midi.data.constants.sysex import (
+    DT1_COMMAND_12,
+    RQ1_COMMAND_11,
+    START_OF_SYSEX,
+)
+from jdxi_editor.midi.io.latency import LatencyMonitor, LatencyStage, message_type
+
+MIDI_BAUD_RATE = 31250
+BITS_PER_BYTE = 10  # start bit, 8 data bits, stop bit
+MIDI_BYTES_PER_SECOND = MIDI_BAUD_RATE / BITS_PER_BYTE
+DEFAULT_LANE_CAPACITY = 1024
+SYSEX_COMMAND_INDEX = 7
+SYSEX_ADDRESS_SLICE = slice(8, 12)
+
+
+class OutputLane(IntEnum):
+    """Output priority lanes, lower values are sent first."""
+
+    NOTES = 0
+    INTERACTIVE = 1
+    BULK = 2
+
+
+@dataclass(frozen=True)
+class OutputStats:
+    """Counters for the MIDI output scheduler."""
+
+    submitted: int
+    sent: int
+    merged: int
+    dropped: int
+    failed: int
+    bytes_sent: int
+    queue_depth: Mapping[str, int]
+    high_water_mark: int
+
+
+def classify_message(message: Sequence[int]) -> OutputLane:
+    """
+    Pick the default lane for a message.
+
+    :param message: The MIDI message bytes.
+    :return: OutputLane
+    """
+    if message[0] != START_OF_SYSEX:
+        return OutputLane.NOTES
+    if len(message) > SYSEX_COMMAND_INDEX and message[SYSEX_COMMAND_INDEX] == RQ1_COMMAND_11:
+        return OutputLane.BULK
+    return OutputLane.INTERACTIVE
+
+
+class MidiOutputScheduler(QThread):
+    """Paces queued MIDI messages onto the output port by priority lane."""
+
+    def __init__(
+        self,
+        send: Callable[[List[int]], None],
+        bytes_per_second: Optional[float] = MIDI_BYTES_PER_SECOND,
+        capacity: int = DEFAULT_LANE_CAPACITY,
+        latency_monitor: Optional[LatencyMonitor] = None,
+        parent=None,
+    ):
+        """
+        Initialize the scheduler.
+
+        :param send: Callable writing a message to the MIDI port.
+        :param bytes_per_second: Link bandwidth to pace to, None disables pacing.
+        :param capacity: int maximum number of messages queued per lane.
+        :param latency_monitor: Optional LatencyMonitor recording the SEND stage.
+        :param parent: Optional parent QObject.
+        """
+        super().__init__(parent)
+        self.send = send
+        self.bytes_per_second = bytes_per_second
+        self.capacity = capacity
+        self.latency_monitor = latency_monitor
+        # Each lane maps a coalescing key to the message and the time it was queued
+        self._lanes: Dict[OutputLane, "OrderedDict[Hashable, Tuple[List[int], float]]"] = {
+            lane: OrderedDict() for lane in OutputLane
+        }
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._running = False
+        self._link_free_at = 0.0
+        self.submitted = 0
+        self.sent = 0
+        self.merged = 0
+        self.dropped = 0
+        self.failed = 0
+        self.bytes_sent = 0
+        self.high_water_mark = 0
+
+    def _key(self, message: List[int], lane: OutputLane) -> Hashable:
+        """Coalescing key: the address for DT1, the message for RQ1, else unique."""
+        if lane != OutputLane.NOTES and len(message) > 12 and message[0] == START_OF_SYSEX:
+            command = message[SYSEX_COMMAND_INDEX]
+            if command == DT1_COMMAND_12:
+                return bytes(message[SYSEX_ADDRESS_SLICE])
+            if command == RQ1_COMMAND_11:
+                return bytes(message)
+        return next(self._sequence)
+
+    def submit(self, message: List[int], lane: Optional[OutputLane] = None) -> bool:
+        """
+        Queue a message for sending.
+
+        :param message: The MIDI message bytes.
+        :param lane: OutputLane, defaults to classify_message(message).
+        :return: False if the lane is full and the message was dropped.
+
+        If the scheduler thread is not running the message is sent immediately.
+        """
+        if lane is None:
+            lane = classify_message(message)
+        key = self._key(message, lane)
+        queued_at = time.monotonic()
+        with self._condition:
+            queue = self._lanes[lane]
+            if key in queue:
+                # Last write wins and keeps its place in the lane
+                self.merged += 1
+                queued_at = queue[key][1]
+            else:
+                if len(queue) >= self.capacity:
+                    self.dropped += 1
+                    return False
+                other = self._lanes[
+                    OutputLane.BULK if lane == OutputLane.INTERACTIVE else OutputLane.INTERACTIVE
+                ]
+                if isinstance(key, bytes) and key in other:
+                    queued_at = other.pop(key)[1]
+                    self.merged += 1
+            queue[key] = (list(message), queued_at)
+            self.submitted += 1
+            depth = sum(len(pending) for pending in self._lanes.values())
+            self.high_water_mark = max(self.high_water_mark, depth)
+            self._condition.notify()
+            running = self._running
+        if not running:
+            self.flush()  # not started, or stopped at shutdown: send unpaced
+        return True
+
+    def stats(self) -> OutputStats:
+        """Return a snapshot of the scheduler counters."""
+        with self._condition:
+            queue_depth = {lane.name: len(self._lanes[lane]) for lane in OutputLane}
+        return OutputStats(
+            submitted=self.submitted,
+            sent=self.sent,
+            merged=self.merged,
+            dropped=self.dropped,
+            failed=self.failed,
+            bytes_sent=self.bytes_sent,
+            queue_depth=queue_depth,
+            high_water_mark=self.high_water_mark,
+        )
+
+    def start(self, *args, **kwargs) -> None:
+        """Start the scheduler thread."""
+        self._running = True
+        super().start(*args, **kwargs)
+
+    def stop(self, timeout_ms: int = 1000) -> None:
+        """Stop the scheduler thread; anything still queued is sent unpaced."""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self.isRunning():
+            self.wait(timeout_ms)
+        self.flush()
+
+    def flush(self) -> int:
+        """
+        Send every queued message now, in lane order, without pacing.
+
+        :return: int number of messages sent
+        """
+        count = 0
+        while True:
+            with self._condition:
+                entry = self._pop_next()
+            if entry is None:
+                return count
+            self._write(*entry)
+            count += 1
+
+    def run(self) -> None:
+        """Send queued messages, highest lane first, no faster than the link."""
+        while True:
+            with self._condition:
+                while self._running and not any(self._lanes.values()):
+                    self._condition.wait()
+                if not self._running:
+                    return
+                delay = self._link_free_at - time.monotonic()
+                if delay > 0:
+                    # Keep coalescing while the link is busy
+                    self._condition.wait(delay)
+                    continue
+                entry = self._pop_next()
+            if entry is not None:
+                self._write(*entry)
+
+    def _pop_next(self) -> Optional[Tuple[List[int], float]]:
+        """Pop the oldest message, and its queue time, of the highest priority non-empty lane."""
+        for lane in OutputLane:
+            queue = self._lanes[lane]
+            if queue:
+                return queue.popitem(last=False)[1]
+        return None
+
+    def _write(self, message: List[int], queued_at: float) -> None:
+        """Write a message to the port and book its time on the link."""
+        try:
+            self.send(message)
+        except Exception as ex:
+            self.failed += 1
+            logging.info(f"Error sending MIDI message: {ex}")
+            return
+        self.sent += 1
+        self.bytes_sent += len(message)
+        now = time.monotonic()
+        if self.latency_monitor is not None:
+            self.latency_monitor.record(LatencyStage.SEND, message_type(message), queued_at, now)
+        if self.bytes_per_second:
+            self._link_free_at = (
+                max(now, self._link_free_at) + len(message) / self.bytes_per_second
+            )
@@ -0,0 +1,344 @@
+"""
+MIDI File Playback
+==================
+
+This module provides the `MidiFilePlayer` class, which plays a MIDI file to the
+JD-Xi on its own high priority thread, so the editor stays responsive for the
+whole song.
+
+The file is first compiled into a `PlaybackSchedule`: the channel messages of
+every track in time order, each with its time in seconds from the start of the
+song, taken from the file's `MidiEventIndex`. Playback then only compares
+the schedule with `time.perf_counter`. Every event is due at a fixed offset from
+the moment playback started, rather than a sleep after the previous event, so a
+late wake-up does not push back the rest of the song: the late event is sent at
+once and the next one keeps its deadline.
+
+Transport:
+    - start / stop: play from, or pause at, the current position. Stopping and
+      locating release the notes still sounding, always from the playback thread.
+    - locate: move the position, playing or stopped.
+    - set_loop: repeat a range of the song, to the end of the song by default.
+    - set_muted_channels: note-ons on muted channels are skipped and the notes
+      already sounding on them are released. Other channel messages are still
+      sent, so controllers are right when the channel is unmuted.
+
+Position updates are emitted at most once per `position_interval`, so the UI is
+redrawn at a steady rate however dense the song is.
+
+Classes:
+    - PlaybackSchedule: Channel messages of a MIDI file at absolute times.
+    - MidiFilePlayer: QThread playing a schedule against a monotonic clock.
+
+Usage Example:
+    >>> player = MidiFilePlayer(midi_helper.send_raw_message)
+    >>> player.load(MidiFile("song.mid"))
+    >>> player.position_changed.connect(editor.on_position_changed)
+    >>> player.set_loop(8.0, 16.0)
+    >>> player.start()
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Callable, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+import mido
+from PySide6.QtCore import QThread, Signal
+
+from jdxi_editor.midi.file.index import DEFAULT_TEMPO, event_index
+
+DEFAULT_POSITION_INTERVAL = 1 / 30
+# Deadlines closer than this are met by yielding instead of a timed wait,
+# whose wake-up can be a scheduler tick late
+SPIN_SECONDS = 0.002
+
+NOTE_OFF = 0x80
+NOTE_ON = 0x90
+
+
+@dataclass(frozen=True)
+class PlaybackSchedule:
+    """Channel messages of a MIDI file, with their times in seconds."""
+
+    times: List[float] = field(default_factory=list)
+    messages: List[List[int]] = field(default_factory=list)
+    channels: List[int] = field(default_factory=list)
+    duration: float = 0.0
+    # (seconds, beats, tempo) at the start of the song and at each tempo change
+    tempo_map: List[Tuple[float, float, int]] = field(
+        default_factory=lambda: [(0.0, 0.0, DEFAULT_TEMPO)]
+    )
+
+    @classmethod
+    def from_midi_file(cls, midi_file: mido.MidiFile) -> "PlaybackSchedule":
+        """
+        Compile a MIDI file into a schedule.
+
+        :param midi_file: mido.MidiFile to play.
+        :return: PlaybackSchedule
+        """
+        index = event_index(midi_file)
+        seconds, channels, messages = index.channel_messages()
+        tempo_map = [
+            (start, tick / index.ticks_per_beat, tempo)
+            for tick, start, tempo in index.tempo_map.tolist()
+        ]
+        return cls(seconds.tolist(), messages, channels.tolist(), index.duration, tempo_map)
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def index_at(self, seconds: float) -> int:
+        """Return the index of the first event at or after a time."""
+        return bisect_left(self.times, seconds)
+
+    def beats_at(self, seconds: float) -> float:
+        """
+        Convert a time in the song to beats, following the tempo changes.
+
+        :param seconds: float seconds from the start of the song.
+        :return: float beats from the start of the song
+        """
+        start, beats, tempo = self.tempo_map[
+            max(bisect_right(self.tempo_map, (seconds, float("inf"))) - 1, 0)
+        ]
+        return beats + (seconds - start) * 1e6 / tempo
+
+
+class MidiFilePlayer(QThread):
+    """Plays a PlaybackSchedule on a high priority thread."""
+
+    position_changed = Signal(float)
+    playback_finished = Signal()
+
+    def __init__(
+        self,
+        send: Callable[[List[int]], object],
+        position_interval: float = DEFAULT_POSITION_INTERVAL,
+        parent=None,
+    ):
+        """
+        Initialize the player.
+
+        :param send: Callable sending a MIDI message, e.g. MidiIOHelper.send_raw_message.
+        :param position_interval: float minimum seconds between position updates.
+        :param parent: Optional parent QObject.
+        """
+        super().__init__(parent)
+        self.send = send
+        self.position_interval = position_interval
+        self.midi_file: Optional[mido.MidiFile] = None
+        self.schedule = PlaybackSchedule()
+        self._condition = threading.Condition()
+        self._playing = False
+        self._position = 0.0
+        self._anchor = 0.0  # clock time of the start of the song while playing
+        self._locate_to: Optional[float] = None
+        self._loop: Optional[Tuple[float, Optional[float]]] = None
+        self._muted: FrozenSet[int] = frozenset()
+        self._release_channels: Set[int] = set()
+        self._sounding: Set[Tuple[int, int]] = set()
+        self.sent = 0
+        self.failed = 0
+        self.max_lateness = 0.0
+
+    def load(self, midi_file: mido.MidiFile) -> None:
+        """
+        Stop, and compile a MIDI file to play from the start.
+
+        :param midi_file: mido.MidiFile to play.
+        """
+        self.stop()
+        self.midi_file = midi_file
+        self.schedule = PlaybackSchedule.from_midi_file(midi_file)
+        self.max_lateness = 0.0
+        self.locate(0.0)
+
+    @property
+    def playing(self) -> bool:
+        """True while the song is playing."""
+        return self._playing
+
+    def position(self) -> float:
+        """Return the current position in seconds."""
+        with self._condition:
+            if self._playing:
+                return time.perf_counter() - self._anchor
+            return self._position
+
+    def start(self, priority=QThread.Priority.TimeCriticalPriority) -> None:
+        """Play from the current position."""
+        with self._condition:
+            if self._playing:
+                return
+            if self._position >= self.schedule.duration:
+                self._position = 0.0
+            self._playing = True
+        if self.isRunning():
+            self.wait()  # finishing the previous playback
+        super().start(priority)
+
+    def stop(self, timeout_ms: int = 1000) -> None:
+        """Stop playing, keeping the position. The thread releases the sounding notes."""
+        with self._condition:
+            if self._playing:
+                self._position = time.perf_counter() - self._anchor
+                self._playing = False
+                self._condition.notify()
+        if self.isRunning() and not self.wait(timeout_ms):
+            logging.warning("Playback thread did not stop in time, its notes are released when it does")
+
+    def locate(self, seconds: float) -> None:
+        """
+        Move the position, releasing the sounding notes.
+
+        :param seconds: float seconds from the start of the song.
+        """
+        seconds = min(max(seconds, 0.0), self.schedule.duration)
+        with self._condition:
+            if self._playing:
+                self._locate_to = seconds
+                self._condition.notify()
+                return
+            self._position = seconds
+        self.position_changed.emit(seconds)
+
+    def set_loop(self, start: float = 0.0, end: Optional[float] = None) -> None:
+        """
+        Repeat a range of the song until the loop is cleared.
+
+        :param start: float loop start in seconds.
+        :param end: Optional float loop end in seconds, the end of the song if None.
+        """
+        if end is not None and end <= start:
+            raise ValueError(f"Loop end {end} must be after its start {start}")
+        with self._condition:
+            self._loop = (start, end)
+            self._condition.notify()
+
+    def clear_loop(self) -> None:
+        """Play on past the loop end."""
+        with self._condition:
+            self._loop = None
+            self._condition.notify()
+
+    def set_muted_channels(self, channels: Iterable[int]) -> None:
+        """
+        Mute channels, releasing the notes sounding on newly muted ones.
+
+        :param channels: 0-based MIDI channels to mute.
+        """
+        muted = frozenset(channels)
+        with self._condition:
+            if self._playing:
+                self._release_channels |= muted - self._muted
+                self._condition.notify()
+            self._muted = muted
+
+    def run(self) -> None:
+        """Send each event when it is due, until stopped or the song ends."""
+        schedule = self.schedule
+        times, messages, channels = schedule.times, schedule.messages, schedule.channels
+        with self._condition:
+            self._anchor = time.perf_counter() - self._position
+            index = schedule.index_at(self._position)
+        next_update = 0.0
+        while True:
+            with self._condition:
+                if not self._playing:
+                    break
+                if self._locate_to is not None:
+                    self._anchor = time.perf_counter() - self._locate_to
+                    index = schedule.index_at(self._locate_to)
+                    self._locate_to = None
+                    self._release_notes()
+                    next_update = 0.0
+                release, self._release_channels = self._release_channels, set()
+                muted = self._muted
+                loop = self._loop
+                anchor = self._anchor
+            if release:
+                self._release_notes(release)
+            end = schedule.duration
+            if loop is not None and loop[1] is not None:
+                end = min(loop[1], end)
+            now = time.perf_counter()
+            position = now - anchor
+            while index < len(times) and times[index] <= position and times[index] < end:
+                self.max_lateness = max(self.max_lateness, position - times[index])
+                self._dispatch(messages[index], channels[index], muted)
+                index += 1
+            if now >= next_update:
+                self.position_changed.emit(min(position, schedule.duration))
+                next_update = now + self.position_interval
+            if position >= end and (index >= len(times) or times[index] >= end):
+                if loop is not None and loop[0] < end:
+                    with self._condition:
+                        # Keep the anchor continuous, so looping does not drift either
+                        self._anchor += end - loop[0]
+                    index = schedule.index_at(loop[0])
+                    self._release_notes()
+                    continue
+                self._finish()
+                return
+            deadline = min(
+                anchor + (times[index] if index < len(times) else end),
+                anchor + end,
+                next_update,
+            )
+            self._wait_until(deadline)
+        # Released here rather than in stop(), which may give up waiting for the thread
+        self._release_notes()
+
+    def _wait_until(self, deadline: float) -> None:
+        """Wait for a clock time, or until the transport changes."""
+        delay = deadline - time.perf_counter()
+        if delay > SPIN_SECONDS:
+            with self._condition:
+                if self._playing and self._locate_to is None and not self._release_channels:
+                    self._condition.wait(delay - SPIN_SECONDS)
+        elif delay > 0:
+            time.sleep(0)
+
+    def _finish(self) -> None:
+        """Release the notes at the end of the song and rewind."""
+        self._release_notes()
+        with self._condition:
+            self._playing = False
+            self._position = 0.0
+        self.position_changed.emit(self.schedule.duration)
+        self.playback_finished.emit()
+
+    def _dispatch(self, message: List[int], channel: int, muted: FrozenSet[int]) -> None:
+        """Send a scheduled message, keeping track of the sounding notes."""
+        status = message[0] & 0xF0
+        if status == NOTE_ON and message[2] > 0:
+            if channel in muted:
+                return
+            self._sounding.add((channel, message[1]))
+        elif status == NOTE_OFF or status == NOTE_ON:
+            if (channel, message[1]) not in self._sounding and channel in muted:
+                return
+            self._sounding.discard((channel, message[1]))
+        self._send(message)
+
+    def _release_notes(self, channels: Optional[Iterable[int]] = None) -> None:
+        """Send note-offs for the sounding notes, on some channels or all."""
+        channels = None if channels is None else set(channels)
+        for channel, note in sorted(self._sounding):
+            if channels is None or channel in channels:
+                self._sounding.discard((channel, note))
+                self._send([NOTE_OFF | channel, note, 0])
+
+    def _send(self, message: List[int]) -> None:
+        """Send a message, counting failures instead of stopping playback."""
+        try:
+            self.send(message)
+        except Exception as ex:
+            self.failed += 1
+            logging.info(f"Error sending MIDI message during playback: {ex}")
+            return
+        self.sent += 1
@@ -0,0 +1,273 @@
+"""
+Step Sequencer Clock
+====================
+
+This module provides the `StepSequencer` class, which plays a step pattern to
+the JD-Xi on its own high priority thread, so the pattern keeps time however
+busy the editor is.
+
+Step times come from a grid: the clock time at which the current tempo took
+effect plus a whole number of steps, all in floating point seconds of
+`time.perf_counter`. Nothing is rounded to milliseconds and nothing
+accumulates from one step to the next, so the pattern does not drift. A tempo
+change re-anchors the grid at the next step not yet scheduled, so it takes
+effect in the middle of a pattern without a gap or a jump. Swing delays every
+other step by a fraction of a step.
+
+Each pass of the clock schedules the steps due within `lookahead` seconds into
+a queue of timed messages, and sends every message in the queue as it falls due,
+waking up shortly before the deadline and yielding until it passes. Changes to
+the pattern, tempo and swing are picked up from the next step scheduled.
+
+Messages go straight to the MIDI output from the clock thread. The UI follows
+asynchronously, from `step_changed`, emitted as each step sounds.
+
+Classes:
+    - StepSequencer: QThread playing a step pattern against a monotonic clock.
+
+Usage Example:
+    >>> sequencer = StepSequencer(midi_helper.send_raw_message)
+    >>> sequencer.set_steps([[(9, 36, 100)], [], [(9, 38, 100)], []])
+    >>> sequencer.set_tempo(128)
+    >>> sequencer.set_swing(0.2)
+    >>> sequencer.step_changed.connect(editor.on_step_changed)
+    >>> sequencer.start()
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Callable, FrozenSet, Iterable, List, Sequence, Set, Tuple
+
+from PySide6.QtCore import QThread, Signal
+
+from jdxi_editor.midi.io.playback import NOTE_OFF, NOTE_ON, SPIN_SECONDS
+
+DEFAULT_BPM = 120.0
+DEFAULT_STEPS_PER_BEAT = 4  # 16th notes
+DEFAULT_LOOKAHEAD = 0.005
+DEFAULT_NOTE_LENGTH = 0.1
+MAX_SWING = 0.5
+
+# (channel, note, velocity)
+StepNote = Tuple[int, int, int]
+
+
+class StepSequencer(QThread):
+    """Plays a step pattern on a high priority thread."""
+
+    step_changed = Signal(int)
+
+    def __init__(
+        self,
+        send: Callable[[List[int]], object],
+        steps_per_beat: int = DEFAULT_STEPS_PER_BEAT,
+        lookahead: float = DEFAULT_LOOKAHEAD,
+        note_length: float = DEFAULT_NOTE_LENGTH,
+        parent=None,
+    ):
+        """
+        Initialize the sequencer.
+
+        :param send: Callable sending a MIDI message, e.g. MidiIOHelper.send_raw_message.
+        :param steps_per_beat: int steps in a beat.
+        :param lookahead: float seconds ahead of the clock that steps are scheduled.
+        :param note_length: float seconds each note sounds, at most until the next step.
+        :param parent: Optional parent QObject.
+        """
+        super().__init__(parent)
+        self.send = send
+        self.steps_per_beat = steps_per_beat
+        self.lookahead = lookahead
+        self.note_length = note_length
+        self._condition = threading.Condition()
+        self._playing = False
+        self._steps: Tuple[Tuple[StepNote, ...], ...] = ()
+        self._bpm = DEFAULT_BPM
+        self._swing = 0.0
+        self._muted: FrozenSet[int] = frozenset()
+        self._start_step = 0
+        self._current_step = 0
+        # (clock time, order, message or None to mark the start of a step, step)
+        self._queue: List[Tuple[float, int, List[int], int]] = []
+        self._sounding: Set[Tuple[int, int]] = set()
+        self.sent = 0
+        self.failed = 0
+        self.max_lateness = 0.0
+
+    @property
+    def playing(self) -> bool:
+        """True while the pattern is playing."""
+        return self._playing
+
+    @property
+    def current_step(self) -> int:
+        """The step sounding last, or to be played first when stopped."""
+        return self._current_step
+
+    @property
+    def bpm(self) -> float:
+        """Tempo in beats per minute."""
+        return self._bpm
+
+    def step_seconds(self) -> float:
+        """Return the length of a step in seconds at the current tempo."""
+        return 60.0 / (self._bpm * self.steps_per_beat)
+
+    def set_steps(self, steps: Sequence[Iterable[StepNote]]) -> None:
+        """
+        Set the pattern, from the next step scheduled.
+
+        :param steps: the (channel, note, velocity) notes of each step.
+        """
+        pattern = tuple(tuple(notes) for notes in steps)
+        with self._condition:
+            self._steps = pattern
+
+    def set_tempo(self, bpm: float) -> None:
+        """
+        Set the tempo, from the next step scheduled.
+
+        :param bpm: float beats per minute.
+        """
+        if bpm <= 0:
+            raise ValueError(f"Tempo must be positive, not {bpm}")
+        with self._condition:
+            self._bpm = float(bpm)
+            self._condition.notify()
+
+    def set_swing(self, swing: float) -> None:
+        """
+        Delay every other step, from the next step scheduled.
+
+        :param swing: float fraction of a step, 0 for straight time. 1/3 gives triplets.
+        """
+        if not 0.0 <= swing < MAX_SWING:
+            raise ValueError(f"Swing must be from 0 to below {MAX_SWING}, not {swing}")
+        with self._condition:
+            self._swing = swing
+
+    def set_muted_channels(self, channels: Iterable[int]) -> None:
+        """
+        Mute channels, from the next step scheduled.
+
+        :param channels: 0-based MIDI channels to mute.
+        """
+        with self._condition:
+            self._muted = frozenset(channels)
+
+    def locate(self, step: int) -> None:
+        """
+        Set the step to play first, when stopped.
+
+        :param step: int step of the pattern.
+        """
+        with self._condition:
+            if not self._playing:
+                self._start_step = step
+                self._current_step = step
+
+    def start(self, priority=QThread.Priority.TimeCriticalPriority) -> None:
+        """Play the pattern from the located step."""
+        with self._condition:
+            if self._playing:
+                return
+            self._playing = True
+        if self.isRunning():
+            self.wait()  # finishing the previous playback
+        super().start(priority)
+
+    def stop(self, timeout_ms: int = 1000) -> None:
+        """Stop playing. The clock thread releases the sounding notes."""
+        with self._condition:
+            self._playing = False
+            self._start_step = 0
+            self._condition.notify()
+        if self.isRunning() and not self.wait(timeout_ms):
+            logging.warning("Sequencer thread did not stop in time, its notes are released when it does")
+
+    def run(self) -> None:
+        """Schedule the steps ahead of the clock and send them as they fall due."""
+        queue = self._queue
+        order = itertools.count()
+        with self._condition:
+            step = self._start_step
+            bpm = self._bpm
+        # The grid: step `anchor_step` starts at clock time `anchor`
+        anchor, anchor_step = time.perf_counter(), step
+        while True:
+            with self._condition:
+                if not self._playing:
+                    break
+                steps, swing, muted = self._steps, self._swing, self._muted
+                if self._bpm != bpm:
+                    anchor += (step - anchor_step) * 60.0 / (bpm * self.steps_per_beat)
+                    anchor_step, bpm = step, self._bpm
+            step_seconds = 60.0 / (bpm * self.steps_per_beat)
+            now = time.perf_counter()
+            next_grid = anchor + (step - anchor_step) * step_seconds
+            while next_grid <= now + self.lookahead:
+                position = step % len(steps) if steps else 0
+                at = next_grid + (swing * step_seconds if position % 2 else 0.0)
+                heapq.heappush(queue, (at, next(order), None, position))
+                # Released before the next step, however it is swung
+                length = min(self.note_length, step_seconds * (1.0 - swing))
+                for channel, note, velocity in steps[position] if steps else ():
+                    if channel in muted:
+                        continue
+                    heapq.heappush(queue, (at, next(order), [NOTE_ON | channel, note, velocity], position))
+                    heapq.heappush(queue, (at + length, next(order), [NOTE_OFF | channel, note, 0], position))
+                step += 1
+                next_grid = anchor + (step - anchor_step) * step_seconds
+            while queue and queue[0][0] <= time.perf_counter():
+                at, _, message, position = heapq.heappop(queue)
+                self.max_lateness = max(self.max_lateness, time.perf_counter() - at)
+                if message is None:
+                    self._current_step = position
+                    self.step_changed.emit(position)
+                else:
+                    self._dispatch(message)
+            deadline = next_grid - self.lookahead
+            if queue:
+                deadline = min(deadline, queue[0][0])
+            self._wait_until(deadline)
+        # Only this thread touches the queue, stop() may give up waiting for it
+        self._release_notes()
+
+    def _wait_until(self, deadline: float) -> None:
+        """Wait for a clock time, or until the tempo changes or playback stops."""
+        delay = deadline - time.perf_counter()
+        if delay > SPIN_SECONDS:
+            with self._condition:
+                if self._playing:
+                    self._condition.wait(delay - SPIN_SECONDS)
+        elif delay > 0:
+            time.sleep(0)
+
+    def _dispatch(self, message: List[int]) -> None:
+        """Send a scheduled message, keeping track of the sounding notes."""
+        key = (message[0] & 0x0F, message[1])
+        if message[0] & 0xF0 == NOTE_ON:
+            self._sounding.add(key)
+        else:
+            self._sounding.discard(key)
+        self._send(message)
+
+    def _release_notes(self) -> None:
+        """Drop the messages not yet sent and release the sounding notes."""
+        self._queue.clear()
+        for channel, note in sorted(self._sounding):
+            self._send([NOTE_OFF | channel, note, 0])
+        self._sounding.clear()
+
+    def _send(self, message: List[int]) -> None:
+        """Send a message, counting failures instead of stopping playback."""
+        try:
+            self.send(message)
+        except Exception as ex:
+            self.failed += 1
+            logging.info(f"Error sending MIDI message from the sequencer: {ex}")
+            return
+        self.sent += 1
@@ -0,0 +1,131 @@
+"""
+SysEx Template Module
+=====================
+
+This module provides precompiled JD-Xi DT1 message templates and RQ1 request frames. A template is built
+once per parameter address (area, part, group, param) and cached. Sending a value
+then only encodes the data bytes and checksum and appends them to the prebuilt
+header and address, instead of constructing a `RolandSysEx` and re-summing the
+whole message for every slider movement.
+
+The checksum is incremental: the sum of the address bytes is stored with the
+template, so only the data bytes are added per message. Nibble encoding for 4 and
+5 byte values uses `BYTE_TO_NIBBLES`. Values outside the range of the parameter size
+raise ValueError rather than being truncated to a different value.
+
+Classes:
+    - SysExTemplate: Prebuilt DT1 frame for a single parameter address.
+
+Functions:
+    - sysex_template(area, part, group, param, size) -> SysExTemplate
+    - render_parameter(area, part, group, param, value, size) -> bytes
+    - render_request(address, size) -> bytes
+
+Usage Example:
+    >>> render_parameter(0x19, 0x01, 0x20, 0x0C, 64).hex(" ").upper()
+    'F0 41 10 00 00 00 0E 12 19 01 20 0C 40 7A F7'
+"""
+
+from functools import lru_cache
+from typing import Sequence
+
+from jdxi_editor.midi.data.constants.sysex import (
+    DT1_COMMAND_12,
+    END_OF_SYSEX,
+    JD_XI_HEADER_LIST,
+    RQ1_COMMAND_11,
+)
+from jdxi_editor.midi.utils.byte import BYTE_TO_NIBBLES
+
+# Largest value by size in bytes: 7 bits, then 16 and 20 bits sent as nibbles
+MAX_VALUES = {1: 0x7F, 4: 0xFFFF, 5: 0xFFFFF}
+
+
+class SysExTemplate:
+    """Prebuilt JD-Xi DT1 frame, patched with the value and checksum per send."""
+
+    __slots__ = ("address", "size", "_prefix", "_address_sum")
+
+    def __init__(self, address: Sequence[int], size: int = 1):
+        """
+        Build the template.
+
+        :param address: The 4-byte parameter address.
+        :param size: int value size in bytes: 1, 4 or 5.
+        """
+        if len(address) != 4:
+            raise ValueError("Address must be a list of 4 bytes (area, part, group, param).")
+        if size not in MAX_VALUES:
+            raise ValueError(f"Unsupported parameter size: {size}")
+        self.address = tuple(address)
+        self.size = size
+        self._prefix = bytes(JD_XI_HEADER_LIST + [DT1_COMMAND_12] + list(address))
+        self._address_sum = sum(address)
+
+    def render(self, value: int) -> bytes:
+        """
+        Return the complete DT1 frame for value.
+
+        :param value: int parameter value, 0-127 for single byte parameters.
+        :return: bytes SysEx message including F0 and F7
+        :raises ValueError: if the value does not fit the parameter size
+        """
+        if not 0 <= value <= MAX_VALUES[self.size]:
+            raise ValueError(
+                f"Value {value} out of range 0-{MAX_VALUES[self.size]} for a {self.size} byte parameter"
+            )
+        if self.size == 1:
+            checksum = -(self._address_sum + value) & 0x7F
+            return self._prefix + bytes((value, checksum, END_OF_SYSEX))
+        data = BYTE_TO_NIBBLES[(value >> 8) & 0xFF] + BYTE_TO_NIBBLES[value & 0xFF]
+        if self.size == 5:
+            data = ((value >> 16) & 0x0F,) + data
+        checksum = -(self._address_sum + sum(data)) & 0x7F
+        return self._prefix + bytes(data + (checksum, END_OF_SYSEX))
+
+
+@lru_cache(maxsize=None)
+def sysex_template(area: int, part: int, group: int, param: int, size: int = 1) -> SysExTemplate:
+    """
+    Return the cached template for a parameter address.
+
+    :param area: Parameter area (e.g., Program, Digital Synth).
+    :param part: Part number.
+    :param group: Parameter group.
+    :param param: Parameter number.
+    :param size: int value size in bytes: 1, 4 or 5.
+    :return: SysExTemplate
+    """
+    return SysExTemplate((area, part, group, param), size)
+
+
+def render_parameter(
+    area: int, part: int, group: int, param: int, value: int, size: int = 1
+) -> bytes:
+    """
+    Return a ready DT1 frame setting a parameter.
+
+    :param area: Parameter area (e.g., Program, Digital Synth).
+    :param part: Part number.
+    :param group: Parameter group.
+    :param param: Parameter number.
+    :param value: Parameter value.
+    :param size: int value size in bytes: 1, 4 or 5.
+    :return: bytes SysEx message including F0 and F7
+    """
+    return sysex_template(area, part, group, param, size).render(value)
+
+
+def render_request(address: Sequence[int], size: int) -> bytes:
+    """
+    Return an RQ1 frame requesting size bytes starting at address.
+
+    :param address: The 4-byte start address.
+    :param size: int number of bytes requested, sent as four 7-bit bytes.
+    :return: bytes SysEx message including F0 and F7
+    """
+    size_bytes = [(size >> shift) & 0x7F for shift in (21, 14, 7, 0)]
+    checksum = -sum(list(address) + size_bytes) & 0x7F
+    return bytes(
+        JD_XI_HEADER_LIST + [RQ1_COMMAND_11] + list(address) + size_bytes + [checksum, END_OF_SYSEX]
+    )
@@ -4,41 +4,56 @@ Module: parameter_handler
 This module defines the `ParameterHandler` class, which manages MIDI parameter values
 and emits signals when parameters are updated.
 
+Values at addresses of the JD-Xi temporary areas are stored in a `ShadowMemory`;
+other addresses are kept in a dict. Only the changed parameter is emitted. The shadow
+memory may be the device state shared with the editors, so it is never cleared here.
+
 Classes:
     - ParameterHandler: Handles storing, updating, retrieving, and clearing MIDI parameters.
 
 Signals:
-    - parameters_updated: Emitted when parameter values change.
+    - parameters_updated: Emitted with {address: value} for a parameter that changed.
 
 Methods:
     - update_parameter(address, value): Updates the value of a parameter at the given address.
     - get_parameter(address): Retrieves the value of a parameter at the given address.
-    - clear_parameters(): Clears all stored parameters.
+    - clear_parameters(): Clears the parameters stored outside the shadow memory.
 
 """
 
 from PySide6.QtCore import QObject, Signal
-from typing import Dict, List
+from typing import List, Optional
+
+from jdxi_editor.midi.sysex.memory import ShadowMemory
 
 
 class ParameterHandler(QObject):
-    parameters_updated = Signal(dict)  # Emits when parameters change
+    parameters_updated = Signal(dict)  # Emits the changed parameter
 
-    def __init__(self):
+    def __init__(self, shadow_memory: Optional[ShadowMemory] = None):
         super().__init__()
+        self.shadow_memory = shadow_memory or ShadowMemory()
         self._parameters = {}
 
     def update_parameter(self, address: List[int], value: int):
         """Update address parameter value"""
-        addr_key = ".".join(str(x) for x in address)
-        self._parameters[addr_key] = value
-        self.parameters_updated.emit(self._parameters.copy())
+        address = tuple(address)
+        if self.shadow_memory.value(address) is not None:
+            if not self.shadow_memory.write(address, bytes([value & 0x7F]), source="editor"):
+                return
+        elif self._parameters.get(address) == value:
+            return
+        else:
+            self._parameters[address] = value
+        self.parameters_updated.emit({".".join(str(x) for x in address): value})
 
     def get_parameter(self, address: List[int]) -> int:
         """Get address parameter value"""
-        addr_key = ".".join(str(x) for x in address)
-        return self._parameters.get(addr_key, 0)
+        value = self.shadow_memory.value(address)
+        if value is not None:
+            return value
+        return self._parameters.get(tuple(address), 0)
 
     def clear_parameters(self):
-        """Clear all parameters"""
+        """Clear the parameters kept outside the shadow memory"""
         self._parameters.clear()
@@ -156,6 +156,5 @@ class PresetHelper(QObject):
             self.midi_helper.send_midi_message(sysex_message)
 
     def data_request(self):
-        for midi_request in self.midi_requests:
-            byte_list_message = bytes.fromhex(midi_request)
-            self.midi_helper.send_raw_message(byte_list_message)
+        """Request the current program and tones from the JD-Xi as one bulk snapshot"""
+        return self.midi_helper.bulk_fetcher.fetch(self.midi_requests)
@@ -91,7 +91,6 @@ class ProgramHelper(QObject):
             "F0 41 10 00 00 00 0E 11 19 21 50 00 00 00 00 25 51 F7",  # digital2 modify request
             "F0 41 10 00 00 00 0E 11 19 42 00 00 00 00 00 40 65 F7",  # analog request
             "F0 41 10 00 00 00 0E 11 19 70 00 00 00 00 00 12 65 F7",  # drums requests
-            "F0 41 10 00 00 00 0E 11 19 70 00 00 00 00 00 12 65 F7",
             "F0 41 10 00 00 00 0E 11 19 70 2E 00 00 00 01 43 05 F7",
             "F0 41 10 00 00 00 0E 11 19 70 30 00 00 00 01 43 03 F7",
             "F0 41 10 00 00 00 0E 11 19 70 32 00 00 00 01 43 01 F7",
@@ -128,6 +127,5 @@ class ProgramHelper(QObject):
         # self.update_current_synths(program_details)
 
     def data_request(self):
-        for midi_request in self.midi_requests:
-            byte_list_message = bytes.fromhex(midi_request)
-            self.midi_helper.send_raw_message(byte_list_message)
+        """Request the current program and tones from the JD-Xi as one bulk snapshot"""
+        return self.midi_helper.bulk_fetcher.fetch(self.midi_requests)
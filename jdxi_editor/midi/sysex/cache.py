@@ -0,0 +1,194 @@
+"""
+Decoded Dump Cache
+==================
+
+This module provides the `DecodedDumpCache` class, which keeps recently decoded
+JD-Xi tone dumps so that a block the synth sends again, byte for byte, is neither
+decoded nor applied to the editors a second time. After a program change the
+editors and `ProgramHelper` request the same blocks repeatedly; only the first
+reply of each is decoded and routed.
+
+Two things are tracked:
+    - decoded frames, in an LRU keyed by address and payload hash and capped at
+      an approximate number of bytes, used by the SysEx decode worker thread;
+    - the frame last applied at each address, used on the GUI thread. An entry
+      is dropped when anything changes memory in its address range, an edit in
+      the editor or a knob turned on the synth, since the controls no longer
+      show the dump. It is ignored once the subscribers change, since a new
+      editor has not seen it. A dump routed again writes no new bytes, so it
+      does not drop its own entry.
+
+Classes:
+    - DumpCacheStats: Snapshot of the cache counters.
+    - DecodedDumpCache: LRU of decoded dumps and record of the applied ones.
+
+Usage Example:
+    >>> cache = DecodedDumpCache(max_bytes=256 * 1024)
+    >>> parsed = cache.get(sysex_data) or cache.put(ParsedSysEx.from_sysex(sysex_data))
+    >>> if not cache.is_applied(parsed, router.generation):
+    ...     router.dispatch(parsed)
+    ...     cache.mark_applied(parsed, router.generation)
+    >>> cache.stats()
+    DumpCacheStats(hits=0, misses=1, evictions=0, skipped=0, ...)
+"""
+
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+from jdxi_editor.midi.sysex.memory import MemoryChange
+from jdxi_editor.midi.sysex.parsed import ParsedSysEx
+from jdxi_editor.midi.utils.byte import address_to_offset
+
+DEFAULT_MAX_BYTES = 1024 * 1024
+
+ADDRESS_START = 8
+ADDRESS_END = 12
+DT1_TRAILER_LENGTH = 2  # checksum and F7
+
+DumpKey = Tuple[bytes, int]
+
+
+def dump_key(sysex_data: bytes) -> DumpKey:
+    """Address bytes and payload hash of a frame."""
+    return sysex_data[ADDRESS_START:ADDRESS_END], hash(sysex_data[ADDRESS_END:])
+
+
+def _entry_size(parsed: ParsedSysEx) -> int:
+    """Approximate memory held by a decoded frame, in bytes."""
+    return sys.getsizeof(parsed.raw) + sys.getsizeof(parsed.parameters.values)
+
+
+@dataclass(frozen=True)
+class DumpCacheStats:
+    """Counters of the decoded dump cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    skipped: int
+    entries: int
+    size: int
+    max_bytes: int
+
+
+class DecodedDumpCache:
+    """LRU of decoded dumps, and the dump last applied at each address."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        :param max_bytes: Approximate memory cap of the decoded frames, in bytes.
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[DumpKey, Tuple[ParsedSysEx, int]]" = OrderedDict()
+        self.size = 0
+        # Address bytes -> key of the frame last applied there, subscriber generation
+        # and number of data bytes
+        self._applied: Dict[bytes, Tuple[DumpKey, int, int]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.skipped = 0
+
+    def get(self, sysex_data: bytes, received_at: Optional[float] = None) -> Optional[ParsedSysEx]:
+        """
+        Return the decoded frame for identical bytes, if cached.
+
+        :param sysex_data: The SysEx message bytes, including F0 and F7.
+        :param received_at: time.monotonic() timestamp of arrival.
+        :return: ParsedSysEx with the arrival time of this frame, or None on a miss
+        """
+        key = dump_key(sysex_data)
+        entry = self._entries.get(key)
+        if entry is None or entry[0].raw != sysex_data:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0].received(received_at)
+
+    def put(self, parsed: ParsedSysEx) -> ParsedSysEx:
+        """
+        Add a decoded frame, evicting the least recently used ones over the cap.
+
+        :param parsed: ParsedSysEx.
+        :return: parsed, for chaining
+        """
+        key = dump_key(parsed.raw)
+        size = _entry_size(parsed)
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size -= previous[1]
+        self._entries[key] = (parsed, size)
+        self.size += size
+        while self.size > self.max_bytes and self._entries:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.size -= evicted_size
+            self.evictions += 1
+        return parsed
+
+    def is_applied(self, parsed: ParsedSysEx, generation: int = 0) -> bool:
+        """
+        True if the same bytes were the last applied at the frame's address.
+
+        Counts the frame as skipped when it is.
+
+        :param parsed: ParsedSysEx about to be routed.
+        :param generation: Subscriber generation of the router, see SysExRouter.
+        """
+        applied = self._applied.get(parsed.address_bytes)
+        if applied is None or applied[:2] != (dump_key(parsed.raw), generation):
+            return False
+        self.skipped += 1
+        return True
+
+    def mark_applied(self, parsed: ParsedSysEx, generation: int = 0) -> None:
+        """
+        Record a frame as applied to the editors.
+
+        :param parsed: ParsedSysEx that was routed.
+        :param generation: Subscriber generation of the router it was routed by.
+        """
+        length = len(parsed.raw) - ADDRESS_END - DT1_TRAILER_LENGTH
+        self._applied[parsed.address_bytes] = (dump_key(parsed.raw), generation, length)
+
+    def invalidate(self, address: Optional[Sequence[int]] = None, size: int = 1) -> None:
+        """
+        Forget the applied frames overlapping an address range, or all of them.
+
+        :param address: Optional 4-byte start address, None for every frame.
+        :param size: int number of bytes in the range.
+        """
+        if address is None:
+            self._applied.clear()
+            return
+        start = address_to_offset(address)
+        for applied_address, (_, _, length) in list(self._applied.items()):
+            applied_start = address_to_offset(applied_address)
+            if start < applied_start + length and applied_start < start + size:
+                del self._applied[applied_address]
+
+    def on_memory_changed(self, change: MemoryChange) -> None:
+        """Forget the applied frames a change to shadow memory touches, from any source."""
+        self.invalidate(change.address, len(change.data))
+
+    def clear(self) -> None:
+        """Drop every cached and applied frame, keeping the counters."""
+        self._entries.clear()
+        self._applied.clear()
+        self.size = 0
+
+    def stats(self) -> DumpCacheStats:
+        """Return a snapshot of the counters."""
+        return DumpCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            skipped=self.skipped,
+            entries=len(self._entries),
+            size=self.size,
+            max_bytes=self.max_bytes,
+        )
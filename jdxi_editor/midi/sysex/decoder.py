@@ -0,0 +1,192 @@
+"""
+SysEx Decode Worker
+===================
+
+This module provides the `SysExDecodeWorker` class, which decodes incoming JD-Xi
+SysEx frames on a dedicated thread so that `parse_sysex`, JSON logging and
+serialization no longer run inside the rtmidi callback or on the GUI thread.
+
+The rtmidi callback hands raw frames to `submit`, which appends them to a bounded
+queue without taking a lock. The worker drains the queue, decodes each frame into a
+`ParsedSysEx` and publishes the decoded frames to the GUI as a single batch at most
+once per display frame. Frames for the same address within one display frame are
+coalesced, the latest one wins. With a `DecodedDumpCache`, a frame byte-identical
+to one decoded recently reuses its decoded parameters and is not logged again.
+
+Classes:
+    - DecodeStats: Snapshot of the worker's backpressure counters.
+    - SysExDecodeWorker: QThread decoding SysEx frames off the GUI thread.
+
+Usage Example:
+    >>> worker = SysExDecodeWorker()
+    >>> worker.frame_decoded.connect(on_frames)  # list of ParsedSysEx
+    >>> worker.start()
+    >>> worker.submit(sysex_bytes)
+    >>> worker.stats()
+    DecodeStats(submitted=1, decoded=1, dropped=0, ...)
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional, Tuple
+
+from PySide6.QtCore import QThread, Signal
+
+from jdxi_editor.midi.sysex.cache import DecodedDumpCache
+from jdxi_editor.midi.sysex.parsed import ParsedSysEx
+
+DEFAULT_QUEUE_CAPACITY = 512
+DEFAULT_FRAME_INTERVAL = 1 / 60  # seconds, one display refresh
+
+
+@dataclass(frozen=True)
+class DecodeStats:
+    """Backpressure counters for the SysEx decode worker."""
+
+    submitted: int
+    decoded: int
+    dropped: int
+    coalesced: int
+    failed: int
+    frames_published: int
+    queue_depth: int
+    high_water_mark: int
+    capacity: int
+
+
+class SysExDecodeWorker(QThread):
+    """Decode SysEx frames off the GUI thread and publish them once per frame."""
+
+    frame_decoded = Signal(list)  # list of ParsedSysEx
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_QUEUE_CAPACITY,
+        frame_interval: float = DEFAULT_FRAME_INTERVAL,
+        cache: Optional[DecodedDumpCache] = None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.capacity = capacity
+        self.frame_interval = frame_interval
+        self.cache = cache
+        # Single producer (rtmidi callback), single consumer (this thread):
+        # deque.append and deque.popleft are atomic, so no lock is needed.
+        self._queue: Deque[Tuple[bytes, float]] = deque()
+        self._wakeup = threading.Event()
+        self._running = False
+        self.submitted = 0
+        self.decoded = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.failed = 0
+        self.frames_published = 0
+        self.high_water_mark = 0
+
+    def submit(self, sysex_data: bytes) -> bool:
+        """
+        Queue a SysEx frame for decoding. Safe to call from the rtmidi callback.
+
+        :param sysex_data: The SysEx message bytes, including F0 and F7.
+        :return: False if the queue is full and the frame was dropped.
+        """
+        depth = len(self._queue)
+        if depth >= self.capacity:
+            self.dropped += 1
+            return False
+        self._queue.append((sysex_data, time.monotonic()))
+        self.submitted += 1
+        if depth >= self.high_water_mark:
+            self.high_water_mark = depth + 1
+        self._wakeup.set()
+        return True
+
+    def stats(self) -> DecodeStats:
+        """Return a snapshot of the backpressure counters."""
+        return DecodeStats(
+            submitted=self.submitted,
+            decoded=self.decoded,
+            dropped=self.dropped,
+            coalesced=self.coalesced,
+            failed=self.failed,
+            frames_published=self.frames_published,
+            queue_depth=len(self._queue),
+            high_water_mark=self.high_water_mark,
+            capacity=self.capacity,
+        )
+
+    def stop(self, timeout_ms: int = 1000) -> None:
+        """Stop the worker thread and wait for it to finish."""
+        self._running = False
+        self._wakeup.set()
+        if self.isRunning():
+            self.wait(timeout_ms)
+
+    def start(self, *args, **kwargs) -> None:
+        """Start the worker thread."""
+        self._running = True
+        super().start(*args, **kwargs)
+
+    def run(self) -> None:
+        """Drain, decode and publish until stopped."""
+        pending: Dict[bytes, ParsedSysEx] = {}
+        last_publish = 0.0
+        while self._running:
+            if pending:
+                timeout = max(0.0, last_publish + self.frame_interval - time.monotonic())
+            else:
+                timeout = self.frame_interval
+            self._wakeup.wait(timeout)
+            self._wakeup.clear()
+            self._drain(pending)
+            now = time.monotonic()
+            if pending and now - last_publish >= self.frame_interval:
+                self.frame_decoded.emit(list(pending.values()))
+                self.frames_published += 1
+                pending = {}
+                last_publish = now
+
+    def _drain(self, pending: Dict[bytes, ParsedSysEx]) -> None:
+        """Decode every queued frame into pending, keyed by address."""
+        queue = self._queue
+        while queue:
+            sysex_data, received_at = queue.popleft()
+            parsed = self.decode(sysex_data, received_at)
+            if parsed is None:
+                continue
+            key = parsed.address_bytes
+            if key in pending:
+                self.coalesced += 1
+                del pending[key]  # re-insert so batch order follows arrival
+            pending[key] = parsed
+
+    def decode(
+        self, sysex_data: bytes, received_at: Optional[float] = None
+    ) -> Optional[ParsedSysEx]:
+        """
+        Decode a single SysEx frame.
+
+        :param sysex_data: The SysEx message bytes, including F0 and F7.
+        :param received_at: time.monotonic() timestamp of arrival.
+        :return: ParsedSysEx or None if the frame could not be parsed.
+        """
+        if self.cache is not None:
+            parsed = self.cache.get(sysex_data, received_at)
+            if parsed is not None:
+                return parsed
+        try:
+            parsed = ParsedSysEx.from_sysex(sysex_data, received_at)
+            # Serializing every parameter is slow, only do it when it is logged
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug(parsed.json_string)
+            self.decoded += 1
+            if self.cache is not None:
+                self.cache.put(parsed)
+            return parsed
+        except Exception as parse_ex:
+            self.failed += 1
+            logging.warning("Failed to parse JD-Xi tone data: %s", parse_ex)
+            return None
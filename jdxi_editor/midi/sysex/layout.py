@@ -0,0 +1,218 @@
+"""
+SysEx Parameter Layouts
+=======================
+
+This module compiles the parameter enums (`DigitalParameter`, `DrumParameter`,
+...) into `ParameterLayout` tables of byte positions, once per area, so that a
+tone dump is decoded in a single pass with `operator.itemgetter` instead of
+iterating the enum and looking up every member.
+
+Parameter addresses are 7-bit: `DrumParameter.WMT4_WAVE_NUMBER_R` at 0x102 is the
+130th byte of a drum partial. Parameters with a range above 127 are sent as four
+bytes holding one nibble each, most significant first, and are combined into a
+single value.
+
+The decoded values are returned as a `SysExRecord`, an immutable record indexed
+by position, by parameter member or by name. It is also a read-only Mapping of
+names to values, with the header fields first, so existing consumers of the
+`parse_sysex` dict keep working.
+
+Classes:
+    - ParameterLayout: Compiled byte positions of a parameter enum.
+    - SysExRecord: Decoded parameter values of a SysEx frame.
+
+Usage Example:
+    >>> layout = ParameterLayout.compile((DrumParameter,))
+    >>> record = SysExRecord(header, layout, layout.decode(sysex_data))
+    >>> record[DrumParameter.TVF_CUTOFF_FREQUENCY] == record["TVF_CUTOFF_FREQUENCY"]
+    True
+"""
+
+from collections.abc import Mapping
+from enum import Enum
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Iterator, Optional, Sequence, Tuple, Type, Union
+
+SYSEX_DATA_OFFSET = 12  # F0, manufacturer, device, model (4), command, address (4)
+NIBBLE_COUNT = 4
+
+HEADER_KEYS = ("JD_XI_HEADER", "ADDRESS", "TEMPORARY_AREA", "SYNTH_TONE", "TONE_NAME")
+
+
+def parameter_offset(address: int) -> int:
+    """
+    Linear byte offset of a 7-bit parameter address, e.g. 0x102 -> 130.
+
+    :param address: int parameter address within its block.
+    :return: int offset
+    """
+    return ((address >> 8) << 7) | (address & 0x7F)
+
+
+def _is_nibbled(parameter: Enum) -> bool:
+    """True if the parameter is sent as four nibbles."""
+    max_val = getattr(parameter, "max_val", None)
+    return max_val is not None and max_val > 127
+
+
+class ParameterLayout:
+    """Byte positions of the parameters of one or more enums."""
+
+    def __init__(self, names: Sequence[str], positions: Sequence[int], nibbled: Sequence[int]):
+        """
+        Initialize the layout.
+
+        :param names: Parameter names, in record order.
+        :param positions: Index in the SysEx frame of each parameter's first byte.
+        :param nibbled: Record indices of the parameters sent as four nibbles.
+        """
+        self.names: Tuple[str, ...] = tuple(names)
+        self.positions: Tuple[int, ...] = tuple(positions)
+        self.nibbled: Tuple[int, ...] = tuple(nibbled)
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.end = max(self.positions, default=0) + 1
+        self._getter = itemgetter(*self.positions) if len(self.positions) > 1 else None
+        # The nibbles of every nibbled parameter, fetched in one call
+        nibble_positions = [
+            self.positions[i] + nibble for i in self.nibbled for nibble in range(NIBBLE_COUNT)
+        ]
+        self._nibble_end = max(nibble_positions, default=0) + 1
+        self._nibble_getter = itemgetter(*nibble_positions) if len(nibble_positions) > 1 else None
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def compile(cls, parameter_types: Tuple[Type[Enum], ...]) -> "ParameterLayout":
+        """
+        Compile parameter enums into a layout, once per tuple of enums.
+
+        A name defined by several enums takes the position from the last one,
+        as updating a dict with each enum in turn would.
+
+        :param parameter_types: Tuple of parameter Enum classes.
+        :return: ParameterLayout
+        """
+        positions: Dict[str, Tuple[int, bool]] = {}
+        for parameter_type in parameter_types:
+            for parameter in parameter_type:
+                positions[parameter.name] = (
+                    SYSEX_DATA_OFFSET + parameter_offset(parameter.address),
+                    _is_nibbled(parameter),
+                )
+        names = list(positions)
+        return cls(
+            names,
+            [position for position, _ in positions.values()],
+            [i for i, (_, nibbled) in enumerate(positions.values()) if nibbled],
+        )
+
+    def decode(self, data: Sequence[int]) -> Tuple[int, ...]:
+        """
+        Decode the parameter values of a frame.
+
+        Bytes past the end of the data read as 0.
+
+        :param data: The SysEx message bytes, including F0 and F7.
+        :return: Tuple of values, in the order of names
+        """
+        if self._getter is not None and len(data) >= self.end:
+            values = self._getter(data)
+        else:
+            length = len(data)
+            values = tuple(data[p] if p < length else 0 for p in self.positions)
+        if not self.nibbled:
+            return values
+        values = list(values)
+        if len(data) >= self._nibble_end:
+            nibbles = iter(self._nibble_getter(data))
+            for i, high, mid_high, mid_low, low in zip(self.nibbled, nibbles, nibbles, nibbles, nibbles):
+                values[i] = (high & 0x0F) << 12 | (mid_high & 0x0F) << 8 | (mid_low & 0x0F) << 4 | low & 0x0F
+        else:
+            for i in self.nibbled:
+                position = self.positions[i]
+                if position + NIBBLE_COUNT <= len(data):
+                    high, mid_high, mid_low, low = data[position:position + NIBBLE_COUNT]
+                    values[i] = (high & 0x0F) << 12 | (mid_high & 0x0F) << 8 | (mid_low & 0x0F) << 4 | low & 0x0F
+        return tuple(values)
+
+
+class SysExRecord(Mapping):
+    """Decoded values of a SysEx frame, indexed by position, parameter or name."""
+
+    __slots__ = ("header", "layout", "values", "_dict")
+
+    def __init__(
+        self,
+        header: Dict[str, object],
+        layout: Optional[ParameterLayout] = None,
+        values: Tuple[int, ...] = (),
+    ):
+        """
+        Initialize the record.
+
+        :param header: Dict of the HEADER_KEYS fields.
+        :param layout: Optional ParameterLayout of the values.
+        :param values: Tuple of decoded values, in layout order.
+        """
+        self.header = header
+        self.layout = layout
+        self.values = values
+        self._dict: Optional[Dict[str, object]] = None
+
+    def _index(self, key: object) -> Optional[int]:
+        """Position of a name, parameter member or index in values, or None."""
+        if self.layout is not None:
+            # Names are the common case, try them before any isinstance check
+            index = self.layout.index.get(key)
+            if index is not None:
+                return index
+            if isinstance(key, Enum):
+                return self.layout.index.get(key.name)
+        if isinstance(key, int) and -len(self.values) <= key < len(self.values):
+            return key
+        return None
+
+    def __getitem__(self, key: Union[int, str, Enum]) -> object:
+        index = self._index(key)
+        if index is not None:
+            return self.values[index]
+        return self.header[key]
+
+    def get(self, key: Union[int, str, Enum], default: object = None) -> object:
+        index = self._index(key)
+        if index is not None:
+            return self.values[index]
+        return self.header.get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        if isinstance(key, int):
+            return False  # positions index the record, they are not keys
+        return self._index(key) is not None or key in self.header
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.header
+        if self.layout is not None:
+            yield from self.layout.names
+
+    def __len__(self) -> int:
+        return len(self.header) + len(self.values)
+
+    def items(self):
+        """(name, value) pairs, header fields first."""
+        return self._as_dict().items()
+
+    def to_dict(self) -> Dict[str, object]:
+        """Return the record as a new dict of names to values."""
+        return dict(self._as_dict())
+
+    def _as_dict(self) -> Dict[str, object]:
+        """The record as a dict, built once and never handed out."""
+        if self._dict is None:
+            parameters = dict(self.header)
+            if self.layout is not None:
+                parameters.update(zip(self.layout.names, self.values))
+            self._dict = parameters
+        return self._dict
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._as_dict()!r})"
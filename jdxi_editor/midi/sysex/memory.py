@@ -0,0 +1,293 @@
+"""
+Device Shadow Memory
+====================
+
+This module provides the `ShadowMemory` class, a bytearray-backed copy of the JD-Xi
+temporary areas: program common, digital synth 1 and 2 common, partials and modify,
+analog synth, and drum kit common and partials.
+
+Every DT1 frame received from the synth, and every parameter edit sent to it, is
+written into the shadow memory. A byte is located from its 4-byte address with one
+dict lookup and an addition, so editors can read the current state directly instead
+of keeping their own copies of previous dumps. Writes that change something emit a
+`MemoryChange` on `memory_changed`, covering only the bytes that differ and holding
+the bytes they replaced, so `parameter_changes()` can name the parameters an edit or
+dump changed without another copy of the block.
+
+Classes:
+    - MemoryBlock: An address range of the JD-Xi temporary area.
+    - MemoryChange: A modified range of the shadow memory.
+    - ShadowMemory: The shadow copy of the JD-Xi temporary areas.
+
+Usage Example:
+    >>> memory = ShadowMemory()
+    >>> memory.memory_changed.connect(lambda change: print(change.address, change.data))
+    >>> memory.write_sysex(dt1_frame)
+    >>> memory.value([0x19, 0x01, 0x20, 0x0C])
+    64
+    >>> list(memory.parameter_changes(memory.write([0x19, 0x01, 0x20, 0x0C], bytes([70]))[0]))
+    [('FILTER_CUTOFF', 64, 70)]
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from PySide6.QtCore import QObject, Signal
+
+from jdxi_editor.midi.data.constants.sysex import DT1_COMMAND_12
+from jdxi_editor.midi.sysex.tone import ToneBlock, block_type
+from jdxi_editor.midi.utils.byte import address_to_offset, offset_to_address
+
+DT1_MIN_LENGTH = 14  # header, command, address, checksum and F7
+
+
+@dataclass(frozen=True)
+class MemoryBlock:
+    """An address range of the JD-Xi temporary area."""
+
+    name: str
+    address: Tuple[int, int, int, int]
+    size: int
+
+    @property
+    def offset(self) -> int:
+        """Linear offset of the first byte."""
+        return address_to_offset(self.address)
+
+
+@dataclass(frozen=True)
+class MemoryChange:
+    """A modified range of the shadow memory."""
+
+    address: Tuple[int, int, int, int]
+    data: bytes
+    block: str
+    source: str
+    # The bytes data replaced
+    previous: bytes = b""
+
+    def overlaps(self, address: Sequence[int], size: int = 1) -> bool:
+        """True if the change touches any of size bytes starting at address."""
+        start = address_to_offset(address)
+        change_start = address_to_offset(self.address)
+        return start < change_start + len(self.data) and change_start < start + size
+
+
+def _tone_blocks(name: str, area: int, part: int) -> List[MemoryBlock]:
+    """Common, partial and modify blocks of a digital synth tone."""
+    return [
+        MemoryBlock(f"{name}_COMMON", (area, part, 0x00, 0x00), 0x40),
+        MemoryBlock(f"{name}_PARTIAL_1", (area, part, 0x20, 0x00), 0x3D),
+        MemoryBlock(f"{name}_PARTIAL_2", (area, part, 0x21, 0x00), 0x3D),
+        MemoryBlock(f"{name}_PARTIAL_3", (area, part, 0x22, 0x00), 0x3D),
+        MemoryBlock(f"{name}_MODIFY", (area, part, 0x50, 0x00), 0x25),
+    ]
+
+
+JDXI_MEMORY_BLOCKS: Tuple[MemoryBlock, ...] = tuple(
+    [MemoryBlock("PROGRAM_COMMON", (0x18, 0x00, 0x00, 0x00), 0x40)]
+    + _tone_blocks("DIGITAL_1", 0x19, 0x01)
+    + _tone_blocks("DIGITAL_2", 0x19, 0x21)
+    + [MemoryBlock("ANALOG", (0x19, 0x42, 0x00, 0x00), 0x40)]
+    + [MemoryBlock("DRUM_COMMON", (0x19, 0x70, 0x00, 0x00), 0x12)]
+    + [
+        MemoryBlock(f"DRUM_PARTIAL_{note}", (0x19, 0x70, 0x2E + (note - 36) * 2, 0x00), 0xC3)
+        for note in range(36, 73)
+    ]
+)
+
+
+class ShadowMemory(QObject):
+    """Bytearray-backed shadow copy of the JD-Xi temporary areas."""
+
+    memory_changed = Signal(object)  # MemoryChange
+
+    def __init__(self, blocks: Sequence[MemoryBlock] = JDXI_MEMORY_BLOCKS, parent=None):
+        """
+        Initialize the shadow memory.
+
+        :param blocks: Sequence of MemoryBlock address ranges to shadow.
+        :param parent: Optional parent QObject.
+        """
+        super().__init__(parent)
+        self.blocks: Dict[str, MemoryBlock] = {}
+        # (area, part, group) -> block and buffer position of the group's first address
+        self._rows: Dict[Tuple[int, int, int], Tuple[MemoryBlock, int]] = {}
+        self._positions: Dict[str, int] = {}
+        position = 0
+        for block in blocks:
+            self.blocks[block.name] = block
+            self._positions[block.name] = position
+            for row_offset in range(block.offset & ~0x7F, block.offset + block.size, 0x80):
+                row = offset_to_address(row_offset)[:3]
+                self._rows[row] = (block, position + row_offset - block.offset)
+            position += block.size
+        self._buffer = bytearray(position)
+        self.unmapped = 0
+
+    def _locate(self, offset: int) -> Optional[Tuple[MemoryBlock, int]]:
+        """Block and buffer position of a linear offset, or None if not shadowed."""
+        row = self._rows.get(((offset >> 21) & 0x7F, (offset >> 14) & 0x7F, (offset >> 7) & 0x7F))
+        if row is None:
+            return None
+        block, row_position = row
+        if not block.offset <= offset < block.offset + block.size:
+            return None
+        return block, row_position + (offset & 0x7F)
+
+    def value(self, address: Sequence[int]) -> Optional[int]:
+        """
+        Return the byte at address.
+
+        :param address: The 4-byte address.
+        :return: int value, or None if the address is not shadowed
+        """
+        located = self._locate(address_to_offset(address))
+        return None if located is None else self._buffer[located[1]]
+
+    def read(self, address: Sequence[int], size: int) -> Optional[bytes]:
+        """
+        Return size bytes starting at address, within one block.
+
+        :param address: The 4-byte start address.
+        :param size: int number of bytes.
+        :return: bytes, or None if the range is not shadowed
+        """
+        offset = address_to_offset(address)
+        located = self._locate(offset)
+        if located is None:
+            return None
+        block, position = located
+        if offset + size > block.offset + block.size:
+            return None
+        return bytes(self._buffer[position:position + size])
+
+    def block(self, name: str) -> memoryview:
+        """Read-only view of a whole block."""
+        block = self.blocks[name]
+        position = self._positions[name]
+        return memoryview(self._buffer)[position:position + block.size].toreadonly()
+
+    def tone_block(self, name: str) -> Optional[ToneBlock]:
+        """
+        Return a copy of a block as a ToneBlock.
+
+        :param name: str block name, e.g. "DIGITAL_1_PARTIAL_1".
+        :return: ToneBlock, or None if the block holds no tone parameters
+        """
+        block = self.blocks[name]
+        block_class = block_type(block.address)
+        return None if block_class is None else block_class(block.address, self.block(name))
+
+    def parameter_changes(self, change: MemoryChange) -> Iterator[Tuple[str, Optional[int], int]]:
+        """
+        Yield (name, previous value, value) for each parameter a change modified.
+
+        Only the bytes of the change are compared, the rest of the block is read
+        from the shadow memory.
+
+        :param change: MemoryChange emitted by this shadow memory.
+        """
+        current = self.tone_block(change.block)
+        if current is None:
+            return
+        start = address_to_offset(change.address) - self.blocks[change.block].offset
+        data = bytearray(current.data)
+        data[start:start + len(change.data)] = change.data
+        previous = bytearray(data)
+        previous[start:start + len(change.previous)] = change.previous
+        block_class = current.__class__
+        yield from block_class(current.address, data).changes(block_class(current.address, previous))
+
+    def write(self, address: Sequence[int], data: bytes, source: str = "device") -> List[MemoryChange]:
+        """
+        Write data starting at address and emit the ranges that changed.
+
+        Bytes outside the shadowed blocks are ignored.
+
+        :param address: The 4-byte start address.
+        :param data: bytes to write.
+        :param source: str origin of the write, "device" or "editor".
+        :return: List of MemoryChange, one per block with modified bytes
+        """
+        changes = []
+        offset = address_to_offset(address)
+        index = 0
+        while index < len(data):
+            located = self._locate(offset + index)
+            if located is None:
+                self.unmapped += 1
+                index += 1
+                continue
+            block, position = located
+            count = min(len(data) - index, block.offset + block.size - (offset + index))
+            change = self._write_run(block, position, offset + index, data[index:index + count], source)
+            if change is not None:
+                changes.append(change)
+            index += count
+        for change in changes:
+            self.memory_changed.emit(change)
+        return changes
+
+    def _write_run(
+        self, block: MemoryBlock, position: int, offset: int, data: bytes, source: str
+    ) -> Optional[MemoryChange]:
+        """Write a run within one block, returning the modified range if any."""
+        current = self._buffer[position:position + len(data)]
+        if current == data:
+            return None
+        first = next(i for i in range(len(data)) if current[i] != data[i])
+        last = next(i for i in range(len(data) - 1, -1, -1) if current[i] != data[i])
+        self._buffer[position + first:position + last + 1] = data[first:last + 1]
+        return MemoryChange(
+            address=offset_to_address(offset + first),
+            data=bytes(data[first:last + 1]),
+            block=block.name,
+            source=source,
+            previous=bytes(current[first:last + 1]),
+        )
+
+    def write_sysex(self, sysex_data: bytes, source: str = "device") -> List[MemoryChange]:
+        """
+        Write the data of a DT1 frame.
+
+        :param sysex_data: The SysEx message bytes, including F0 and F7.
+        :param source: str origin of the frame.
+        :return: List of MemoryChange
+        """
+        if len(sysex_data) < DT1_MIN_LENGTH or sysex_data[7] != DT1_COMMAND_12:
+            return []
+        return self.write(sysex_data[8:12], bytes(sysex_data[12:-2]), source)
+
+    def changes(self, other: bytes) -> Iterator[MemoryChange]:
+        """
+        Yield the ranges where a previous snapshot differs from the current state.
+
+        :param other: bytes returned by snapshot().
+        """
+        if len(other) != len(self._buffer):
+            logging.warning("Shadow memory snapshot has a different layout")
+            return
+        for name, block in self.blocks.items():
+            position = self._positions[name]
+            current = self._buffer[position:position + block.size]
+            previous = other[position:position + block.size]
+            if current != previous:
+                first = next(i for i in range(block.size) if current[i] != previous[i])
+                last = next(i for i in range(block.size - 1, -1, -1) if current[i] != previous[i])
+                yield MemoryChange(
+                    address=offset_to_address(block.offset + first),
+                    data=bytes(current[first:last + 1]),
+                    block=name,
+                    source="snapshot",
+                    previous=bytes(previous[first:last + 1]),
+                )
+
+    def clear(self) -> None:
+        """Zero the whole shadow memory without emitting changes."""
+        self._buffer[:] = bytes(len(self._buffer))
+
+    def snapshot(self) -> bytes:
+        """Return a copy of the whole shadow memory."""
+        return bytes(self._buffer)
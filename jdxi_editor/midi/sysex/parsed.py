@@ -0,0 +1,104 @@
+"""
+Parsed SysEx Module
+
+This module defines the `ParsedSysEx` class, an immutable, typed view of a decoded
+JD-Xi SysEx frame. It is produced once per frame by the SysEx decode worker and
+shared by every consumer, so nothing downstream needs to re-parse the frame.
+
+Classes:
+    - ParsedSysEx: Frozen result of `parse_sysex` for a single frame.
+
+Usage Example:
+    >>> parsed = ParsedSysEx.from_sysex(sysex_bytes)
+    >>> parsed.temporary_area
+    'TEMPORARY_DIGITAL_SYNTH_1_AREA'
+    >>> parsed.parameters["FILTER_CUTOFF"]
+    64
+    >>> parsed.parameters[DigitalParameter.FILTER_CUTOFF]
+    64
+    >>> parsed.tone.filter_cutoff
+    64
+"""
+
+import json
+import time
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Optional
+
+from jdxi_editor.midi.sysex.layout import SysExRecord
+from jdxi_editor.midi.sysex.parsers import parse_sysex
+from jdxi_editor.midi.sysex.tone import ToneBlock, block_from_sysex
+
+
+@dataclass(frozen=True)
+class ParsedSysEx:
+    """Immutable decoded JD-Xi SysEx frame."""
+
+    raw: bytes
+    address: str
+    temporary_area: str
+    synth_tone: str
+    tone_name: Optional[str]
+    parameters: SysExRecord
+    received_at: float = 0.0
+    decoded_at: float = 0.0
+
+    @classmethod
+    def from_sysex(
+        cls, sysex_data: bytes, received_at: Optional[float] = None
+    ) -> "ParsedSysEx":
+        """
+        Decode a SysEx frame.
+
+        :param sysex_data: The SysEx message bytes, including F0 and F7.
+        :param received_at: time.monotonic() timestamp of arrival.
+        :return: ParsedSysEx
+        """
+        parsed_data = parse_sysex(sysex_data)
+        decoded_at = time.monotonic()
+        return cls(
+            raw=bytes(sysex_data),
+            address=parsed_data.get("ADDRESS", "N/A"),
+            temporary_area=parsed_data.get("TEMPORARY_AREA", "Unknown"),
+            synth_tone=parsed_data.get("SYNTH_TONE", "Unknown"),
+            tone_name=parsed_data.get("TONE_NAME"),
+            parameters=parsed_data,
+            received_at=decoded_at if received_at is None else received_at,
+            decoded_at=decoded_at,
+        )
+
+    def received(self, received_at: Optional[float] = None) -> "ParsedSysEx":
+        """
+        Return the frame as received again, reusing its decoded parameters.
+
+        :param received_at: time.monotonic() timestamp of the new arrival.
+        :return: ParsedSysEx with the new arrival and decode times
+        """
+        decoded_at = time.monotonic()
+        # Copied field by field, replace() would run __init__ and drop json_string
+        parsed = object.__new__(ParsedSysEx)
+        parsed.__dict__.update(self.__dict__)
+        parsed.__dict__.pop("tone", None)  # mutable, each frame builds its own
+        parsed.__dict__["received_at"] = decoded_at if received_at is None else received_at
+        parsed.__dict__["decoded_at"] = decoded_at
+        return parsed
+
+    @property
+    def address_bytes(self) -> bytes:
+        """The 4-byte JD-Xi address of the frame."""
+        return self.raw[8:12]
+
+    def to_dict(self) -> dict:
+        """Return a mutable copy of the parsed parameters."""
+        return self.parameters.to_dict()
+
+    @cached_property
+    def json_string(self) -> str:
+        """The parsed parameters serialized as a JSON string, computed once."""
+        return json.dumps(self.to_dict())
+
+    @cached_property
+    def tone(self) -> Optional[ToneBlock]:
+        """The frame as a bytearray-backed ToneBlock, or None if it is not a tone block."""
+        return block_from_sysex(self.raw)
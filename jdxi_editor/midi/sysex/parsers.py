@@ -12,13 +12,19 @@ Functions:
     - get_synth_tone: Maps byte values to synth tone types.
     - extract_tone_name: Extracts and cleans the tone name from SysEx data.
     - parse_parameters: Parses JD-Xi tone parameters for different synth types.
+    - get_parameter_layout: Returns the compiled parameter layout of an area and tone.
     - parse_sysex: Parses JD-Xi tone data from SysEx messages.
 
+parse_sysex decodes the parameters with a ParameterLayout compiled once per area
+and returns a SysExRecord, a read-only mapping also indexable by parameter.
+
 """
 
 import logging
-from typing import List, Dict, Type
+from functools import lru_cache
+from typing import List, Dict, Optional, Type
 
+from jdxi_editor.midi.data.constants.sysex import TEMPORARY_AREA_MAPPING
 from jdxi_editor.midi.data.parameter.analog import AnalogParameter
 from jdxi_editor.midi.data.parameter.digital import DigitalParameter
 from jdxi_editor.midi.data.parameter.digital_common import DigitalCommonParameter
@@ -26,6 +32,9 @@ from jdxi_editor.midi.data.parameter.drums import DrumParameter, DrumCommonParam
 from jdxi_editor.midi.data.parameter.effects import EffectParameter
 from jdxi_editor.midi.data.parameter.program_common import ProgramCommonParameter
 from jdxi_editor.midi.data.partials.partials import TONE_MAPPING
+from jdxi_editor.midi.sysex.layout import ParameterLayout, SysExRecord
+
+DIGITAL_SYNTH_AREAS = ("TEMPORARY_DIGITAL_SYNTH_1_AREA", "TEMPORARY_DIGITAL_SYNTH_2_AREA")
 
 
 def safe_get(data: List[int], index: int, offset: int = 12, default: int = 0) -> int:
@@ -41,16 +50,8 @@ def extract_hex(data: List[int], start: int, end: int, default: str = "N/A") ->
 
 def get_temporary_area(data: List[int]) -> str:
     """Map address bytes to corresponding temporary area."""
-    logging.info(f"data for temporary area: {data}")
-    area_mapping = {
-        (0x18, 0x00):  "TEMPORARY_PROGRAM_AREA",
-        (0x19, 0x42): "TEMPORARY_ANALOG_SYNTH_AREA",
-        (0x19, 0x01): "TEMPORARY_DIGITAL_SYNTH_1_AREA",
-        (0x19, 0x21): "TEMPORARY_DIGITAL_SYNTH_2_AREA",
-        (0x19, 0x70): "TEMPORARY_DRUM_KIT_AREA",
-    }
     return (
-        area_mapping.get(tuple(data[8:10]), "Unknown") if len(data) >= 10 else "Unknown"
+        TEMPORARY_AREA_MAPPING.get((data[8], data[9]), "Unknown") if len(data) >= 10 else "Unknown"
     )
 
 
@@ -102,48 +103,57 @@ def parse_parameters_new(data: List[int], parameter_type: Type) -> Dict[str, int
     return parameters
 
 
-def parse_sysex(data: List[int]) -> Dict[str, str]:
+@lru_cache(maxsize=None)
+def get_parameter_layout(temporary_area: str, synth_tone: str) -> Optional[ParameterLayout]:
+    """
+    Return the compiled parameter layout of an area and tone.
+
+    :param temporary_area: TEMPORARY_AREA name, e.g. "TEMPORARY_DRUM_KIT_AREA".
+    :param synth_tone: SYNTH_TONE name, e.g. "TONE_COMMON" or "BD1".
+    :return: ParameterLayout, or None if the area has no parameters
+    """
+    if temporary_area == "TEMPORARY_PROGRAM_AREA":
+        return ParameterLayout.compile((ProgramCommonParameter,))
+    if temporary_area in DIGITAL_SYNTH_AREAS:
+        if synth_tone == "TONE_COMMON":
+            return ParameterLayout.compile((DigitalCommonParameter,))
+        if synth_tone == "TONE_MODIFY":
+            return ParameterLayout.compile((EffectParameter,))
+        return ParameterLayout.compile((DigitalParameter,))
+    if temporary_area == "TEMPORARY_ANALOG_SYNTH_AREA":
+        return ParameterLayout.compile((AnalogParameter,))
+    if temporary_area == "TEMPORARY_DRUM_KIT_AREA":
+        if synth_tone == "TONE_COMMON":
+            return ParameterLayout.compile((DrumCommonParameter, DrumParameter))
+        return ParameterLayout.compile((DrumParameter,))
+    return None
+
+
+def parse_sysex(data: List[int]) -> SysExRecord:
     """Parses JD-Xi tone data from SysEx messages."""
     if len(data) <= 7:
         logging.warning("Insufficient data length for parsing.")
-        return {
+        return SysExRecord({
             "JD_XI_HEADER": extract_hex(data, 0, 7),
             "ADDRESS": extract_hex(data, 7, 11),
             "TEMPORARY_AREA": "Unknown",
             "SYNTH_TONE": "Unknown",
-        }
+        })
 
-    parameters = {
+    temporary_area = get_temporary_area(data)
+    synth_tone = get_synth_tone(data[10]) if len(data) > 10 else "Unknown"
+    header = {
         "JD_XI_HEADER": extract_hex(data, 0, 7),
         "ADDRESS": extract_hex(data, 7, 11),
-        "TEMPORARY_AREA": get_temporary_area(data),
-        "SYNTH_TONE": get_synth_tone(data[10]) if len(data) > 10 else "Unknown",
+        "TEMPORARY_AREA": temporary_area,
+        "SYNTH_TONE": synth_tone,
         "TONE_NAME": extract_tone_name(data),
     }
-
-    temporary_area = parameters["TEMPORARY_AREA"]
-    synth_tone = parameters["SYNTH_TONE"]
-
-    if temporary_area == "TEMPORARY_PROGRAM_AREA":
-        parameters.update(parse_parameters(data, ProgramCommonParameter))
-
-    if temporary_area in [
-        "TEMPORARY_DIGITAL_SYNTH_1_AREA",
-        "TEMPORARY_DIGITAL_SYNTH_2_AREA",
-    ]:
-        if synth_tone == "TONE_COMMON":
-            parameters.update(parse_parameters(data, DigitalCommonParameter))
-        elif synth_tone == "TONE_MODIFY":
-            parameters.update(parse_parameters(data, EffectParameter))
-        else:
-            parameters.update(parse_parameters(data, DigitalParameter))
-    elif temporary_area == "TEMPORARY_ANALOG_SYNTH_AREA":
-        parameters.update(parse_parameters(data, AnalogParameter))
-    elif temporary_area == "TEMPORARY_DRUM_KIT_AREA":
-        if synth_tone == "TONE_COMMON":
-            parameters.update(parse_parameters(data, DrumCommonParameter))
-        parameters.update(parse_parameters(data, DrumParameter))
-    print(parameters)
+    layout = get_parameter_layout(temporary_area, synth_tone)
+    if layout is None:
+        parameters = SysExRecord(header)
+    else:
+        parameters = SysExRecord(header, layout, layout.decode(data))
 
     """
     # Extract tone name (assuming its offset is correctly defined in parameter_type)
@@ -166,7 +176,6 @@ def parse_sysex(data: List[int]) -> Dict[str, str]:
     #print(tone_name_ascii)
     #print(tone_name)
     """
-    logging.info(f"Address: {parameters['ADDRESS']}")
-    logging.info(f"Temporary Area: {temporary_area}")
+    logging.debug("Address: %s, Temporary Area: %s", header["ADDRESS"], temporary_area)
 
     return parameters
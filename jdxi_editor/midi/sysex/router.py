@@ -0,0 +1,135 @@
+"""
+SysEx Router Module
+
+This module defines the `SysExRouter` class, a subscription registry that hands
+decoded SysEx frames only to the editors that own the address range they came
+from. Subscriptions are keyed by the TEMPORARY_AREA and, optionally, the
+SYNTH_TONE reported by `parse_sysex`, so an editor never sees, or has to
+discard, frames for another area.
+
+Bound methods are held by weak reference so a destroyed editor does not keep
+receiving frames. `generation` changes whenever the set of subscribers does.
+
+Classes:
+    - SysExRouter: Routes ParsedSysEx frames to area subscribers.
+
+Usage Example:
+    >>> router = SysExRouter()
+    >>> router.subscribe("TEMPORARY_ANALOG_SYNTH_AREA", editor.update_from_sysex)
+    >>> router.dispatch(parsed)
+    1
+"""
+
+import logging
+import weakref
+from inspect import ismethod
+from typing import Callable, Dict, List, Optional, Tuple
+
+from jdxi_editor.midi.sysex.parsed import ParsedSysEx
+
+SysExCallback = Callable[[ParsedSysEx], None]
+
+
+def _reference(callback: SysExCallback) -> Callable[[], Optional[SysExCallback]]:
+    """Weakly reference bound methods; plain functions are held strongly."""
+    if ismethod(callback):
+        return weakref.WeakMethod(callback)
+    return lambda: callback
+
+
+class SysExRouter:
+    """Registry of SysEx subscribers keyed by (TEMPORARY_AREA, SYNTH_TONE)."""
+
+    def __init__(self):
+        self._subscribers: Dict[
+            Tuple[str, Optional[str]], List[Callable[[], Optional[SysExCallback]]]
+        ] = {}
+        self.delivered = 0
+        self.unrouted = 0
+        # Bumped on every change of subscribers, so callers can tell a frame
+        # delivered earlier has not reached the current ones
+        self.generation = 0
+
+    def subscribe(
+        self,
+        temporary_area: str,
+        callback: SysExCallback,
+        synth_tone: Optional[str] = None,
+    ) -> None:
+        """
+        Register callback for frames from an area.
+
+        :param temporary_area: TEMPORARY_AREA name, e.g. "TEMPORARY_DRUM_KIT_AREA".
+        :param callback: Called with each ParsedSysEx for the area.
+        :param synth_tone: Optional SYNTH_TONE to narrow the subscription,
+            e.g. "TONE_COMMON". None receives every tone in the area.
+        """
+        self._subscribers.setdefault((temporary_area, synth_tone), []).append(
+            _reference(callback)
+        )
+        self.generation += 1
+
+    def unsubscribe(self, callback: SysExCallback) -> int:
+        """
+        Remove every subscription for callback.
+
+        :param callback: A previously subscribed callback.
+        :return: int number of subscriptions removed
+        """
+        removed = 0
+        for key, references in list(self._subscribers.items()):
+            kept = [ref for ref in references if ref() not in (None, callback)]
+            removed += len(references) - len(kept)
+            if kept:
+                self._subscribers[key] = kept
+            else:
+                del self._subscribers[key]
+        if removed:
+            self.generation += 1
+        return removed
+
+    def subscribers(
+        self, temporary_area: str, synth_tone: Optional[str] = None
+    ) -> List[SysExCallback]:
+        """
+        Return the live callbacks that would receive a frame.
+
+        :param temporary_area: TEMPORARY_AREA of the frame.
+        :param synth_tone: SYNTH_TONE of the frame.
+        :return: List of callbacks, tone-specific subscribers first.
+        """
+        callbacks = []
+        keys = [(temporary_area, None)]
+        if synth_tone is not None:
+            keys.insert(0, (temporary_area, synth_tone))
+        for key in keys:
+            references = self._subscribers.get(key)
+            if not references:
+                continue
+            live = [ref for ref in references if ref() is not None]
+            if len(live) != len(references):
+                self._subscribers[key] = live
+                self.generation += 1
+            callbacks.extend(ref() for ref in live)
+        return callbacks
+
+    def dispatch(self, parsed: ParsedSysEx) -> int:
+        """
+        Deliver a frame to the subscribers for its area.
+
+        :param parsed: ParsedSysEx decoded frame.
+        :return: int number of callbacks the frame was delivered to
+        """
+        callbacks = self.subscribers(parsed.temporary_area, parsed.synth_tone)
+        if not callbacks:
+            self.unrouted += 1
+            return 0
+        for callback in callbacks:
+            try:
+                callback(parsed)
+            except Exception as ex:
+                logging.error(
+                    f"Error {ex} delivering {parsed.temporary_area} SysEx to {callback}"
+                )
+        self.delivered += len(callbacks)
+        return len(callbacks)
@@ -0,0 +1,401 @@
+"""
+Tone Value Types
+================
+
+This module provides compact value types for the JD-Xi tone blocks: `Tone` for the
+common block of a tone, `Partial` for a digital synth or drum partial and `DrumKit`
+for a drum kit common block with its partials.
+
+A block holds the raw bytes of its address range in a single bytearray, exactly as
+they are sent in a DT1 frame, instead of a dict of parameter names. Parameters are
+read and written through properties generated from the `AREA_GROUPS` of the
+parameter registry, e.g. `partial.filter_cutoff`, or by name or member as with a
+`SysExRecord`. Parameters sent as four nibbles are combined when read and split
+when written.
+
+`copy()` is copy-on-write: the copy shares the bytearray until either block is
+written. `to_bytes()` is a stable binary serialization, a small header with the
+block address followed by the block bytes, read back by `block_from_bytes()`.
+
+Classes:
+    - ToneBlock: Parameters of one address block, backed by a bytearray.
+    - Tone: Common block of a tone, e.g. AnalogTone or DigitalTone.
+    - Partial: Partial block of a tone, e.g. DigitalSynthPartial or DrumPartial.
+    - DrumKit: Drum kit common block and partials.
+
+Functions:
+    - block_type(address) -> Optional[Type[ToneBlock]]
+    - block_from_sysex(sysex_data) -> Optional[ToneBlock]
+    - block_from_bytes(data) -> ToneBlock
+
+Usage Example:
+    >>> partial = block_from_sysex(sysex_data)
+    >>> partial.filter_cutoff
+    64
+    >>> edited = partial.copy()
+    >>> edited.filter_cutoff = 100
+    >>> list(edited.changes(partial))
+    [('FILTER_CUTOFF', 64, 100)]
+    >>> block_from_bytes(edited.to_bytes()) == edited
+    True
+"""
+
+import struct
+from collections.abc import Mapping
+from enum import Enum
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Type, Union
+
+from jdxi_editor.midi.data.constants.sysex import TEMPORARY_AREA_MAPPING
+from jdxi_editor.midi.data.parameter.analog import AnalogParameter
+from jdxi_editor.midi.data.parameter.digital import DigitalParameter
+from jdxi_editor.midi.data.parameter.digital_common import DigitalCommonParameter
+from jdxi_editor.midi.data.parameter.drums import DrumCommonParameter, DrumParameter
+from jdxi_editor.midi.data.parameter.registry import AREA_GROUPS
+from jdxi_editor.midi.data.parameter.synth import SynthParameter
+from jdxi_editor.midi.sysex.layout import NIBBLE_COUNT, SYSEX_DATA_OFFSET, _is_nibbled, parameter_offset
+
+SERIAL_MAGIC = b"JDXT"
+SERIAL_VERSION = 1
+# Magic, version, address and block size, big-endian
+SERIAL_HEADER = struct.Struct(">4sB4sH")
+
+DT1_TRAILER_LENGTH = 2  # checksum and F7
+
+
+def _read_nibbles(data: bytearray, offset: int) -> int:
+    """Value of a parameter sent as four nibbles, most significant first."""
+    high, mid_high, mid_low, low = data[offset:offset + NIBBLE_COUNT]
+    return (high & 0x0F) << 12 | (mid_high & 0x0F) << 8 | (mid_low & 0x0F) << 4 | low & 0x0F
+
+
+def _parameter_property(name: str, offset: int, nibbled: bool) -> property:
+    """Property reading and writing a parameter at offset in the block."""
+    if nibbled:
+        def getter(self):
+            return _read_nibbles(self._data, offset)
+    else:
+        def getter(self):
+            return self._data[offset]
+
+    def setter(self, value: int):
+        self._write(offset, nibbled, value)
+
+    return property(getter, setter, doc=f"{name} value")
+
+
+class ToneBlock(Mapping):
+    """Parameter values of one address block, backed by a bytearray."""
+
+    __slots__ = ("address", "_data", "_shared")
+
+    # Set by each concrete subclass, the remaining attributes are compiled from it
+    parameter_type: Optional[Type[SynthParameter]] = None
+    size = 0
+    names: Tuple[str, ...] = ()
+    offsets: Dict[str, Tuple[int, bool]] = {}
+    # Parameter of each byte of the block, for changes()
+    byte_names: Tuple[Optional[str], ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "parameter_type" not in cls.__dict__:
+            return
+        offsets = {}
+        for param in cls.parameter_type:
+            offsets.setdefault(param.name, (parameter_offset(param.address), _is_nibbled(param)))
+        cls.names = tuple(offsets)
+        cls.offsets = offsets
+        cls.size = max(offset + (NIBBLE_COUNT if nibbled else 1) for offset, nibbled in offsets.values())
+        byte_names: List[Optional[str]] = [None] * cls.size
+        for name, (offset, nibbled) in offsets.items():
+            for position in range(offset, offset + (NIBBLE_COUNT if nibbled else 1)):
+                byte_names[position] = byte_names[position] or name
+        cls.byte_names = tuple(byte_names)
+        for name, (offset, nibbled) in offsets.items():
+            attribute = name.lower()
+            if not hasattr(cls, attribute):
+                setattr(cls, attribute, _parameter_property(name, offset, nibbled))
+
+    def __init__(self, address: Sequence[int], data: Union[bytes, bytearray, memoryview] = b""):
+        """
+        Initialize the block.
+
+        :param address: The 4-byte address of the first byte of the block.
+        :param data: Block bytes from the start of the block, padded with zeros or
+            truncated to the size of the block.
+        """
+        self.address: Tuple[int, ...] = tuple(address)
+        self._data = bytearray(data[:self.size])
+        if len(self._data) < self.size:
+            self._data.extend(bytes(self.size - len(self._data)))
+        self._shared = False
+
+    @classmethod
+    def from_sysex(cls, sysex_data: Sequence[int]) -> "ToneBlock":
+        """
+        Create a block from a DT1 frame starting at the block address.
+
+        :param sysex_data: The SysEx message bytes, including F0 and F7.
+        :return: ToneBlock
+        """
+        return cls(
+            sysex_data[SYSEX_DATA_OFFSET - 4:SYSEX_DATA_OFFSET],
+            bytes(sysex_data[SYSEX_DATA_OFFSET:len(sysex_data) - DT1_TRAILER_LENGTH]),
+        )
+
+    @property
+    def data(self) -> memoryview:
+        """Read-only view of the block bytes."""
+        return memoryview(self._data).toreadonly()
+
+    def _write(self, offset: int, nibbled: bool, value: int) -> None:
+        """Write a value at offset, copying the bytes first if they are shared."""
+        if self._shared:
+            self._data = bytearray(self._data)
+            self._shared = False
+        if nibbled:
+            self._data[offset:offset + NIBBLE_COUNT] = bytes(
+                ((value >> 12) & 0x0F, (value >> 8) & 0x0F, (value >> 4) & 0x0F, value & 0x0F)
+            )
+        else:
+            self._data[offset] = value & 0x7F
+
+    def _name(self, key: Union[str, Enum]) -> str:
+        """Parameter name of a name or member, KeyError if the block has none."""
+        name = key.name if isinstance(key, Enum) else key
+        if name not in self.offsets:
+            raise KeyError(key)
+        return name
+
+    def __getitem__(self, key: Union[str, Enum]) -> int:
+        offset, nibbled = self.offsets[self._name(key)]
+        return _read_nibbles(self._data, offset) if nibbled else self._data[offset]
+
+    def __setitem__(self, key: Union[str, Enum], value: int) -> None:
+        offset, nibbled = self.offsets[self._name(key)]
+        self._write(offset, nibbled, value)
+
+    def __contains__(self, key: object) -> bool:
+        name = key.name if isinstance(key, Enum) else key
+        return name in self.offsets
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ToneBlock):
+            return NotImplemented
+        return (
+            self.__class__ is other.__class__
+            and self.address == other.address
+            and self._data == other._data
+        )
+
+    __hash__ = None
+
+    def copy(self) -> "ToneBlock":
+        """Return a copy sharing the block bytes until either block is written."""
+        clone = self.__class__.__new__(self.__class__)
+        clone.address = self.address
+        clone._data = self._data
+        clone._shared = self._shared = True
+        return clone
+
+    def changes(self, previous: "ToneBlock") -> Iterator[Tuple[str, Optional[int], int]]:
+        """
+        Yield (name, previous value, value) for each parameter that differs.
+
+        Blocks of the same class are compared byte by byte, the parameters of
+        unchanged bytes are not read.
+
+        :param previous: ToneBlock, usually an earlier copy of this one.
+        """
+        if previous.__class__ is not self.__class__:
+            for name in self.names:
+                previous_value = previous.get(name)
+                value = self[name]
+                if previous_value != value:
+                    yield name, previous_value, value
+            return
+        if previous._data == self._data:
+            return
+        seen = set()
+        for position, (old, new) in enumerate(zip(previous._data, self._data)):
+            if old != new:
+                name = self.byte_names[position]
+                if name is not None and name not in seen:
+                    seen.add(name)
+                    yield name, previous[name], self[name]
+
+    def to_dict(self) -> Dict[str, int]:
+        """Return the parameter values as a new dict of names to values."""
+        return {name: self[name] for name in self.names}
+
+    def to_bytes(self) -> bytes:
+        """Serialize the block: a header with the address and size, then the bytes."""
+        return SERIAL_HEADER.pack(SERIAL_MAGIC, SERIAL_VERSION, bytes(self.address), self.size) + bytes(
+            self._data
+        )
+
+    def __repr__(self) -> str:
+        address = " ".join(f"{byte:02X}" for byte in self.address)
+        return f"{self.__class__.__name__}({address})"
+
+
+class Tone(ToneBlock):
+    """Common block of a tone."""
+
+    __slots__ = ()
+
+
+class Partial(ToneBlock):
+    """Partial block of a tone."""
+
+    __slots__ = ()
+
+
+class DigitalTone(Tone):
+    """Digital synth tone common block."""
+
+    __slots__ = ()
+    parameter_type = DigitalCommonParameter
+
+
+class DigitalSynthPartial(Partial):
+    """Digital synth partial block."""
+
+    __slots__ = ()
+    parameter_type = DigitalParameter
+
+
+class AnalogTone(Tone):
+    """Analog synth tone block."""
+
+    __slots__ = ()
+    parameter_type = AnalogParameter
+
+
+class DrumKitCommon(Tone):
+    """Drum kit common block."""
+
+    __slots__ = ()
+    parameter_type = DrumCommonParameter
+
+
+class DrumPartial(Partial):
+    """Drum kit partial block, one per key."""
+
+    __slots__ = ()
+    parameter_type = DrumParameter
+
+
+BLOCK_TYPES: Dict[Type[SynthParameter], Type[ToneBlock]] = {
+    block.parameter_type: block
+    for block in (DigitalTone, DigitalSynthPartial, AnalogTone, DrumKitCommon, DrumPartial)
+}
+
+
+def block_type(address: Sequence[int]) -> Optional[Type[ToneBlock]]:
+    """
+    Return the block class of a block address.
+
+    :param address: The 4-byte address, e.g. [0x19, 0x70, 0x2E, 0x00] for BD1.
+    :return: ToneBlock subclass, or None if the address is not the start of a block
+    """
+    if len(address) < 4 or address[3] != 0x00:
+        return None
+    groups = AREA_GROUPS.get(TEMPORARY_AREA_MAPPING.get((address[0], address[1])), {})
+    return BLOCK_TYPES.get(groups.get(address[2]))
+
+
+def block_from_sysex(sysex_data: Sequence[int]) -> Optional[ToneBlock]:
+    """
+    Create the block a DT1 frame holds.
+
+    :param sysex_data: The SysEx message bytes, including F0 and F7.
+    :return: ToneBlock, or None if the frame does not start at a tone block
+    """
+    block_class = block_type(sysex_data[SYSEX_DATA_OFFSET - 4:SYSEX_DATA_OFFSET])
+    if block_class is None:
+        return None
+    return block_class.from_sysex(sysex_data)
+
+
+def block_from_bytes(data: bytes) -> ToneBlock:
+    """
+    Read a block serialized with ToneBlock.to_bytes().
+
+    :param data: bytes, starting with the serialization header.
+    :return: ToneBlock
+    :raises ValueError: if the data is not a serialized block
+    """
+    if len(data) < SERIAL_HEADER.size:
+        raise ValueError("Serialized tone block is too short")
+    magic, version, address, size = SERIAL_HEADER.unpack_from(data)
+    if magic != SERIAL_MAGIC or version != SERIAL_VERSION:
+        raise ValueError(f"Not a serialized tone block: {magic!r} version {version}")
+    block_class = block_type(address)
+    if block_class is None:
+        raise ValueError(f"No tone block at address {address.hex(' ').upper()}")
+    body = data[SERIAL_HEADER.size:SERIAL_HEADER.size + size]
+    if len(body) != size:
+        raise ValueError("Serialized tone block is truncated")
+    return block_class(address, body)
+
+
+class DrumKit:
+    """Drum kit common block and partials."""
+
+    __slots__ = ("common", "partials")
+
+    def __init__(self, common: DrumKitCommon, partials: Sequence[DrumPartial] = ()):
+        """
+        Initialize the kit.
+
+        :param common: DrumKitCommon block.
+        :param partials: DrumPartial blocks, in key order from BD1.
+        """
+        self.common = common
+        self.partials: List[DrumPartial] = list(partials)
+
+    def copy(self) -> "DrumKit":
+        """Return a copy whose blocks share their bytes until written."""
+        return DrumKit(self.common.copy(), [partial.copy() for partial in self.partials])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DrumKit):
+            return NotImplemented
+        return self.common == other.common and self.partials == other.partials
+
+    __hash__ = None
+
+    def to_bytes(self) -> bytes:
+        """Serialize the kit, the serialized common block followed by each partial."""
+        return b"".join(block.to_bytes() for block in (self.common, *self.partials))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "DrumKit":
+        """
+        Read a kit serialized with to_bytes().
+
+        :param data: bytes.
+        :return: DrumKit
+        :raises ValueError: if the data does not hold a common block and partials
+        """
+        blocks = []
+        position = 0
+        while position < len(data):
+            block = block_from_bytes(data[position:])
+            blocks.append(block)
+            position += SERIAL_HEADER.size + block.size
+        if not blocks or not isinstance(blocks[0], DrumKitCommon):
+            raise ValueError("Serialized drum kit does not start with a common block")
+        if not all(isinstance(block, DrumPartial) for block in blocks[1:]):
+            raise ValueError("Serialized drum kit holds blocks other than partials")
+        return cls(blocks[0], blocks[1:])
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self.partials)} partials)"
@@ -1,34 +1,32 @@
 import logging
 from typing import List
 
-from jdxi_editor.midi.data.digital import get_digital_parameter_by_address
+from jdxi_editor.midi.data.parameter.registry import PARAMETER_REGISTRY
 
 
 def get_parameter_from_address(address: List[int]):
     """
-    Map address given address to address DigitalParameter.
+    Map address given address to its parameter.
 
     Args:
-        address: A list representing the address bytes.
+        address: A list of the four address bytes, e.g. [0x19, 0x42, 0x00, 0x0E].
     Raises:
-        ValueError: If the address is too short or no corresponding DigitalParameter is found.
+        ValueError: If the address is too short or no corresponding parameter is found.
     Returns:
-        The DigitalParameter corresponding to the address.
+        The SynthParameter corresponding to the address.
     """
-    if len(address) < 2:
+    if len(address) < 4:
         raise ValueError(
-            f"Address must contain at least 2 elements, got {len(address)}"
+            f"Address must contain at least 4 elements, got {len(address)}"
         )
 
-    # Assuming address structure [area, address, ...]
-    parameter_address = tuple(address[1:2])
-    param = get_digital_parameter_by_address(parameter_address)
+    param = PARAMETER_REGISTRY.from_address(address)
 
     if param:
         return param
     else:
         raise ValueError(
-            f"Invalid address {parameter_address} - no corresponding DigitalParameter found."
+            f"Invalid address {tuple(address[:4])} - no corresponding parameter found."
         )
 
 
@@ -1,15 +1,30 @@
+# High and low nibble of every byte value, so encoding a value is a table lookup
+# per byte rather than a shift and mask per nibble.
+BYTE_TO_NIBBLES = tuple(((byte >> 4) & 0x0F, byte & 0x0F) for byte in range(256))
+
+
 def split_value_to_nibbles(value: int, size: int = 4):
     """Handle bit value list with variable byte size."""
     try:
         # Ensure size is valid
         if size not in (1, 4, 5):
             raise ValueError("Size must be 1, 4, or 5 bytes.")
-        # Prepare an array to hold the bytes
-        byte_array = []
-        # Process bits based on the specified size
-        for i in range(size):
-            byte = (value >> (4 * (size - 1 - i))) & 0x0F  # Extract 4 bits
-            byte_array.append(byte)
-        return byte_array
+        # Most significant nibble first
+        if size == 1:
+            return [value & 0x0F]
+        nibbles = BYTE_TO_NIBBLES[(value >> 8) & 0xFF] + BYTE_TO_NIBBLES[value & 0xFF]
+        if size == 5:
+            nibbles = ((value >> 16) & 0x0F,) + nibbles
+        return list(nibbles)
     except Exception as ex:
         print(f"Error: {ex}")
+
+
+def address_to_offset(address) -> int:
+    """Linear offset of a 4-byte JD-Xi address, each address byte holding 7 bits."""
+    return (address[0] << 21) | (address[1] << 14) | (address[2] << 7) | address[3]
+
+
+def offset_to_address(offset: int) -> tuple:
+    """4-byte JD-Xi address of a linear offset."""
+    return (offset >> 21) & 0x7F, (offset >> 14) & 0x7F, (offset >> 7) & 0x7F, offset & 0x7F
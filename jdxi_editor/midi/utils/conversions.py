@@ -10,6 +10,10 @@ Functions:
 - frac_to_midi_cc: Converts address fractional value (0.0-1.0) to address MIDI CC value (0-127).
 - midi_cc_to_frac: Converts address MIDI CC value (0-127) to address fractional value (0.0-1.0).
 
+Constants:
+- MIDI_CC_TO_MS, MIDI_CC_TO_FRAC: midi_cc_to_ms and midi_cc_to_frac of every MIDI CC
+  value with the default ranges, indexed by the value.
+
 These functions are useful for mapping MIDI CC messages to meaningful time or intensity values
 in address synthesizer or effect unit.
 """
@@ -85,3 +89,8 @@ def midi_cc_to_frac(midi_cc_value, min=0, max=1):
     cc_range = 127
     conversion_factor = range / cc_range
     return float((midi_cc_value * conversion_factor) + min)
+
+
+# Every MIDI CC value converted with the default ranges, for incoming tone dumps
+MIDI_CC_TO_MS = tuple(midi_cc_to_ms(cc_value) for cc_value in range(128))
+MIDI_CC_TO_FRAC = tuple(midi_cc_to_frac(cc_value) for cc_value in range(128))
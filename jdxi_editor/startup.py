@@ -0,0 +1,109 @@
+"""
+Startup Timing
+==============
+
+This module provides the `StartupTimer` class, which records how long each phase
+of application startup takes, and `STARTUP_TIMER`, the instance `main()` and the
+main window report to. Phases may nest, e.g. the MIDI auto-connect inside the
+window build, and are logged once the event loop is running. Startup slower than
+`COLD_START_TARGET_SECONDS` is logged as a warning.
+
+Only the standard library is imported here, so `main.py` can import this module
+before anything else and have the timer cover the imports too. Run
+`python -X importtime -m jdxi_editor.main` for a per-module breakdown.
+
+Phases:
+    - imports: importing the main window and the modules it needs at startup.
+    - QApplication: creating the application and setting its icon.
+    - window build: constructing and showing the main window.
+    - MIDI auto-connect: opening the JD-Xi ports and sending the identity request.
+
+Classes:
+    - StartupTimer: Durations of the startup phases.
+
+Usage Example:
+    >>> with STARTUP_TIMER.phase("imports"):
+    ...     from jdxi_editor.ui.windows.jdxi.instrument import JdxiInstrument
+    >>> STARTUP_TIMER.finish()
+    >>> print(STARTUP_TIMER.report())
+    imports                 312.4 ms
+    ...
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional, Tuple
+
+# Seconds from the start of main.py to a running event loop, on a typical machine
+COLD_START_TARGET_SECONDS = 1.5
+
+
+class StartupTimer:
+    """Durations of the named startup phases, in the order they started."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        """
+        Start timing.
+
+        :param clock: Function returning a time in seconds.
+        """
+        self.clock = clock
+        self.started = clock()
+        # (name, nesting depth, seconds), seconds is None until the phase ends
+        self.phases: List[Tuple[str, int, Optional[float]]] = []
+        self.total: Optional[float] = None
+        self._depth = 0
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time the body of a with statement as a phase.
+
+        :param name: str phase name, e.g. "window build".
+        """
+        index = len(self.phases)
+        self.phases.append((name, self._depth, None))
+        self._depth += 1
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.phases[index] = (name, self._depth, self.clock() - start)
+
+    def duration(self, name: str) -> Optional[float]:
+        """
+        Return the seconds a finished phase took.
+
+        :param name: str phase name.
+        :return: float seconds, or None if the phase has not finished
+        """
+        return next((seconds for phase, _, seconds in self.phases if phase == name), None)
+
+    def finish(self) -> float:
+        """
+        Record the end of startup and log the phases.
+
+        :return: float seconds since the timer started
+        """
+        self.total = self.clock() - self.started
+        logging.info(f"Startup phases:\n{self.report()}")
+        if self.total > COLD_START_TARGET_SECONDS:
+            logging.warning(
+                f"Startup took {self.total:.2f} s, over the {COLD_START_TARGET_SECONDS:.2f} s target"
+            )
+        return self.total
+
+    def report(self) -> str:
+        """Return the phases, one per line, nested ones indented."""
+        lines = []
+        for name, depth, seconds in self.phases:
+            duration = "running" if seconds is None else f"{seconds * 1000:.1f} ms"
+            lines.append(f"{'  ' * depth + name:<24}{duration:>10}")
+        if self.total is not None:
+            lines.append(f"{'total':<24}{self.total * 1000:>7.1f} ms")
+        return "\n".join(lines)
+
+
+STARTUP_TIMER = StartupTimer()
@@ -1,17 +1,40 @@
-"""Editor modules for JD-Xi parameters"""
+"""Editor modules for JD-Xi parameters
 
-# First import base editor since others depend on it
-from jdxi_editor.ui.editors.synth import SynthEditor
+Editors are imported on first access, so importing this package, or a helper
+module in it, does not load every editor and the plotting libraries they use.
+"""
+
+from importlib import import_module
+
+# Editor class -> module defining it
+_EDITOR_MODULES = {
+    "SynthEditor": "jdxi_editor.ui.editors.synth",
+    "AnalogSynthEditor": "jdxi_editor.ui.editors.analog",
+    "DigitalSynthEditor": "jdxi_editor.ui.editors.digital",
+    "DrumEditor": "jdxi_editor.ui.editors.drum",
+    "ArpeggioEditor": "jdxi_editor.ui.editors.arpeggio",
+    "EffectsEditor": "jdxi_editor.ui.editors.effects",
+    "VocalFXEditor": "jdxi_editor.ui.editors.vocal_fx",
+    "ProgramEditor": "jdxi_editor.ui.editors.program",
+    "PresetEditor": "jdxi_editor.ui.editors.preset",
+    "PatternSequencer": "jdxi_editor.ui.editors.pattern",
+    "MidiFileEditor": "jdxi_editor.ui.editors.midi_file",
+}
+
+
+def __getattr__(name):
+    """Import an editor class on first access."""
+    module_name = _EDITOR_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    editor_class = getattr(import_module(module_name), name)
+    globals()[name] = editor_class
+    return editor_class
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EDITOR_MODULES))
 
-# Then import specific editors
-from jdxi_editor.ui.editors.analog import AnalogSynthEditor
-from jdxi_editor.ui.editors.digital import DigitalSynthEditor
-from jdxi_editor.ui.editors.drum import DrumEditor
-from jdxi_editor.ui.editors.arpeggio import ArpeggioEditor
-from jdxi_editor.ui.editors.effects import EffectsEditor
-from jdxi_editor.ui.editors.vocal_fx import VocalFXEditor
-from jdxi_editor.ui.editors.program import ProgramEditor
-from jdxi_editor.ui.editors.midi_file import MidiFileEditor
 
 __all__ = [
     "SynthEditor",
@@ -22,5 +45,7 @@ __all__ = [
     "EffectsEditor",
     "VocalFXEditor",
     "ProgramEditor",
+    "PresetEditor",
+    "PatternSequencer",
     "MidiFileEditor",
 ]
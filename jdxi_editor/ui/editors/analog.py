@@ -43,10 +43,9 @@ Example:
 
 import os
 import re
-import json
 import logging
 from functools import partial
-from typing import Optional, Dict, Union
+from typing import Optional, Dict, Tuple, Union
 
 from PySide6.QtWidgets import (
     QWidget,
@@ -66,9 +65,14 @@ import qtawesome as qta
 from jdxi_editor.midi.data.presets.analog import ANALOG_PRESETS_ENUMERATED
 from jdxi_editor.midi.preset.type import SynthType
 from jdxi_editor.midi.data.parameter.analog import AnalogParameter
+from jdxi_editor.midi.data.parameter.conversion import convert_record
+from jdxi_editor.midi.data.parameter.registry import PARAMETER_REGISTRY
 from jdxi_editor.midi.io.helper import MidiIOHelper
 from jdxi_editor.midi.message.roland import RolandSysEx
+from jdxi_editor.midi.sysex.parsed import ParsedSysEx
 from jdxi_editor.midi.utils.conversions import (
+    MIDI_CC_TO_FRAC,
+    MIDI_CC_TO_MS,
     midi_cc_to_ms,
     midi_cc_to_frac,
     frac_to_midi_cc,
@@ -93,14 +97,12 @@ from jdxi_editor.ui.widgets.preset.combo_box import PresetComboBox
 from jdxi_editor.ui.widgets.slider import Slider
 
 
-def get_analog_parameter_by_address(address: int):
-    """Retrieve the DigitalParameter by its address."""
-    logging.info(f"address: {address}")
-    for param in AnalogParameter:
-        if param.address == address:
-            logging.info(f"get_analog_parameter_by_address found param: {param}")
-            return param
-    return None
+def get_analog_parameter_by_address(address: Tuple[int, int]):
+    """Retrieve the AnalogParameter at a (group, offset) address."""
+    if len(address) < 2:
+        return None
+    group, offset = address[0], address[1]
+    return PARAMETER_REGISTRY.get("TEMPORARY_ANALOG_SYNTH_AREA", group, offset)
 
 
 class AnalogSynthEditor(SynthEditor):
@@ -129,9 +131,9 @@ class AnalogSynthEditor(SynthEditor):
         self.area = TEMPORARY_TONE_AREA
         self.group = ANALOG_OSC_GROUP
         self.part = ANALOG_PART
+        self.memory_blocks = ("ANALOG",)
         self.preset_handler = preset_handler
         self.setWindowTitle("Analog Synth")
-        self.previous_json_data = None
         # Allow resizing
         self.setMinimumSize(800, 600)
         self.resize(900, 600)
@@ -247,7 +249,9 @@ class AnalogSynthEditor(SynthEditor):
                 AnalogParameter.FILTER_RESONANCE.value[0], v
             )
         )
-        self.midi_helper.midi_sysex_json.connect(self._update_sliders_from_sysex)
+        self.midi_helper.sysex_router.subscribe(
+            "TEMPORARY_ANALOG_SYNTH_AREA", self._update_sliders_from_sysex
+        )
         for param, slider in self.controls.items():
             if isinstance(slider, QSlider):  # Ensure it's address slider
                 slider.setTickPosition(
@@ -256,8 +260,6 @@ class AnalogSynthEditor(SynthEditor):
                 slider.setTickInterval(10)  # Adjust interval as needed
         self.data_request()
         self.midi_helper.midi_parameter_received.connect(self._on_parameter_received)
-        # Initialize previous JSON data storage
-        self.previous_json_data = None
         self.refresh_shortcut = QShortcut(QKeySequence.StandardKey.Refresh, self)
         self.refresh_shortcut.activated.connect(self.data_request)
         if self.midi_helper:
@@ -293,9 +295,7 @@ class AnalogSynthEditor(SynthEditor):
                         f"midi value {value} converted to slider value {slider_value}"
                     )
                     slider = self.controls[param]
-                    slider.blockSignals(True)  # Prevent feedback loop
-                    slider.setValue(slider_value)
-                    slider.blockSignals(False)
+                    self.update_scheduler.schedule(slider, slider_value)
 
                 # Handle OSC_WAVE parameter to update waveform buttons
                 if param == AnalogParameter.OSC_WAVEFORM:
@@ -1058,22 +1058,11 @@ class AnalogSynthEditor(SynthEditor):
                                         value=midi_value)
             self.midi_helper.send_midi_message(sysex_message)
 
-    def _update_sliders_from_sysex(self, json_sysex_data: str):
+    def _update_sliders_from_sysex(self, parsed: ParsedSysEx):
         """Update sliders and combo boxes based on parsed SysEx data."""
         logging.info("Updating UI components from SysEx data")
 
-        try:
-            current_sysex_data = json.loads(json_sysex_data)
-        except json.JSONDecodeError as ex:
-            logging.error(f"Invalid JSON format: {ex}")
-            return
-
-        # Compare with previous data and log changes
-        if self.previous_json_data:
-            self._log_changes(self.previous_json_data, current_sysex_data)
-
-        # Store the current data for future comparison
-        self.previous_json_data = current_sysex_data
+        current_sysex_data = parsed.parameters
 
         if current_sysex_data.get("TEMPORARY_AREA") != "TEMPORARY_ANALOG_SYNTH_AREA":
             logging.warning(
@@ -1099,43 +1088,47 @@ class AnalogSynthEditor(SynthEditor):
         osc_waveform_map = {0: Waveform.SAW, 1: Waveform.TRIANGLE, 2: Waveform.PULSE}
 
         failures, successes = [], []
+        # Display values of the whole tone, converted in one call
+        display_values = convert_record(parsed.parameters, AnalogParameter)
 
         def update_slider(param, value):
             """Helper function to update sliders safely."""
             slider = self.controls.get(param)
             if slider:
-                slider_value = param.convert_from_midi(value)
-                slider.blockSignals(True)
-                slider.setValue(slider_value)
-                slider.blockSignals(False)
+                slider_value = display_values.get(param.name)
+                if slider_value is None:
+                    slider_value = param.convert_from_midi(value)
+                self.update_scheduler.schedule(slider, slider_value)
                 successes.append(param.name)
 
         def update_adsr_widget(param, value):
             """Helper function to update ADSR widgets."""
-            new_value = (
-                midi_cc_to_frac(value)
-                if param
-                   in [
-                       AnalogParameter.AMP_ENV_SUSTAIN_LEVEL,
-                       AnalogParameter.FILTER_ENV_SUSTAIN_LEVEL,
-                   ]
-                else midi_cc_to_ms(value)
-            )
-
+            amp_env, filter_env = self.amp_env_adsr_widget, self.filter_adsr_widget
             adsr_mapping = {
-                AnalogParameter.AMP_ENV_ATTACK_TIME: self.amp_env_adsr_widget.attack_sb,
-                AnalogParameter.AMP_ENV_DECAY_TIME: self.amp_env_adsr_widget.decay_sb,
-                AnalogParameter.AMP_ENV_SUSTAIN_LEVEL: self.amp_env_adsr_widget.sustain_sb,
-                AnalogParameter.AMP_ENV_RELEASE_TIME: self.amp_env_adsr_widget.release_sb,
-                AnalogParameter.FILTER_ENV_ATTACK_TIME: self.filter_adsr_widget.attack_sb,
-                AnalogParameter.FILTER_ENV_DECAY_TIME: self.filter_adsr_widget.decay_sb,
-                AnalogParameter.FILTER_ENV_SUSTAIN_LEVEL: self.filter_adsr_widget.sustain_sb,
-                AnalogParameter.FILTER_ENV_RELEASE_TIME: self.filter_adsr_widget.release_sb,
+                AnalogParameter.AMP_ENV_ATTACK_TIME: (amp_env, amp_env.attack_sb),
+                AnalogParameter.AMP_ENV_DECAY_TIME: (amp_env, amp_env.decay_sb),
+                AnalogParameter.AMP_ENV_SUSTAIN_LEVEL: (amp_env, amp_env.sustain_sb),
+                AnalogParameter.AMP_ENV_RELEASE_TIME: (amp_env, amp_env.release_sb),
+                AnalogParameter.FILTER_ENV_ATTACK_TIME: (filter_env, filter_env.attack_sb),
+                AnalogParameter.FILTER_ENV_DECAY_TIME: (filter_env, filter_env.decay_sb),
+                AnalogParameter.FILTER_ENV_SUSTAIN_LEVEL: (filter_env, filter_env.sustain_sb),
+                AnalogParameter.FILTER_ENV_RELEASE_TIME: (filter_env, filter_env.release_sb),
             }
 
             if param in adsr_mapping:
-                spinbox = adsr_mapping[param]
-                spinbox.setValue(new_value)
+                adsr_widget, spinbox = adsr_mapping[param]
+                new_value = (
+                    MIDI_CC_TO_FRAC[value]
+                    if param
+                    in [
+                        AnalogParameter.AMP_ENV_SUSTAIN_LEVEL,
+                        AnalogParameter.FILTER_ENV_SUSTAIN_LEVEL,
+                    ]
+                    else MIDI_CC_TO_MS[value]
+                )
+                self.update_scheduler.schedule(
+                    spinbox, new_value, after_batch=adsr_widget.refresh_from_spinboxes
+                )
 
         for param_name, param_value in current_sysex_data.items():
             param = AnalogParameter.get_by_name(param_name)
@@ -1161,15 +1154,15 @@ class AnalogSynthEditor(SynthEditor):
                         param_name == "SUB_OSCILLATOR_TYPE"
                         and param_value in sub_osc_type_map
                 ):
-                    self.sub_oscillator_type_switch.blockSignals(True)
-                    self.sub_oscillator_type_switch.setValue(sub_osc_type_map[param_value])
-                    self.sub_oscillator_type_switch.blockSignals(False)
+                    self.update_scheduler.schedule(
+                        self.sub_oscillator_type_switch, sub_osc_type_map[param_value]
+                    )
                 elif param_name == "OSC_WAVEFORM" and param_value in osc_waveform_map:
                     self._update_waveform_buttons(param_value)
                 elif param_name == "FILTER_SWITCH" and param_value in filter_switch_map:
-                    self.filter_switch.blockSignals(True)
-                    self.filter_switch.setValue(filter_switch_map[param_value])
-                    self.filter_switch.blockSignals(False)
+                    self.update_scheduler.schedule(
+                        self.filter_switch, filter_switch_map[param_value]
+                    )
                 else:
                     update_slider(param, param_value)
                     update_adsr_widget(param, param_value)
@@ -1304,9 +1297,7 @@ class AnalogSynthEditor(SynthEditor):
         slider = self.controls.get(param)
         if slider:
             slider_value = param.convert_from_midi(value)
-            slider.blockSignals(True)
-            slider.setValue(slider_value)
-            slider.blockSignals(False)
+            self.update_scheduler.schedule(slider, slider_value)
             logging.info(f"Updated {param.name} slider to {slider_value}")
 
 
@@ -30,7 +30,6 @@ Dependencies:
 """
 
 import os
-import json
 import re
 import logging
 from typing import Dict, Optional, Union
@@ -54,7 +53,8 @@ from jdxi_editor.midi.data.presets.digital import DIGITAL_PRESETS_ENUMERATED
 from jdxi_editor.midi.preset.type import SynthType
 from jdxi_editor.midi.io import MidiIOHelper
 from jdxi_editor.midi.message.roland import RolandSysEx
-from jdxi_editor.midi.utils.conversions import midi_cc_to_ms, midi_cc_to_frac
+from jdxi_editor.midi.sysex.parsed import ParsedSysEx
+from jdxi_editor.midi.utils.conversions import MIDI_CC_TO_FRAC, MIDI_CC_TO_MS
 from jdxi_editor.ui.editors.synth import SynthEditor
 from jdxi_editor.ui.editors.digital_partial import DigitalPartialEditor
 from jdxi_editor.midi.data.parameter.digital_modify import DigitalModifyParameter
@@ -68,6 +68,7 @@ from jdxi_editor.midi.data.digital import (
 )
 from jdxi_editor.midi.data.parameter.digital_common import DigitalCommonParameter
 from jdxi_editor.midi.data.parameter.digital import DigitalParameter
+from jdxi_editor.midi.data.parameter.conversion import convert_record
 from jdxi_editor.midi.data.constants import (
     TEMPORARY_DIGITAL_SYNTH_1_AREA,
     COMMON_AREA,
@@ -90,10 +91,9 @@ class DigitalSynthEditor(SynthEditor):
         parent=None,
         preset_handler=None,
     ):
-        super().__init__(parent)
+        super().__init__(midi_helper, parent)
         # Image display
         self.partial_num = None
-        self.current_data = None
         self.preset_type = (
             SynthType.DIGITAL_1 if synth_num == 1 else SynthType.DIGITAL_2
         )
@@ -134,10 +134,12 @@ class DigitalSynthEditor(SynthEditor):
             self.midi_channel = MIDI_CHANNEL_DIGITAL2
             self.area = DIGITAL_SYNTH_2_AREA
             self.part = DIGITAL_2_PART
+            self.memory_blocks = ("DIGITAL_2_",)
         else:
             self.midi_channel = MIDI_CHANNEL_DIGITAL1
             self.area = DIGITAL_SYNTH_1_AREA
             self.part = DIGITAL_1_PART
+            self.memory_blocks = ("DIGITAL_1_",)
         # midi message parameters
 
         self.group = COMMON_AREA
@@ -298,7 +300,12 @@ class DigitalSynthEditor(SynthEditor):
         else:
             logging.error("MIDI helper not initialized")
 
-        self.midi_helper.midi_sysex_json.connect(self._dispatch_sysex_to_area)
+        self.midi_helper.sysex_router.subscribe(
+            "TEMPORARY_DIGITAL_SYNTH_2_AREA"
+            if self.synth_num == 2
+            else "TEMPORARY_DIGITAL_SYNTH_1_AREA",
+            self._dispatch_sysex_to_area,
+        )
         print(f"self.controls: {self.controls}")
         self.refresh_shortcut = QShortcut(QKeySequence.StandardKey.Refresh, self)
         self.refresh_shortcut.activated.connect(self.data_request)
@@ -589,9 +596,7 @@ class DigitalSynthEditor(SynthEditor):
                         f"midi value {value} converted to slider value {slider_value}"
                     )
                     slider = self.partial_editors[partial_no].controls[param]
-                    slider.blockSignals(True)  # Prevent feedback loop
-                    slider.setValue(slider_value)
-                    slider.blockSignals(False)
+                    self.update_scheduler.schedule(slider, slider_value)
 
                 # Handle OSC_WAVE parameter to update waveform buttons
                 if param == DigitalParameter.OSC_WAVE:
@@ -600,20 +605,13 @@ class DigitalSynthEditor(SynthEditor):
                         "updating waveform buttons for param {param} with {value}"
                     )
 
-    def _update_partial_sliders_from_sysex(self, json_sysex_data: str):
+    def _update_partial_sliders_from_sysex(self, parsed: ParsedSysEx):
         """Update sliders and combo boxes based on parsed SysEx data."""
         logging.info("Updating UI components from SysEx data")
         debug_param_updates = True
         debug_stats = True
 
-        try:
-            sysex_data = json.loads(json_sysex_data)
-            self.previous_data = self.current_data
-            self.current_data = sysex_data
-            self._log_changes(self.previous_data, sysex_data)
-        except json.JSONDecodeError as ex:
-            logging.error(f"Invalid JSON format: {ex}")
-            return
+        sysex_data = parsed.parameters
 
         def _is_valid_sysex_area(sysex_data):
             """Check if SysEx data belongs to address supported digital synth area."""
@@ -630,46 +628,39 @@ class DigitalSynthEditor(SynthEditor):
 
         def update_adsr_widget(param, value):
             """Helper function to update ADSR widgets."""
-            new_value = (
-                midi_cc_to_frac(value)
-                if param
-                in [
-                    DigitalParameter.AMP_ENV_SUSTAIN_LEVEL,
-                    DigitalParameter.FILTER_ENV_SUSTAIN_LEVEL,
-                ]
-                else midi_cc_to_ms(value)
-            )
-
+            amp_env = self.partial_editors[partial_no].amp_env_adsr_widget
+            filter_env = self.partial_editors[partial_no].filter_adsr_widget
             adsr_mapping = {
-                DigitalParameter.AMP_ENV_ATTACK_TIME: self.partial_editors[
-                    partial_no
-                ].amp_env_adsr_widget.attack_sb,
-                DigitalParameter.AMP_ENV_DECAY_TIME: self.partial_editors[
-                    partial_no
-                ].amp_env_adsr_widget.decay_sb,
-                DigitalParameter.AMP_ENV_SUSTAIN_LEVEL: self.partial_editors[
-                    partial_no
-                ].amp_env_adsr_widget.sustain_sb,
-                DigitalParameter.AMP_ENV_RELEASE_TIME: self.partial_editors[
-                    partial_no
-                ].amp_env_adsr_widget.release_sb,
-                DigitalParameter.FILTER_ENV_ATTACK_TIME: self.partial_editors[
-                    partial_no
-                ].filter_adsr_widget.attack_sb,
-                DigitalParameter.FILTER_ENV_DECAY_TIME: self.partial_editors[
-                    partial_no
-                ].filter_adsr_widget.decay_sb,
-                DigitalParameter.FILTER_ENV_SUSTAIN_LEVEL: self.partial_editors[
-                    partial_no
-                ].filter_adsr_widget.sustain_sb,
-                DigitalParameter.FILTER_ENV_RELEASE_TIME: self.partial_editors[
-                    partial_no
-                ].filter_adsr_widget.release_sb,
+                DigitalParameter.AMP_ENV_ATTACK_TIME: (amp_env, amp_env.attack_sb),
+                DigitalParameter.AMP_ENV_DECAY_TIME: (amp_env, amp_env.decay_sb),
+                DigitalParameter.AMP_ENV_SUSTAIN_LEVEL: (amp_env, amp_env.sustain_sb),
+                DigitalParameter.AMP_ENV_RELEASE_TIME: (amp_env, amp_env.release_sb),
+                DigitalParameter.FILTER_ENV_ATTACK_TIME: (filter_env, filter_env.attack_sb),
+                DigitalParameter.FILTER_ENV_DECAY_TIME: (filter_env, filter_env.decay_sb),
+                DigitalParameter.FILTER_ENV_SUSTAIN_LEVEL: (
+                    filter_env,
+                    filter_env.sustain_sb,
+                ),
+                DigitalParameter.FILTER_ENV_RELEASE_TIME: (
+                    filter_env,
+                    filter_env.release_sb,
+                ),
             }
 
             if param in adsr_mapping:
-                spinbox = adsr_mapping[param]
-                spinbox.setValue(new_value)
+                adsr_widget, spinbox = adsr_mapping[param]
+                new_value = (
+                    MIDI_CC_TO_FRAC[value]
+                    if param
+                    in [
+                        DigitalParameter.AMP_ENV_SUSTAIN_LEVEL,
+                        DigitalParameter.FILTER_ENV_SUSTAIN_LEVEL,
+                    ]
+                    else MIDI_CC_TO_MS[value]
+                )
+                self.update_scheduler.schedule(
+                    spinbox, new_value, after_batch=adsr_widget.refresh_from_spinboxes
+                )
 
         if not _is_valid_sysex_area(sysex_data):
             logging.warning(
@@ -690,18 +681,20 @@ class DigitalSynthEditor(SynthEditor):
         sysex_data = {k: v for k, v in sysex_data.items() if k not in ignored_keys}
 
         failures, successes = [], []
+        # Display values of the whole tone, converted in one call
+        display_values = convert_record(parsed.parameters, DigitalParameter)
 
         def _update_slider(param, value):
             """Helper function to update sliders safely."""
             slider = self.partial_editors[partial_no].controls.get(param)
             if slider:
-                slider_value = param.convert_from_midi(value)
+                slider_value = display_values.get(param.name)
+                if slider_value is None:
+                    slider_value = param.convert_from_midi(value)
                 logging.info(
                     f"midi value {value} converted to slider value {slider_value}"
                 )
-                slider.blockSignals(True)
-                slider.setValue(slider_value)
-                slider.blockSignals(False)
+                self.update_scheduler.schedule(slider, slider_value)
                 successes.append(param.name)
                 if debug_param_updates:
                     logging.info(f"Updated: {param.name:50} {value}")
@@ -731,54 +724,26 @@ class DigitalSynthEditor(SynthEditor):
 
         _log_debug_info()
 
-    def _dispatch_sysex_to_area(self, json_sysex_data: str):
-        """Update sliders and combo boxes based on parsed SysEx data."""
+    def _dispatch_sysex_to_area(self, parsed: ParsedSysEx):
+        """Route a SysEx frame for this synth's area to the common or partial controls."""
         logging.info("Updating UI components from SysEx data")
-        failures, successes = [], []
-
-        def _parse_sysex_json(json_data):
-            """Parse JSON safely and log changes."""
-            try:
-                sysex_data = json.loads(json_data)
-                return sysex_data
-            except json.JSONDecodeError as ex:
-                logging.error(f"Invalid JSON format: {ex}")
-                return None
-
-        # Parse SysEx data
-        sysex_data = _parse_sysex_json(json_sysex_data)
-        if not sysex_data:
-            return
-
-        synth_tone = sysex_data.get("SYNTH_TONE")
+        synth_tone = parsed.synth_tone
 
         if synth_tone == "TONE_COMMON":
             logging.info("\nTone common")
-            self._update_common_sliders_from_sysex(json_sysex_data)
+            self._update_common_sliders_from_sysex(parsed)
         elif synth_tone == "TONE_MODIFY":
             pass  # not yet implemented
         else:
-            self._update_partial_sliders_from_sysex(json_sysex_data)
+            self._update_partial_sliders_from_sysex(parsed)
 
-    def _update_common_sliders_from_sysex(self, json_sysex_data: str):
+    def _update_common_sliders_from_sysex(self, parsed: ParsedSysEx):
         """Update sliders and combo boxes based on parsed SysEx data."""
         logging.info("Updating UI components from SysEx data")
         debug_param_updates = True
         debug_stats = True
         failures, successes = [], []
 
-        def _parse_sysex_json(json_data):
-            """Parse JSON safely and log changes."""
-            try:
-                sysex_data = json.loads(json_data)
-                self.previous_data = self.current_data
-                self.current_data = sysex_data
-                self._log_changes(self.previous_data, sysex_data)
-                return sysex_data
-            except json.JSONDecodeError as ex:
-                logging.error(f"Invalid JSON format: {ex}")
-                return None
-
         def _is_valid_sysex_area(sysex_data):
             """Check if SysEx data belongs to address supported digital synth area."""
             return sysex_data.get("TEMPORARY_AREA") in [
@@ -798,9 +763,7 @@ class DigitalSynthEditor(SynthEditor):
             slider = self.controls.get(param)
             logging.info(f"slider: {slider}")
             if slider:
-                slider.blockSignals(True)
-                slider.setValue(value)
-                slider.blockSignals(False)
+                self.update_scheduler.schedule(slider, value)
                 successes.append(param.name)
                 if debug_param_updates:
                     logging.info(f"Updated: {param.name:50} {value}")
@@ -819,19 +782,18 @@ class DigitalSynthEditor(SynthEditor):
             check_box = self.partials_panel.switches.get(partial_number)
             logging.info(f"check_box: {check_box}")
             if check_box:  # and isinstance(check_box, QCheckBox):
-                check_box.blockSignals(True)
-                check_box.setState(bool(value), False)
-                check_box.blockSignals(False)
+                self.update_scheduler.schedule(
+                    check_box,
+                    bool(value),
+                    setter=lambda state: check_box.setState(state, False),
+                )
                 successes.append(param.name)
                 if debug_param_updates:
                     logging.info(f"Updated: {param.name:50} {value}")
             else:
                 failures.append(param.name)
 
-        # Parse SysEx data
-        sysex_data = _parse_sysex_json(json_sysex_data)
-        if not sysex_data:
-            return
+        sysex_data = parsed.parameters
 
         if not _is_valid_sysex_area(sysex_data):
             logging.warning(
@@ -876,9 +838,7 @@ class DigitalSynthEditor(SynthEditor):
             """Helper function to update sliders safely."""
             slider = self.partial_editors[partial_no].controls.get(param)
             if slider:
-                slider.blockSignals(True)
-                slider.setValue(value)
-                slider.blockSignals(False)
+                self.update_scheduler.schedule(slider, value)
                 successes.append(param.name)
                 if debug_param_updates:
                     logging.info(f"Updated: {param.name:50} {value}")
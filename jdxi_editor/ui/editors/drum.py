@@ -61,7 +61,6 @@ import os
 import re
 import logging
 from typing import Optional, Dict
-import json
 
 from PySide6.QtWidgets import (
     QVBoxLayout,
@@ -78,10 +77,12 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QPixmap
 
 from jdxi_editor.midi.data.parameter.drums import DrumParameter, DrumCommonParameter
+from jdxi_editor.midi.data.parameter.conversion import convert_record
 from jdxi_editor.midi.data.presets.drum import DRUM_PRESETS_ENUMERATED
 from jdxi_editor.midi.preset.type import SynthType
 from jdxi_editor.midi.io import MidiIOHelper
 from jdxi_editor.midi.preset.data import PresetData
+from jdxi_editor.midi.sysex.parsed import ParsedSysEx
 from jdxi_editor.midi.preset.handler import PresetHandler
 from jdxi_editor.ui.editors.drum_partial import DrumPartialEditor
 from jdxi_editor.ui.style import Style
@@ -114,8 +115,7 @@ class DrumEditor(SynthEditor):
         self.area = TEMPORARY_TONE_AREA
         self.part = DRUM_KIT_AREA
         self.group = 0x2E
-        self.current_data = None
-        self.previous_data = None
+        self.memory_blocks = ("DRUM_",)
         self.partial_mapping = {
             "BD1": 0,
             "RIM": 1,
@@ -310,7 +310,9 @@ class DrumEditor(SynthEditor):
 
         self.update_instrument_image()
         self.partial_tab_widget.currentChanged.connect(self.update_partial_num)
-        self.midi_helper.midi_sysex_json.connect(self._dispatch_sysex_to_area)
+        self.midi_helper.sysex_router.subscribe(
+            "TEMPORARY_DRUM_KIT_AREA", self._dispatch_sysex_to_area
+        )
         # Register the callback for incoming MIDI messages
         if self.midi_helper:
             logging.info("MIDI helper initialized")
@@ -389,55 +391,27 @@ class DrumEditor(SynthEditor):
             if not load_and_set_image(default_image_path):
                 self.image_label.clear()  # Clear label if default image is also missing
 
-    def _dispatch_sysex_to_area(self, json_sysex_data: str):
-        """Update sliders and combo boxes based on parsed SysEx data."""
+    def _dispatch_sysex_to_area(self, parsed: ParsedSysEx):
+        """Route a drum kit SysEx frame to the common or partial controls."""
         logging.info("Updating UI components from SysEx data")
-        # failures, successes = [], []
-
-        def _parse_sysex_json(json_data):
-            """Parse JSON safely and log changes."""
-            try:
-                sysex_data = json.loads(json_data)
-                return sysex_data
-            except json.JSONDecodeError as ex:
-                logging.error(f"Invalid JSON format: {ex}")
-                return None
-
-        # Parse SysEx data
-        sysex_data = _parse_sysex_json(json_sysex_data)
-        if not sysex_data:
-            return
-
-        synth_tone = sysex_data.get("SYNTH_TONE")
+        synth_tone = parsed.synth_tone
 
         if synth_tone == "TONE_COMMON":
             logging.info("\nTone common")
-            self._update_common_sliders_from_sysex(json_sysex_data)
+            self._update_common_sliders_from_sysex(parsed)
         else:
-            self._update_partial_sliders_from_sysex(json_sysex_data)
+            self._update_partial_sliders_from_sysex(parsed)
 
-    def _update_common_sliders_from_sysex(self, json_sysex_data: str):
+    def _update_common_sliders_from_sysex(self, parsed: ParsedSysEx):
         """Update sliders and combo boxes based on parsed SysEx data."""
         logging.info("Updating UI components from SysEx data")
         debug_param_updates = True
         debug_stats = True
         failures, successes = [], []
 
-        def _parse_sysex_json(json_data):
-            """Parse JSON safely and log changes."""
-            try:
-                sysex_data = json.loads(json_data)
-                self.previous_data = self.current_data
-                self.current_data = sysex_data
-                self._log_changes(self.previous_data, sysex_data)
-                return sysex_data
-            except json.JSONDecodeError as ex:
-                logging.error(f"Invalid JSON format: {ex}")
-                return None
-
         def _is_valid_sysex_area(sysex_data):
-            """Check if SysEx data belongs to address supported digital synth area."""
-            return sysex_data.get("TEMPORARY_AREA") == DRUM_KIT_AREA
+            """Check if SysEx data belongs to the drum kit area."""
+            return sysex_data.get("TEMPORARY_AREA") == "TEMPORARY_DRUM_KIT_AREA"
 
         def _get_partial_number(synth_tone):
             """Retrieve partial number from synth tone mapping."""
@@ -451,9 +425,7 @@ class DrumEditor(SynthEditor):
             slider = self.controls.get(param)
             logging.info(f"slider: {slider}")
             if slider:
-                slider.blockSignals(True)
-                slider.setValue(value)
-                slider.blockSignals(False)
+                self.update_scheduler.schedule(slider, value)
                 successes.append(param.name)
                 if debug_param_updates:
                     logging.info(f"Updated: {param.name:50} {value}")
@@ -472,19 +444,18 @@ class DrumEditor(SynthEditor):
             check_box = self.partials_panel.switches.get(partial_number)
             logging.info(f"check_box: {check_box}")
             if check_box:  # and isinstance(check_box, QCheckBox):
-                check_box.blockSignals(True)
-                check_box.setState(bool(value), False)
-                check_box.blockSignals(False)
+                self.update_scheduler.schedule(
+                    check_box,
+                    bool(value),
+                    setter=lambda state: check_box.setState(state, False),
+                )
                 successes.append(param.name)
                 if debug_param_updates:
                     logging.info(f"Updated: {param.name:50} {value}")
             else:
                 failures.append(param.name)
 
-        # Parse SysEx data
-        sysex_data = _parse_sysex_json(json_sysex_data)
-        if not sysex_data:
-            return
+        sysex_data = parsed.parameters
 
         if not _is_valid_sysex_area(sysex_data):
             logging.warning(
@@ -547,9 +518,7 @@ class DrumEditor(SynthEditor):
             """Helper function to update sliders safely."""
             slider = self.partial_editors[partial_no].controls.get(param)
             if slider:
-                slider.blockSignals(True)
-                slider.setValue(value)
-                slider.blockSignals(False)
+                self.update_scheduler.schedule(slider, value)
                 successes.append(param.name)
                 if debug_param_updates:
                     logging.info(f"Updated: {param.name:50} {value}")
@@ -569,20 +538,13 @@ class DrumEditor(SynthEditor):
 
         _log_debug_info()
 
-    def _update_partial_sliders_from_sysex(self, json_sysex_data: str):
+    def _update_partial_sliders_from_sysex(self, parsed: ParsedSysEx):
         """Update sliders and combo boxes based on parsed SysEx data."""
         logging.info("Updating UI components from SysEx data")
         debug_param_updates = True
         debug_stats = True
 
-        try:
-            sysex_data = json.loads(json_sysex_data)
-            self.previous_data = self.current_data
-            self.current_data = sysex_data
-            self._log_changes(self.previous_data, sysex_data)
-        except json.JSONDecodeError as ex:
-            logging.error(f"Invalid JSON format: {ex}")
-            return
+        sysex_data = parsed.parameters
 
         def _is_valid_sysex_area(sysex_data):
             """Check if SysEx data belongs to address supported digital synth area."""
@@ -611,18 +573,20 @@ class DrumEditor(SynthEditor):
         }
         sysex_data = {k: v for k, v in sysex_data.items() if k not in ignored_keys}
         failures, successes = [], []
+        # Display values of the whole tone, converted in one call
+        display_values = convert_record(parsed.parameters, DrumParameter)
 
         def _update_slider(param, value):
             """Helper function to update sliders safely."""
             slider = self.partial_editors[partial_no].controls.get(param)
             if slider:
-                slider_value = param.convert_from_midi(value)
+                slider_value = display_values.get(param.name)
+                if slider_value is None:
+                    slider_value = param.convert_from_midi(value)
                 logging.info(
                     f"midi value {value} converted to slider value {slider_value}"
                 )
-                slider.blockSignals(True)
-                slider.setValue(slider_value)
-                slider.blockSignals(False)
+                self.update_scheduler.schedule(slider, slider_value)
                 successes.append(param.name)
                 if debug_param_updates:
                     logging.info(f"Updated: {param.name:50} {value}")
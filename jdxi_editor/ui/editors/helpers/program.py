@@ -14,6 +14,12 @@ Functions:
     - get_program_by_id(program_id: str) -> Optional[Dict[str, str]]:
         Retrieves a program by its ID from the `PROGRAM_LIST`.
 
+    - get_program_by_midi(msb: int, lsb: int, pc: int) -> Optional[Dict[str, str]]:
+        Retrieves a program by its bank select and program change values.
+
+    - get_programs_using_tone(tone: str, part: Optional[str] = None) -> List[Dict[str, str]]:
+        Retrieves the programs using a digital, drum or analog tone.
+
     - calculate_midi_values(bank: str, program_number: int) -> tuple:
         Calculates the MSB, LSB, and PC based on the given bank and program number.
 
@@ -31,6 +37,8 @@ Functions:
 
 Constants:
     - PROGRAM_LIST: A list of dictionaries containing MIDI program information used throughout the functions.
+    - PROGRAM_CATALOG: Indexes of `PROGRAM_LIST` by ID, name, MIDI values and tones, used for the lookups.
+      Loaded from the compiled catalogs on first use, with msb, lsb and pc as ints.
 
 Logging:
     This module uses Python's `logging` module to log key operations and errors, such as retrieving programs, calculating MIDI values,
@@ -42,95 +50,84 @@ Usage Example:
 """
 
 import logging
-import re
-from typing import Optional, Dict, Union, Any
+from typing import Optional, Dict, List, Union, Any
 
-from jdxi_editor.midi.data.programs.presets import DIGITAL_PRESET_LIST
-from jdxi_editor.midi.data.programs.programs import PROGRAM_LIST
+from jdxi_editor.midi.data.programs import DIGITAL_PRESET_CATALOG, PROGRAM_CATALOG
 
 
 def get_program_index_by_id(program_id: str) -> Optional[int]:
     """Retrieve the index of a program by its ID from PROGRAM_LIST."""
     logging.info(f"Getting program index for {program_id}")
-    for index, program in enumerate(PROGRAM_LIST):
-        if program["id"] == program_id:
-            logging.info(f"Index for {program_id} is {index - 1}")
-            return index - 1  # Convert to 0-based index
-    logging.warning(f"Program with ID {program_id} not found.")
-    return None
+    index = PROGRAM_CATALOG.index_of("id", program_id)
+    if index is None:
+        logging.warning(f"Program with ID {program_id} not found.")
+        return None
+    logging.info(f"Index for {program_id} is {index - 1}")
+    return index - 1  # Convert to 0-based index
 
 
 def get_program_by_id(program_id: str) -> Optional[Dict[str, str]]:
     """Retrieve a program by its ID from PROGRAM_LIST."""
-    return next((program for program in PROGRAM_LIST if program["id"] == program_id), None)
+    return PROGRAM_CATALOG.get_by_id(program_id)
 
 
 def get_program_by_bank_and_number(bank: str, program_number: int) -> Optional[Dict[str, str]]:
     """Retrieve a program by its bank letter and number."""
-    program_id = f"{bank}{program_number:02d}"
-    return next((program for program in PROGRAM_LIST if program["id"] == program_id), None)
+    return PROGRAM_CATALOG.get_by_id(f"{bank}{program_number:02d}")
 
 
-def get_program_id_by_name_new(name: str) -> Optional[str]:
-    """Retrieve a program's ID by its name from PROGRAM_LIST."""
-    program = next((program for program in PROGRAM_LIST if program["name"] == name), None)
-    return program["id"] if program else None
+def get_program_by_midi(msb: int, lsb: int, pc: int) -> Optional[Dict[str, str]]:
+    """Retrieve a program by its bank select MSB, LSB and program change."""
+    return PROGRAM_CATALOG.get_by_midi(msb, lsb, pc)
 
 
 def get_program_id_by_name_new(name: str) -> Optional[str]:
     """Retrieve a program's ID from PROGRAM_LIST by matching its name flexibly."""
-    print(f"Searching for program name: {name}")
-
-    for program in PROGRAM_LIST:
-        # Match 'name' as a substring of 'program["name"]' (correct order)
-        if re.search(re.escape(fr"{name}"), fr'{program["name"]}', re.IGNORECASE):
-            print(program)
-            return program["id"]
-
-    logging.warning(f"Program named '{name}' not found.")
-    return None
+    programs = PROGRAM_CATALOG.search(name)
+    if not programs:
+        logging.warning(f"Program named '{name}' not found.")
+        return None
+    return programs[0]["id"]
 
 
 def get_program_id_by_name(name: str) -> Optional[str]:
     """Retrieve a program's ID from PROGRAM_LIST by matching its name as a substring."""
-    print(f"Searching for program name: {name}")
-
-    for program in PROGRAM_LIST:
-        if name in program["name"]:  # Check if 'name' is a substring
-            print(program)
-            return program["id"]
-
-    logging.warning(f"Program named '{name}' not found.")
-    return None
+    program = PROGRAM_CATALOG.first_containing(name)
+    if program is None:
+        logging.warning(f"Program named '{name}' not found.")
+        return None
+    return program["id"]
 
 
 def get_program_number_by_name(program_name: str) -> Optional[str]:
     """Retrieve a program's number (without bank letter) by its name from PROGRAM_LIST."""
-    program = next((p for p in PROGRAM_LIST if p["name"] == program_name), None)
+    program = PROGRAM_CATALOG.get_by_name(program_name)
     return int(program["id"][1:]) if program else None
 
 
 def get_program_name_by_id(program_id: str) -> Optional[str]:
     """Retrieve a program name by its ID from PROGRAM_LIST."""
-    program = next((program for program in PROGRAM_LIST if program["id"] == program_id), None)
+    program = PROGRAM_CATALOG.get_by_id(program_id)
     return program["name"] if program else None
 
 
 def get_program_parameter_value(parameter: str, program_id: str) -> Optional[str]:
     """Retrieve a specific parameter value from a program by its ID."""
-    program = next((p for p in PROGRAM_LIST if p["id"] == program_id), None)
+    program = PROGRAM_CATALOG.get_by_id(program_id)
     return program.get(parameter) if program else None
 
 
+def get_programs_using_tone(tone: str, part: Optional[str] = None) -> List[Dict[str, str]]:
+    """Retrieve the programs using a tone, optionally only as "digital_1", "digital_2", "drum" or "analog"."""
+    return PROGRAM_CATALOG.using(tone, part)
+
+
 def get_preset_parameter_value(parameter: str, id: str) -> Union[Optional[int], Any]:
     """Retrieve a specific parameter value from a program by its ID."""
-    preset = next((p for p in DIGITAL_PRESET_LIST if p["id"] == id), None)
+    preset = DIGITAL_PRESET_CATALOG.get_by_id(id)
     if not preset:
         return None
-    # Convert string values to integers for msb, lsb, pc
-    if parameter in ["msb", "lsb", "pc"]:
-        return int(preset.get(parameter))
-    return preset.get(parameter)
+    return preset.get(parameter)  # msb, lsb and pc are compiled as ints
 
 
 def calculate_midi_values(bank: str, program_number: int):
@@ -185,9 +182,9 @@ def log_program_info(program_name, program_id=None, program_details=None):
 
 def get_msb_lsb_pc(program_number: int):
     """Get MSB, LSB, and PC based on bank and program number."""
-    msb, lsb, pc = (
-        PROGRAM_LIST[program_number]["msb"],  # Tone Bank Select MSB (CC# 0)
-        PROGRAM_LIST[program_number]["lsb"],  # Tone Bank Select LSB (CC# 32)
-        PROGRAM_LIST[program_number]["pc"],  # Tone Program Number (PC)
+    program = PROGRAM_CATALOG[program_number]
+    return (
+        program["msb"],  # Tone Bank Select MSB (CC# 0)
+        program["lsb"],  # Tone Bank Select LSB (CC# 32)
+        program["pc"],  # Tone Program Number (PC)
     )
-    return int(msb), int(lsb), int(pc)
@@ -0,0 +1,188 @@
+"""
+UI Update Scheduler Module
+
+This module defines the `UiUpdateScheduler` class, which coalesces control updates
+coming from the synth (tone dumps, parameter echoes) and applies them in a single
+batch per display refresh.
+
+A full tone dump touches every slider, switch and ADSR spin box of an editor.
+Rather than calling `setValue` and repainting for each parameter as it is parsed,
+editors schedule (control, value) pairs; the scheduler keeps only the last value
+per control and applies the batch with the control's signals blocked and window
+updates disabled, so the editor repaints once and nothing is echoed back to the
+synth.
+
+While an editor waits for a bulk snapshot of its areas, it holds the scheduler:
+the replies are collected as they arrive and applied as one batch after the
+snapshot completes, instead of one batch per reply.
+
+When a `LatencyMonitor` is given, updates scheduled while an incoming frame is
+routed are attributed to it, and the time from the frame's arrival to the batch
+being applied is recorded as the UI_APPLY stage.
+
+Classes:
+    - UpdateStats: Counters reported by the scheduler.
+    - UiUpdateScheduler: Frame-coalesced control updater for an editor.
+
+Usage Example:
+    >>> scheduler = UiUpdateScheduler(editor)
+    >>> scheduler.schedule(slider, 64)
+    >>> scheduler.schedule(slider, 72)  # replaces 64, counted as dropped
+    >>> scheduler.flush()
+    1
+    >>> scheduler.hold()  # a snapshot was requested
+    >>> scheduler.release()  # snapshot_complete, applied on the next frame
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtWidgets import QWidget
+
+from jdxi_editor.midi.io.latency import LatencyMonitor, LatencyStage
+
+FRAME_INTERVAL_MS = 16  # ~60 Hz display refresh
+
+
+@dataclass(frozen=True)
+class UpdateStats:
+    """Snapshot of the scheduler counters."""
+
+    scheduled: int
+    applied: int
+    dropped: int
+    batches: int
+    pending: int
+
+
+class UiUpdateScheduler(QObject):
+    """Collects dirty (control, value) pairs and applies them once per frame."""
+
+    def __init__(
+        self,
+        editor: QWidget,
+        interval_ms: int = FRAME_INTERVAL_MS,
+        latency_monitor: Optional[LatencyMonitor] = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        :param editor: QWidget whose updates are suspended while a batch is applied.
+        :param interval_ms: int batch interval in milliseconds.
+        :param latency_monitor: Optional LatencyMonitor recording the UI_APPLY stage.
+        """
+        super().__init__(editor)
+        self.editor = editor
+        self.latency_monitor = latency_monitor
+        # Message type and arrival time of the oldest frame in the pending batch
+        self._origin: Optional[Tuple[str, float]] = None
+        self._pending: Dict[QObject, Tuple[Callable[[Any], None], Any]] = {}
+        self._after_batch: Dict[Callable[[], None], None] = {}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+        self._held = False
+        self.scheduled = 0
+        self.applied = 0
+        self.dropped = 0
+        self.batches = 0
+
+    def schedule(
+        self,
+        control: QObject,
+        value: Any,
+        setter: Optional[Callable[[Any], None]] = None,
+        after_batch: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Queue a value for a control; the last value scheduled before the batch wins.
+
+        :param control: The widget to update.
+        :param value: The value to apply.
+        :param setter: Callable applying the value, defaults to control.setValue.
+        :param after_batch: Optional callable run once after the batch, with
+            signals unblocked, e.g. to refresh a plot that depends on the control.
+        """
+        if control in self._pending:
+            self.dropped += 1
+        self._pending[control] = (setter or control.setValue, value)
+        if after_batch is not None:
+            self._after_batch[after_batch] = None
+        if self._origin is None and self.latency_monitor is not None:
+            self._origin = self.latency_monitor.active_origin
+        self.scheduled += 1
+        if not self._held and not self._timer.isActive():
+            self._timer.start()
+
+    @property
+    def held(self) -> bool:
+        """True while updates are kept pending until release()."""
+        return self._held
+
+    def hold(self) -> None:
+        """Keep scheduled updates pending until release(), e.g. while a snapshot is fetched."""
+        self._held = True
+        self._timer.stop()
+
+    def release(self) -> None:
+        """
+        Apply the updates held back, on the next frame.
+
+        Waiting a frame lets replies still being decoded join the batch.
+        """
+        self._held = False
+        if self._pending and not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self) -> int:
+        """
+        Apply all pending updates now.
+
+        :return: int number of controls updated
+        """
+        self._timer.stop()
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, {}
+        after_batch, self._after_batch = self._after_batch, {}
+        origin, self._origin = self._origin, None
+        updates_enabled = self.editor.updatesEnabled()
+        self.editor.setUpdatesEnabled(False)
+        try:
+            for control, (setter, value) in pending.items():
+                was_blocked = control.blockSignals(True)
+                try:
+                    setter(value)
+                except Exception as ex:
+                    logging.error(f"Error {ex} applying {value} to {control}")
+                finally:
+                    control.blockSignals(was_blocked)
+            for callback in after_batch:
+                try:
+                    callback()
+                except Exception as ex:
+                    logging.error(f"Error {ex} in {callback} after applying control updates")
+        finally:
+            self.editor.setUpdatesEnabled(updates_enabled)
+        if origin is not None:
+            self.latency_monitor.record(LatencyStage.UI_APPLY, *origin)
+        self.applied += len(pending)
+        self.batches += 1
+        logging.debug(
+            f"Applied {len(pending)} control updates, "
+            f"{self.dropped} redundant updates dropped so far"
+        )
+        return len(pending)
+
+    def stats(self) -> UpdateStats:
+        """Return a snapshot of the scheduler counters."""
+        return UpdateStats(
+            scheduled=self.scheduled,
+            applied=self.applied,
+            dropped=self.dropped,
+            batches=self.batches,
+            pending=len(self._pending),
+        )
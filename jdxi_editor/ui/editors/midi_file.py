@@ -18,10 +18,8 @@ Features:
 
 import datetime
 import logging
-from typing import Optional
+from typing import List, Optional
 import qtawesome as qta
-import mido
-import matplotlib.pyplot as plt
 
 from PySide6.QtWidgets import (
     QFileDialog,
@@ -35,19 +33,23 @@ from PySide6.QtWidgets import (
     QMessageBox,
 )
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QCoreApplication
 
 from mido import tempo2bpm, MidiFile, MidiTrack, Message, MetaMessage, bpm2tempo
 from rtmidi.midiconstants import NOTE_ON, CONTROL_CHANGE
 
 from jdxi_editor.midi.data.constants.constants import MIDI_CHANNEL_DIGITAL1, MIDI_CHANNEL_DIGITAL2, MIDI_CHANNEL_ANALOG, \
     MIDI_CHANNEL_DRUMS
+from jdxi_editor.midi.file.index import DEFAULT_TEMPO, event_index
+from jdxi_editor.midi.file.roll import PianoRoll, piano_roll
 from jdxi_editor.midi.io import MidiIOHelper
+from jdxi_editor.midi.io.playback import MidiFilePlayer
 from jdxi_editor.midi.preset.handler import PresetHandler
 
 from jdxi_editor.ui.editors.synth import SynthEditor
 from jdxi_editor.ui.style import Style
 from jdxi_editor.ui.widgets.pattern.measure import PatternMeasure
+from jdxi_editor.ui.widgets.piano_roll.view import PianoRollView
 
 
 class MidiFileEditor(SynthEditor):
@@ -78,6 +80,13 @@ class MidiFileEditor(SynthEditor):
         self.midi_file = MidiFile()  # Initialize a new MIDI file
         self.midi_track = MidiTrack()  # Create a new track
         self.midi_file.tracks.append(self.midi_track)  # Add the track to the file
+        self.playback_step = None
+        self.player = MidiFilePlayer(self._send_raw_message, parent=self)
+        self.player.position_changed.connect(self._on_playback_position)
+        self.player.playback_finished.connect(self._on_playback_finished)
+        application = QCoreApplication.instance()
+        if application is not None:
+            application.aboutToQuit.connect(self.player.stop)
         self._setup_ui()
         self._init_midi_file()
 
@@ -222,18 +231,26 @@ class MidiFileEditor(SynthEditor):
         transport_group = QGroupBox("Transport")
         transport_layout = QHBoxLayout()
 
+        self.rewind_button = QPushButton(qta.icon("ri.skip-back-line"), "Rewind")
         self.start_button = QPushButton(qta.icon("ri.play-line"), "Play")
         self.stop_button = QPushButton(qta.icon("ri.stop-line"), "Stop")
-        # self.start_button.clicked.connect(self.play_pattern)
-        # self.stop_button.clicked.connect(self.stop_pattern)
-
+        self.loop_button = QPushButton(qta.icon("ri.repeat-line"), "Loop")
+        self.loop_button.setCheckable(True)
+        self.rewind_button.clicked.connect(lambda: self.player.locate(0.0))
+        self.start_button.clicked.connect(lambda: self.play_file())
+        self.stop_button.clicked.connect(self.stop_file)
+        self.loop_button.toggled.connect(self._on_loop_toggled)
+
+        transport_layout.addWidget(self.rewind_button)
         transport_layout.addWidget(self.start_button)
         transport_layout.addWidget(self.stop_button)
+        transport_layout.addWidget(self.loop_button)
         transport_group.setLayout(transport_layout)
         control_panel.addWidget(transport_group)
 
         self.layout.addLayout(control_panel)
-        self.midi_helper.midi_incoming_message.connect(self._update_combo_boxes)
+        if self.midi_helper:
+            self.midi_helper.midi_incoming_message.connect(self._update_combo_boxes)
 
         for row_idx, label_text in enumerate(row_labels):
             row_layout = QVBoxLayout()
@@ -290,6 +307,9 @@ class MidiFileEditor(SynthEditor):
             self.layout.addLayout(row_layout)
             self.setLayout(self.layout)
 
+        self.roll_view = PianoRollView()
+        self.layout.addWidget(self.roll_view)
+
     def ui_generate_button_row(self, row_index: int, visible: bool = False):
         """generate sequencer button row"""
         button_row_layout = QHBoxLayout()
@@ -499,20 +519,9 @@ class MidiFileEditor(SynthEditor):
 
         if filename:
             try:
+                # Also sets the tempo of the file
                 self.load_pattern(filename)
                 logging.info(f"Pattern loaded from {filename}")
-
-                # Update tempo from loaded file
-                if self.midi_file and self.midi_file.tracks:
-                    for event in self.midi_file.tracks[0]:
-                        if (
-                            event.type == "set_tempo"
-                        ):  # Compare with the string "set_tempo"
-                            bpm = int(
-                                tempo2bpm(event.tempo)
-                            )  # Use .tempo instead of .data
-                            self.tempo_spinbox.setValue(bpm)
-                            break
             except Exception as ex:
                 logging.error(f"Error loading pattern: {ex}")
                 QMessageBox.critical(self, "Error", f"Could not load pattern: {str(ex)}")
@@ -623,51 +632,32 @@ class MidiFileEditor(SynthEditor):
             
             midi_file = MidiFile(filename)
             self.midi_file = midi_file  # Store for playback
+            self.player.load(midi_file)
+            self.roll_view.set_roll(self.get_roll())
             
             # Get ticks per beat for timing calculations
             ppq = midi_file.ticks_per_beat
-            
-            # Create a dictionary to store notes for each channel
-            channel_notes = {0: [], 1: [], 2: [], 9: []}  # Channels 1, 2, 3, and 10 (0-based)
-            
-            # Process each track
-            for track in midi_file.tracks:
-                absolute_time = 0
-                for msg in track:
-                    absolute_time += msg.time
-                    
-                    if msg.type == 'note_on' and hasattr(msg, 'channel'):
-                        if msg.channel in channel_notes:
-                            step = int((absolute_time / ppq) * 4) % 16
-                            channel_notes[msg.channel].append({
-                                'step': step,
-                                'note': msg.note,
-                                'velocity': msg.velocity
-                            })
-            
+            index = event_index(midi_file)
+
             # Map channels to rows (0->0, 1->1, 2->2, 9->3)
             channel_to_row = {0: 0, 1: 1, 2: 2, 9: 3}
-            
+            note_ons = index.note_ons(channels=channel_to_row)
+            steps = (note_ons["tick"] * 4 // ppq) % 16
+
             # Update sequencer buttons
-            for channel, notes in channel_notes.items():
-                row = channel_to_row[channel]
-                for note_data in notes:
-                    step = note_data['step']
-                    if step < 16:  # Ensure step is within bounds
-                        button = self._get_button(row, step)
-                        if button:
-                            button.setChecked(True)
-                            button.note = note_data['note']
-                            self._update_button_style(button, True)
-            
+            for channel, note, step in zip(
+                note_ons["channel"].tolist(), note_ons["note"].tolist(), steps.tolist()
+            ):
+                button = self._get_button(channel_to_row[channel], step)
+                if button:
+                    button.setChecked(True)
+                    button.note = note
+                    self._update_button_style(button, True)
+
             # Update tempo if available
-            for track in midi_file.tracks:
-                for msg in track:
-                    if msg.type == 'set_tempo':
-                        bpm = int(tempo2bpm(msg.tempo))
-                        self.tempo_spinbox.setValue(bpm)
-                        break
-            
+            if index.tempo is not None:
+                self.tempo_spinbox.setValue(int(tempo2bpm(index.tempo)))
+
             logging.info(f"Pattern loaded from {filename}")
             
         except Exception as ex:
@@ -690,45 +680,62 @@ class MidiFileEditor(SynthEditor):
         else:
             button.setToolTip("Rest")
 
-    def play_file(self, filename):
-        """Play the loaded MIDI file"""
-        if not hasattr(self, 'midi_file'):
+    def play_file(self, filename: Optional[str] = None):
+        """Play the loaded MIDI file, or load filename and play it, on the player thread"""
+        if filename:
+            self.load_pattern(filename)
+        if not self.midi_file:
             logging.error("No MIDI file loaded")
             return
-        
-        try:
-            # Calculate timing based on tempo
-            tempo = 500000  # Default tempo (120 BPM)
-            for track in self.midi_file.tracks:
-                for msg in track:
-                    if msg.type == 'set_tempo':
-                        tempo = msg.tempo
-                        break
-            
-            # Start playback
-            current_time = 0
-            for msg in self.midi_file.play():
-                if msg.type in ['note_on', 'note_off']:
-                    if msg.channel in [0, 1, 2, 9]:  # Only process our tracked channels
-                        # Update visual state of buttons
-                        step = int((current_time / self.midi_file.ticks_per_beat) * 4) % 16
-                        self._highlight_current_step(step)
-                        
-                        # Send MIDI message if we have a MIDI helper
-                        if hasattr(self, 'midi_helper') and self.midi_helper:
-                            self.midi_helper.send_message(msg)
-                        
-                current_time += msg.time
-                
-        except Exception as ex:
-            logging.error(f"Error playing MIDI file: {ex}")
-            raise
-
-    def _highlight_current_step(self, step):
-        """Highlight the current step in the sequencer"""
-        for button in self.buttons[0]:
-            is_current = button.column == step
-            button.setStyleSheet(self.generate_sequencer_button_style(button.isChecked(), is_current))
+        if self.player.midi_file is not self.midi_file:
+            # The pattern was edited or cleared since the last load
+            self.player.load(self.midi_file)
+            self.roll_view.set_roll(self.get_roll())
+        self.player.set_muted_channels(self.muted_channels)
+        self.player.start()
+
+    def stop_file(self):
+        """Stop playback, keeping the position for the next Play"""
+        self.player.stop()
+
+    def _send_raw_message(self, message: List[int]) -> bool:
+        """Send a message from the player thread, dropping it without a MIDI helper"""
+        if not self.midi_helper:
+            logging.debug("MIDI helper not available")
+            return False
+        return self.midi_helper.send_raw_message(message)
+
+    def _on_loop_toggled(self, checked: bool):
+        """Loop the whole file while the Loop button is down"""
+        if checked:
+            self.player.set_loop(0.0)
+        else:
+            self.player.clear_loop()
+
+    def _on_playback_position(self, seconds: float):
+        """Follow the playback position, a 16th note per step"""
+        beats = self.player.schedule.beats_at(seconds)
+        self._highlight_current_step(int(beats * 4) % self.total_steps)
+        self.roll_view.set_playhead(beats * self.midi_file.ticks_per_beat)
+
+    def _on_playback_finished(self):
+        """Clear the step highlight and the playhead at the end of the file"""
+        self._highlight_current_step(None)
+        self.roll_view.set_playhead(None)
+
+    def _highlight_current_step(self, step: Optional[int]):
+        """Highlight the current step, restyling only the columns that change"""
+        previous, self.playback_step = self.playback_step, step
+        if previous == step:
+            return
+        for row_buttons in self.buttons:
+            for button in row_buttons:
+                if button.column in (previous, step):
+                    button.setStyleSheet(
+                        self.generate_sequencer_button_style(
+                            button.isChecked(), button.column == step
+                        )
+                    )
 
     def generate_sequencer_button_style(
         self, is_checked: bool, is_current: bool = False
@@ -857,6 +864,7 @@ class MidiFileEditor(SynthEditor):
         else:
             logging.info(f"Row {row} unmuted")
             self.muted_channels.remove(channel)
+        self.player.set_muted_channels(self.muted_channels)
 
         # Update the UI or internal state to reflect the mute status
         # For example, you might want to disable the buttons in the row
@@ -880,234 +888,19 @@ class MidiFileEditor(SynthEditor):
         self.update()
 
     def get_events(self):
-        mid = self
-        print(mid)
+        """Events of the loaded MIDI file, one array per channel, see MidiEventIndex"""
+        index = event_index(self.midi_file)
+        return [index.select(channels=[channel]) for channel in range(16)]
 
-        # There is > 16 channel in midi.tracks. However there is only 16 channel related to "music" events.
-        # We store music events of 16 channel in the list "events" with form [[ch1],[ch2]....[ch16]]
-        # Lyrics and meta data used a extra channel which is not include in "events"
-
-        events = [[] for x in range(16)]
-
-        # Iterate all event in the midi and extract to 16 channel form
-        for track in mid.tracks:
-            for msg in track:
-                try:
-                    channel = msg.channel
-                    events[channel].append(msg)
-                except AttributeError:
-                    try:
-                        if type(msg) != type(mido.UnknownMetaMessage):
-                            self.meta[msg.type] = msg.dict()
-                        else:
-                            pass
-                    except:
-                        print("error",type(msg))
-
-        return events
-
-    def get_roll(self):
-        events = self.get_events()
-        # Identify events, then translate to piano roll
-        # choose a sample ratio(sr) to down-sample through time axis
-        sr = self.sr
-
-        # compute total length in tick unit
-        length = self.get_total_ticks()
-
-        # allocate memory to numpy array
-        roll = np.zeros((16, 128, length // sr), dtype="int8")
-
-        # use a register array to save the state(no/off) for each key
-        note_register = [int(-1) for x in range(128)]
-
-        # use a register array to save the state(program_change) for each channel
-        timbre_register = [1 for x in range(16)]
-
-
-        for idx, channel in enumerate(events):
-
-            time_counter = 0
-            volume = 100
-            # Volume would change by control change event (cc) cc7 & cc11
-            # Volume 0-100 is mapped to 0-127
-
-            print("channel", idx, "start")
-            for msg in channel:
-                if msg.type == "control_change":
-                    if msg.control == 7:
-                        volume = msg.value
-                        # directly assign volume
-                    if msg.control == 11:
-                        volume = volume * msg.value // 127
-                        # change volume by percentage
-                    # print("cc", msg.control, msg.value, "duration", msg.time)
-
-                if msg.type == "program_change":
-                    timbre_register[idx] = msg.program
-                    print("channel", idx, "pc", msg.program, "time", time_counter, "duration", msg.time)
-
-
-
-                if msg.type == "note_on":
-                    print("on ", msg.note, "time", time_counter, "duration", msg.time, "velocity", msg.velocity)
-                    note_on_start_time = time_counter // sr
-                    note_on_end_time = (time_counter + msg.time) // sr
-                    intensity = volume * msg.velocity // 127
-
-
-
-					# When a note_on event *ends* the note start to be play
-					# Record end time of note_on event if there is no value in register
-					# When note_off event happens, we fill in the color
-                    if note_register[msg.note] == -1:
-                        note_register[msg.note] = (note_on_end_time,intensity)
-                    else:
-					# When note_on event happens again, we also fill in the color
-                        old_end_time = note_register[msg.note][0]
-                        old_intensity = note_register[msg.note][1]
-                        roll[idx, msg.note, old_end_time: note_on_end_time] = old_intensity
-                        note_register[msg.note] = (note_on_end_time,intensity)
-
-
-                if msg.type == "note_off":
-                    print("off", msg.note, "time", time_counter, "duration", msg.time, "velocity", msg.velocity)
-                    note_off_start_time = time_counter // sr
-                    note_off_end_time = (time_counter + msg.time) // sr
-                    note_on_end_time = note_register[msg.note][0]
-                    intensity = note_register[msg.note][1]
-					# fill in color
-                    roll[idx, msg.note, note_on_end_time:note_off_end_time] = intensity
-
-                    note_register[msg.note] = -1  # reinitialize register
-
-                time_counter += msg.time
-
-                # TODO : velocity -> done, but not verified
-                # TODO: Pitch wheel
-                # TODO: Channel - > Program Changed / Timbre catagory
-                # TODO: real time scale of roll
-
-            # if there is a note not closed at the end of a channel, close it
-            for key, data in enumerate(note_register):
-                if data != -1:
-                    note_on_end_time = data[0]
-                    intensity = data[1]
-                    # print(key, note_on_end_time)
-                    note_off_start_time = time_counter // sr
-                    roll[idx, key, note_on_end_time:] = intensity
-                note_register[idx] = -1
-
-        return roll
-
-    def get_roll_image(self):
-        roll = self.get_roll()
-        plt.ioff()
-
-        K = 16
-
-        transparent = colorConverter.to_rgba('black')
-        colors = [mpl.colors.to_rgba(mpl.colors.hsv_to_rgb((i / K, 1, 1)), alpha=1) for i in range(K)]
-        cmaps = [mpl.colors.LinearSegmentedColormap.from_list('my_cmap', [transparent, colors[i]], 128) for i in
-                 range(K)]
-
-        for i in range(K):
-            cmaps[i]._init()  # create the _lut array, with rgba values
-            # create your alpha array and fill the colormap with them.
-            # here it is progressive, but you can create whathever you want
-            alphas = np.linspace(0, 1, cmaps[i].N + 3)
-            cmaps[i]._lut[:, -1] = alphas
-
-        fig = plt.figure(figsize=(4, 3))
-        a1 = fig.add_subplot(111)
-        a1.axis("equal")
-        a1.set_facecolor("black")
-
-        array = []
-
-        for i in range(K):
-            try:
-                img = a1.imshow(roll[i], interpolation='nearest', cmap=cmaps[i], aspect='auto')
-                array.append(img.get_array())
-            except IndexError:
-                pass
-        return array
-
-    def draw_roll(self):
-
-
-        roll = self.get_roll()
-
-        # build and set fig obj
-        plt.ioff()
-        fig = plt.figure(figsize=(4, 3))
-        a1 = fig.add_subplot(111)
-        a1.axis("equal")
-        a1.set_facecolor("black")
-
-        # change unit of time axis from tick to second
-        tick = self.get_total_ticks()
-        second = mido.tick2second(tick, self.ticks_per_beat, self.get_tempo())
-        print(second)
-        if second > 10:
-            x_label_period_sec = second // 10
-        else:
-            x_label_period_sec = second / 10  # ms
-        print(x_label_period_sec)
-        x_label_interval = mido.second2tick(x_label_period_sec, self.ticks_per_beat, self.get_tempo()) / self.sr
-        print(x_label_interval)
-        plt.xticks([int(x * x_label_interval) for x in range(20)], [round(x * x_label_period_sec, 2) for x in range(20)])
-
-        # change scale and label of y axis
-        plt.yticks([y*16 for y in range(8)], [y*16 for y in range(8)])
-
-        # build colors
-        channel_nb = 16
-        transparent = colorConverter.to_rgba('black')
-        colors = [mpl.colors.to_rgba(mpl.colors.hsv_to_rgb((i / channel_nb, 1, 1)), alpha=1) for i in range(channel_nb)]
-        cmaps = [mpl.colors.LinearSegmentedColormap.from_list('my_cmap', [transparent, colors[i]], 128) for i in
-                 range(channel_nb)]
-
-        # build color maps
-        for i in range(channel_nb):
-            cmaps[i]._init()
-            # create your alpha array and fill the colormap with them.
-            alphas = np.linspace(0, 1, cmaps[i].N + 3)
-            # create the _lut array, with rgba values
-            cmaps[i]._lut[:, -1] = alphas
-
-
-        # draw piano roll and stack image on a1
-        for i in range(channel_nb):
-            try:
-                a1.imshow(roll[i], origin="lower", interpolation='nearest', cmap=cmaps[i], aspect='auto')
-            except IndexError:
-                pass
-
-        # draw color bar
-
-        colors = [mpl.colors.hsv_to_rgb((i / channel_nb, 1, 1)) for i in range(channel_nb)]
-        cmap = mpl.colors.LinearSegmentedColormap.from_list('my_cmap', colors, 16)
-        a2 = fig.add_axes([0.05, 0.80, 0.9, 0.15])
-        cbar = mpl.colorbar.ColorbarBase(a2, cmap=cmap,
-                                        orientation='horizontal',
-                                        ticks=list(range(16)))
-
-        # show piano roll
-        plt.draw()
-        plt.ion()
-        plt.show(block=True)
+    def get_roll(self) -> PianoRoll:
+        """Piano roll of the loaded MIDI file, built once per file"""
+        return piano_roll(self.midi_file)
 
     def get_tempo(self):
-        try:
-            return self.meta["set_tempo"]["tempo"]
-        except:
-            return 500000
+        """Tempo set first in the loaded MIDI file, in microseconds per beat"""
+        tempo = event_index(self.midi_file).tempo
+        return DEFAULT_TEMPO if tempo is None else tempo
 
     def get_total_ticks(self):
-        max_ticks = 0
-        for channel in range(16):
-            ticks = sum(msg.time for msg in self.events[channel])
-            if ticks > max_ticks:
-                max_ticks = ticks
-        return max_ticks
+        """Length of the longest track of the loaded MIDI file, in ticks"""
+        return event_index(self.midi_file).total_ticks
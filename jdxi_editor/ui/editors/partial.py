@@ -27,9 +27,9 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from jdxi_editor.midi.data.parameter.conversion import convert_from_display
 from jdxi_editor.midi.data.parameter.synth import SynthParameter
 from jdxi_editor.midi.data.constants.constants import PART_1
-from jdxi_editor.midi.message.roland import RolandSysEx
 from jdxi_editor.ui.widgets.slider import Slider
 from jdxi_editor.ui.widgets.combo_box.combo_box import ComboBox
 from jdxi_editor.ui.widgets.spin_box.spin_box import SpinBox
@@ -139,14 +139,9 @@ class PartialEditor(QWidget):
                 f"Sending param={param.name}, partial={self.part}, group={group}, value={value}"
             )
 
-            sysex_message = RolandSysEx(
-                area=self.area,
-                section=self.part,
-                group=group,
-                param=param.address,
-                value=value,
+            result = self.midi_helper.send_parameter(
+                self.area, self.part, group, param.address, value
             )
-            result = self.midi_helper.send_midi_message(sysex_message)
 
             return bool(result)
         except Exception as ex:
@@ -158,7 +153,7 @@ class PartialEditor(QWidget):
         try:
             # Convert display value to MIDI value
             midi_value = (
-                param.convert_from_display(display_value)
+                convert_from_display(param, display_value)
                 if hasattr(param, "convert_from_display")
                 else param.validate_value(display_value)
             )
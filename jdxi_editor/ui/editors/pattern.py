@@ -13,12 +13,13 @@ Features:
 - Styled buttons with illumination effects.
 - Each button stores an associated MIDI note and its on/off state.
 - Start/Stop playback buttons for sequence control. ..
+- Steps are played by a StepSequencer clock thread, the grid follows it.
 
 """
 
 import datetime
 import logging
-from typing import Optional
+from typing import List, Optional
 import qtawesome as qta
 
 from PySide6.QtWidgets import (
@@ -34,14 +35,16 @@ from PySide6.QtWidgets import (
     QMessageBox,
 )
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import QCoreApplication, Qt
 
 from mido import tempo2bpm, MidiFile, MidiTrack, Message, MetaMessage, bpm2tempo
-from rtmidi.midiconstants import NOTE_ON, CONTROL_CHANGE
+from rtmidi.midiconstants import CONTROL_CHANGE
 
 from jdxi_editor.midi.data.constants.constants import MIDI_CHANNEL_DIGITAL1, MIDI_CHANNEL_DIGITAL2, MIDI_CHANNEL_ANALOG, \
     MIDI_CHANNEL_DRUMS
+from jdxi_editor.midi.file.index import event_index
 from jdxi_editor.midi.io import MidiIOHelper
+from jdxi_editor.midi.io.sequencer import StepSequencer
 from jdxi_editor.midi.preset.handler import PresetHandler
 
 from jdxi_editor.ui.editors.synth import SynthEditor
@@ -65,7 +68,6 @@ class PatternSequencer(SynthEditor):
         self.preset_handler = preset_handler
         self.buttons = []
         self.measures = []
-        self.timer = None
         self.current_step = 0
         self.total_steps = 16
         self.beats_per_pattern = 4
@@ -77,6 +79,12 @@ class PatternSequencer(SynthEditor):
         self.midi_file = MidiFile()  # Initialize a new MIDI file
         self.midi_track = MidiTrack()  # Create a new track
         self.midi_file.tracks.append(self.midi_track)  # Add the track to the file
+        self.playback_step = None
+        self.sequencer = StepSequencer(self._send_raw_message, parent=self)
+        self.sequencer.step_changed.connect(self._on_sequencer_step)
+        application = QCoreApplication.instance()
+        if application is not None:
+            application.aboutToQuit.connect(self.sequencer.stop)
         self._setup_ui()
         self._init_midi_file()
 
@@ -232,7 +240,8 @@ class PatternSequencer(SynthEditor):
         control_panel.addWidget(transport_group)
 
         self.layout.addLayout(control_panel)
-        self.midi_helper.midi_incoming_message.connect(self._update_combo_boxes)
+        if self.midi_helper:
+            self.midi_helper.midi_incoming_message.connect(self._update_combo_boxes)
 
         for row_idx, label_text in enumerate(row_labels):
             row_layout = QVBoxLayout()
@@ -433,14 +442,11 @@ class PatternSequencer(SynthEditor):
                 checked, self.current_step % self.total_steps == button.column
             )
         )
+        self._update_sequencer_steps()
 
     def _on_tempo_changed(self, bpm: int):
         """Handle tempo changes from the spinbox"""
         self.set_tempo(bpm)
-        if self.timer and self.timer.isActive():
-            # Update timer interval for running sequence
-            ms_per_step = (60000 / bpm) / 4  # ms per 16th note
-            self.timer.setInterval(int(ms_per_step))
 
     def _on_tap_tempo(self):
         """Handle tap tempo button clicks"""
@@ -529,10 +535,8 @@ class PatternSequencer(SynthEditor):
         if self.midi_file.tracks:
             self.midi_file.tracks[0].insert(0, tempo_message)
 
-        # Update playback speed if sequence is running
-        if hasattr(self, "timer") and self.timer and self.timer.isActive():
-            ms_per_step = (60000 / bpm) / 4  # ms per 16th note
-            self.timer.setInterval(int(ms_per_step))
+        # Takes effect from the next step, also while the sequence is running
+        self.sequencer.set_tempo(bpm)
 
         logging.info(f"Tempo set to {bpm} BPM")
 
@@ -613,6 +617,7 @@ class PatternSequencer(SynthEditor):
                 self.buttons[row][step].setToolTip(
                     f"Note: {self.buttons[row][step].note}"
                 )
+        self._update_sequencer_steps()
 
     def load_pattern(self, filename: str):
         """Load a pattern from a MIDI file"""
@@ -620,58 +625,47 @@ class PatternSequencer(SynthEditor):
             self.clear_pattern()
             midi_file = MidiFile(filename)
             ppq = midi_file.ticks_per_beat
+            index = event_index(midi_file)
 
-            for track_num, track in enumerate(midi_file.tracks[:4]):
-                if track_num >= len(self.buttons):
-                    logging.error(f"Track {track_num} exceeds available button rows.")
+            # One row per track, later tracks are ignored
+            note_ons = index.note_ons(tracks=range(len(self.buttons)))
+            steps = (note_ons["tick"] * 4 // ppq) % self.total_steps
+            for row, note, step in zip(
+                note_ons["track"].tolist(), note_ons["note"].tolist(), steps.tolist()
+            ):
+                if step >= len(self.buttons[row]):
+                    logging.error(f"Step {step} exceeds available buttons in row {row}.")
                     continue
 
-                absolute_time = 0
-                for msg in track:
-                    absolute_time += msg.time
-                    if msg.type == "note_on" and msg.velocity > 0:
-                        step = int((absolute_time / ppq) * 4) % self.total_steps
-                        if step >= len(self.buttons[track_num]):
-                            logging.error(
-                                f"Step {step} exceeds available buttons in row {track_num}."
-                            )
-                            continue
-
-                        button = self.buttons[track_num][step]
-                        button.setChecked(True)
-                        button.note = msg.note
-                        if track_num == 3:
-                            drums_note_name = self._midi_to_note_name(
-                                button.note, drums=True
-                            )
-                            button.setToolTip(f"Note: {drums_note_name}")
-                        else:
-                            note_name = self._midi_to_note_name(button.note)
-                            button.setToolTip(f"Note: {note_name}")
-
-            for event in midi_file.tracks[0]:
-                if event.type == "set_tempo":
-                    bpm = int(tempo2bpm(event.tempo))
-                    self.tempo_spinbox.setValue(bpm)
+                button = self.buttons[row][step]
+                button.setChecked(True)
+                button.note = note
+                if row == 3:
+                    drums_note_name = self._midi_to_note_name(button.note, drums=True)
+                    button.setToolTip(f"Note: {drums_note_name}")
+                else:
+                    note_name = self._midi_to_note_name(button.note)
+                    button.setToolTip(f"Note: {note_name}")
+            self._update_sequencer_steps()
+
+            if index.tempo is not None:
+                self.tempo_spinbox.setValue(int(tempo2bpm(index.tempo)))
 
         except Exception as ex:
             logging.error(f"Error loading pattern: {ex}")
             QMessageBox.critical(self, "Error", f"Could not load pattern: {str(ex)}")
 
     def play_pattern(self):
-        """Start playing the pattern"""
-        if hasattr(self, "timer") and self.timer and self.timer.isActive():
+        """Start playing the pattern on the sequencer thread"""
+        if self.sequencer.playing:
             return  # Already playing
 
         self.current_step = 0
-
-        # Calculate interval based on tempo (ms per 16th note)
-        ms_per_step = (60000 / self.bpm) / 4
-
-        # Create and start timer
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._play_step)
-        self.timer.start(int(ms_per_step))
+        self._update_sequencer_steps()
+        self.sequencer.set_tempo(self.bpm)
+        self.sequencer.set_muted_channels(self.muted_channels)
+        self.sequencer.locate(0)
+        self.sequencer.start()
 
         # Update button states
         self.start_button.setEnabled(False)
@@ -681,12 +675,11 @@ class PatternSequencer(SynthEditor):
 
     def stop_pattern(self):
         """Stop playing the pattern"""
-        if hasattr(self, "timer") and self.timer:
-            self.timer.stop()
-            self.timer = None
+        self.sequencer.stop()
 
         # Reset step counter
         self.current_step = 0
+        self._highlight_current_step(None)
 
         # Update button states
         self.start_button.setEnabled(True)
@@ -760,55 +753,41 @@ class PatternSequencer(SynthEditor):
         # so not drums
         return f"{note}{octave}"
 
-    def _play_step(self):
-        """Plays the current step and advances to the next one."""
-        step = self.current_step % self.total_steps
-        logging.info(f"Playing step {step}")
-
-        # Check each row's button at the current step
-        for row in range(4):
-            button = self.buttons[row][step]
-            if (
-                button.isChecked()
-                and hasattr(button, "note")
-                and button.note is not None
-            ):
-                # Determine channel based on row
-                channel = (
-                    row if row < 3 else 9
-                )  # channels 0,1,2 for synths, 9 for drums
-
-                # Send Note On message using the stored note
-                if self.midi_helper:
-                    if channel not in self.muted_channels:
-                        logging.info(
-                            f"Row {row} active at step {step}, sending note {button.note} on channel {channel}"
-                        )
-                        self.midi_helper.send_raw_message(
-                            [NOTE_ON | channel, button.note, 100]
-                        )  # velocity 100
-                        # Note Off message after a short delay
-                        QTimer.singleShot(
-                            100,
-                            lambda ch=channel, n=button.note: self.midi_helper.send_raw_message(
-                                [NOTE_ON | ch, n, 0]
-                            ),
+    def _send_raw_message(self, message: List[int]) -> bool:
+        """Send a message from the sequencer thread, dropping it without a MIDI helper"""
+        if not self.midi_helper:
+            logging.warning("MIDI helper not available")
+            return False
+        return self.midi_helper.send_raw_message(message)
+
+    def _update_sequencer_steps(self):
+        """Hand the checked steps of every row to the sequencer, from its next step"""
+        steps = [[] for _ in range(self.total_steps)]
+        for row, row_buttons in enumerate(self.buttons):
+            channel = row if row < 3 else 9  # channels 0,1,2 for synths, 9 for drums
+            for button in row_buttons[: self.total_steps]:
+                if button.isChecked() and button.note is not None:
+                    steps[button.column].append((channel, button.note, 100))  # velocity 100
+        self.sequencer.set_steps(steps)
+
+    def _on_sequencer_step(self, step: int):
+        """Follow the step the sequencer is playing"""
+        self.current_step = step
+        self._highlight_current_step(step)
+
+    def _highlight_current_step(self, step: Optional[int]):
+        """Highlight the current step, restyling only the columns that change"""
+        previous, self.playback_step = self.playback_step, step
+        if previous == step:
+            return
+        for row_buttons in self.buttons:
+            for button in row_buttons:
+                if button.column in (previous, step):
+                    button.setStyleSheet(
+                        self.generate_sequencer_button_style(
+                            button.isChecked(), button.column == step
                         )
-                else:
-                    logging.warning("MIDI helper not available")
-
-        # Advance to next step
-        self.current_step = (self.current_step + 1) % self.total_steps
-
-        # Update UI to show current step
-        for row in range(4):
-            for col in range(self.total_steps):
-                button = self.buttons[row][col]
-                button.setStyleSheet(
-                    self.generate_sequencer_button_style(
-                        button.isChecked(), col == step
                     )
-                )
 
     def generate_sequencer_button_style(
         self, is_checked: bool, is_current: bool = False
@@ -897,6 +876,7 @@ class PatternSequencer(SynthEditor):
                     else:
                         note_name = self._midi_to_note_name(button.note)
                         button.setToolTip(f"Note: {note_name}")
+        self._update_sequencer_steps()
 
     def _get_note_range_for_row(self, row):
         """Get the note range for a specific row."""
@@ -915,8 +895,7 @@ class PatternSequencer(SynthEditor):
         if self.current_step == 0:
             logging.info("Learning complete after 16 steps.")
             self.on_stop_learn_pattern_button_clicked()
-            self.timer.stop()
-            del self.timer
+            self.sequencer.stop()
         else:
             logging.info(f"Moved to step {self.current_step}")
 
@@ -935,6 +914,7 @@ class PatternSequencer(SynthEditor):
         else:
             logging.info(f"Row {row} unmuted")
             self.muted_channels.remove(channel)
+        self.sequencer.set_muted_channels(self.muted_channels)
 
         # Update the UI or internal state to reflect the mute status
         # For example, you might want to disable the buttons in the row
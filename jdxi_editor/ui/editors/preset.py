@@ -52,10 +52,11 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Signal, Qt
 
-from jdxi_editor.midi.data.programs.analog import ANALOG_PRESET_LIST
-from jdxi_editor.midi.data.programs.drum import DRUM_KIT_LIST
-from jdxi_editor.midi.data.programs.presets import DIGITAL_PRESET_LIST, get_preset_parameters
-from jdxi_editor.midi.data.programs.programs import PROGRAM_LIST
+from jdxi_editor.midi.data.programs import (
+    ANALOG_PRESET_CATALOG,
+    DIGITAL_PRESET_CATALOG,
+    DRUM_KIT_CATALOG,
+)
 from jdxi_editor.midi.data.constants.constants import MIDI_CHANNEL_PROGRAMS, MIDI_CHANNEL_DIGITAL1, \
     MIDI_CHANNEL_DIGITAL2, MIDI_CHANNEL_DRUMS, MIDI_CHANNEL_ANALOG
 from jdxi_editor.midi.io import MidiIOHelper
@@ -171,7 +172,7 @@ class PresetEditor(SynthEditor):
         # Category selection combo box
         self.category_combo_box = QComboBox()
         self.category_combo_box.addItem("No Category Selected")
-        categories = set(preset["category"] for preset in DIGITAL_PRESET_LIST)
+        categories = set(preset["category"] for preset in DIGITAL_PRESET_CATALOG)
         self.category_combo_box.addItems(sorted(categories))
         self.category_combo_box.currentIndexChanged.connect(self.on_category_changed)
         layout.addWidget(self.category_combo_box)
@@ -341,13 +342,13 @@ class PresetEditor(SynthEditor):
 
         selected_part = self.digital_preset_type_combo.currentText()
         if selected_part in ["Digital Synth 1", "Digital Synth 2"]:
-            self.preset_list = DIGITAL_PRESET_LIST
+            self.preset_list = DIGITAL_PRESET_CATALOG
         elif selected_part == "Drums":
-            self.preset_list = DRUM_KIT_LIST
+            self.preset_list = DRUM_KIT_CATALOG
         elif selected_part == "Analog Synth":
-            self.preset_list = ANALOG_PRESET_LIST
+            self.preset_list = ANALOG_PRESET_CATALOG
         else:
-            self.preset_list = DIGITAL_PRESET_LIST  # Default to digital synth 1
+            self.preset_list = DIGITAL_PRESET_CATALOG  # Default to digital synth 1
         # self.update_category_combo_box_categories()
 
         selected_category = self.category_combo_box.currentText()
@@ -356,16 +357,11 @@ class PresetEditor(SynthEditor):
         self.preset_combo_box.clear()
         self.presets.clear()
 
-        filtered_list = [  # Filter programs based on bank and genre
+        filtered_presets = [  # Filter presets based on search text and category
             preset
-            for preset in self.preset_list
-
+            for preset in self.preset_list.search(search_text)
             if (selected_category in ["No Category Selected", preset["category"]])
         ]
-        filtered_presets = []
-        for i, preset in enumerate(filtered_list):
-            if search_text.lower() in preset["name"].lower():
-                filtered_presets.append(preset)
 
         for preset in filtered_presets:  # Add programs to the combo box
             preset_name = preset["name"]
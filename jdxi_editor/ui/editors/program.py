@@ -49,10 +49,11 @@ from PySide6.QtWidgets import (
     QWidget,
     QLabel,
     QHBoxLayout,
+    QLineEdit,
 )
 from PySide6.QtCore import Signal, Qt
 
-from jdxi_editor.midi.data.programs.programs import PROGRAM_LIST
+from jdxi_editor.midi.data.programs import PROGRAM_CATALOG
 from jdxi_editor.midi.data.constants.constants import MIDI_CHANNEL_PROGRAMS
 from jdxi_editor.midi.io import MidiIOHelper
 from jdxi_editor.midi.preset.handler import PresetHandler
@@ -94,6 +95,7 @@ class ProgramEditor(SynthEditor):
         ]
         self.layout = None
         self.genre_label = None
+        self.search_box = None
         self.program_number_combo_box = None
         self.bank_combo_box = None
         self.load_button = None
@@ -135,6 +137,15 @@ class ProgramEditor(SynthEditor):
         title_layout.addWidget(self.image_label)
         self.update_instrument_image()
 
+        # Search Box
+        search_row = QHBoxLayout()
+        search_row.addWidget(QLabel("Search:"))
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("Search programs...")
+        self.search_box.textChanged.connect(self.populate_programs)
+        search_row.addWidget(self.search_box)
+        layout.addLayout(search_row)
+
         self.program_label = QLabel("Program")
         layout.addWidget(self.program_label)
 
@@ -152,7 +163,7 @@ class ProgramEditor(SynthEditor):
         # Genre selection combo box
         self.genre_combo_box = QComboBox()
         self.genre_combo_box.addItem("No Genre Selected")
-        genres = set(program["genre"] for program in PROGRAM_LIST)
+        genres = set(program["genre"] for program in PROGRAM_CATALOG)
         self.genre_combo_box.addItems(sorted(genres))
         self.genre_combo_box.currentIndexChanged.connect(self.on_genre_changed)
         layout.addWidget(self.genre_combo_box)
@@ -288,14 +299,15 @@ class ProgramEditor(SynthEditor):
 
         selected_bank = self.bank_combo_box.currentText()
         selected_genre = self.genre_combo_box.currentText()
+        search_text = self.search_box.text()
         logging.info(f"Selected bank: {selected_bank}, Genre: {selected_genre}")
 
         self.program_number_combo_box.clear()
         self.programs.clear()
 
-        filtered_list = [  # Filter programs based on bank and genre
+        filtered_list = [  # Filter programs based on search text, bank and genre
             program
-            for program in PROGRAM_LIST
+            for program in PROGRAM_CATALOG.search(search_text)
             if (selected_bank in ["No Bank Selected", program["id"][0]])
             and (selected_genre in ["No Genre Selected", program["genre"]])
         ]
@@ -312,6 +324,7 @@ class ProgramEditor(SynthEditor):
         if (
             selected_bank in ["No Bank Selected", "E", "F", "G", "H"]
             and selected_genre == "No Genre Selected"
+            and not search_text
         ):
             self.add_user_banks(
                 filtered_list, selected_bank
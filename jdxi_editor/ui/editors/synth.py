@@ -23,22 +23,25 @@ Dependencies:
 import re
 import os
 import logging
-from typing import Optional
+from concurrent.futures import Future
+from typing import Optional, Tuple
 from PySide6.QtGui import QPixmap, QKeySequence, QShortcut
 from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import Qt, Signal
 
 from jdxi_editor.midi.data.parameter.digital import DigitalParameter
 from jdxi_editor.midi.data.parameter.drums import DrumCommonParameter
+from jdxi_editor.midi.data.parameter.conversion import convert_from_display
 from jdxi_editor.midi.data.parameter.synth import SynthParameter
 from jdxi_editor.midi.data.presets.digital import DIGITAL_PRESETS_ENUMERATED
 from jdxi_editor.midi.preset.type import SynthType
 from jdxi_editor.midi.data.constants.constants import MIDI_CHANNEL_DIGITAL1
 from jdxi_editor.midi.data.constants.sysex import PROGRAM_GROUP
 from jdxi_editor.midi.io.helper import MidiIOHelper
-from jdxi_editor.midi.message.roland import RolandSysEx
+from jdxi_editor.midi.sysex.memory import MemoryChange
 from jdxi_editor.midi.preset.data import PresetData
 from jdxi_editor.midi.preset.handler import PresetHandler
+from jdxi_editor.ui.editors.helpers.update_scheduler import UiUpdateScheduler
 from jdxi_editor.ui.style import Style
 from jdxi_editor.ui.widgets.combo_box.combo_box import ComboBox
 from jdxi_editor.ui.widgets.slider import Slider
@@ -65,8 +68,14 @@ class SynthEditor(QWidget):
         self.preset_loader = None
         self.midi_helper = midi_helper
         self.bipolar_parameters = []
+        # Incoming parameter values are applied to controls once per frame
+        self.update_scheduler = UiUpdateScheduler(
+            self, latency_monitor=getattr(midi_helper, "latency_monitor", None)
+        )
         # Midi request for Temporary program
         self.midi_requests = []
+        # Bulk snapshot of midi_requests in flight, its replies are applied as one batch
+        self._snapshot_request: Optional[Future] = None
         logging.debug(
             f"Initialized {self.__class__.__name__} with MIDI helper: {midi_helper}"
         )
@@ -83,6 +92,8 @@ class SynthEditor(QWidget):
         """
         self.part = None  #
         self.group = None  # ANALOG_OSC_GROUP
+        # Name prefixes of the shadow memory blocks the editor shows, e.g. ("ANALOG",)
+        self.memory_blocks: Tuple[str, ...] = ()
         # Set window flags for address tool window
         self.setWindowFlags(Qt.WindowType.Tool)
 
@@ -103,6 +114,8 @@ class SynthEditor(QWidget):
         # Connect to program change signal if MIDI helper exists
         if self.midi_helper:
             self.midi_helper.midi_program_changed.connect(self._handle_program_change)
+            self.midi_helper.bulk_fetcher.snapshot_complete.connect(self._on_snapshot_complete)
+            self.midi_helper.shadow_memory.memory_changed.connect(self._on_memory_changed)
             logging.info("MIDI helper initialized")
             # register callback
             if hasattr(self.midi_helper, "set_callback"):
@@ -209,6 +222,8 @@ class SynthEditor(QWidget):
     def set_midi_helper(self, midi_helper: MidiIOHelper):
         """Set MIDI helper instance"""
         self.midi_helper = midi_helper
+        self.midi_helper.bulk_fetcher.snapshot_complete.connect(self._on_snapshot_complete)
+        self.midi_helper.shadow_memory.memory_changed.connect(self._on_memory_changed)
 
     def update_combo_box_index(self, preset_number):
         """Updates the QComboBox to reflect the loaded preset."""
@@ -319,14 +334,9 @@ class SynthEditor(QWidget):
                 f"Sending param={param.name}, partial={self.part}, group={group}, value={value}"
             )
 
-            sysex_message = RolandSysEx(
-                area=self.area,
-                section=self.part,
-                group=group,
-                param=param.address,
-                value=value,
+            result = self.midi_helper.send_parameter(
+                self.area, self.part, group, param.address, value
             )
-            result = self.midi_helper.send_midi_message(sysex_message)
 
             return bool(result)
         except Exception as ex:
@@ -338,7 +348,7 @@ class SynthEditor(QWidget):
         try:
             # Convert display value to MIDI value
             midi_value = (
-                param.convert_from_display(display_value)
+                convert_from_display(param, display_value)
                 if hasattr(param, "convert_from_display")
                 else param.validate_value(display_value)
             )
@@ -350,12 +360,23 @@ class SynthEditor(QWidget):
             logging.error(f"Error handling parameter {param.name}: {ex}")
 
     def data_request(self):
-        """Send data request SysEx messages to the JD-Xi"""
-        # Define SysEx messages as byte arrays
-        for request in self.midi_requests:
-            request = bytes.fromhex(request)
-            # Send each SysEx message
-            self.send_message(request)
+        """Request the editor's areas from the JD-Xi as one bulk snapshot"""
+        if self.midi_helper:
+            request = self.midi_helper.bulk_fetcher.fetch(self.midi_requests)
+            if not request.done():
+                # Hold the replies back and refresh once, when the snapshot completes
+                self._snapshot_request = request
+                self.update_scheduler.hold()
+            return request
+        logging.error("MIDI helper not initialized")
+        return None
+
+    def _on_snapshot_complete(self, snapshot):
+        """Apply the replies to this editor's last data request in one batch"""
+        # The future is resolved before snapshot_complete, other editors' snapshots are ignored
+        if self._snapshot_request is not None and self._snapshot_request.done():
+            self._snapshot_request = None
+            self.update_scheduler.release()
 
     def send_message(self, message):
         """Send address SysEx message using the MIDI helper"""
@@ -370,8 +391,6 @@ class SynthEditor(QWidget):
             f"Program change {program} detected on channel {channel}, requesting data update"
         )
         self.data_request()
-        if hasattr(self, "address") and channel == self.midi_channel:
-            self.data_request()
 
     def _handle_control_change(self, channel: int, control: int, value: int):
         """Handle program change messages by requesting updated data"""
@@ -379,8 +398,6 @@ class SynthEditor(QWidget):
             f"Control change {control} detected on channel {channel}, value {value} requesting data update"
         )
         self.data_request()
-        if hasattr(self, "address") and channel == self.midi_channel:
-            self.data_request()
 
     def _handle_dt1_message(self, data):
         """Handle Data Set 1 (DT1) messages
@@ -399,25 +416,18 @@ class SynthEditor(QWidget):
         # Emit signal with parameter data
         self.parameter_received.emit(address, value)
 
-    def _log_changes(self, previous_data, current_data):
-        """Log changes between previous and current JSON data."""
-        changes = []
-        if not current_data or not previous_data:
+    def _on_memory_changed(self, change: MemoryChange):
+        """Log the parameters of the editor's blocks that the synth changed"""
+        if change.source != "device" or not change.block.startswith(self.memory_blocks):
             return
-        for key, current_value in current_data.items():
-            previous_value = previous_data.get(key)
-            if previous_value != current_value:
-                changes.append((key, previous_value, current_value))
-
-        changes = [
-            change
-            for change in changes
-            if change[0]
-            not in ["JD_XI_HEADER", "ADDRESS", "TEMPORARY_AREA", "TONE_NAME"]
-        ]
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            self._log_changes(change)
 
+    def _log_changes(self, change: MemoryChange):
+        """Log the parameters a shadow memory change modified."""
+        changes = list(self.midi_helper.shadow_memory.parameter_changes(change))
         if changes:
-            logging.info("Changes detected:")
+            logging.info(f"Changes detected in {change.block}:")
             for key, prev, curr in changes:
                 logging.info(
                     f"\n===> Changed Parameter: {key}, Previous: {prev}, Current: {curr}"
@@ -21,7 +21,6 @@ from PySide6.QtWidgets import QWidget, QSpinBox, QDoubleSpinBox, QGridLayout
 
 from jdxi_editor.midi.data.parameter.synth import SynthParameter
 from jdxi_editor.midi.data.constants.sysex import TEMPORARY_TONE_AREA
-from jdxi_editor.midi.message.roland import RolandSysEx
 from jdxi_editor.midi.data.constants.analog import (
     ANALOG_PART,
     ANALOG_OSC_GROUP,
@@ -231,12 +230,9 @@ class ADSR(QWidget):
         try:
             group = self.group  # Common parameters area
             param_address = param.address
-            sysex_message = RolandSysEx(area=self.area,
-                                        section=self.part,
-                                        group=group,
-                                        param=param_address,
-                                        value=value)
-            return self.midi_helper.send_midi_message(sysex_message)
+            return self.midi_helper.send_parameter(
+                self.area, self.part, group, param_address, value
+            )
         except Exception as e:
             logging.error(f"MIDI error setting {param}: {str(e)}")
             return False
@@ -257,6 +253,16 @@ class ADSR(QWidget):
         self.plot.set_values(self.envelope)
         self.envelopeChanged.emit(self.envelope)
 
+    def refresh_from_spinboxes(self):
+        """Sync the envelope, sliders and plot from the spin boxes without sending MIDI."""
+        self.update_envelope_from_spinboxes()
+        for slider in self.controls.values():
+            slider.blockSignals(True)
+        self.update_controls_from_envelope()
+        for slider in self.controls.values():
+            slider.blockSignals(False)
+        self.plot.set_values(self.envelope)
+
     def update_envelope_from_spinboxes(self):
         self.envelope["attack_time"] = (
             self.attack_sb.value()
@@ -523,12 +529,9 @@ class ADSR_new(QWidget):
         try:
             group = self.group  # Common parameters area
             param_address = param.address
-            sysex_message = RolandSysEx(area=self.area,
-                                        section=self.part,
-                                        group=group,
-                                        param=param_address,
-                                        value=value)
-            return self.midi_helper.send_midi_message(sysex_message)
+            return self.midi_helper.send_parameter(
+                self.area, self.part, group, param_address, value
+            )
         except Exception as e:
             logging.error(f"MIDI error setting {param}: {str(e)}")
             return False
@@ -20,7 +20,6 @@ from PySide6.QtWidgets import QWidget, QSpinBox, QDoubleSpinBox, QGridLayout, QS
 from typing import Dict, Union
 from jdxi_editor.midi.data.parameter.synth import SynthParameter
 from jdxi_editor.midi.data.constants.sysex import TEMPORARY_ANALOG_SYNTH_AREA, TEMPORARY_TONE_AREA
-from jdxi_editor.midi.message.roland import RolandSysEx
 from jdxi_editor.ui.widgets.adsr.plot import ADSRPlot
 from jdxi_editor.ui.widgets.slider.slider import Slider
 from jdxi_editor.ui.style import Style
@@ -250,12 +249,9 @@ class PitchEnvelope(QWidget):
         try:
             group = self.group  # Common parameters area
             param_address = param.address
-            sysex_message = RolandSysEx(area=self.area,
-                                        section=self.part,
-                                        group=group,
-                                        param=param_address,
-                                        value=value)
-            return self.midi_helper.send_midi_message(sysex_message)
+            return self.midi_helper.send_parameter(
+                self.area, self.part, group, param_address, value
+            )
         except Exception as e:
             logging.error(f"MIDI error setting {param}: {str(e)}")
             return False
@@ -29,9 +29,7 @@ Customization:
 
 
 import numpy as np
-import matplotlib.pyplot as plt
 from PySide6.QtWidgets import QWidget, QVBoxLayout
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
 import numpy as np
 from PySide6.QtWidgets import QWidget
@@ -164,6 +162,10 @@ class ADSRPlot(QWidget):
 
 class ADSRMatplot(QWidget):
     def __init__(self):
+        # Deferred, matplotlib takes longer to import than the rest of the editor
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+
         super().__init__()
         self.envelope = {
             "attack_time": 100,
@@ -0,0 +1,242 @@
+"""
+Piano Roll View
+===============
+
+This module defines the `PianoRollView` class, a QWidget drawing the
+`PianoRoll` of a MIDI file with QPainter instead of matplotlib.
+
+The roll is cut into tiles of `TILE_COLUMNS` columns of the level matching the
+zoom. Each tile is an 8-bit image, channel in the high four bits and intensity in
+the low four, wrapped in a QImage without copying and coloured through its
+colour table, one hue per channel as in the old plots. Tiles are built when
+first shown and kept in a small LRU, so a repaint only scales cached images:
+
+- scrolling moves the pixels already on screen with `QWidget.scroll` and paints
+  only the strip uncovered;
+- zooming picks a coarser or finer level, never more columns than pixels;
+- the playhead is drawn over the tiles, and moving it repaints the two thin
+  strips where it was and where it is.
+
+The mouse wheel scrolls, with Ctrl held it zooms around the pointer.
+
+Classes:
+    - PianoRollView: Tiled QWidget view of a PianoRoll with a playhead.
+
+Usage Example:
+    >>> view = PianoRollView()
+    >>> view.set_roll(piano_roll(midi_file))
+    >>> view.set_playhead(960)
+"""
+
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import numpy as np
+from PySide6.QtCore import QRect, QRectF, QSize, Qt
+from PySide6.QtGui import QColor, QImage, QPainter, QPen
+from PySide6.QtWidgets import QWidget
+
+from jdxi_editor.midi.file.roll import NUM_CHANNELS, NUM_NOTES, PianoRoll
+
+TILE_COLUMNS = 256
+MAX_TILES = 64  # about 2 MB of tile images
+INTENSITY_LEVELS = 16
+PIXELS_PER_KEY = 2
+MAX_PIXELS_PER_COLUMN = 8
+ZOOM_STEP = 1.25
+PLAYHEAD_WIDTH = 2
+BACKGROUND_COLOR = QColor("#000000")
+PLAYHEAD_COLOR = QColor("#ffffff")
+
+
+def color_table() -> List[int]:
+    """Colours of the tile codes, channel * 16 + intensity level."""
+    background = BACKGROUND_COLOR
+    table = []
+    for channel in range(NUM_CHANNELS):
+        color = QColor.fromHsvF(channel / NUM_CHANNELS, 1.0, 1.0)
+        for level in range(INTENSITY_LEVELS):
+            mix = level / (INTENSITY_LEVELS - 1)
+            table.append(
+                QColor(
+                    round(background.red() + (color.red() - background.red()) * mix),
+                    round(background.green() + (color.green() - background.green()) * mix),
+                    round(background.blue() + (color.blue() - background.blue()) * mix),
+                ).rgb()
+            )
+    return table
+
+
+class PianoRollView(QWidget):
+    """Tiled view of a piano roll, time across and keys up, with a playhead."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.roll: Optional[PianoRoll] = None
+        self.start_tick = 0.0  # tick at the left edge
+        self.ticks_per_pixel = 1.0
+        self.playhead: Optional[float] = None
+        self.follow_playhead = True
+        self.tiles_built = 0
+        self._color_table = color_table()
+        self._tiles: "OrderedDict[Tuple[int, int], Tuple[np.ndarray, QImage]]" = OrderedDict()
+        self.setMinimumHeight(NUM_NOTES)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+
+    def sizeHint(self) -> QSize:
+        return QSize(800, NUM_NOTES * PIXELS_PER_KEY)
+
+    def set_roll(self, roll: Optional[PianoRoll]) -> None:
+        """
+        Show a piano roll, zoomed to fit.
+
+        :param roll: PianoRoll, or None to clear the view.
+        """
+        if roll is self.roll:
+            return
+        self.roll = roll
+        self._tiles.clear()
+        self.playhead = None
+        self.fit()
+
+    def fit(self) -> None:
+        """Zoom to show the whole roll."""
+        self.start_tick = 0.0
+        if self.roll is not None:
+            self.ticks_per_pixel = self._clamp_zoom(self.roll.total_ticks / max(self.width(), 1))
+        self.update()
+
+    def _clamp_zoom(self, ticks_per_pixel: float) -> float:
+        """Zoom limited to between the whole roll and a few pixels per column."""
+        low = self.roll.ticks_per_column / MAX_PIXELS_PER_COLUMN
+        high = max(self.roll.total_ticks / max(self.width(), 1), low)
+        return min(max(ticks_per_pixel, low), high)
+
+    def zoom(self, factor: float, anchor_x: Optional[float] = None) -> None:
+        """
+        Zoom in, factor > 1, or out, keeping the tick under anchor_x in place.
+
+        :param factor: float zoom factor.
+        :param anchor_x: Optional float x of the zoom centre, the middle by default.
+        """
+        if self.roll is None:
+            return
+        if anchor_x is None:
+            anchor_x = self.width() / 2
+        anchor_tick = self.start_tick + anchor_x * self.ticks_per_pixel
+        self.ticks_per_pixel = self._clamp_zoom(self.ticks_per_pixel / factor)
+        self.start_tick = self._clamp_start(anchor_tick - anchor_x * self.ticks_per_pixel)
+        self.update()
+
+    def _clamp_start(self, tick: float) -> float:
+        """Left edge tick, within the roll."""
+        end = self.roll.total_ticks - self.width() * self.ticks_per_pixel
+        return min(max(tick, 0.0), max(end, 0.0))
+
+    def scroll_to(self, tick: float) -> None:
+        """
+        Scroll so that tick is at the left edge, repainting only what is uncovered.
+
+        :param tick: float tick.
+        """
+        if self.roll is None:
+            return
+        # Whole pixels, so the pixels moved line up with the ones painted
+        dx = round((self.start_tick - self._clamp_start(tick)) / self.ticks_per_pixel)
+        if not dx:
+            return
+        self.start_tick -= dx * self.ticks_per_pixel
+        if abs(dx) < self.width():
+            self.scroll(dx, 0)
+        else:
+            self.update()
+
+    def set_playhead(self, tick: Optional[float]) -> None:
+        """
+        Move the playhead, repainting only where it was and where it is.
+
+        :param tick: float tick, or None to hide the playhead.
+        """
+        if self.follow_playhead and tick is not None and self.roll is not None:
+            page = self.width() * self.ticks_per_pixel
+            if not self.start_tick <= tick < self.start_tick + page:
+                # The old playhead scrolls with the pixels it was drawn on
+                self.scroll_to(tick)
+        old_x = self._playhead_x()
+        self.playhead = tick
+        for x in (old_x, self._playhead_x()):
+            if x is not None:
+                self.update(QRect(x - PLAYHEAD_WIDTH, 0, PLAYHEAD_WIDTH * 2 + 1, self.height()))
+
+    def _playhead_x(self) -> Optional[int]:
+        if self.playhead is None:
+            return None
+        return round((self.playhead - self.start_tick) / self.ticks_per_pixel)
+
+    def _tile(self, level: int, index: int) -> QImage:
+        """The image of a tile, built on first use."""
+        key = (level, index)
+        entry = self._tiles.get(key)
+        if entry is not None:
+            self._tiles.move_to_end(key)
+            return entry[1]
+        first = index * TILE_COLUMNS
+        # Highest key on the top row
+        intensity = self.roll.intensity[level][::-1, first:first + TILE_COLUMNS]
+        channels = self.roll.channels[level][::-1, first:first + TILE_COLUMNS]
+        codes = np.zeros((NUM_NOTES, TILE_COLUMNS), dtype=np.uint8)
+        # Any sounding note is at least level 1, silence is level 0 of every channel
+        codes[:, :intensity.shape[1]] = (
+            (channels << 4) | (intensity >> 3) | (intensity > 0)
+        )
+        image = QImage(codes.data, TILE_COLUMNS, NUM_NOTES, TILE_COLUMNS, QImage.Format.Format_Indexed8)
+        image.setColorTable(self._color_table)
+        # The image reads the array in place, keep them together
+        self._tiles[key] = (codes, image)
+        self.tiles_built += 1
+        if len(self._tiles) > MAX_TILES:
+            self._tiles.popitem(last=False)
+        return image
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        rect = event.rect()
+        painter.fillRect(rect, BACKGROUND_COLOR)
+        if self.roll is not None:
+            self._paint_tiles(painter, rect)
+        x = self._playhead_x()
+        if x is not None:
+            painter.setPen(QPen(PLAYHEAD_COLOR, PLAYHEAD_WIDTH))
+            painter.drawLine(x, rect.top(), x, rect.bottom())
+        painter.end()
+
+    def _paint_tiles(self, painter: QPainter, rect: QRect) -> None:
+        """Draw the tiles under rect at the level of the current zoom."""
+        level = self.roll.level_for(self.ticks_per_pixel)
+        columns = self.roll.intensity[level].shape[1]
+        tile_ticks = TILE_COLUMNS * (self.roll.ticks_per_column << level)
+        tile_width = tile_ticks / self.ticks_per_pixel
+        first_tick = self.start_tick + rect.left() * self.ticks_per_pixel
+        last_tick = self.start_tick + (rect.right() + 1) * self.ticks_per_pixel
+        last_index = min(int(last_tick // tile_ticks), (columns - 1) // TILE_COLUMNS)
+        source = QRectF(0, 0, TILE_COLUMNS, NUM_NOTES)
+        for index in range(max(int(first_tick // tile_ticks), 0), last_index + 1):
+            x = (index * tile_ticks - self.start_tick) / self.ticks_per_pixel
+            target = QRectF(x, 0, tile_width, self.height())
+            painter.drawImage(target, self._tile(level, index), source)
+
+    def resizeEvent(self, event):
+        if self.roll is not None:
+            self.ticks_per_pixel = self._clamp_zoom(self.ticks_per_pixel)
+            self.start_tick = self._clamp_start(self.start_tick)
+        super().resizeEvent(event)
+
+    def wheelEvent(self, event):
+        delta = event.angleDelta().y() or event.angleDelta().x()
+        if not delta or self.roll is None:
+            return
+        if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            self.zoom(ZOOM_STEP ** (delta / 120), event.position().x())
+        else:
+            self.scroll_to(self.start_tick - delta / 120 * self.width() / 8 * self.ticks_per_pixel)
+        event.accept()
@@ -33,12 +33,13 @@ from pubsub import pub
 from PySide6.QtWidgets import QMenu, QMessageBox, QLabel
 from PySide6.QtCore import Qt, QSettings, Signal
 
+from jdxi_editor.startup import STARTUP_TIMER
 from jdxi_editor.midi.preset.preset import Preset
 from jdxi_editor.midi.preset.type import SynthType
 from jdxi_editor.midi.data.presets.drum import DRUM_PRESETS_ENUMERATED
 from jdxi_editor.midi.data.presets.digital import DIGITAL_PRESETS_ENUMERATED
 from jdxi_editor.midi.data.presets.analog import ANALOG_PRESETS_ENUMERATED, AN_PRESETS
-from jdxi_editor.midi.data.constants.triage import DigitalParameter
+from jdxi_editor.midi.data.parameter.digital_common import DigitalCommonParameter
 from jdxi_editor.midi.data.constants.constants import MIDI_CHANNEL_DIGITAL1, MIDI_CHANNEL_DIGITAL2, MIDI_CHANNEL_ANALOG, \
     MIDI_CHANNEL_DRUMS, START_OF_SYSEX, END_OF_SYSEX, DEVICE_ID, MODEL_ID_1, MODEL_ID_2, MODEL_ID, JD_XI_HEADER, \
     MIDI_CHANNEL_PROGRAMS
@@ -54,19 +55,8 @@ from jdxi_editor.midi.preset.data import PresetData
 from jdxi_editor.midi.preset.handler import PresetHandler
 from jdxi_editor.midi.preset.helper import PresetHelper
 from jdxi_editor.midi.program.helper import ProgramHelper
-from jdxi_editor.ui.editors import (
-    AnalogSynthEditor,
-    DigitalSynthEditor,
-    DrumEditor,
-    ArpeggioEditor,
-    EffectsEditor,
-    VocalFXEditor,
-    ProgramEditor,
-    MidiFileEditor,
-)
+from jdxi_editor.ui import editors
 from jdxi_editor.ui.editors.helpers.program import get_program_id_by_name, get_program_name_by_id
-from jdxi_editor.ui.editors.pattern import PatternSequencer
-from jdxi_editor.ui.editors.preset import PresetEditor
 from jdxi_editor.ui.style import Style
 from jdxi_editor.ui.widgets.button import SequencerSquare
 from jdxi_editor.ui.windows.midi.config_dialog import MIDIConfigDialog
@@ -80,6 +70,16 @@ from jdxi_editor.ui.widgets.button.favorite import FavoriteButton
 
 CENTER_OCTAVE_VALUE = 0x40  # for octave up/down buttons
 
+# Editors constructed with the preset handler of the selected synth
+PRESET_HANDLER_EDITORS = (
+    "DigitalSynthEditor",
+    "DrumEditor",
+    "AnalogSynthEditor",
+    "PatternSequencer",
+    "ProgramEditor",
+    "PresetEditor",
+)
+
 
 class JdxiInstrument(JdxiUi):
     midi_program_changed = Signal(
@@ -132,9 +132,10 @@ class JdxiInstrument(JdxiUi):
         ]
 
         # Try to auto-connect to JD-Xi
-        self._auto_connect_jdxi()
-        # self.midi_helper.set_callback(self.midi_helper.midi_callback)
-        self.midi_helper.send_identity_request()
+        with STARTUP_TIMER.phase("MIDI auto-connect"):
+            self._auto_connect_jdxi()
+            # self.midi_helper.set_callback(self.midi_helper.midi_callback)
+            self.midi_helper.send_identity_request()
         self.program_helper = ProgramHelper(self.midi_helper, MIDI_CHANNEL_PROGRAMS)
         # Show MIDI config if auto-connect failed
         if (
@@ -270,12 +271,8 @@ class JdxiInstrument(JdxiUi):
         self._update_display()
 
     def data_request(self):
-        """Send data request SysEx messages to the JD-Xi"""
-        # Define SysEx messages as byte arrays
-        for request in self.midi_requests:
-            request = bytes.fromhex(request)
-            # Send each SysEx message
-            self.midi_helper.send_raw_message(request)
+        """Request the current program and tones from the JD-Xi as one bulk snapshot"""
+        return self.midi_helper.bulk_fetcher.fetch(self.midi_requests)
 
     def set_current_digital2_tone_name(self, tone_name: str):
         """ program name """
@@ -474,52 +471,52 @@ class JdxiInstrument(JdxiUi):
 
     def _show_vocal_fx(self, editor_type: str):
         if not hasattr(self, "vocal_fx_editor"):
-            self.vocal_fx_editor = VocalFXEditor(self.midi_helper, self)
+            self.vocal_fx_editor = editors.VocalFXEditor(self.midi_helper, self)
             self.vocal_fx_editor.show()
             self.vocal_fx_editor.raise_()
 
     def _show_digital_synth_editor(self, editor_type: str):
         synth_num = 1 if editor_type == "digital1" else 2
         self._show_editor(
-            f"Digital Synth {synth_num}", DigitalSynthEditor, synth_num=synth_num
+            f"Digital Synth {synth_num}", editors.DigitalSynthEditor, synth_num=synth_num
         )
         self.preset_type = (
             SynthType.DIGITAL_1 if synth_num == 1 else SynthType.DIGITAL_2
         )
 
     def _show_analog_synth_editor(self, editor_type: str):
-        self._show_editor("Analog Synth", AnalogSynthEditor)
+        self._show_editor("Analog Synth", editors.AnalogSynthEditor)
         self.channel = MIDI_CHANNEL_ANALOG
         self.preset_type = SynthType.ANALOG
 
     def _show_drums_editor(self, editor_type: str):
-        self._show_editor("Drums", DrumEditor)
+        self._show_editor("Drums", editors.DrumEditor)
         self.channel = MIDI_CHANNEL_DRUMS
         self.preset_type = SynthType.DRUMS
 
     def _open_effects(self, title, editor_type: str):
-        self._show_editor("Effects", EffectsEditor)
+        self._show_editor("Effects", editors.EffectsEditor)
 
     def _open_vocal_effects(self, title, editor_type: str):
-        self._show_editor("Vocal Effects", VocalFXEditor)
+        self._show_editor("Vocal Effects", editors.VocalFXEditor)
 
     def _open_pattern(self, editor_type: str):
-        self._show_editor("Pattern", PatternSequencer)
+        self._show_editor("Pattern", editors.PatternSequencer)
 
     def _open_preset(self, editor_type: str):
         try:
-            self._show_editor("Preset", PresetEditor)
+            self._show_editor("Preset", editors.PresetEditor)
         except Exception as ex:
             logging.error(f"Error showing Preset editor: {str(ex)}")
 
     def _open_program(self, editor_type: str):
         try:
-            self._show_editor("Program", ProgramEditor)
+            self._show_editor("Program", editors.ProgramEditor)
         except Exception as ex:
             logging.error(f"Error showing Program editor: {str(ex)}")
 
     def _open_midi_file(self, editor_type: str):
-        self._show_editor("MIDI File", MidiFileEditor)
+        self._show_editor("MIDI File", editors.MidiFileEditor)
 
     def _save_favorite(self, button, index):
         """Save the current preset as address favorite"""
@@ -680,14 +677,7 @@ class JdxiInstrument(JdxiUi):
         """Show editor window"""
         try:
             # Create editor with proper initialization
-            if editor_class in [
-                DigitalSynthEditor,
-                DrumEditor,
-                AnalogSynthEditor,
-                PatternSequencer,
-                ProgramEditor,
-                PresetEditor,
-            ]:
+            if editor_class.__name__ in PRESET_HANDLER_EDITORS:
                 preset_handler = self._get_preset_handler_for_current_synth()
                 editor = editor_class(
                     midi_helper=self.midi_helper, parent=self, preset_handler=preset_handler, **kwargs
@@ -736,7 +726,7 @@ class JdxiInstrument(JdxiUi):
         self.midi_in_indicator.flash()
 
     def _open_analog_synth(self):
-        self._show_editor("Analog Synth", AnalogSynthEditor)
+        self._show_editor("Analog Synth", editors.AnalogSynthEditor)
         self.preset_type = SynthType.ANALOG
         self.current_synth_type = SynthType.ANALOG
         self.channel = MIDI_CHANNEL_ANALOG
@@ -747,7 +737,7 @@ class JdxiInstrument(JdxiUi):
         self.channel = MIDI_CHANNEL_DIGITAL1
         try:
             if not hasattr(self, "digital_synth1_editor"):
-                self.digital_synth1_editor = DigitalSynthEditor(
+                self.digital_synth1_editor = editors.DigitalSynthEditor(
                     midi_helper=self.midi_helper, parent=self
                 )
             self.digital_synth1_editor.show()
@@ -756,14 +746,14 @@ class JdxiInstrument(JdxiUi):
             logging.error(f"Error opening Digital Synth 1 editor: {str(ex)}")
 
     def _open_digital_synth2(self):
-        self._show_editor("Digital Synth 2", DigitalSynthEditor, synth_num=2)
+        self._show_editor("Digital Synth 2", editors.DigitalSynthEditor, synth_num=2)
         self.channel = MIDI_CHANNEL_DIGITAL2
         self.preset_type = SynthType.DIGITAL_2
         self.current_synth_type = SynthType.DIGITAL_2
 
     def _open_drums(self):
         self.channel = MIDI_CHANNEL_DRUMS
-        self._show_editor("Drums", DrumEditor)
+        self._show_editor("Drums", editors.DrumEditor)
         self.preset_type = SynthType.DRUMS
         self.current_synth_type = SynthType.DRUMS
 
@@ -771,7 +761,7 @@ class JdxiInstrument(JdxiUi):
         """Show the arpeggiator editor window"""
         try:
             if not hasattr(self, "arpeggiator"):
-                self.arpeggiator = ArpeggioEditor(
+                self.arpeggiator = editors.ArpeggioEditor(
                     midi_helper=self.midi_helper,  # Pass midi_helper instance
                     parent=self,
                 )
@@ -785,7 +775,7 @@ class JdxiInstrument(JdxiUi):
         """Show the effects editor window"""
         try:
             if not hasattr(self, "effects_editor"):
-                self.effects_editor = EffectsEditor(
+                self.effects_editor = editors.EffectsEditor(
                     midi_helper=self.midi_helper,  # Pass midi_helper instead of midi_out
                     parent=self,
                 )
@@ -909,7 +899,7 @@ class JdxiInstrument(JdxiUi):
             self._update_display()
             part_address = 0x01
             group_address = 0x00
-            param_address = DigitalParameter.OCTAVE_SHIFT.value
+            param_address = DigitalCommonParameter.OCTAVE_SHIFT.address
             # Map octave value to correct SysEx value
             # -3 = 0x3D, -2 = 0x3E, -1 = 0x3F, 0 = 0x40, +1 = 0x41, +2 = 0x42, +3 = 0x43
             octave_value = 0x40 + self.current_octave  # 0x40 is center octave
@@ -1193,7 +1183,7 @@ class JdxiInstrument(JdxiUi):
 
     def _show_analog_presets(self):
         """Show the analog preset editor window"""
-        self.preset_editor = PresetEditor(
+        self.preset_editor = editors.PresetEditor(
             midi_helper=self.midi_helper, parent=self, preset_type=SynthType.ANALOG
         )
         self.preset_editor.preset_changed.connect(self._update_display_preset)
@@ -1427,7 +1417,7 @@ class JdxiInstrument(JdxiUi):
         """Show the vocal FX editor window"""
         try:
             if not hasattr(self, "vocal_fx_editor"):
-                self.vocal_fx_editor = VocalFXEditor(
+                self.vocal_fx_editor = editors.VocalFXEditor(
                     midi_helper=self.midi_helper, parent=self
                 )
             self.vocal_fx_editor.show()
@@ -1441,7 +1431,7 @@ class JdxiInstrument(JdxiUi):
         try:
             if not hasattr(self, "arpeggio_editor"):
                 logging.debug("Creating new arpeggio editor")
-                self.arpeggio_editor = ArpeggioEditor(midi_helper=self.midi_helper)
+                self.arpeggio_editor = editors.ArpeggioEditor(midi_helper=self.midi_helper)
             logging.debug("Showing arpeggio editor")
             self.arpeggio_editor.show()
         except Exception as ex:
@@ -1451,6 +1441,6 @@ class JdxiInstrument(JdxiUi):
         """Open the ProgramEditor when the digital display is clicked."""
         if event.button() == Qt.MouseButton.LeftButton:
             try:
-                self._show_editor("Program", ProgramEditor)
+                self._show_editor("Program", editors.ProgramEditor)
             except Exception as ex:
                 logging.error(f"Error opening Program editor: {str(ex)}")
@@ -31,7 +31,6 @@ from PySide6.QtWidgets import (
     QLabel, QPushButton, QGroupBox, QDialogButtonBox
 )
 from PySide6.QtCore import Qt
-import qtawesome as qta
 from jdxi_editor.ui.style import Style
 from jdxi_editor.midi.io.helper import MidiIOHelper
 
@@ -54,6 +53,8 @@ class MIDIConfigDialog(QDialog):
         
     def _create_ui(self):
         """Create the dialog UI"""
+        import qtawesome as qta  # Deferred, the dialog is only shown when auto-connect fails
+
         layout = QVBoxLayout(self)
         
         # Input port selection
@@ -12,13 +12,16 @@ Key Features:
 - Log responses from MIDI devices, including message sending success and failure information.
 - Validate checksum for SysEx messages to ensure message integrity.
 - Provides an easy-to-use interface with instructions, buttons, and output areas for effective debugging.
+- Show the latency histograms of the MIDI input and output paths, refreshed only while the window
+  is visible, and dump them to a JSON file.
 
 Attributes:
     SYSEX_AREAS (dict): Mappings for SysEx area IDs to their human-readable names.
     COMMANDS (dict): Mappings for SysEx command IDs to their human-readable names.
     SECTIONS (dict): Mappings for SysEx section IDs to their human-readable names.
     GROUPS (dict): Mappings for SysEx group IDs to their human-readable names.
-    PARAMETERS (dict): Mappings for SysEx parameter IDs to their human-readable names.
+    PARAMETERS (dict): Mappings for SysEx parameter IDs to their human-readable names,
+        used when the parameter registry does not know the address.
 
 Methods:
     __init__(self, midi_helper, parent=None): Initializes the MIDI debugger with a MIDI helper.
@@ -29,6 +32,8 @@ Methods:
     _send_commands(self): Sends the entered MIDI commands to the connected MIDI device.
     log_response(self, text): Logs a response message to the response log.
     handle_midi_response(self, message): Handles incoming MIDI messages and logs them.
+    _refresh_latency(self): Shows the latency summary of the MIDI helper's latency monitor.
+    _dump_latency(self): Writes the latency histograms to a JSON file.
 
 This class is useful for MIDI developers, musicians, and anyone working with MIDI devices, providing both real-time MIDI debugging and SysEx message analysis capabilities.
 
@@ -38,19 +43,24 @@ import logging
 from tabulate import tabulate
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-    QPushButton, QTextEdit, QLabel, QPlainTextEdit
+    QPushButton, QTextEdit, QLabel, QPlainTextEdit, QFileDialog
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QFontDatabase
 
 from jdxi_editor.midi.data.constants import (EFFECTS_AREA
                                              )
 from jdxi_editor.midi.data.constants.constants import DT1_COMMAND_12
 from jdxi_editor.midi.data.constants.sysex import DIGITAL_SYNTH_1_AREA
+from jdxi_editor.midi.data.parameter.registry import PARAMETER_REGISTRY
 from jdxi_editor.ui.style import Style
 from jdxi_editor.midi.sysex.parsers import parse_sysex
 from jdxi_editor.ui.windows.midi.helpers.debugger import _validate_checksum
 
 
+LATENCY_REFRESH_MS = 500
+
+
 class MIDIDebugger(QMainWindow):
     # SysEx message structure constants
     SYSEX_AREAS = {
@@ -181,9 +191,32 @@ class MIDIDebugger(QMainWindow):
         self.clear_button.clicked.connect(self.decoded_text.clear)
         self.clear_button.clicked.connect(self.response_log.clear)
 
+        # Latency section
+        latency_widget = QWidget()
+        latency_layout = QVBoxLayout(latency_widget)
+        latency_layout.addWidget(QLabel("Latency (wire to widget, edit to wire):"))
+        self.latency_text = QPlainTextEdit()
+        self.latency_text.setReadOnly(True)
+        self.latency_text.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        latency_layout.addWidget(self.latency_text)
+        latency_buttons = QHBoxLayout()
+        self.latency_reset_button = QPushButton("Reset Latency")
+        self.latency_reset_button.clicked.connect(self._reset_latency)
+        latency_buttons.addWidget(self.latency_reset_button)
+        self.latency_dump_button = QPushButton("Dump Latency...")
+        self.latency_dump_button.clicked.connect(self._dump_latency)
+        latency_buttons.addWidget(self.latency_dump_button)
+        latency_layout.addLayout(latency_buttons)
+
+        # The summary is only formatted while the window is visible
+        self.latency_timer = QTimer(self)
+        self.latency_timer.setInterval(LATENCY_REFRESH_MS)
+        self.latency_timer.timeout.connect(self._refresh_latency)
+
         # Add widgets to splitter
         splitter.addWidget(top_widget)
         splitter.addWidget(bottom_widget)
+        splitter.addWidget(latency_widget)
 
         # Add splitter to main layout
         layout.addWidget(splitter)
@@ -235,9 +268,13 @@ class MIDIDebugger(QMainWindow):
             param = message[11]
             group_address = hex(group)
             param_address = hex(param)
-            # param_str = DigitalParameter.get_name_by_address(int(param))
             group_str = self.GROUPS.get(group, f"Common Group ({group_address})")
-            param_str = self.PARAMETERS.get(param, f"Unknown Parameter ({param_address})")
+            parameter = PARAMETER_REGISTRY.from_address(message[8:12])
+            param_str = (
+                parameter.name
+                if parameter is not None
+                else self.PARAMETERS.get(param, f"Unknown Parameter ({param_address})")
+            )
 
             # Get value
             value = message[12]
@@ -298,7 +335,12 @@ class MIDIDebugger(QMainWindow):
 
             # Get parameter
             param = message[11]
-            param_str = self.PARAMETERS.get(param, f"Unknown Parameter ({hex(param)})")
+            parameter = PARAMETER_REGISTRY.from_address(message[8:12])
+            param_str = (
+                parameter.name
+                if parameter is not None
+                else self.PARAMETERS.get(param, f"Unknown Parameter ({hex(param)})")
+            )
 
             # Get value
             value = message[12]
@@ -411,3 +453,48 @@ class MIDIDebugger(QMainWindow):
 
         except Exception as e:
             self.log_response(f"Error handling response: {str(e)}")
+
+    @property
+    def latency_monitor(self):
+        """The MIDI helper's LatencyMonitor, if any"""
+        return getattr(self.midi_helper, "latency_monitor", None)
+
+    def showEvent(self, event):
+        """Start refreshing the latency summary"""
+        super().showEvent(event)
+        self._refresh_latency()
+        self.latency_timer.start()
+
+    def hideEvent(self, event):
+        """Stop refreshing the latency summary"""
+        self.latency_timer.stop()
+        super().hideEvent(event)
+
+    def _refresh_latency(self):
+        """Show the latency summary"""
+        if self.latency_monitor is None:
+            self.latency_text.setPlainText("No latency monitor available")
+            return
+        self.latency_text.setPlainText(self.latency_monitor.report() or "No samples yet")
+
+    def _reset_latency(self):
+        """Discard the latency samples"""
+        if self.latency_monitor is not None:
+            self.latency_monitor.reset()
+            self._refresh_latency()
+
+    def _dump_latency(self):
+        """Write the latency histograms to a JSON file"""
+        if self.latency_monitor is None:
+            self.log_response("Error: No latency monitor available")
+            return
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Dump Latency Histograms", "jdxi_latency.json", "JSON Files (*.json)"
+        )
+        if not path:
+            return
+        try:
+            self.latency_monitor.dump(path)
+            self.log_response(f"Latency histograms written to {path}")
+        except OSError as e:
+            self.log_response(f"Error writing latency histograms: {str(e)}")
@@ -24,6 +24,8 @@ setup(
     name="jdxi_editor",
     version="0.30",
     packages=find_packages(),
+    # Compiled by jdxi_editor.midi.data.programs.build, read on first use of a catalog
+    package_data={"jdxi_editor.midi.data.programs": ["catalogs.json"]},
     install_requires=[
         "PySide6",
         "python-rtmidi",
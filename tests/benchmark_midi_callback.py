@@ -0,0 +1,128 @@
+"""
+Benchmark: messages per second through MidiInHandler.midi_callback
+
+Compares the raw status byte dispatch in `MidiInHandler.midi_callback` with the
+previous implementation, which converted every event with
+`mido.Message.from_bytes`, rebuilt the handler dict per message, formatted
+several `logging.info` f-strings and parsed SysEx frames before returning.
+SysEx frames are now decoded by the SysEx decode worker, whose counters are
+printed at the end.
+
+Usage:
+    python tests/benchmark_midi_callback.py [--seconds 1.0]
+"""
+
+import argparse
+import json
+import logging
+import time
+from typing import Callable, Dict, List, Tuple
+
+from jdxi_editor.midi.io import MidiIOHelper
+from jdxi_editor.midi.preset.data import PresetData
+from jdxi_editor.midi.sysex.parsers import parse_sysex
+from jdxi_editor.midi.utils.json import log_json
+
+
+def _roland_dt1(address: List[int], data: List[int]) -> List[int]:
+    """Build a JD-Xi DT1 frame with a valid checksum."""
+    checksum = (128 - (sum(address + data) & 0x7F)) & 0x7F
+    return [0xF0, 0x41, 0x10, 0x00, 0x00, 0x00, 0x0E, 0x12] + address + data + [checksum, 0xF7]
+
+
+def build_corpus() -> Dict[str, List[Tuple[List[int], float]]]:
+    """Synthetic but realistic incoming traffic, keyed by message class."""
+    knob_sweep = [([0xB0, 74, value], 0.0) for value in range(128)]
+    notes = [([0x90, 60, 100], 0.0), ([0x80, 60, 0], 0.0)] * 64
+    clock = [([0xF8], 0.0)] * 128
+    dt1_edits = [(_roland_dt1([0x19, 0x01, 0x20, 0x0C], [value]), 0.0) for value in range(128)]
+    tone_name = [ord(c) for c in "JP8 Strings1"]
+    partial_dump = [(_roland_dt1([0x19, 0x01, 0x20, 0x00], tone_name + [0x40] * 0x31), 0.0)] * 16
+    return {
+        "control_change": knob_sweep,
+        "note_on/off": notes,
+        "clock": clock,
+        "dt1_edit": dt1_edits,
+        "rq1_reply": partial_dump,
+    }
+
+
+def legacy_handle_sysex(handler: MidiIOHelper, message, preset_data) -> None:
+    """SysEx handling prior to the decode worker: parsed inside the callback."""
+    hex_string = " ".join(f"{byte:02X}" for byte in message.data)
+    sysex_message_byte_list = bytes(
+        [0xF0] + [int(byte, 16) for byte in hex_string.split()] + [0xF7]
+    )
+    parsed_data = parse_sysex(sysex_message_byte_list)
+    if len(message.data) > 20:
+        json.dumps(parsed_data)  # broadcast to every editor as a JSON string
+    log_json(parsed_data)
+
+
+def legacy_midi_callback(handler: MidiIOHelper, event) -> None:
+    """The midi_callback implementation prior to raw status byte dispatch."""
+    try:
+        logging.info(f"midi_callback: message preset_type: {type(event)}")
+        if type(event) is tuple:
+            message_data, _ = event
+            message = handler.rtmidi_to_mido(message_data)
+            if message.type == "program_change":
+                logging.info(
+                    "Program Change - Channel: %d, Program: %d",
+                    message.channel,
+                    message.program,
+                )
+            if message.type != "clock":
+                handler.midi_incoming_message.emit(message)
+                logging.info(
+                    "MIDI message of preset_type %s incoming: %s",
+                    message.type,
+                    message,
+                )
+            preset_data = PresetData(modified=0)
+            message_handlers = {
+                "sysex": lambda m, p: legacy_handle_sysex(handler, m, p),
+                "control_change": handler._handle_control_change,
+                "program_change": handler._handle_program_change,
+                "note_on": handler._handle_note_change,
+                "note_off": handler._handle_note_change,
+                "clock": handler._handle_clock,
+            }
+            message_handler = message_handlers.get(message.type)
+            if message_handler:
+                message_handler(message, preset_data)
+    except Exception as exc:
+        logging.error("Error handling incoming MIDI message: %s", str(exc))
+
+
+def measure(callback: Callable, events: List, seconds: float) -> float:
+    """Return messages per second for callback over events."""
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        for event in events:
+            callback(event)
+        count += len(events)
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    handler = MidiIOHelper()
+    print(f"{'message class':<16}{'before msg/s':>16}{'after msg/s':>16}{'speedup':>10}")
+    for name, events in build_corpus().items():
+        before = measure(lambda e: legacy_midi_callback(handler, e), events, args.seconds)
+        after = measure(handler.midi_callback, events, args.seconds)
+        print(f"{name:<16}{before:>16,.0f}{after:>16,.0f}{after / before:>9.1f}x")
+    decode_stats = handler.sysex_decoder.stats()
+    print(f"sysex decoder: {decode_stats}")
+    handler.sysex_decoder.stop()
+
+
+if __name__ == "__main__":
+    main()
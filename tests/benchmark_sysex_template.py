@@ -0,0 +1,81 @@
+"""
+Benchmark: building a DT1 parameter message
+
+Compares the precompiled `SysExTemplate` path used by `send_parameter` with the
+previous ways of building a parameter change: `RolandSysEx(...).to_list()`, used
+by the editors' `send_midi_parameter`, and `RolandSysEx().construct_sysex`, used
+by `send_parameter`.
+
+Usage:
+    python tests/benchmark_sysex_template.py [--seconds 1.0]
+"""
+
+import argparse
+import logging
+import time
+from typing import Callable
+
+from jdxi_editor.midi.message.roland import RolandSysEx
+from jdxi_editor.midi.message.template import render_parameter
+from jdxi_editor.midi.utils.byte import split_value_to_nibbles
+
+AREA, PART, GROUP, PARAM = 0x19, 0x01, 0x20, 0x0C
+
+
+def roland_sysex_to_list(value: int):
+    """Editor path prior to templates."""
+    return RolandSysEx(area=AREA, section=PART, group=GROUP, param=PARAM, value=value).to_list()
+
+
+def construct_sysex(value: int):
+    """send_parameter path prior to templates."""
+    return RolandSysEx().construct_sysex([AREA, PART, GROUP, PARAM], value & 0x7F)
+
+
+def construct_sysex_nibbles(value: int):
+    """send_parameter path prior to templates, 4 byte value."""
+    return RolandSysEx().construct_sysex(
+        [AREA, PART, GROUP, PARAM], *split_value_to_nibbles(value, 4)
+    )
+
+
+def template(value: int):
+    return render_parameter(AREA, PART, GROUP, PARAM, value)
+
+
+def template_nibbles(value: int):
+    return render_parameter(AREA, PART, GROUP, PARAM, value, 4)
+
+
+def measure(build: Callable, seconds: float) -> float:
+    """Return messages built per second."""
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        for value in range(128):
+            build(value)
+        count += 128
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    cases = [
+        ("RolandSysEx.to_list", roland_sysex_to_list, template),
+        ("construct_sysex", construct_sysex, template),
+        ("construct_sysex 4 byte", construct_sysex_nibbles, template_nibbles),
+    ]
+    print(f"{'path':<24}{'before msg/s':>16}{'after msg/s':>16}{'speedup':>10}")
+    for name, before_build, after_build in cases:
+        before = measure(before_build, args.seconds)
+        after = measure(after_build, args.seconds)
+        print(f"{name:<24}{before:>16,.0f}{after:>16,.0f}{after / before:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
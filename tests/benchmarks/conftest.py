@@ -0,0 +1,175 @@
+"""
+Benchmark harness
+=================
+
+Benchmarks run only when JDXI_BENCHMARK is set, so a plain `pytest` stays fast:
+
+    JDXI_BENCHMARK=1 QT_QPA_PLATFORM=offscreen pytest tests/benchmarks
+
+Each benchmark is timed as the best of several rounds and divided by the time of a
+fixed pure-Python reference workload measured in the same session. A benchmark
+over its limit is re-measured before it fails. This score is
+compared with the one stored in baselines.json. A benchmark fails when its score
+exceeds the baseline by more than JDXI_BENCHMARK_THRESHOLD (default 0.5, i.e.
+50% slower). Dividing by the reference keeps baselines usable across machines.
+
+Environment:
+    JDXI_BENCHMARK: run the benchmarks.
+    JDXI_BENCHMARK_SAVE: write the results to baselines.json instead of checking.
+    JDXI_BENCHMARK_THRESHOLD: allowed slowdown as a fraction of the baseline.
+    JDXI_BENCHMARK_RESULTS: optional path to write the results as JSON.
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+import pytest
+
+BASELINES_PATH = Path(__file__).with_name("baselines.json")
+DEFAULT_THRESHOLD = 0.5
+MIN_ROUND_TIME = 0.025  # seconds
+ROUNDS = 7
+RETRIES = 2
+
+
+def _enabled(name: str) -> bool:
+    return os.environ.get(name, "").lower() not in ("", "0", "false", "no")
+
+
+def pytest_collection_modifyitems(config, items):
+    if _enabled("JDXI_BENCHMARK") or _enabled("JDXI_BENCHMARK_SAVE"):
+        return
+    skip = pytest.mark.skip(reason="set JDXI_BENCHMARK=1 to run benchmarks")
+    benchmark_dir = Path(__file__).parent
+    for item in items:
+        if benchmark_dir in Path(str(item.fspath)).parents:
+            item.add_marker(skip)
+
+
+def measure(function: Callable[[], object]) -> float:
+    """Best time per call in seconds."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_ROUND_TIME:
+            break
+        number *= 2
+    best = elapsed
+    for _ in range(ROUNDS - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+
+def _reference_workload():
+    """Fixed mix of dict, string and integer work the hot paths are made of."""
+    table = {index: index * 3 for index in range(200)}
+    text = " ".join(f"{value:02X}" for value in table.values())
+    return sum(int(token, 16) for token in text.split()) & 0x7F
+
+
+class BenchmarkSession:
+    """Results of the session and the baselines they are checked against."""
+
+    def __init__(self):
+        self.reference = measure(_reference_workload)
+        self.threshold = float(os.environ.get("JDXI_BENCHMARK_THRESHOLD", DEFAULT_THRESHOLD))
+        self.baselines: Dict[str, float] = {}
+        if BASELINES_PATH.exists():
+            self.baselines = json.loads(BASELINES_PATH.read_text())["scores"]
+        self.results: Dict[str, Dict[str, float]] = {}
+
+    def score(self, function: Callable[[], object]) -> Tuple[float, float]:
+        """Seconds per call and score, against a reference measured alongside."""
+        seconds = measure(function)
+        reference = min(self.reference, measure(_reference_workload))
+        return seconds, seconds / reference
+
+    def run(self, name: str, function: Callable[[], object]) -> float:
+        """Measure a benchmark, record it, and fail if it regressed."""
+        seconds, score = self.score(function)
+        baseline = self.baselines.get(name)
+        limit = None if baseline is None else baseline * (1 + self.threshold)
+        for _ in range(RETRIES):
+            if limit is None or score <= limit:
+                break
+            # Re-measure before failing, a busy machine only ever makes things slower
+            retry_seconds, retry_score = self.score(function)
+            if retry_score < score:
+                seconds, score = retry_seconds, retry_score
+        self.results[name] = {"seconds": seconds, "score": score, "baseline": baseline}
+        if _enabled("JDXI_BENCHMARK_SAVE"):
+            return seconds
+        if baseline is None:
+            logging.warning(f"No baseline for benchmark {name}")
+            return seconds
+        assert score <= limit, (
+            f"{name} regressed: score {score:.2f} > {limit:.2f} "
+            f"(baseline {baseline:.2f}, {seconds * 1e6:.1f} us per call)"
+        )
+        return seconds
+
+    def report(self, write: Callable[[str], None]) -> None:
+        write(f"{'benchmark':<40}{'us/call':>12}{'score':>10}{'baseline':>10}")
+        for name, result in sorted(self.results.items()):
+            baseline = result["baseline"]
+            write(
+                f"{name:<40}{result['seconds'] * 1e6:>12.2f}{result['score']:>10.2f}"
+                f"{'-' if baseline is None else format(baseline, '.2f'):>10}"
+            )
+
+    def save(self) -> None:
+        scores = dict(self.baselines)
+        scores.update({name: round(result["score"], 3) for name, result in self.results.items()})
+        BASELINES_PATH.write_text(
+            json.dumps({"reference_seconds": self.reference, "scores": dict(sorted(scores.items()))}, indent=2)
+            + "\n"
+        )
+
+
+SESSION_KEY = pytest.StashKey[BenchmarkSession]()
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    session = config.stash.get(SESSION_KEY, None)
+    if session is not None and session.results:
+        terminalreporter.section("benchmarks")
+        session.report(terminalreporter.write_line)
+
+
+@pytest.fixture(scope="session")
+def benchmark_session(request):
+    session = BenchmarkSession()
+    request.config.stash[SESSION_KEY] = session
+    yield session
+    if _enabled("JDXI_BENCHMARK_SAVE"):
+        session.save()
+    results_path = os.environ.get("JDXI_BENCHMARK_RESULTS")
+    if results_path:
+        Path(results_path).write_text(json.dumps(session.results, indent=2) + "\n")
+
+
+@pytest.fixture
+def benchmark(benchmark_session, request):
+    """Benchmark a callable under the test's name plus an optional suffix."""
+
+    def run(function: Callable[[], object], name: str = None) -> float:
+        return benchmark_session.run(name or request.node.name, function)
+
+    return run
+
+
+@pytest.fixture(scope="session")
+def qt_application():
+    from PySide6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
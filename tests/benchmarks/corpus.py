@@ -0,0 +1,59 @@
+"""
+Synthetic SysEx corpus for the benchmark suite.
+
+Frames are the sizes the JD-Xi sends in reply to the editors' RQ1 requests, with a
+tone name where the area has one and seeded pseudo-random parameter values, so
+every run parses the same bytes.
+"""
+
+import random
+from typing import Dict, List
+
+from tests.helpers import roland_dt1
+
+# name: (address, size, tone name or None)
+AREAS = {
+    "program_common": ([0x18, 0x00, 0x00, 0x00], 0x40, "Ambient Pad"),
+    "digital_common": ([0x19, 0x01, 0x00, 0x00], 0x40, "JP8 Strings1"),
+    "digital_partial": ([0x19, 0x01, 0x20, 0x00], 0x3D, None),
+    "digital_modify": ([0x19, 0x01, 0x50, 0x00], 0x25, None),
+    "analog": ([0x19, 0x42, 0x00, 0x00], 0x40, "Saw Bass    "),
+    "drum_common": ([0x19, 0x70, 0x00, 0x00], 0x12, "TR-909 Kit  "),
+    "drum_partial": ([0x19, 0x70, 0x2E, 0x00], 0xC3, "Kick 1      "),
+}
+
+
+def area_frame(name: str, seed: int = 0) -> bytes:
+    """DT1 dump of an area."""
+    address, size, tone_name = AREAS[name]
+    rng = random.Random(f"{name}-{seed}")
+    data = [rng.randrange(128) for _ in range(size)]
+    if tone_name:
+        data[:12] = [ord(c) for c in tone_name.ljust(12)[:12]]
+    return roland_dt1(address, data)
+
+
+def drum_kit_frames(seed: int = 0) -> List[bytes]:
+    """DT1 dumps of the 37 partials of a drum kit, keys 36 to 72."""
+    _, size, _ = AREAS["drum_partial"]
+    rng = random.Random(f"drum_kit-{seed}")
+    return [
+        roland_dt1([0x19, 0x70, 0x2E + 2 * key, 0x00], [rng.randrange(128) for _ in range(size)])
+        for key in range(37)
+    ]
+
+
+def area_frames() -> Dict[str, bytes]:
+    """One dump per area."""
+    return {name: area_frame(name) for name in AREAS}
+
+
+def incoming_traffic() -> Dict[str, List[List[int]]]:
+    """Incoming messages per class, as delivered by rtmidi."""
+    return {
+        "control_change": [[0xB0, 74, value] for value in range(128)],
+        "program_change": [[0xC0, value] for value in range(128)],
+        "note_on_off": [[0x90, 60, 100], [0x80, 60, 0]] * 64,
+        "clock": [[0xF8]] * 128,
+        "dt1_edit": [list(roland_dt1([0x19, 0x01, 0x20, 0x0C], [value])) for value in range(128)],
+    }
@@ -0,0 +1,54 @@
+"""Benchmarks: program catalog lookups used on every program change."""
+
+import logging
+
+import pytest
+
+from jdxi_editor.ui.editors.helpers.program import (
+    calculate_midi_values,
+    get_msb_lsb_pc,
+    get_program_by_bank_and_number,
+    get_program_by_id,
+    get_program_id_by_name,
+    get_program_index_by_id,
+)
+from jdxi_editor.midi.data.programs import PROGRAM_CATALOG
+
+LAST_PROGRAM = PROGRAM_CATALOG[-1]
+
+
+@pytest.fixture(autouse=True)
+def quiet_logging():
+    level = logging.getLogger().level
+    logging.getLogger().setLevel(logging.WARNING)
+    yield
+    logging.getLogger().setLevel(level)
+
+
+def test_get_program_by_id(benchmark):
+    benchmark(lambda: get_program_by_id(LAST_PROGRAM["id"]))
+
+
+def test_get_program_index_by_id(benchmark):
+    benchmark(lambda: get_program_index_by_id(LAST_PROGRAM["id"]))
+
+
+def test_get_program_by_bank_and_number(benchmark):
+    benchmark(lambda: get_program_by_bank_and_number("H", 64))
+
+
+def test_get_program_id_by_name(benchmark):
+    benchmark(lambda: get_program_id_by_name(LAST_PROGRAM["name"]))
+
+
+def test_calculate_midi_values(benchmark):
+    benchmark(lambda: calculate_midi_values("G", 64))
+
+
+def test_get_msb_lsb_pc(benchmark):
+    benchmark(lambda: get_msb_lsb_pc(len(PROGRAM_CATALOG) - 1))
+
+
+def test_search_programs_as_typed(benchmark):
+    text = LAST_PROGRAM["name"]
+    benchmark(lambda: [PROGRAM_CATALOG.search(text[:length]) for length in range(len(text) + 1)])
@@ -0,0 +1,78 @@
+"""Benchmarks: applying a decoded dump to an editor, including the batched flush."""
+
+import itertools
+import logging
+
+import pytest
+from PySide6.QtWidgets import QWidget
+
+from jdxi_editor.midi.io.emulator import JDXiEmulator
+from jdxi_editor.midi.io.helper import MidiIOHelper
+from jdxi_editor.midi.preset.handler import PresetHandler
+from jdxi_editor.midi.preset.type import SynthType
+from jdxi_editor.midi.sysex.parsed import ParsedSysEx
+
+from tests.benchmarks.corpus import area_frame
+
+
+@pytest.fixture(scope="module")
+def midi_helper(qt_application):
+    level = logging.getLogger().level
+    logging.getLogger().setLevel(logging.WARNING)
+    emulator = JDXiEmulator()
+    midi_in, midi_out = emulator.create_ports()
+    helper = MidiIOHelper(midi_in=midi_in, midi_out=midi_out)
+    yield helper
+    helper.output_scheduler.stop()
+    helper.sysex_decoder.stop()
+    emulator.close()
+    logging.getLogger().setLevel(level)
+
+
+def alternating(area):
+    """Two different dumps of an area, so every application changes the controls."""
+    return itertools.cycle(
+        [ParsedSysEx.from_sysex(area_frame(area, seed)) for seed in (0, 1)]
+    )
+
+
+def apply(editor, update, frames):
+    update(next(frames))
+    editor.update_scheduler.flush()
+
+
+def test_analog_update_from_sysex(benchmark, midi_helper):
+    from jdxi_editor.ui.editors.analog import AnalogSynthEditor
+
+    editor = AnalogSynthEditor(midi_helper)
+    frames = alternating("analog")
+    benchmark(lambda: apply(editor, editor._update_sliders_from_sysex, frames))
+
+
+@pytest.mark.parametrize("area", ["digital_common", "digital_partial"])
+def test_digital_update_from_sysex(benchmark, midi_helper, area):
+    from jdxi_editor.ui.editors.digital import DigitalSynthEditor
+
+    from jdxi_editor.midi.data.presets.digital import DIGITAL_PRESETS_ENUMERATED
+
+    preset_handler = PresetHandler(midi_helper, DIGITAL_PRESETS_ENUMERATED)
+    editor = DigitalSynthEditor(midi_helper, preset_handler=preset_handler)
+    frames = alternating(area)
+    benchmark(lambda: apply(editor, editor._dispatch_sysex_to_area, frames))
+
+
+@pytest.mark.parametrize("area", ["drum_common", "drum_partial"])
+def test_drum_update_from_sysex(benchmark, midi_helper, area):
+    from jdxi_editor.ui.editors.drum import DrumEditor
+
+    from jdxi_editor.midi.data.presets.drum import DRUM_PRESETS_ENUMERATED
+
+    preset_handler = PresetHandler(
+        midi_helper, DRUM_PRESETS_ENUMERATED, preset_type=SynthType.DRUMS
+    )
+    # The drum editor follows the main window's drum preset handler
+    main_window = QWidget()
+    main_window.drums_preset_handler = preset_handler
+    editor = DrumEditor(midi_helper, preset_handler=preset_handler, parent=main_window)
+    frames = alternating(area)
+    benchmark(lambda: apply(editor, editor._dispatch_sysex_to_area, frames))
@@ -0,0 +1,38 @@
+"""Benchmarks: MidiInHandler.midi_callback dispatch per message class."""
+
+import logging
+
+import pytest
+
+from jdxi_editor.midi.io.emulator import JDXiEmulator
+from jdxi_editor.midi.io.helper import MidiIOHelper
+
+from tests.benchmarks.corpus import incoming_traffic
+
+
+@pytest.fixture(scope="module")
+def midi_helper(qt_application):
+    level = logging.getLogger().level
+    logging.getLogger().setLevel(logging.WARNING)
+    emulator = JDXiEmulator()
+    midi_in, midi_out = emulator.create_ports()
+    helper = MidiIOHelper(midi_in=midi_in, midi_out=midi_out)
+    # Measure the callback alone, not the decode worker competing for the GIL
+    helper.sysex_decoder.stop()
+    yield helper
+    helper.output_scheduler.stop()
+    emulator.close()
+    logging.getLogger().setLevel(level)
+
+
+@pytest.mark.parametrize("message_class", sorted(incoming_traffic()))
+def test_midi_callback(benchmark, midi_helper, message_class):
+    messages = [(message, 0.0) for message in incoming_traffic()[message_class]]
+
+    def dispatch():
+        for event in messages:
+            midi_helper.midi_callback(event)
+        # Keep the decode queue from filling up between rounds
+        midi_helper.sysex_decoder._queue.clear()
+
+    benchmark(dispatch)
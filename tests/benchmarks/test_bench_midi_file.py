@@ -0,0 +1,26 @@
+"""Benchmarks: indexing a loaded MIDI file, building and viewing its piano roll."""
+
+import os
+
+from mido import MidiFile
+
+from jdxi_editor.midi.file.index import MidiEventIndex, NoteArrays
+from jdxi_editor.midi.file.roll import PianoRoll
+
+TESTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SONG = MidiFile(os.path.join(TESTS_DIR, "taito13.mid"))
+ROLL = PianoRoll(NoteArrays.from_midi_file(SONG))
+
+
+def test_index_midi_file(benchmark):
+    benchmark(lambda: MidiEventIndex.from_midi_file(SONG))
+
+
+def test_build_piano_roll(benchmark):
+    benchmark(lambda: PianoRoll(NoteArrays.from_midi_file(SONG)))
+
+
+def test_view_piano_roll(benchmark):
+    # Zooming in on the whole song, a window 800 pixels wide
+    spans = [ROLL.total_ticks >> zoom for zoom in range(8)]
+    benchmark(lambda: [ROLL.view(span // 2, span // 2 + span, 800) for span in spans])
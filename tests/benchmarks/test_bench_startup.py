@@ -0,0 +1,22 @@
+"""Benchmarks: cold imports at startup, each in a fresh interpreter."""
+
+from tests.helpers import run_python
+
+LOAD_CATALOGS = (
+    "from jdxi_editor.midi.data import programs\n"
+    "programs.PROGRAM_CATALOG.get_by_id('A01')\n"
+    "for catalog in (programs.DIGITAL_PRESET_CATALOG, programs.ANALOG_PRESET_CATALOG, programs.DRUM_KIT_CATALOG):\n"
+    "    catalog.search('bass')\n"
+)
+
+
+def test_import_catalogs(benchmark):
+    benchmark(lambda: run_python("from jdxi_editor.midi.data import programs"))
+
+
+def test_load_catalogs(benchmark):
+    benchmark(lambda: run_python(LOAD_CATALOGS))
+
+
+def test_import_main_window(benchmark):
+    benchmark(lambda: run_python("import jdxi_editor.ui.windows.jdxi.instrument"))
@@ -0,0 +1,70 @@
+"""Benchmarks: SysEx parsing and construction."""
+
+import logging
+
+import pytest
+
+from jdxi_editor.midi.data.parameter.analog import AnalogParameter
+from jdxi_editor.midi.data.parameter.conversion import convert_record
+from jdxi_editor.midi.data.parameter.digital import DigitalParameter
+from jdxi_editor.midi.data.parameter.drums import DrumParameter
+from jdxi_editor.midi.message.roland import RolandSysEx
+from jdxi_editor.midi.message.template import render_parameter
+from jdxi_editor.midi.sysex.cache import DecodedDumpCache
+from jdxi_editor.midi.sysex.decoder import SysExDecodeWorker
+from jdxi_editor.midi.sysex.parsers import parse_sysex
+
+from tests.benchmarks.corpus import AREAS, area_frame, drum_kit_frames
+
+
+@pytest.fixture(autouse=True)
+def quiet_output():
+    """Discard the parser's logging output; formatting it is still measured."""
+    level = logging.getLogger().level
+    logging.getLogger().setLevel(logging.WARNING)
+    yield
+    logging.getLogger().setLevel(level)
+
+
+@pytest.mark.parametrize("area", sorted(AREAS))
+def test_parse_sysex(benchmark, area):
+    frame = area_frame(area)
+    benchmark(lambda: parse_sysex(frame))
+
+
+def test_parse_drum_kit(benchmark):
+    frames = drum_kit_frames()
+    benchmark(lambda: [parse_sysex(frame) for frame in frames])
+
+
+@pytest.mark.parametrize(
+    "area, parameter_type",
+    [("analog", AnalogParameter), ("digital_partial", DigitalParameter), ("drum_partial", DrumParameter)],
+    ids=["analog", "digital_partial", "drum_partial"],
+)
+def test_convert_record(benchmark, area, parameter_type):
+    record = parse_sysex(area_frame(area))
+    benchmark(lambda: convert_record(record, parameter_type))
+
+
+def test_decode_drum_kit_repeated(benchmark):
+    # The replies to a second request for a kit, identical to the first
+    worker = SysExDecodeWorker(cache=DecodedDumpCache())
+    frames = drum_kit_frames()
+    for frame in frames:
+        worker.decode(frame)
+    benchmark(lambda: [worker.decode(frame) for frame in frames])
+
+
+def test_construct_sysex(benchmark):
+    address = [0x19, 0x01, 0x20, 0x0C]
+    benchmark(lambda: RolandSysEx().construct_sysex(address, 0x40))
+
+
+def test_construct_sysex_nibbles(benchmark):
+    address = [0x19, 0x01, 0x20, 0x35]
+    benchmark(lambda: RolandSysEx().construct_sysex(address, 0x00, 0x08, 0x00, 0x00))
+
+
+def test_render_parameter(benchmark):
+    benchmark(lambda: render_parameter(0x19, 0x01, 0x20, 0x0C, 0x40))
@@ -0,0 +1,29 @@
+"""
+Helpers shared by the test modules and the benchmark suite.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from typing import Sequence
+
+from jdxi_editor.midi.message.roland import RolandSysEx
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(code: str):
+    """Run code in a fresh interpreter and return the JSON it prints last, if any."""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT, env=env, check=True, capture_output=True, text=True
+    ).stdout
+    lines = output.strip().splitlines()
+    return json.loads(lines[-1]) if lines else None
+
+
+def roland_dt1(address: Sequence[int], data: Sequence[int]) -> bytes:
+    """Build a JD-Xi DT1 frame with RolandSysEx, the editors' own encoder."""
+    area, section, group, param = address
+    return bytes(RolandSysEx(area=area, section=section, group=group, param=param, value=list(data)).to_list())
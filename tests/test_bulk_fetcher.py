@@ -0,0 +1,90 @@
+import time
+import unittest
+
+from PySide6.QtWidgets import QApplication
+
+from jdxi_editor.midi.io.bulk import BulkFetcher, parse_request
+from jdxi_editor.midi.io.correlator import RequestCorrelator
+from jdxi_editor.midi.message.template import render_request
+
+from tests.helpers import roland_dt1
+
+
+PROGRAM_COMMON = "F0 41 10 00 00 00 0E 11 18 00 00 00 00 00 00 40 26 F7"
+DRUM_COMMON = "F0 41 10 00 00 00 0E 11 19 70 00 00 00 00 00 12 65 F7"
+DRUM_PARTIAL = "F0 41 10 00 00 00 0E 11 19 70 2E 00 00 00 01 43 05 F7"
+
+
+class TestBulkFetcher(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.sent = []
+        self.correlator = RequestCorrelator(
+            lambda message, lane: self.sent.append(bytes(message)) or True, timeout=0.01, retries=0
+        )
+        self.fetcher = BulkFetcher(self.correlator, window=2)
+        self.snapshots = []
+        self.fetcher.snapshot_complete.connect(self.snapshots.append)
+
+    def tearDown(self):
+        self.correlator.cancel_all()
+
+    def rendered(self, request):
+        return render_request(*parse_request(request))
+
+    def reply(self, request, size=None):
+        address, request_size = parse_request(request)
+        self.correlator.feed(roland_dt1(list(address), [0] * (size or request_size)))
+
+    def test_parse_request(self):
+        self.assertEqual(parse_request(DRUM_PARTIAL), ((0x19, 0x70, 0x2E, 0x00), 0xC3))
+        self.assertEqual(parse_request(bytes.fromhex(PROGRAM_COMMON)), ((0x18, 0, 0, 0), 0x40))
+        self.assertEqual(self.rendered(DRUM_PARTIAL), bytes.fromhex(DRUM_PARTIAL))
+        # Requests are re-rendered, correcting the checksum of the program common request
+        self.assertEqual(self.rendered(PROGRAM_COMMON)[-2], 0x28)
+        with self.assertRaises(ValueError):
+            parse_request("F0 41 10 00 00 00 0E 12 18 00 00 00 00 68 F7")
+
+    def test_deduplicates_and_limits_window(self):
+        future = self.fetcher.fetch([PROGRAM_COMMON, DRUM_COMMON, DRUM_COMMON, DRUM_PARTIAL])
+        self.assertEqual(self.sent, [self.rendered(PROGRAM_COMMON), self.rendered(DRUM_COMMON)])
+        self.reply(PROGRAM_COMMON)
+        self.assertEqual(self.sent[-1], self.rendered(DRUM_PARTIAL))
+        self.reply(DRUM_PARTIAL)
+        self.assertEqual(self.snapshots, [])
+        self.reply(DRUM_COMMON)
+        self.assertEqual(len(self.sent), 3)
+        self.assertEqual(len(self.snapshots), 1)
+        snapshot = future.result(timeout=0)
+        self.assertIs(snapshot, self.snapshots[0])
+        self.assertTrue(snapshot.complete)
+        self.assertEqual(
+            set(snapshot.latency),
+            {parse_request(r) for r in (PROGRAM_COMMON, DRUM_COMMON, DRUM_PARTIAL)},
+        )
+
+    def test_overlapping_snapshots_share_requests(self):
+        first = self.fetcher.fetch([PROGRAM_COMMON, DRUM_COMMON])
+        second = self.fetcher.fetch([DRUM_COMMON])
+        self.assertEqual(len(self.sent), 2)
+        self.reply(DRUM_COMMON)
+        self.assertTrue(second.done())
+        self.assertFalse(first.done())
+        self.reply(PROGRAM_COMMON)
+        self.assertTrue(first.result(timeout=0).complete)
+        self.assertEqual(self.fetcher.pending, 0)
+
+    def test_timeouts_are_reported(self):
+        future = self.fetcher.fetch([PROGRAM_COMMON])
+        time.sleep(0.02)
+        self.correlator._check_timeouts()
+        snapshot = future.result(timeout=0)
+        self.assertFalse(snapshot.complete)
+        self.assertEqual(snapshot.failed, [parse_request(PROGRAM_COMMON)])
+
+
+if __name__ == "__main__":
+    unittest.main()
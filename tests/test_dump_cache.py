@@ -0,0 +1,94 @@
+import unittest
+
+from jdxi_editor.midi.sysex.cache import DecodedDumpCache
+from jdxi_editor.midi.sysex.decoder import SysExDecodeWorker
+from jdxi_editor.midi.sysex.memory import MemoryChange, ShadowMemory
+from jdxi_editor.midi.sysex.parsed import ParsedSysEx
+from jdxi_editor.midi.sysex.router import SysExRouter
+
+from tests.helpers import roland_dt1
+
+
+ANALOG_ADDRESS = [0x19, 0x42, 0x00, 0x00]
+
+
+def analog_dump(value):
+    return roland_dt1(ANALOG_ADDRESS, [value] * 0x40)
+
+
+class TestDecodedDumpCache(unittest.TestCase):
+    def test_identical_frames_are_decoded_once(self):
+        cache = DecodedDumpCache()
+        worker = SysExDecodeWorker(cache=cache)
+        first = worker.decode(analog_dump(0x10), received_at=1.0)
+        again = worker.decode(analog_dump(0x10), received_at=2.0)
+        other = worker.decode(analog_dump(0x11), received_at=3.0)
+        self.assertEqual(worker.decoded, 2)
+        self.assertIs(again.parameters, first.parameters)
+        self.assertEqual(again.received_at, 2.0)
+        self.assertIsNot(other.parameters, first.parameters)
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.entries), (1, 2, 2))
+
+    def test_memory_cap_evicts_least_recently_used(self):
+        frames = [analog_dump(value) for value in range(4)]
+        probe = DecodedDumpCache()
+        probe.put(ParsedSysEx.from_sysex(frames[0]))
+        cache = DecodedDumpCache(max_bytes=probe.size * 2)
+        for frame in frames[:2]:
+            cache.put(ParsedSysEx.from_sysex(frame))
+        self.assertIsNotNone(cache.get(frames[0]))  # now most recently used
+        cache.put(ParsedSysEx.from_sysex(frames[2]))
+        self.assertIsNone(cache.get(frames[1]))
+        self.assertIsNotNone(cache.get(frames[0]))
+        self.assertEqual(cache.stats().evictions, 1)
+        self.assertLessEqual(cache.size, cache.max_bytes)
+
+    def test_applied_frames_are_skipped_until_edited(self):
+        cache = DecodedDumpCache()
+        parsed = ParsedSysEx.from_sysex(analog_dump(0x20))
+        self.assertFalse(cache.is_applied(parsed))
+        cache.mark_applied(parsed)
+        self.assertTrue(cache.is_applied(ParsedSysEx.from_sysex(analog_dump(0x20))))
+        self.assertFalse(cache.is_applied(ParsedSysEx.from_sysex(analog_dump(0x21))))
+        cache.on_memory_changed(MemoryChange((0x19, 0x01, 0x20, 0x0C), b"\x01", "DIGITAL_1", "editor"))
+        self.assertTrue(cache.is_applied(parsed))
+        cache.on_memory_changed(MemoryChange((0x19, 0x42, 0x00, 0x0C), b"\x01", "ANALOG", "editor"))
+        self.assertFalse(cache.is_applied(parsed))
+        self.assertEqual(cache.stats().skipped, 2)
+
+    def test_knob_turned_on_the_device_drops_the_applied_dump(self):
+        memory = ShadowMemory()
+        cache = DecodedDumpCache()
+        memory.memory_changed.connect(cache.on_memory_changed)
+
+        def receive(frame):
+            # As the input handler does: shadow memory first, then route unless applied
+            memory.write_sysex(frame)
+            parsed = ParsedSysEx.from_sysex(frame)
+            if cache.is_applied(parsed):
+                return False
+            cache.mark_applied(parsed)
+            return True
+
+        self.assertTrue(receive(analog_dump(0x20)))
+        self.assertFalse(receive(analog_dump(0x20)))
+        # A single parameter DT1 from the synth, inside the dump's range
+        memory.write_sysex(roland_dt1([0x19, 0x42, 0x00, 0x0E], [0x05]))
+        self.assertTrue(receive(analog_dump(0x20)))
+
+    def test_new_subscribers_receive_applied_frames(self):
+        router = SysExRouter()
+        cache = DecodedDumpCache()
+        received = []
+        router.subscribe("TEMPORARY_ANALOG_SYNTH_AREA", received.append)
+        parsed = ParsedSysEx.from_sysex(analog_dump(0x30))
+        self.assertEqual(router.dispatch(parsed), 1)
+        cache.mark_applied(parsed, router.generation)
+        self.assertTrue(cache.is_applied(parsed, router.generation))
+        router.subscribe("TEMPORARY_ANALOG_SYNTH_AREA", received.append)
+        self.assertFalse(cache.is_applied(parsed, router.generation))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+import logging
+import time
+import unittest
+
+from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication, QWidget
+
+from jdxi_editor.midi.io.emulator import EMULATOR_PORT_NAME, JDXiEmulator
+from jdxi_editor.midi.io.helper import MidiIOHelper
+from jdxi_editor.midi.message.template import render_parameter, render_request
+
+CUTOFF = [0x19, 0x01, 0x20, 0x0C]
+ANALOG_CUTOFF = [0x19, 0x42, 0x00, 0x21]
+DRUM_PARTIAL = "F0 41 10 00 00 00 0E 11 19 70 2E 00 00 00 01 43 05 F7"
+
+
+def wait_for(future, timeout_ms=2000):
+    """Run the event loop until future is done."""
+    loop = QEventLoop()
+    QTimer.singleShot(timeout_ms, loop.quit)
+    poll = QTimer()
+    poll.timeout.connect(lambda: future.done() and loop.quit())
+    poll.start(1)
+    loop.exec()
+    poll.stop()
+    return future.result(timeout=0)
+
+
+class TestJDXiEmulator(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.emulator = JDXiEmulator(latency=0.001, bytes_per_second=None)
+        self.replies = []
+        self.emulator.set_callback(lambda event, data: self.replies.append(event[0]))
+
+    def tearDown(self):
+        self.emulator.close()
+
+    def wait_for_replies(self, count):
+        deadline = time.monotonic() + 1
+        while len(self.replies) < count and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+    def test_identity_reply(self):
+        self.emulator.receive([0xF0, 0x7E, 0x7F, 0x06, 0x01, 0xF7])
+        self.wait_for_replies(1)
+        self.assertEqual(self.replies[0][:8], [0xF0, 0x7E, 0x10, 0x06, 0x02, 0x41, 0x0E, 0x03])
+
+    def test_dt1_then_rq1(self):
+        self.emulator.receive(render_parameter(*CUTOFF, 99))
+        self.emulator.receive(render_request(CUTOFF, 1))
+        self.wait_for_replies(1)
+        self.assertEqual(self.replies[0][7:14], [0x12] + CUTOFF + [99, -(sum(CUTOFF) + 99) & 0x7F])
+
+    def test_drum_partial_reply_size(self):
+        self.emulator.receive(bytes.fromhex(DRUM_PARTIAL))
+        self.wait_for_replies(1)
+        self.assertEqual(len(self.replies[0]), 12 + 195 + 2)
+
+    def test_bandwidth_is_simulated(self):
+        emulator = JDXiEmulator(latency=0.0)
+        replies = []
+        emulator.set_callback(lambda event, data: replies.append(time.monotonic()))
+        start = time.monotonic()
+        emulator.receive(bytes.fromhex(DRUM_PARTIAL))
+        while not replies and time.monotonic() - start < 1:
+            time.sleep(0.001)
+        emulator.close()
+        # 18 bytes out and 209 bytes back at 3125 bytes per second
+        self.assertGreater(replies[0] - start, 0.07)
+
+    def test_helper_fetches_snapshot_from_emulator(self):
+        midi_in, midi_out = self.emulator.create_ports()
+        helper = MidiIOHelper(midi_in=midi_in, midi_out=midi_out)
+        try:
+            self.assertTrue(helper.open_ports(EMULATOR_PORT_NAME, EMULATOR_PORT_NAME))
+            self.emulator.memory.write(CUTOFF, bytes([42]))
+            snapshot = wait_for(helper.bulk_fetcher.fetch([DRUM_PARTIAL, (CUTOFF, 1)]))
+            self.assertTrue(snapshot.complete)
+            self.assertEqual(snapshot.responses[(tuple(CUTOFF), 1)].data, bytes([42]))
+            self.assertEqual(wait_for(helper.get_parameter(*CUTOFF)), 42)
+        finally:
+            helper.output_scheduler.stop()
+            helper.sysex_decoder.stop()
+
+    def test_editor_applies_a_snapshot_in_one_batch(self):
+        from jdxi_editor.midi.data.presets.digital import DIGITAL_PRESETS_ENUMERATED
+        from jdxi_editor.midi.preset.handler import PresetHandler
+        from jdxi_editor.ui.editors.analog import AnalogSynthEditor
+        from jdxi_editor.ui.editors.digital import DigitalSynthEditor
+
+        midi_in, midi_out = self.emulator.create_ports()
+        helper = MidiIOHelper(midi_in=midi_in, midi_out=midi_out)
+        window = QWidget()
+        try:
+            self.assertTrue(helper.open_ports(EMULATOR_PORT_NAME, EMULATOR_PORT_NAME))
+            editors = [
+                (AnalogSynthEditor(helper), ANALOG_CUTOFF),
+                # Opened from the main window, as the instrument does
+                (
+                    DigitalSynthEditor(
+                        helper, parent=window, preset_handler=PresetHandler(helper, DIGITAL_PRESETS_ENUMERATED)
+                    ),
+                    CUTOFF,
+                ),
+            ]
+            for editor, address in editors:
+                with self.subTest(editor.__class__.__name__):
+                    # A dump the editor has not applied yet
+                    self.emulator.memory.write(address, bytes([42]))
+                    scheduler = editor.update_scheduler
+                    batches = scheduler.stats().batches
+                    request = editor.data_request()
+                    self.assertTrue(scheduler.held)
+                    wait_for(request)
+                    self.assertFalse(scheduler.held)
+                    # Let the last replies be decoded and the batch applied
+                    loop = QEventLoop()
+                    QTimer.singleShot(200, loop.quit)
+                    loop.exec()
+                    stats = scheduler.stats()
+                    self.assertGreater(stats.applied, 0)
+                    self.assertEqual(stats.batches - batches, 1)
+        finally:
+            helper.output_scheduler.stop()
+            helper.sysex_decoder.stop()
+
+    def test_editor_logs_device_changes_from_shadow_memory(self):
+        from jdxi_editor.ui.editors.analog import AnalogSynthEditor
+
+        midi_in, midi_out = self.emulator.create_ports()
+        helper = MidiIOHelper(midi_in=midi_in, midi_out=midi_out)
+        try:
+            editor = AnalogSynthEditor(helper)
+            self.assertFalse(hasattr(editor, "previous_json_data"))
+            helper.shadow_memory.write(ANALOG_CUTOFF, bytes([42]))
+            with self.assertLogs(level="INFO") as logs:
+                helper.shadow_memory.write(ANALOG_CUTOFF, bytes([43]))
+                # Edits sent by the editor and other editors' blocks are not logged
+                helper.shadow_memory.write(ANALOG_CUTOFF, bytes([44]), source="editor")
+                helper.shadow_memory.write(CUTOFF, bytes([45]))
+                logging.info("done")
+            changed = [line for line in logs.output if "Changed Parameter" in line]
+            self.assertEqual(len(changed), 1)
+            self.assertIn("FILTER_CUTOFF, Previous: 42, Current: 43", changed[0])
+        finally:
+            helper.output_scheduler.stop()
+            helper.sysex_decoder.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
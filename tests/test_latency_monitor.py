@@ -0,0 +1,96 @@
+import json
+import os
+import tempfile
+import unittest
+
+from PySide6.QtWidgets import QApplication, QSpinBox, QWidget
+
+from jdxi_editor.midi.io.latency import (
+    HISTOGRAM_BUCKETS,
+    LatencyHistogram,
+    LatencyMonitor,
+    LatencyStage,
+    message_type,
+)
+from jdxi_editor.midi.io.output_scheduler import MidiOutputScheduler
+from jdxi_editor.ui.editors.helpers.update_scheduler import UiUpdateScheduler
+
+DT1_CUTOFF = [0xF0, 0x41, 0x10, 0x00, 0x00, 0x00, 0x0E, 0x12, 0x19, 0x01, 0x20, 0x0C, 0x40, 0x7A, 0xF7]
+
+
+class TestLatencyMonitor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_message_type(self):
+        self.assertEqual(message_type([0x91, 60, 100]), "note_on")
+        self.assertEqual(message_type([0xB0, 7, 100]), "control_change")
+        self.assertEqual(message_type([0xF8]), "clock")
+        self.assertEqual(message_type(DT1_CUTOFF), "sysex_dt1")
+
+    def test_histogram_buckets_and_percentiles(self):
+        histogram = LatencyHistogram()
+        for _ in range(99):
+            histogram.add(0.0001)  # 100 us, bucket 7 (< 128 us)
+        histogram.add(0.010)
+        histogram.add(3600.0)
+        self.assertEqual(len(histogram.counts), HISTOGRAM_BUCKETS)
+        self.assertEqual(histogram.counts[7], 99)
+        self.assertEqual(histogram.counts[32], 1)  # 3600 s is below 2**32 us
+        self.assertEqual(histogram.count, 101)
+        self.assertAlmostEqual(histogram.percentile(0.5), 128e-6)
+        self.assertEqual(histogram.percentile(1.0), 3600.0)
+
+    def test_record_report_and_dump(self):
+        monitor = LatencyMonitor()
+        monitor.record(LatencyStage.SEND, "sysex_dt1", 1.0, 1.002)
+        monitor.record(LatencyStage.CALLBACK, "note_on", 1.0, 1.00001)
+        rows = monitor.rows()
+        self.assertEqual([row[:3] for row in rows], [["callback", "note_on", 1], ["send", "sysex_dt1", 1]])
+        self.assertIn("sysex_dt1", monitor.report())
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "latency.json")
+            monitor.dump(path)
+            with open(path) as file:
+                dumped = json.load(file)
+        self.assertEqual(dumped["stages"]["send"]["sysex_dt1"]["count"], 1)
+
+        histogram = monitor.histogram(LatencyStage.SEND, "sysex_dt1")
+        monitor.reset()
+        self.assertEqual(monitor.rows(), [])
+        histogram.add(0.001)  # references kept by hot paths stay valid
+        self.assertEqual(monitor.rows()[0][:3], ["send", "sysex_dt1", 1])
+
+    def test_ui_apply_is_attributed_to_the_routed_frame(self):
+        monitor = LatencyMonitor()
+        editor = QWidget()
+        spin_box = QSpinBox(editor)
+        scheduler = UiUpdateScheduler(editor, latency_monitor=monitor)
+
+        scheduler.schedule(spin_box, 1)  # local update, no frame being routed
+        scheduler.flush()
+        self.assertEqual(monitor.histograms, {})
+
+        monitor.active_origin = ("TEMPORARY_ANALOG_SYNTH_AREA", 0.0)
+        scheduler.schedule(spin_box, 2)
+        monitor.active_origin = None
+        scheduler.flush()
+        histogram = monitor.histograms[(LatencyStage.UI_APPLY, "TEMPORARY_ANALOG_SYNTH_AREA")]
+        self.assertEqual(histogram.count, 1)
+
+    def test_send_latency_keeps_the_first_coalesced_write(self):
+        monitor = LatencyMonitor()
+        sent = []
+        scheduler = MidiOutputScheduler(sent.append, latency_monitor=monitor)
+        scheduler._running = True  # queue without the thread
+        scheduler.submit(DT1_CUTOFF)
+        scheduler.submit(DT1_CUTOFF[:12] + [0x41, 0x79, 0xF7])
+        scheduler._running = False
+        self.assertEqual(scheduler.flush(), 1)
+        self.assertEqual(monitor.histograms[(LatencyStage.SEND, "sysex_dt1")].count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import glob
+import os
+import unittest
+
+import mido
+import numpy as np
+from mido import Message, MetaMessage, MidiFile, MidiTrack
+
+from jdxi_editor.midi.file.index import (
+    DEFAULT_TEMPO,
+    EventType,
+    MidiEventIndex,
+    event_index,
+)
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+MIDI_FILES = sorted(glob.glob(os.path.join(TESTS_DIR, "*.mid")))
+
+
+def reference_events(midi_file):
+    """(tick, seconds, channel, bytes) of the channel messages, through mido.merge_tracks."""
+    events = []
+    tick, seconds, tempo = 0, 0.0, DEFAULT_TEMPO
+    for message in mido.merge_tracks(midi_file.tracks):
+        tick += message.time
+        seconds += mido.tick2second(message.time, midi_file.ticks_per_beat, tempo)
+        if message.type == "set_tempo":
+            tempo = message.tempo
+        elif not message.is_meta and hasattr(message, "channel"):
+            events.append((tick, seconds, message.channel, message.bytes()))
+    return events
+
+
+class TestMidiEventIndex(unittest.TestCase):
+    def test_matches_merged_tracks(self):
+        for path in MIDI_FILES:
+            with self.subTest(os.path.basename(path)):
+                midi_file = MidiFile(path)
+                index = MidiEventIndex.from_midi_file(midi_file)
+                expected = reference_events(midi_file)
+                seconds, channels, messages = index.channel_messages()
+                events = index.events[index.events["channel"] >= 0]
+                self.assertEqual(events["tick"].tolist(), [event[0] for event in expected])
+                np.testing.assert_allclose(seconds, [event[1] for event in expected], atol=1e-9)
+                self.assertEqual(channels.tolist(), [event[2] for event in expected])
+                self.assertEqual(messages, [event[3] for event in expected])
+                self.assertAlmostEqual(index.duration, midi_file.length)
+
+    def test_tracks_tempo_and_queries(self):
+        first = MidiTrack([
+            MetaMessage("set_tempo", tempo=1000000, time=0),
+            MetaMessage("time_signature", numerator=3, denominator=4, time=0),
+            Message("note_on", channel=9, note=36, velocity=100, time=96),
+            Message("note_on", channel=9, note=36, velocity=0, time=96),
+        ])
+        second = MidiTrack([
+            Message("program_change", channel=1, program=5, time=0),
+            Message("pitchwheel", channel=1, pitch=-8192, time=96),
+            Message("note_on", channel=1, note=60, velocity=90, time=0),
+        ])
+        midi_file = MidiFile(ticks_per_beat=96)
+        midi_file.tracks.extend([first, second])
+        index = MidiEventIndex.from_midi_file(midi_file)
+        self.assertEqual(index.tempo, 1000000)
+        self.assertEqual(index.total_ticks, 192)
+        self.assertAlmostEqual(index.duration, 2.0)
+        self.assertAlmostEqual(float(index.beats_at(1.5)), 1.5)
+        self.assertEqual(
+            index.events["type"].tolist(),
+            [EventType.SET_TEMPO, EventType.TIME_SIGNATURE, EventType.PROGRAM_CHANGE,
+             EventType.NOTE_ON, EventType.PITCHWHEEL, EventType.NOTE_ON, EventType.NOTE_ON],
+        )
+        self.assertEqual(index.events["track"].tolist(), [0, 0, 1, 0, 1, 1, 0])
+        note_ons = index.note_ons()
+        self.assertEqual(list(zip(note_ons["channel"].tolist(), note_ons["tick"].tolist())), [(9, 96), (1, 96)])
+        self.assertEqual(index.note_ons(tracks=[1])["note"].tolist(), [60])
+        self.assertEqual(index.channels(), [1, 9])
+        self.assertEqual(len(index.select(types=[EventType.PITCHWHEEL], channels=[1])), 1)
+        self.assertEqual(index.channel_messages()[2][:2], [[0xC1, 5], [0x99, 36, 100]])
+
+    def test_index_is_cached_until_the_file_changes(self):
+        for path in MIDI_FILES:
+            midi_file = MidiFile(path)
+            index = event_index(midi_file)
+            self.assertIs(event_index(midi_file), index)
+        midi_file.tracks[0].append(Message("note_on", note=60, time=10))
+        self.assertIsNot(event_index(midi_file), index)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import time
+import unittest
+
+from mido import Message, MetaMessage, MidiFile, MidiTrack, bpm2tempo
+from PySide6.QtWidgets import QApplication
+
+from jdxi_editor.midi.io.playback import MidiFilePlayer, PlaybackSchedule
+from jdxi_editor.ui.editors.midi_file import MidiFileEditor
+
+TICKS_PER_BEAT = 480
+
+
+def make_file(notes, bpm=120, tempo_change=None):
+    """
+    One track of notes, each (channel, note, start tick, length in ticks).
+
+    tempo_change is an optional (tick, bpm) pair.
+    """
+    events = [(0, MetaMessage("set_tempo", tempo=bpm2tempo(bpm), time=0))]
+    if tempo_change is not None:
+        tick, new_bpm = tempo_change
+        events.append((tick, MetaMessage("set_tempo", tempo=bpm2tempo(new_bpm), time=0)))
+    for channel, note, start, length in notes:
+        events.append((start, Message("note_on", channel=channel, note=note, velocity=100, time=0)))
+        events.append((start + length, Message("note_off", channel=channel, note=note, velocity=0, time=0)))
+    events.sort(key=lambda event: event[0])
+    track = MidiTrack()
+    previous = 0
+    for tick, message in events:
+        track.append(message.copy(time=tick - previous))
+        previous = tick
+    midi_file = MidiFile(ticks_per_beat=TICKS_PER_BEAT)
+    midi_file.tracks.append(track)
+    return midi_file
+
+
+class TestPlaybackSchedule(unittest.TestCase):
+    def test_times_follow_the_tempo_map(self):
+        # 120 BPM for the first beat, then 60 BPM
+        midi_file = make_file(
+            [(0, 60, 0, 240), (0, 62, 480, 480)], tempo_change=(480, 60)
+        )
+        schedule = PlaybackSchedule.from_midi_file(midi_file)
+        self.assertEqual(len(schedule), 4)
+        for actual, expected in zip(schedule.times, [0.0, 0.25, 0.5, 1.5]):
+            self.assertAlmostEqual(actual, expected)
+        self.assertAlmostEqual(schedule.duration, 1.5)
+        self.assertEqual(schedule.messages[0], [0x90, 60, 100])
+        self.assertAlmostEqual(schedule.beats_at(0.25), 0.5)
+        self.assertAlmostEqual(schedule.beats_at(1.0), 1.5)
+        self.assertEqual(schedule.index_at(0.3), 2)
+
+
+class TestMidiFilePlayer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.sent = []
+        self.player = MidiFilePlayer(self.sent.append)
+
+    def tearDown(self):
+        self.player.stop()
+
+    def play_to_end(self):
+        self.player.start()
+        self.assertTrue(self.player.wait(5000))
+
+    def note_ons(self, channel=None):
+        return [
+            message for message in self.sent
+            if message[0] & 0xF0 == 0x90 and (channel is None or message[0] & 0x0F == channel)
+        ]
+
+    def test_plays_every_event_on_time(self):
+        # 16 notes 25 ms apart
+        self.player.load(make_file([(0, 60 + step, step * 24, 12) for step in range(16)]))
+        started = time.perf_counter()
+        self.play_to_end()
+        self.assertEqual(self.sent, self.player.schedule.messages)
+        self.assertGreaterEqual(time.perf_counter() - started, self.player.schedule.duration)
+        self.assertLess(self.player.max_lateness, 0.05)
+        self.assertFalse(self.player.playing)
+        self.assertEqual(self.player.position(), 0.0)
+
+    def test_muted_channels_skip_notes(self):
+        self.player.load(make_file([(0, 60, 0, 24), (1, 64, 0, 24), (1, 65, 24, 24)]))
+        self.player.set_muted_channels([1])
+        self.play_to_end()
+        self.assertEqual(self.sent, [[0x90, 60, 100], [0x80, 60, 0]])
+
+    def test_locate_skips_earlier_events(self):
+        self.player.load(make_file([(0, 60, 0, 12), (0, 62, 48, 12)]))
+        self.player.locate(0.04)
+        self.play_to_end()
+        self.assertEqual(self.sent, [[0x90, 62, 100], [0x80, 62, 0]])
+
+    def test_stop_releases_sounding_notes_and_keeps_position(self):
+        self.player.load(make_file([(0, 60, 0, 4800)]))
+        self.player.start()
+        time.sleep(0.05)
+        self.player.stop()
+        self.assertEqual(self.sent, [[0x90, 60, 100], [0x80, 60, 0]])
+        self.assertGreater(self.player.position(), 0.04)
+
+    def test_stop_timing_out_leaves_the_release_to_the_thread(self):
+        def slow_send(message):
+            time.sleep(0.2)
+            self.sent.append(message)
+
+        self.player.send = slow_send
+        self.player.load(make_file([(0, 60, 0, 4800)]))
+        self.player.start()
+        time.sleep(0.05)
+        self.player.stop(timeout_ms=10)
+        self.assertTrue(self.player.isRunning())
+        self.assertTrue(self.player.wait(5000))
+        self.assertEqual(self.sent, [[0x90, 60, 100], [0x80, 60, 0]])
+
+    def test_loop_repeats_until_cleared(self):
+        self.player.load(make_file([(0, 60, 0, 12), (0, 62, 48, 12)]))
+        self.player.set_loop(0.0, 0.03)
+        self.player.start()
+        time.sleep(0.2)
+        self.assertGreater(len(self.note_ons()), 3)
+        self.assertNotIn([0x90, 62, 100], self.sent)
+        self.player.clear_loop()
+        self.assertTrue(self.player.wait(5000))
+        self.assertIn([0x90, 62, 100], self.sent)
+        with self.assertRaises(ValueError):
+            self.player.set_loop(1.0, 0.5)
+
+
+class TestMidiFileEditorPlayback(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_plays_without_a_midi_helper(self):
+        editor = MidiFileEditor(None, None)
+        editor.midi_file = make_file([(0, 60, 0, 12)])
+        editor.play_file()
+        self.assertTrue(editor.player.wait(5000))
+        self.assertEqual(editor.player.failed, 0)
+        self.assertFalse(editor.player.playing)
+
+
+if __name__ == "__main__":
+    unittest.main()
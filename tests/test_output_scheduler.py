@@ -0,0 +1,113 @@
+import time
+import unittest
+
+from jdxi_editor.midi.io.output_scheduler import (
+    MidiOutputScheduler,
+    OutputLane,
+    classify_message,
+)
+
+
+def roland_sysex(command, address, data):
+    """Build a JD-Xi DT1/RQ1 frame with a valid checksum."""
+    checksum = (128 - (sum(address + data) & 0x7F)) & 0x7F
+    return [0xF0, 0x41, 0x10, 0x00, 0x00, 0x00, 0x0E, command] + address + data + [checksum, 0xF7]
+
+
+CUTOFF = [0x19, 0x01, 0x20, 0x0C]
+RESONANCE = [0x19, 0x01, 0x20, 0x0F]
+PARTIAL_REQUEST = roland_sysex(0x11, [0x19, 0x01, 0x20, 0x00], [0x00, 0x00, 0x00, 0x3D])
+
+
+class TestMidiOutputScheduler(unittest.TestCase):
+    def setUp(self):
+        self.sent = []
+        # 10 bytes per second: after the first message the link stays busy
+        self.scheduler = MidiOutputScheduler(self.sent.append, bytes_per_second=10)
+
+    def tearDown(self):
+        self.scheduler.stop()
+
+    def wait_for_first_send(self):
+        deadline = time.monotonic() + 2
+        while not self.sent and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+    def test_classify_message(self):
+        self.assertEqual(classify_message([0x90, 60, 100]), OutputLane.NOTES)
+        self.assertEqual(classify_message(roland_sysex(0x12, CUTOFF, [1])), OutputLane.INTERACTIVE)
+        self.assertEqual(classify_message(PARTIAL_REQUEST), OutputLane.BULK)
+
+    def test_unstarted_scheduler_sends_immediately(self):
+        self.assertTrue(self.scheduler.submit([0x90, 60, 100]))
+        self.assertEqual(self.sent, [[0x90, 60, 100]])
+
+    def test_last_write_wins_per_address_and_lanes_are_prioritised(self):
+        self.scheduler.start()
+        self.scheduler.submit([0xB0, 74, 0])  # occupies the link
+        self.wait_for_first_send()
+
+        self.scheduler.submit(PARTIAL_REQUEST)
+        self.scheduler.submit(PARTIAL_REQUEST)
+        for value in (10, 20, 30):
+            self.scheduler.submit(roland_sysex(0x12, CUTOFF, [value]))
+        self.scheduler.submit(roland_sysex(0x12, RESONANCE, [5]))
+        self.scheduler.submit([0x90, 60, 100])
+
+        stats = self.scheduler.stats()
+        self.assertEqual(stats.merged, 3)
+        self.assertEqual(
+            dict(stats.queue_depth), {"NOTES": 1, "INTERACTIVE": 2, "BULK": 1}
+        )
+
+        self.scheduler.stop()
+        self.assertEqual(
+            self.sent[1:],
+            [
+                [0x90, 60, 100],
+                roland_sysex(0x12, CUTOFF, [30]),
+                roland_sysex(0x12, RESONANCE, [5]),
+                PARTIAL_REQUEST,
+            ],
+        )
+        self.assertEqual(self.scheduler.stats().sent, 5)
+
+    def test_interactive_write_replaces_pending_bulk_write(self):
+        self.scheduler.start()
+        self.scheduler.submit([0xB0, 74, 0])
+        self.wait_for_first_send()
+        self.scheduler.submit(roland_sysex(0x12, CUTOFF, [1]), OutputLane.BULK)
+        self.scheduler.submit(roland_sysex(0x12, CUTOFF, [2]))
+        self.assertEqual(self.scheduler.stats().queue_depth["BULK"], 0)
+        self.scheduler.stop()
+        self.assertEqual(self.sent[1:], [roland_sysex(0x12, CUTOFF, [2])])
+
+    def test_full_lane_drops_new_messages(self):
+        scheduler = MidiOutputScheduler(self.sent.append, bytes_per_second=10, capacity=1)
+        scheduler.start()
+        try:
+            scheduler.submit([0xB0, 74, 0])
+            self.wait_for_first_send()
+            self.assertTrue(scheduler.submit([0x90, 60, 100]))
+            self.assertFalse(scheduler.submit([0x90, 62, 100]))
+            self.assertEqual(scheduler.stats().dropped, 1)
+        finally:
+            scheduler.stop()
+
+    def test_sends_are_paced_to_link_bandwidth(self):
+        scheduler = MidiOutputScheduler(self.sent.append, bytes_per_second=3000)
+        scheduler.start()
+        try:
+            start = time.monotonic()
+            for note in range(10):
+                scheduler.submit([0x90, note, 100])  # 30 bytes, 10 ms on the link
+            while len(self.sent) < 10 and time.monotonic() - start < 2:
+                time.sleep(0.001)
+            self.assertGreaterEqual(time.monotonic() - start, 0.009)
+        finally:
+            scheduler.stop()
+        self.assertEqual(len(self.sent), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
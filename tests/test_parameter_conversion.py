@@ -0,0 +1,77 @@
+import unittest
+
+from jdxi_editor.midi.data.parameter.analog import AnalogParameter
+from jdxi_editor.midi.data.parameter.conversion import (
+    BatchConverter,
+    conversion_table,
+    convert_from_display,
+    convert_from_midi,
+    convert_record,
+)
+from jdxi_editor.midi.data.parameter.digital import DigitalParameter
+from jdxi_editor.midi.data.parameter.drums import DrumParameter
+from jdxi_editor.midi.sysex.parsers import parse_sysex
+from jdxi_editor.midi.utils.conversions import MIDI_CC_TO_FRAC, MIDI_CC_TO_MS, midi_cc_to_frac, midi_cc_to_ms
+
+from tests.helpers import roland_dt1
+
+
+DIGITAL_PARTIAL_DUMP = roland_dt1([0x19, 0x01, 0x20, 0x00], [(i * 11) % 128 for i in range(0x3D)])
+
+
+def reference(param, method, value):
+    try:
+        return getattr(param, method)(value)
+    except Exception:
+        return None
+
+
+class TestParameterConversion(unittest.TestCase):
+    def test_tables_match_the_methods(self):
+        for parameter_type in (AnalogParameter, DigitalParameter, DrumParameter):
+            for param in parameter_type:
+                table = conversion_table(param)
+                for value in range(128):
+                    self.assertEqual(table.from_midi[value], reference(param, "convert_from_midi", value))
+                display_min, display_max = param.get_display_value()
+                for value in range(display_min, display_max + 1) if table.to_midi else ():
+                    self.assertEqual(
+                        table.to_midi[value - display_min], reference(param, "convert_from_display", value)
+                    )
+
+    def test_single_values_and_fallbacks(self):
+        self.assertEqual(convert_from_midi(DigitalParameter.OSC_PITCH, 40), -24)
+        self.assertEqual(convert_from_display(DigitalParameter.OSC_PITCH, -24), 40)
+        self.assertEqual(convert_from_display(AnalogParameter.OSC_PITCH_FINE, -50), 0)
+        # Past the tables, the methods are called
+        self.assertEqual(convert_from_midi(DrumParameter.WMT1_WAVE_NUMBER_L, 1000), 1000)
+        self.assertEqual(convert_from_display(DigitalParameter.OSC_PITCH, 100), 164)
+        with self.assertRaises(ZeroDivisionError):
+            convert_from_midi(AnalogParameter.RESERVE_1, 0)
+
+    def test_batch_conversion(self):
+        converter = BatchConverter(
+            [AnalogParameter.OSC_PITCH_FINE, AnalogParameter.RESERVE_1, DrumParameter.WMT1_WAVE_NUMBER_L]
+        )
+        self.assertEqual(converter.from_midi([10, 0, 5000]), [-54, None, 5000])
+        self.assertEqual(converter.from_midi([-1, 0, 3]), [-65, None, 3])
+
+    def test_convert_record_matches_a_loop_over_the_record(self):
+        record = parse_sysex(DIGITAL_PARTIAL_DUMP)
+        expected = {}
+        for name, value in record.items():
+            param = DigitalParameter.get_by_name(name)
+            display_value = reference(param, "convert_from_midi", value) if param else None
+            if display_value is not None:
+                expected[name] = display_value
+        self.assertEqual(convert_record(record, DigitalParameter), expected)
+        self.assertEqual(convert_record(record.to_dict(), DigitalParameter), expected)
+
+    def test_midi_cc_tables(self):
+        self.assertEqual(len(MIDI_CC_TO_MS), 128)
+        self.assertEqual(MIDI_CC_TO_MS[64], midi_cc_to_ms(64))
+        self.assertEqual(MIDI_CC_TO_FRAC[127], midi_cc_to_frac(127))
+
+
+if __name__ == "__main__":
+    unittest.main()
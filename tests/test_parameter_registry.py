@@ -0,0 +1,63 @@
+import unittest
+
+from jdxi_editor.midi.data.digital import get_digital_parameter_by_address
+from jdxi_editor.midi.data.parameter.analog import AnalogParameter
+from jdxi_editor.midi.data.parameter.digital import DigitalParameter
+from jdxi_editor.midi.data.parameter.digital_common import DigitalCommonParameter
+from jdxi_editor.midi.data.parameter.drums import DrumCommonParameter, DrumParameter
+from jdxi_editor.midi.data.parameter.effects import EffectParameter
+from jdxi_editor.midi.data.parameter.registry import PARAMETER_REGISTRY, ParameterRegistry
+from jdxi_editor.midi.sysex.utils import get_parameter_from_address
+
+
+class TestParameterRegistry(unittest.TestCase):
+    def test_lookup_by_area_group_and_offset(self):
+        self.assertIs(
+            PARAMETER_REGISTRY.get("TEMPORARY_ANALOG_SYNTH_AREA", 0x00, 0x0E), AnalogParameter.LFO_RATE
+        )
+        self.assertIs(
+            PARAMETER_REGISTRY.get("TEMPORARY_DIGITAL_SYNTH_2_AREA", 0x21, 0x0C), DigitalParameter.FILTER_CUTOFF
+        )
+        self.assertIs(
+            PARAMETER_REGISTRY.get("TEMPORARY_DRUM_KIT_AREA", 0x00, 0x0C), DrumCommonParameter.KIT_LEVEL
+        )
+        self.assertIsNone(PARAMETER_REGISTRY.get("TEMPORARY_ANALOG_SYNTH_AREA", 0x20, 0x0E))
+
+    def test_high_offsets_resolve_as_sent(self):
+        # WMT4_WAVE_NUMBER_R at 0x102 in BD1 (group 0x2E) is sent at 0x2F 0x02
+        parameter = DrumParameter.WMT4_WAVE_NUMBER_R
+        self.assertIs(PARAMETER_REGISTRY.get("TEMPORARY_DRUM_KIT_AREA", 0x2E, 0x102), parameter)
+        self.assertIs(PARAMETER_REGISTRY.from_address([0x19, 0x70, 0x2F, 0x02]), parameter)
+        self.assertIs(get_parameter_from_address([0x19, 0x70, 0x2F, 0x02]), parameter)
+        with self.assertRaises(ValueError):
+            get_parameter_from_address([0x19, 0x70])
+        self.assertIsNone(PARAMETER_REGISTRY.from_address([0x7F, 0x00, 0x00, 0x00]))
+
+    def test_matches_a_scan_of_each_enum(self):
+        for parameter_type in (AnalogParameter, DigitalParameter, DrumParameter, EffectParameter):
+            for address in range(0x150):
+                expected = next((param for param in parameter_type if param.address == address), None)
+                self.assertIs(PARAMETER_REGISTRY.get_by_address(parameter_type, address), expected)
+        self.assertEqual(AnalogParameter.get_name_by_address(0x0E), "LFO_RATE")
+        self.assertIs(get_digital_parameter_by_address((0x20, 0x0C)), DigitalParameter.FILTER_CUTOFF)
+
+    def test_lookup_by_name(self):
+        self.assertIs(PARAMETER_REGISTRY.get_by_name("LFO_RATE", DigitalParameter), DigitalParameter.LFO_RATE)
+        self.assertIs(PARAMETER_REGISTRY.get_by_name("KIT_LEVEL"), DrumCommonParameter.KIT_LEVEL)
+        self.assertIsNone(PARAMETER_REGISTRY.get_by_name("MISSING"))
+        registry = ParameterRegistry({}, ())
+        self.assertIs(registry.get_by_address(AnalogParameter, 0x0E), AnalogParameter.LFO_RATE)
+
+    def test_switch_and_bipolar_metadata_is_class_level(self):
+        self.assertTrue(AnalogParameter.FILTER_SWITCH.is_switch)
+        self.assertFalse(AnalogParameter.FILTER_CUTOFF.is_switch)
+        self.assertTrue(DigitalCommonParameter.RING_SWITCH.is_switch)
+        self.assertTrue(DigitalParameter.AMP_PAN.is_bipolar)
+        self.assertTrue(DrumParameter.WMT2_WAVE_PAN.is_bipolar)
+        self.assertFalse(DrumCommonParameter.KIT_LEVEL.is_switch)
+        self.assertIsInstance(DigitalParameter.BIPOLAR_PARAMETERS, frozenset)
+        self.assertNotIn("BIPOLAR_PARAMETERS", DigitalParameter.__members__)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import unittest
+
+import numpy as np
+from mido import Message, MidiFile, MidiTrack
+
+from jdxi_editor.midi.file.roll import NO_CHANNEL, NoteArrays, PianoRoll, piano_roll
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def make_file(messages, ticks_per_beat=96):
+    """One track of (delta ticks, message) pairs."""
+    track = MidiTrack()
+    for delta, message in messages:
+        track.append(message.copy(time=delta))
+    midi_file = MidiFile(ticks_per_beat=ticks_per_beat)
+    midi_file.tracks.append(track)
+    return midi_file
+
+
+def on(note, velocity=127, channel=0):
+    return Message("note_on", channel=channel, note=note, velocity=velocity)
+
+
+def off(note, channel=0):
+    return Message("note_off", channel=channel, note=note)
+
+
+def reference_roll(notes, ticks_per_column, width):
+    """Fill the roll one note at a time, the loudest note winning a column."""
+    intensity = np.zeros((128, width), dtype=np.uint8)
+    channels = np.full((128, width), NO_CHANNEL, dtype=np.uint8)
+    for index in np.argsort(notes.intensity, kind="stable"):
+        first = notes.start[index] // ticks_per_column
+        last = max(-(-notes.end[index] // ticks_per_column), first + 1)
+        intensity[notes.note[index], first:last] = notes.intensity[index]
+        channels[notes.note[index], first:last] = notes.channel[index]
+    return intensity, channels
+
+
+class TestNoteArrays(unittest.TestCase):
+    def test_pairs_notes(self):
+        midi_file = make_file([
+            (0, on(60)),
+            (10, on(64, channel=9)),
+            (10, on(60)),  # retrigger ends the first note
+            (10, off(60)),
+            (0, on(62, velocity=0)),  # note-on at velocity 0 is a note-off
+            (10, Message("control_change", control=7, value=127)),
+            (0, on(67, velocity=100)),
+            (20, off(64, channel=9)),
+        ])
+        notes = NoteArrays.from_midi_file(midi_file)
+        self.assertEqual(notes.total_ticks, 60)
+        self.assertEqual(
+            list(zip(notes.channel, notes.note, notes.start, notes.end, notes.intensity)),
+            [(0, 60, 0, 20, 100), (9, 64, 10, 60, 100), (0, 60, 20, 30, 100), (0, 67, 40, 60, 100)],
+        )
+
+
+class TestPianoRoll(unittest.TestCase):
+    def setUp(self):
+        self.midi_file = MidiFile(os.path.join(TESTS_DIR, "taito10.mid"))
+        self.roll = PianoRoll(NoteArrays.from_midi_file(self.midi_file), columns_per_beat=24)
+
+    def test_matches_a_note_by_note_fill(self):
+        intensity, channels = reference_roll(
+            self.roll.notes, self.roll.ticks_per_column, self.roll.width
+        )
+        np.testing.assert_array_equal(self.roll.intensity[0], intensity)
+        np.testing.assert_array_equal(self.roll.channels[0], channels)
+
+    def test_levels_keep_the_loudest_column(self):
+        base = self.roll.intensity[0]
+        for level in (1, 3):
+            span = 2 ** level
+            padded = np.pad(base, ((0, 0), (0, -base.shape[1] % span)))
+            expected = padded.reshape(128, -1, span).max(axis=2)
+            np.testing.assert_array_equal(self.roll.intensity[level], expected)
+        self.assertEqual(self.roll.intensity[-1].shape, (128, 1))
+
+    def test_view_is_a_slice_of_the_nearest_level(self):
+        intensity, channels, ticks_per_column = self.roll.view(0, self.roll.total_ticks, 100)
+        self.assertTrue(100 <= intensity.shape[1] < 200)
+        self.assertEqual(channels.shape, intensity.shape)
+        self.assertTrue(any(np.shares_memory(intensity, level) for level in self.roll.intensity))
+        intensity, _, close_up = self.roll.view(0, 960, 4000)
+        self.assertEqual(close_up, self.roll.ticks_per_column)
+        np.testing.assert_array_equal(intensity, self.roll.intensity[0][:, :960 // close_up])
+
+    def test_cached_per_file(self):
+        midi_file = make_file([(0, on(60)), (96, off(60))])
+        roll = piano_roll(midi_file)
+        self.assertIs(piano_roll(midi_file), roll)
+        midi_file.tracks[0].append(on(62).copy(time=96))
+        self.assertIsNot(piano_roll(midi_file), roll)
+        self.assertEqual(len(piano_roll(midi_file).notes), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
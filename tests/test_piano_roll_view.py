@@ -0,0 +1,67 @@
+import os
+import unittest
+
+from mido import MidiFile
+from PySide6.QtWidgets import QApplication
+
+from jdxi_editor.midi.file.roll import piano_roll
+from jdxi_editor.ui.widgets.piano_roll.view import PianoRollView
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class TestPianoRollView(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.roll = piano_roll(MidiFile(os.path.join(TESTS_DIR, "taito13.mid")))
+        self.view = PianoRollView()
+        self.view.resize(800, 256)
+        self.view.set_roll(self.roll)
+
+    def lit_pixels(self, image):
+        return sum(
+            1 for x in range(0, image.width(), 4) for y in range(0, image.height(), 2)
+            if image.pixelColor(x, y).value() > 0
+        )
+
+    def test_draws_the_notes(self):
+        self.assertGreater(self.lit_pixels(self.view.grab().toImage()), 0)
+        self.assertEqual(self.view.start_tick, 0)
+        self.assertGreaterEqual(self.view.ticks_per_pixel * 800, self.roll.total_ticks * 0.99)
+
+    def test_tiles_wrap_the_codes_without_copying(self):
+        self.view.grab()
+        codes, image = next(iter(self.view._tiles.values()))
+        codes[0, 0] = 0x35
+        self.assertEqual(image.pixelIndex(0, 0), 0x35)
+
+    def test_playhead_does_not_rebuild_tiles(self):
+        self.view.grab()
+        built = self.view.tiles_built
+        for step in range(50):
+            self.view.set_playhead(step * self.roll.total_ticks / 50)
+            self.view.grab()
+        self.assertEqual(self.view.tiles_built, built)
+
+    def test_zoom_and_scroll(self):
+        self.view.zoom(16, anchor_x=0)
+        self.assertEqual(self.view.start_tick, 0)
+        self.view.grab()
+        zoomed = self.view.tiles_built
+        page = 800 * self.view.ticks_per_pixel
+        self.view.scroll_to(page / 2)
+        self.assertAlmostEqual(self.view.start_tick, page / 2, delta=self.view.ticks_per_pixel)
+        self.view.grab()
+        # Cached tiles are reused, at most the next one is built
+        self.assertLessEqual(self.view.tiles_built - zoomed, 1)
+        self.view.set_playhead(self.roll.total_ticks - 1)
+        self.assertGreater(self.view.start_tick, page)
+        self.view.fit()
+        self.assertEqual(self.view.start_tick, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
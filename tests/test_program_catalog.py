@@ -0,0 +1,106 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from jdxi_editor.midi.data.programs import ANALOG_PRESET_CATALOG, DIGITAL_PRESET_CATALOG, PROGRAM_CATALOG
+from jdxi_editor.midi.data.programs.analog import get_preset_by_program_number as get_analog_preset
+from jdxi_editor.midi.data.programs.build import compile_catalogs, write_catalogs
+from jdxi_editor.midi.data.programs.catalog import (
+    CATALOG_PATH,
+    CATALOG_SOURCES,
+    Catalog,
+    compiled_catalog,
+    load_compiled,
+    load_source,
+)
+from jdxi_editor.midi.data.programs.presets import get_preset_by_program_number
+from jdxi_editor.ui.editors.helpers.program import (
+    get_preset_parameter_value,
+    get_program_by_bank_and_number,
+    get_program_by_midi,
+    get_program_id_by_name,
+    get_program_index_by_id,
+    get_programs_using_tone,
+)
+
+PROGRAM_LIST = list(PROGRAM_CATALOG)
+DIGITAL_PRESET_LIST = list(DIGITAL_PRESET_CATALOG)
+ANALOG_PRESET_LIST = list(ANALOG_PRESET_CATALOG)
+
+
+class TestCatalog(unittest.TestCase):
+    def test_lookups_match_a_scan(self):
+        for index, program in enumerate(PROGRAM_LIST):
+            first = next(p for p in PROGRAM_LIST if p["id"] == program["id"])
+            self.assertIs(PROGRAM_CATALOG.get_by_id(program["id"]), first)
+            self.assertEqual(get_program_index_by_id(program["id"]), PROGRAM_LIST.index(first) - 1)
+        self.assertIs(get_program_by_bank_and_number("A", 2), PROGRAM_LIST[1])
+        self.assertIsNone(PROGRAM_CATALOG.get_by_id("Z99"))
+        preset = next(p for p in DIGITAL_PRESET_LIST if p["id"] == "090")
+        self.assertIs(get_preset_by_program_number(90), preset)
+        self.assertEqual(get_preset_parameter_value("pc", "090"), 90)
+        self.assertIs(get_analog_preset(6), ANALOG_PRESET_LIST[1])
+
+    def test_midi_values_are_compared_as_ints(self):
+        program = PROGRAM_LIST[0]
+        self.assertIs(get_program_by_midi(program["msb"], program["lsb"], program["pc"]), program)
+        catalog = Catalog([{"id": "064", "name": "Init Tone", "msb": 94.0, "lsb": "64", "pc": 64.0}])
+        self.assertIs(catalog.get_by_midi(94, 64, 64), catalog[0])
+
+    def test_programs_using_a_tone(self):
+        for part in PROGRAM_CATALOG.tone_keys:
+            tone = PROGRAM_LIST[0][part]
+            expected = [program for program in PROGRAM_LIST if program[part] == tone]
+            self.assertEqual(get_programs_using_tone(tone, part), expected)
+        drum = PROGRAM_LIST[0]["drum"]
+        self.assertEqual(
+            PROGRAM_CATALOG.using(drum),
+            [program for program in PROGRAM_LIST if drum in (program[key] for key in PROGRAM_CATALOG.tone_keys)],
+        )
+        self.assertEqual(PROGRAM_CATALOG.using("No Such Tone"), [])
+
+    def test_search_matches_a_substring_scan(self):
+        catalog = Catalog(DIGITAL_PRESET_LIST)
+        for query in ("", "s", "Str", "strings", "STRINGS1", "ngs", "Init Tone", "zzz", "a", "bass 1", "bass"):
+            expected = [preset for preset in DIGITAL_PRESET_LIST if query.lower() in preset["name"].lower()]
+            self.assertEqual(catalog.search(query), expected, query)
+        for query in ("jp", "jp8 s", "JP8 St"):
+            expected = [preset for preset in DIGITAL_PRESET_LIST if preset["name"].lower().startswith(query.lower())]
+            self.assertEqual(catalog.search_prefix(query), expected, query)
+
+    def test_name_lookup_keeps_the_first_case_sensitive_match(self):
+        name = PROGRAM_LIST[5]["name"]
+        expected = next(p["id"] for p in PROGRAM_LIST if name[1:4] in p["name"])
+        self.assertEqual(get_program_id_by_name(name[1:4]), expected)
+        self.assertIsNone(get_program_id_by_name(name.upper() + "~"))
+
+
+class TestCompiledCatalogs(unittest.TestCase):
+    def test_compiled_file_matches_the_source_lists(self):
+        with open(CATALOG_PATH, encoding="utf-8") as file:
+            self.assertEqual(
+                json.load(file), compile_catalogs(),
+                "catalogs.json is stale, run python -m jdxi_editor.midi.data.programs.build",
+            )
+        compiled = load_compiled()
+        for name in CATALOG_SOURCES:
+            self.assertEqual(compiled[name], load_source(name))
+        self.assertEqual(PROGRAM_CATALOG.get_by_id("A01")["msb"], 85)
+
+    def test_missing_file_falls_back_to_the_sources(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertLogs(level="WARNING"):
+                self.assertEqual(load_compiled(Path(directory) / "catalogs.json"), {})
+            path = write_catalogs(Path(directory) / "compiled.json")
+            self.assertEqual(load_compiled(path)["drum_kits"], load_source("drum_kits"))
+        catalog = compiled_catalog("analog_presets")
+        self.assertFalse(catalog.loaded)
+        with mock.patch("jdxi_editor.midi.data.programs.catalog.load_compiled", return_value={}):
+            self.assertEqual(list(catalog), load_source("analog_presets"))
+        self.assertTrue(catalog.loaded)
+
+
+if __name__ == "__main__":
+    unittest.main()
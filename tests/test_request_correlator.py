@@ -0,0 +1,98 @@
+import asyncio
+import time
+import unittest
+from concurrent.futures import Future
+
+from PySide6.QtWidgets import QApplication
+
+from jdxi_editor.midi.data.digital import DigitalPartial, get_partial_state
+from jdxi_editor.midi.io.correlator import RequestCorrelator
+
+
+def roland_sysex(command, address, data):
+    """Build a JD-Xi DT1/RQ1 frame with a valid checksum."""
+    checksum = (128 - (sum(address + data) & 0x7F)) & 0x7F
+    return bytes(
+        [0xF0, 0x41, 0x10, 0x00, 0x00, 0x00, 0x0E, command] + address + data + [checksum, 0xF7]
+    )
+
+
+CUTOFF = [0x19, 0x01, 0x20, 0x0C]
+PARTIAL_1 = [0x19, 0x01, 0x20, 0x00]
+
+
+class TestRequestCorrelator(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.sent = []
+        self.correlator = RequestCorrelator(
+            lambda message, lane: self.sent.append(message) or True, timeout=0.01, retries=1
+        )
+
+    def tearDown(self):
+        self.correlator.cancel_all()
+
+    def test_request_sends_rq1_and_resolves_from_reply(self):
+        future = self.correlator.request(CUTOFF)
+        self.assertEqual(self.sent, [list(roland_sysex(0x11, CUTOFF, [0, 0, 0, 1]))])
+        self.assertFalse(self.correlator.feed(roland_sysex(0x12, [0x19, 0x01, 0x20, 0x0D], [5])))
+        self.assertTrue(self.correlator.feed(roland_sysex(0x12, CUTOFF, [0x40])))
+        response = future.result(timeout=0)
+        self.assertEqual(response.data, bytes([0x40]))
+        self.assertEqual(response.attempts, 1)
+        self.assertEqual(self.correlator.stats().in_flight, 0)
+
+    def test_many_requests_in_flight_resolved_by_one_dump(self):
+        futures = [self.correlator.request([0x19, 0x01, 0x20, param]) for param in (0x00, 0x0C, 0x3C)]
+        self.assertIs(self.correlator.request(CUTOFF), futures[1])
+        data = list(range(0x3D))
+        self.assertTrue(self.correlator.feed(roland_sysex(0x12, PARTIAL_1, data)))
+        self.assertEqual([f.result(timeout=0).data[0] for f in futures], [0x00, 0x0C, 0x3C])
+        self.assertEqual(self.correlator.stats().resolved, 3)
+
+    def test_retries_then_times_out(self):
+        failures = []
+        self.correlator.request_failed.connect(lambda address, reason: failures.append(address))
+        future = self.correlator.request(CUTOFF)
+        for _ in range(2):
+            time.sleep(0.02)
+            self.correlator._check_timeouts()
+        self.assertEqual(len(self.sent), 2)
+        with self.assertRaises(TimeoutError):
+            future.result(timeout=0)
+        self.assertEqual(failures, [CUTOFF])
+        stats = self.correlator.stats()
+        self.assertEqual((stats.retried, stats.timed_out), (1, 1))
+
+    def test_request_async(self):
+        async def read_cutoff():
+            task = asyncio.ensure_future(self.correlator.request_async(CUTOFF))
+            await asyncio.sleep(0)
+            self.correlator.feed(roland_sysex(0x12, CUTOFF, [0x22]))
+            return await task
+
+        self.assertEqual(asyncio.run(read_cutoff()).data, bytes([0x22]))
+
+    def test_get_partial_state_combines_futures(self):
+        class Helper:
+            def __init__(self):
+                self.futures = []
+
+            def get_parameter(self, area, part, group, param):
+                future = Future()
+                self.futures.append(future)
+                return future
+
+        helper = Helper()
+        state = get_partial_state(helper, DigitalPartial.PARTIAL_1)
+        helper.futures[0].set_result(1)
+        self.assertFalse(state.done())
+        helper.futures[1].set_result(0)
+        self.assertEqual(state.result(timeout=0), (True, False))
+
+
+if __name__ == "__main__":
+    unittest.main()
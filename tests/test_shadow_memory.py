@@ -0,0 +1,90 @@
+import unittest
+
+from PySide6.QtWidgets import QApplication
+
+from jdxi_editor.midi.message.template import render_parameter
+from jdxi_editor.midi.parameter.handler import ParameterHandler
+from jdxi_editor.midi.sysex.memory import ShadowMemory
+
+from tests.helpers import roland_dt1
+
+
+CUTOFF = [0x19, 0x01, 0x20, 0x0C]
+
+
+class TestShadowMemory(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.memory = ShadowMemory()
+        self.changes = []
+        self.memory.memory_changed.connect(self.changes.append)
+
+    def test_dump_emits_only_modified_range(self):
+        data = [0] * 0x3D
+        data[0x0C:0x10] = [64, 65, 66, 67]
+        changes = self.memory.write_sysex(roland_dt1([0x19, 0x01, 0x20, 0x00], data))
+        self.assertEqual(changes, self.changes)
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(changes[0].address, tuple(CUTOFF))
+        self.assertEqual(changes[0].data, bytes([64, 65, 66, 67]))
+        self.assertEqual(changes[0].block, "DIGITAL_1_PARTIAL_1")
+        self.assertTrue(changes[0].overlaps([0x19, 0x01, 0x20, 0x00], 0x0D))
+        self.assertFalse(changes[0].overlaps([0x19, 0x01, 0x20, 0x10]))
+        self.assertEqual(self.memory.value(CUTOFF), 64)
+        self.assertEqual(self.memory.read(CUTOFF, 4), bytes([64, 65, 66, 67]))
+        # The same dump again changes nothing
+        self.assertEqual(self.memory.write_sysex(roland_dt1([0x19, 0x01, 0x20, 0x00], data)), [])
+
+    def test_outgoing_edit(self):
+        changes = self.memory.write_sysex(render_parameter(*CUTOFF, 100), source="editor")
+        self.assertEqual([(c.data, c.source) for c in changes], [(bytes([100]), "editor")])
+
+    def test_drum_partial_spans_two_groups(self):
+        address = [0x19, 0x70, 0x2F, 0x42]  # last byte of the pad 36 partial
+        self.memory.write(address, bytes([7, 9]))
+        self.assertEqual(self.memory.value(address), 7)
+        self.assertIsNone(self.memory.value([0x19, 0x70, 0x2F, 0x43]))
+        self.assertEqual(self.memory.block("DRUM_PARTIAL_36")[-1], 7)
+        self.assertEqual(self.memory.unmapped, 1)
+
+    def test_snapshot_changes(self):
+        before = self.memory.snapshot()
+        self.memory.write(CUTOFF, bytes([1]))
+        self.memory.write([0x19, 0x42, 0x00, 0x10], bytes([2, 3]))
+        changes = list(self.memory.changes(before))
+        self.assertEqual([c.block for c in changes], ["DIGITAL_1_PARTIAL_1", "ANALOG"])
+        self.assertEqual(changes[1].data, bytes([2, 3]))
+
+    def test_parameter_changes(self):
+        self.memory.write(CUTOFF, bytes([64]))
+        changes = self.memory.write([0x19, 0x01, 0x20, 0x0B], bytes([1, 70]))
+        self.assertEqual(changes[0].previous, bytes([0, 64]))
+        self.assertEqual(
+            list(self.memory.parameter_changes(changes[0])),
+            [("FILTER_SLOPE", 0, 1), ("FILTER_CUTOFF", 64, 70)],
+        )
+        # Names and values are those of the change, not of later writes
+        self.memory.write(CUTOFF, bytes([80]))
+        self.assertEqual(list(self.memory.parameter_changes(changes[0]))[1], ("FILTER_CUTOFF", 64, 70))
+
+    def test_parameter_handler(self):
+        handler = ParameterHandler(self.memory)
+        updates = []
+        handler.parameters_updated.connect(updates.append)
+        handler.update_parameter(CUTOFF, 10)
+        handler.update_parameter(CUTOFF, 10)
+        handler.update_parameter([0x02, 0x00, 0x00, 0x01], 5)
+        self.assertEqual(updates, [{"25.1.32.12": 10}, {"2.0.0.1": 5}])
+        self.assertEqual(handler.get_parameter(CUTOFF), 10)
+        self.assertEqual(handler.get_parameter([0x02, 0x00, 0x00, 0x01]), 5)
+        # The shadow memory is shared with the editors and outlives the handler's values
+        handler.clear_parameters()
+        self.assertEqual(handler.get_parameter(CUTOFF), 10)
+        self.assertEqual(handler.get_parameter([0x02, 0x00, 0x00, 0x01]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
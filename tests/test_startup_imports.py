@@ -0,0 +1,56 @@
+import unittest
+
+from tests.helpers import run_python
+
+# Modules the main window must not import before they are used
+DEFERRED_MODULES = [
+    "pandas",
+    "matplotlib",
+    "qtawesome",
+    "PIL",
+    "jdxi_editor.ui.editors.synth",
+    "jdxi_editor.ui.editors.analog",
+    "jdxi_editor.ui.editors.digital",
+    "jdxi_editor.ui.editors.drum",
+    "jdxi_editor.ui.editors.midi_file",
+    "jdxi_editor.ui.editors.pattern",
+    "jdxi_editor.ui.editors.preset",
+    "jdxi_editor.ui.editors.program",
+    "jdxi_editor.midi.data.constants.triage",
+    "jdxi_editor.midi.data.programs.programs",
+    "jdxi_editor.midi.data.programs.presets",
+    "jdxi_editor.midi.data.programs.analog",
+    "jdxi_editor.midi.data.programs.drum",
+]
+
+
+class TestStartupImports(unittest.TestCase):
+    def test_catalogs_load_from_the_compiled_file(self):
+        state = run_python(
+            "import json, sys\n"
+            "from jdxi_editor.midi.data import programs\n"
+            "programs.PROGRAM_CATALOG.get_by_id('A01')\n"
+            "for catalog in (programs.DIGITAL_PRESET_CATALOG, programs.ANALOG_PRESET_CATALOG, programs.DRUM_KIT_CATALOG):\n"
+            "    catalog.search('bass')\n"
+            "sources = [name for name in sys.modules if name.startswith('jdxi_editor.midi.data.programs.')]\n"
+            "print(json.dumps({'sources': sources}))\n"
+        )
+        self.assertEqual(state["sources"], ["jdxi_editor.midi.data.programs.catalog"])
+
+    def test_main_window_defers_heavy_modules(self):
+        state = run_python(
+            "import json, sys\n"
+            "import jdxi_editor.ui.windows.jdxi.instrument\n"
+            "from jdxi_editor.midi.data.programs import PROGRAM_CATALOG\n"
+            f"imported = [name for name in {DEFERRED_MODULES!r} if name in sys.modules]\n"
+            "from jdxi_editor.ui import editors\n"
+            "editor = editors.ProgramEditor\n"
+            "print(json.dumps({'imported': imported, 'loaded': PROGRAM_CATALOG.loaded, 'editor': editor.__module__}))\n"
+        )
+        self.assertEqual(state["imported"], [])
+        self.assertFalse(state["loaded"])
+        self.assertEqual(state["editor"], "jdxi_editor.ui.editors.program")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+
+from jdxi_editor.startup import COLD_START_TARGET_SECONDS, StartupTimer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestStartupTimer(unittest.TestCase):
+    def test_nested_phases(self):
+        clock = FakeClock()
+        timer = StartupTimer(clock)
+        with timer.phase("imports"):
+            clock.now += 0.25
+        with timer.phase("window build"):
+            clock.now += 0.1
+            with timer.phase("MIDI auto-connect"):
+                self.assertIsNone(timer.duration("MIDI auto-connect"))
+                clock.now += 0.05
+        self.assertEqual(
+            [(name, depth) for name, depth, _ in timer.phases],
+            [("imports", 0), ("window build", 0), ("MIDI auto-connect", 1)],
+        )
+        self.assertAlmostEqual(timer.duration("window build"), 0.15)
+        self.assertAlmostEqual(timer.duration("MIDI auto-connect"), 0.05)
+        with self.assertLogs(level="INFO") as logs:
+            self.assertAlmostEqual(timer.finish(), 0.4)
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("  MIDI auto-connect", timer.report())
+        self.assertIn("total", timer.report().splitlines()[-1])
+
+    def test_slow_startup_is_a_warning(self):
+        clock = FakeClock()
+        timer = StartupTimer(clock)
+        with timer.phase("imports"):
+            clock.now += COLD_START_TARGET_SECONDS + 1
+        with self.assertLogs(level="WARNING") as logs:
+            timer.finish()
+        self.assertIn("target", logs.output[-1])
+
+    def test_failed_phase_is_still_timed(self):
+        clock = FakeClock()
+        timer = StartupTimer(clock)
+        with self.assertRaises(RuntimeError):
+            with timer.phase("window build"):
+                clock.now += 0.2
+                raise RuntimeError("no display")
+        self.assertAlmostEqual(timer.duration("window build"), 0.2)
+        with timer.phase("imports"):
+            pass
+        self.assertEqual(timer.phases[-1][1], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+import time
+import unittest
+
+from PySide6.QtWidgets import QApplication
+
+from jdxi_editor.midi.io.sequencer import StepSequencer
+from jdxi_editor.ui.editors.pattern import PatternSequencer
+
+# 300 BPM in 16th notes, 50 ms steps
+BPM = 300
+STEP = 0.05
+# Allowed error of a single note against the grid, a busy machine can be late
+TOLERANCE = 0.025
+# Allowed median error, a drifting clock is late by more and more
+MEDIAN_TOLERANCE = 0.003
+
+
+class TestStepSequencer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.sent = []
+        self.sequencer = StepSequencer(self.record, note_length=0.01)
+        self.sequencer.set_tempo(BPM)
+
+    def tearDown(self):
+        self.sequencer.stop()
+
+    def record(self, message):
+        self.sent.append((time.perf_counter(), message))
+
+    def play(self, seconds):
+        self.sequencer.start()
+        time.sleep(seconds)
+        self.sequencer.stop()
+
+    def note_on_times(self, note=None):
+        times = [
+            at for at, message in self.sent
+            if message[0] & 0xF0 == 0x90 and (note is None or message[1] == note)
+        ]
+        return [at - times[0] for at in times]
+
+    def assert_on_grid(self, times, grid):
+        errors = sorted(abs(actual - expected) for actual, expected in zip(times, grid))
+        self.assertLess(errors[-1], TOLERANCE)
+        self.assertLess(errors[len(errors) // 2], MEDIAN_TOLERANCE)
+
+    def test_steps_keep_time_without_drift(self):
+        self.sequencer.set_steps([[(9, 36, 100)]] * 4)
+        self.play(1.0)
+        times = self.note_on_times()
+        self.assertGreaterEqual(len(times), 18)
+        self.assert_on_grid(times, [step * STEP for step in range(len(times))])
+        # Every note is released
+        self.assertEqual(len([m for _, m in self.sent if m[0] == 0x89]), len(times))
+        self.assertLess(self.sequencer.max_lateness, TOLERANCE)
+
+    def test_swing_delays_every_other_step(self):
+        self.sequencer.set_steps([[(0, 60, 100)]] * 16)
+        self.sequencer.set_swing(0.2)
+        self.play(0.5)
+        times = self.note_on_times()
+        self.assertGreaterEqual(len(times), 8)
+        self.assert_on_grid(times, [step * STEP + (0.2 * STEP if step % 2 else 0.0) for step in range(len(times))])
+        with self.assertRaises(ValueError):
+            self.sequencer.set_swing(0.5)
+
+    def test_tempo_change_mid_pattern(self):
+        self.sequencer.set_steps([[(0, 60, 100)]] * 16)
+        self.sequencer.start()
+        time.sleep(0.22)
+        self.sequencer.set_tempo(BPM / 2)
+        time.sleep(0.45)
+        self.sequencer.stop()
+        times = self.note_on_times()
+        intervals = [later - earlier for earlier, later in zip(times, times[1:])]
+        self.assertAlmostEqual(intervals[0], STEP, delta=TOLERANCE)
+        self.assertAlmostEqual(intervals[-1], STEP * 2, delta=TOLERANCE)
+        # The change falls on a step, nothing is skipped or doubled
+        self.assertTrue(all(STEP - TOLERANCE < interval < STEP * 2 + TOLERANCE for interval in intervals))
+
+    def test_pattern_and_mutes_apply_from_the_next_step(self):
+        self.sequencer.set_steps([[(0, 60, 100), (9, 36, 100)], []])
+        self.sequencer.set_muted_channels([9])
+        self.sequencer.start()
+        time.sleep(0.18)
+        self.assertEqual({message[1] for _, message in self.sent}, {60})
+        self.sequencer.set_steps([[(2, 48, 100)], []])
+        self.sequencer.set_muted_channels([])
+        time.sleep(0.12)
+        self.sequencer.stop()
+        self.assertIn([0x92, 48, 100], [message for _, message in self.sent])
+        self.assertNotIn([0x99, 36, 100], [message for _, message in self.sent])
+
+    def test_stop_releases_sounding_notes(self):
+        self.sequencer.note_length = 10.0
+        self.sequencer.set_steps([[(1, 64, 90)]])
+        self.play(0.02)
+        self.assertEqual([message for _, message in self.sent], [[0x91, 64, 90], [0x81, 64, 0]])
+        self.assertFalse(self.sequencer.playing)
+
+    def test_stop_timing_out_leaves_the_release_to_the_thread(self):
+        def slow_record(message):
+            time.sleep(0.2)
+            self.record(message)
+
+        self.sequencer.send = slow_record
+        self.sequencer.note_length = 10.0
+        self.sequencer.set_steps([[(1, 64, 90)]])
+        self.sequencer.start()
+        time.sleep(0.05)
+        self.sequencer.stop(timeout_ms=10)
+        self.assertTrue(self.sequencer.isRunning())
+        self.assertTrue(self.sequencer.wait(5000))
+        self.assertEqual([message for _, message in self.sent], [[0x91, 64, 90], [0x81, 64, 0]])
+
+    def test_ui_follows_the_steps(self):
+        steps = []
+        self.sequencer.step_changed.connect(steps.append)
+        self.sequencer.set_steps([[], [], [], []])
+        self.play(0.18)
+        self.app.processEvents()
+        self.assertEqual(steps[:4], [0, 1, 2, 3])
+
+
+class TestPatternSequencerPlayback(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_plays_without_a_midi_helper(self):
+        editor = PatternSequencer(None, None)
+        button = editor.buttons[3][0]
+        button.setChecked(True)
+        editor._on_button_clicked(button, True)
+        editor.play_pattern()
+        time.sleep(0.05)
+        editor.stop_pattern()
+        self.assertEqual(editor.sequencer.failed, 0)
+        self.assertGreater(editor.sequencer.sent, 0)
+        self.assertFalse(editor.sequencer.playing)
+
+
+if __name__ == "__main__":
+    unittest.main()
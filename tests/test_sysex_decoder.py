@@ -0,0 +1,79 @@
+import logging
+import unittest
+
+from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication
+
+from jdxi_editor.midi.sysex.decoder import SysExDecodeWorker
+
+from tests.helpers import roland_dt1
+
+
+class TestSysExDecodeWorker(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_submit_drops_when_queue_is_full(self):
+        worker = SysExDecodeWorker(capacity=2)
+        frame = roland_dt1([0x19, 0x01, 0x20, 0x0C], [0x40])
+        self.assertTrue(worker.submit(frame))
+        self.assertTrue(worker.submit(frame))
+        self.assertFalse(worker.submit(frame))
+        stats = worker.stats()
+        self.assertEqual(stats.submitted, 2)
+        self.assertEqual(stats.dropped, 1)
+        self.assertEqual(stats.queue_depth, 2)
+        self.assertEqual(stats.high_water_mark, 2)
+
+    def test_drain_coalesces_frames_for_the_same_address(self):
+        worker = SysExDecodeWorker()
+        for value in (0x10, 0x20, 0x30):
+            worker.submit(roland_dt1([0x19, 0x01, 0x20, 0x0C], [value]))
+        worker.submit(roland_dt1([0x19, 0x01, 0x20, 0x0F], [0x7F]))
+        pending = {}
+        worker._drain(pending)
+        self.assertEqual(len(pending), 2)
+        self.assertEqual(worker.coalesced, 2)
+        self.assertEqual(worker.decoded, 4)
+        latest = pending[bytes([0x19, 0x01, 0x20, 0x0C])]
+        self.assertEqual(latest.raw[12], 0x30)
+        self.assertEqual(latest.temporary_area, "TEMPORARY_DIGITAL_SYNTH_1_AREA")
+
+    def test_worker_publishes_decoded_batch(self):
+        worker = SysExDecodeWorker()
+        batches = []
+        loop = QEventLoop()
+
+        def on_frames(frames):
+            batches.append(frames)
+            loop.quit()
+
+        worker.frame_decoded.connect(on_frames)
+        worker.start()
+        try:
+            worker.submit(roland_dt1([0x19, 0x42, 0x00, 0x00], [0x41] * 12 + [0x00] * 8))
+            QTimer.singleShot(2000, loop.quit)
+            loop.exec()
+        finally:
+            worker.stop()
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(batches[0][0].temporary_area, "TEMPORARY_ANALOG_SYNTH_AREA")
+        self.assertEqual(worker.stats().frames_published, 1)
+
+    def test_decode_serializes_only_when_debug_is_logged(self):
+        worker = SysExDecodeWorker()
+        frame = roland_dt1([0x19, 0x01, 0x20, 0x0C], [0x40])
+        root = logging.getLogger()
+        level = root.level
+        try:
+            root.setLevel(logging.INFO)
+            self.assertNotIn("json_string", worker.decode(frame).__dict__)
+            root.setLevel(logging.DEBUG)
+            self.assertIn("json_string", worker.decode(frame).__dict__)
+        finally:
+            root.setLevel(level)
+
+
+if __name__ == "__main__":
+    unittest.main()
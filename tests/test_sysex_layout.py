@@ -0,0 +1,61 @@
+import unittest
+
+from jdxi_editor.midi.data.parameter.analog import AnalogParameter
+from jdxi_editor.midi.data.parameter.drums import DrumParameter
+from jdxi_editor.midi.sysex.layout import ParameterLayout, SysExRecord, parameter_offset
+from jdxi_editor.midi.sysex.parsers import parse_sysex, safe_get
+from jdxi_editor.midi.utils.byte import split_value_to_nibbles
+
+from tests.helpers import roland_dt1
+
+
+ANALOG_DUMP = roland_dt1([0x19, 0x42, 0x00, 0x00], [(i * 7) % 128 for i in range(0x40)])
+
+
+def drum_partial_dump(wave_number):
+    data = [(i * 5) % 128 for i in range(0xC3)]
+    offset = DrumParameter.WMT1_WAVE_NUMBER_L.address
+    data[offset:offset + 4] = split_value_to_nibbles(wave_number, 4)
+    data[130] = 0x55  # WMT4_WAVE_NUMBER_R, address 0x102, starts at byte 130
+    return roland_dt1([0x19, 0x70, 0x2E, 0x00], data)
+
+
+class TestParameterLayout(unittest.TestCase):
+    def test_parameter_offset_is_7_bit(self):
+        self.assertEqual(parameter_offset(0x7E), 0x7E)
+        self.assertEqual(parameter_offset(0x102), 130)
+        self.assertEqual(parameter_offset(0x142), 194)
+
+    def test_single_byte_values_match_the_enum(self):
+        record = parse_sysex(ANALOG_DUMP)
+        for parameter in AnalogParameter:
+            self.assertEqual(record[parameter.name], safe_get(ANALOG_DUMP, parameter.address))
+
+    def test_nibbled_and_high_address_values(self):
+        record = parse_sysex(drum_partial_dump(0x1234))
+        self.assertEqual(record[DrumParameter.WMT1_WAVE_NUMBER_L], 0x1234)
+        self.assertEqual(record[DrumParameter.WMT4_WAVE_NUMBER_R] >> 12, 0x5)
+
+    def test_short_frames_read_missing_bytes_as_zero(self):
+        layout = ParameterLayout.compile((DrumParameter,))
+        values = layout.decode(drum_partial_dump(0x1234)[:60])
+        self.assertEqual(values[layout.index["WMT1_WAVE_NUMBER_L"]], 0x1234)
+        self.assertEqual(values[layout.index["WMT4_WAVE_NUMBER_R"]], 0)
+        self.assertIs(ParameterLayout.compile((DrumParameter,)), layout)
+
+    def test_record_is_a_mapping_and_an_indexable_record(self):
+        record = parse_sysex(ANALOG_DUMP)
+        self.assertIsInstance(record, SysExRecord)
+        self.assertEqual(record["TEMPORARY_AREA"], "TEMPORARY_ANALOG_SYNTH_AREA")
+        self.assertEqual(list(record)[:5], ["JD_XI_HEADER", "ADDRESS", "TEMPORARY_AREA", "SYNTH_TONE", "TONE_NAME"])
+        index = record.layout.index["LFO_RATE"]
+        self.assertEqual(record[index], record[AnalogParameter.LFO_RATE])
+        self.assertEqual(record.get("LFO_RATE"), record["LFO_RATE"])
+        self.assertIn(AnalogParameter.LFO_RATE, record)
+        self.assertIsNone(record.get("MISSING"))
+        self.assertEqual(dict(record.items()), record.to_dict())
+        self.assertEqual(len(record), len(record.to_dict()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+
+from jdxi_editor.midi.sysex.parsed import ParsedSysEx
+from jdxi_editor.midi.sysex.router import SysExRouter
+
+from tests.helpers import roland_dt1
+
+
+class Editor:
+    def __init__(self):
+        self.received = []
+
+    def update_from_sysex(self, parsed):
+        self.received.append(parsed)
+
+
+class TestSysExRouter(unittest.TestCase):
+    def setUp(self):
+        self.router = SysExRouter()
+        self.analog = ParsedSysEx.from_sysex(
+            roland_dt1([0x19, 0x42, 0x00, 0x00], [0x41] * 12 + [0x00] * 8)
+        )
+        self.digital_common = ParsedSysEx.from_sysex(
+            roland_dt1([0x19, 0x01, 0x00, 0x00], [0x41] * 12 + [0x00] * 8)
+        )
+
+    def test_frame_is_delivered_only_to_its_area(self):
+        analog, digital = Editor(), Editor()
+        self.router.subscribe("TEMPORARY_ANALOG_SYNTH_AREA", analog.update_from_sysex)
+        self.router.subscribe("TEMPORARY_DIGITAL_SYNTH_1_AREA", digital.update_from_sysex)
+        self.assertEqual(self.router.dispatch(self.analog), 1)
+        self.assertEqual(analog.received, [self.analog])
+        self.assertEqual(digital.received, [])
+
+    def test_synth_tone_narrows_subscription(self):
+        common, partial = Editor(), Editor()
+        self.router.subscribe(
+            "TEMPORARY_DIGITAL_SYNTH_1_AREA", common.update_from_sysex, "TONE_COMMON"
+        )
+        self.router.subscribe(
+            "TEMPORARY_DIGITAL_SYNTH_1_AREA", partial.update_from_sysex, "PARTIAL_1"
+        )
+        self.router.dispatch(self.digital_common)
+        self.assertEqual(len(common.received), 1)
+        self.assertEqual(partial.received, [])
+
+    def test_area_subscribers_are_listed_once_without_a_synth_tone(self):
+        editor = Editor()
+        self.router.subscribe("TEMPORARY_ANALOG_SYNTH_AREA", editor.update_from_sysex)
+        self.assertEqual(self.router.subscribers("TEMPORARY_ANALOG_SYNTH_AREA"), [editor.update_from_sysex])
+
+    def test_unrouted_frames_are_counted(self):
+        self.assertEqual(self.router.dispatch(self.analog), 0)
+        self.assertEqual(self.router.unrouted, 1)
+
+    def test_unsubscribe_and_dead_editors(self):
+        editor = Editor()
+        self.router.subscribe("TEMPORARY_ANALOG_SYNTH_AREA", editor.update_from_sysex)
+        self.assertEqual(self.router.unsubscribe(editor.update_from_sysex), 1)
+        self.assertEqual(self.router.dispatch(self.analog), 0)
+
+        self.router.subscribe("TEMPORARY_ANALOG_SYNTH_AREA", editor.update_from_sysex)
+        del editor
+        self.assertEqual(self.router.subscribers("TEMPORARY_ANALOG_SYNTH_AREA"), [])
+
+    def test_failing_subscriber_does_not_block_others(self):
+        editor = Editor()
+
+        def broken(parsed):
+            raise ValueError("boom")
+
+        self.router.subscribe("TEMPORARY_ANALOG_SYNTH_AREA", broken)
+        self.router.subscribe("TEMPORARY_ANALOG_SYNTH_AREA", editor.update_from_sysex)
+        with self.assertLogs(level="ERROR"):
+            self.assertEqual(self.router.dispatch(self.analog), 2)
+        self.assertEqual(len(editor.received), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from jdxi_editor.midi.message.roland import RolandSysEx
+from jdxi_editor.midi.message.template import (
+    SysExTemplate,
+    render_parameter,
+    sysex_template,
+)
+from jdxi_editor.midi.utils.byte import split_value_to_nibbles
+
+
+def roland_checksum(address, data):
+    return (128 - (sum(address + data) & 0x7F)) & 0x7F
+
+
+class TestSysExTemplate(unittest.TestCase):
+    def test_matches_roland_sysex_for_single_byte_values(self):
+        for address in ([0x19, 0x01, 0x20, 0x0C], [0x18, 0x00, 0x00, 0x1C]):
+            for value in range(128):
+                expected = RolandSysEx(
+                    area=address[0],
+                    section=address[1],
+                    group=address[2],
+                    param=address[3],
+                    value=value,
+                ).to_list()
+                self.assertEqual(list(render_parameter(*address, value)), expected)
+
+    def test_nibble_values(self):
+        address = [0x19, 0x01, 0x20, 0x35]
+        for size, values in ((4, (0, 0x7F, 0x1234, 0xFFFF)), (5, (0, 0x7F, 0xFFFF, 0x8ABCD))):
+            for value in values:
+                data = split_value_to_nibbles(value, size)
+                expected = (
+                    [0xF0, 0x41, 0x10, 0x00, 0x00, 0x00, 0x0E, 0x12]
+                    + address
+                    + data
+                    + [roland_checksum(address, data), 0xF7]
+                )
+                self.assertEqual(list(render_parameter(*address, value, size)), expected)
+
+    def test_templates_are_cached_per_address(self):
+        self.assertIs(sysex_template(0x19, 0x42, 0x00, 0x10), sysex_template(0x19, 0x42, 0x00, 0x10))
+        self.assertIsNot(
+            sysex_template(0x19, 0x42, 0x00, 0x10), sysex_template(0x19, 0x42, 0x00, 0x10, 4)
+        )
+
+    def test_invalid_templates(self):
+        with self.assertRaises(ValueError):
+            SysExTemplate([0x19, 0x01, 0x20])
+        with self.assertRaises(ValueError):
+            SysExTemplate([0x19, 0x01, 0x20, 0x00], size=2)
+
+    def test_out_of_range_values_are_rejected(self):
+        for size, value in ((1, 128), (1, -1), (4, 0x10000), (5, 0x100000)):
+            with self.subTest(size=size, value=value), self.assertRaises(ValueError):
+                render_parameter(0x19, 0x01, 0x20, 0x0C, value, size)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+
+from jdxi_editor.midi.data.parameter.analog import AnalogParameter
+from jdxi_editor.midi.data.parameter.digital import DigitalParameter
+from jdxi_editor.midi.data.parameter.drums import DrumParameter
+from jdxi_editor.midi.sysex.parsed import ParsedSysEx
+from jdxi_editor.midi.sysex.parsers import parse_sysex
+from jdxi_editor.midi.sysex.tone import (
+    AnalogTone,
+    DigitalSynthPartial,
+    DrumKit,
+    DrumKitCommon,
+    DrumPartial,
+    block_from_bytes,
+    block_from_sysex,
+    block_type,
+)
+from jdxi_editor.midi.utils.byte import split_value_to_nibbles
+
+from tests.helpers import roland_dt1
+
+
+ANALOG_DUMP = roland_dt1([0x19, 0x42, 0x00, 0x00], [(i * 7) % 128 for i in range(0x40)])
+
+
+def drum_partial_dump(group, wave_number):
+    data = [(i * 5) % 128 for i in range(0xC3)]
+    offset = DrumParameter.WMT1_WAVE_NUMBER_L.address
+    data[offset:offset + 4] = split_value_to_nibbles(wave_number, 4)
+    return roland_dt1([0x19, 0x70, group, 0x00], data)
+
+
+class TestToneBlock(unittest.TestCase):
+    def test_values_match_the_parsed_record(self):
+        for dump in (ANALOG_DUMP, drum_partial_dump(0x2E, 0x1234)):
+            block = block_from_sysex(dump)
+            record = parse_sysex(dump)
+            self.assertEqual(block.to_dict(), {name: record[name] for name in block})
+        tone = block_from_sysex(ANALOG_DUMP)
+        self.assertIsInstance(tone, AnalogTone)
+        self.assertEqual(tone.lfo_rate, tone["LFO_RATE"])
+        self.assertEqual(tone[AnalogParameter.LFO_RATE], tone.lfo_rate)
+        self.assertEqual(block_from_sysex(drum_partial_dump(0x30, 0x1234)).wmt1_wave_number_l, 0x1234)
+
+    def test_block_type_by_address(self):
+        self.assertIs(block_type([0x19, 0x01, 0x21, 0x00]), DigitalSynthPartial)
+        self.assertIs(block_type([0x19, 0x70, 0x00, 0x00]), DrumKitCommon)
+        self.assertIs(block_type([0x19, 0x70, 0x78, 0x00]), DrumPartial)
+        self.assertIsNone(block_type([0x19, 0x70, 0x2F, 0x00]))
+        self.assertIsNone(block_type([0x19, 0x42, 0x00, 0x0C]))
+        self.assertIsNone(ParsedSysEx.from_sysex(roland_dt1([0x19, 0x42, 0x00, 0x0C], [64])).tone)
+
+    def test_copy_on_write(self):
+        tone = block_from_sysex(ANALOG_DUMP)
+        snapshot = tone.copy()
+        self.assertIs(snapshot._data, tone._data)
+        tone.lfo_rate = 100
+        tone[AnalogParameter.FILTER_CUTOFF] = 7
+        self.assertIsNot(snapshot._data, tone._data)
+        self.assertEqual(list(tone.changes(snapshot)), [
+            ("LFO_RATE", snapshot.lfo_rate, 100),
+            ("FILTER_CUTOFF", snapshot.filter_cutoff, 7),
+        ])
+        self.assertEqual(list(tone.changes(tone.copy())), [])
+        self.assertNotEqual(tone, snapshot)
+
+    def test_nibbled_parameters_are_written_as_nibbles(self):
+        partial = block_from_sysex(drum_partial_dump(0x2E, 0x1234))
+        edited = partial.copy()
+        edited.wmt1_wave_number_l = 0x0ABC
+        offset = DrumParameter.WMT1_WAVE_NUMBER_L.address
+        self.assertEqual(bytes(edited.data[offset:offset + 4]), bytes([0x0, 0xA, 0xB, 0xC]))
+        self.assertEqual(list(edited.changes(partial)), [("WMT1_WAVE_NUMBER_L", 0x1234, 0x0ABC)])
+        self.assertEqual(partial[DrumParameter.WMT1_WAVE_NUMBER_L], 0x1234)
+        with self.assertRaises(KeyError):
+            partial[DigitalParameter.OSC_WAVE]
+
+    def test_binary_serialization_round_trip(self):
+        tone = block_from_sysex(ANALOG_DUMP)
+        data = tone.to_bytes()
+        self.assertEqual(data[:4], b"JDXT")
+        self.assertEqual(block_from_bytes(data), tone)
+        with self.assertRaises(ValueError):
+            block_from_bytes(b"JDXS" + data[4:])
+        with self.assertRaises(ValueError):
+            block_from_bytes(data[:-1])
+        kit = DrumKit(
+            block_from_sysex(roland_dt1([0x19, 0x70, 0x00, 0x00], [0] * 0x12)),
+            [block_from_sysex(drum_partial_dump(0x2E + 2 * key, key)) for key in range(3)],
+        )
+        copy = DrumKit.from_bytes(kit.to_bytes())
+        self.assertEqual(copy, kit)
+        copy.partials[1].wmt1_wave_number_l = 99
+        self.assertEqual(kit.partials[1].wmt1_wave_number_l, 1)
+        self.assertNotEqual(copy, kit)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+
+from PySide6.QtWidgets import QApplication, QSpinBox, QWidget
+
+from jdxi_editor.ui.editors.helpers.update_scheduler import UiUpdateScheduler
+
+
+class TestUiUpdateScheduler(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.editor = QWidget()
+        self.spin_boxes = [QSpinBox(self.editor) for _ in range(2)]
+        self.scheduler = UiUpdateScheduler(self.editor)
+
+    def test_last_write_wins_and_redundant_updates_are_dropped(self):
+        first, second = self.spin_boxes
+        for value in (10, 20, 30):
+            self.scheduler.schedule(first, value)
+        self.scheduler.schedule(second, 5)
+        self.assertEqual(first.value(), 0)  # nothing applied before the frame
+
+        self.assertEqual(self.scheduler.flush(), 2)
+        self.assertEqual(first.value(), 30)
+        self.assertEqual(second.value(), 5)
+        stats = self.scheduler.stats()
+        self.assertEqual(stats.scheduled, 4)
+        self.assertEqual(stats.applied, 2)
+        self.assertEqual(stats.dropped, 2)
+        self.assertEqual(stats.batches, 1)
+        self.assertEqual(stats.pending, 0)
+
+    def test_batch_is_applied_with_signals_blocked(self):
+        spin_box = self.spin_boxes[0]
+        changes = []
+        spin_box.valueChanged.connect(changes.append)
+        refreshed = []
+
+        def after_batch():
+            refreshed.append(self.editor.updatesEnabled())
+
+        self.scheduler.schedule(spin_box, 42, after_batch=after_batch)
+        self.scheduler.schedule(self.spin_boxes[1], 7, after_batch=after_batch)
+        self.scheduler.flush()
+        self.assertEqual(spin_box.value(), 42)
+        self.assertEqual(changes, [])
+        self.assertFalse(spin_box.signalsBlocked())
+        self.assertEqual(refreshed, [False])  # once per batch, before repaint
+        self.assertTrue(self.editor.updatesEnabled())
+
+    def test_failing_setter_and_callback_do_not_stop_the_batch(self):
+        spin_box, other = self.spin_boxes
+        refreshed = []
+
+        def failing_setter(value):
+            raise TypeError("setValue(None)")
+
+        def failing_callback():
+            raise RuntimeError("plot")
+
+        self.scheduler.schedule(spin_box, None, setter=failing_setter, after_batch=failing_callback)
+        self.scheduler.schedule(other, 9, after_batch=lambda: refreshed.append(True))
+        with self.assertLogs(level="ERROR"):
+            self.assertEqual(self.scheduler.flush(), 2)
+        self.assertFalse(spin_box.signalsBlocked())
+        self.assertEqual(other.value(), 9)
+        self.assertEqual(refreshed, [True])
+        self.assertEqual(self.scheduler.stats().batches, 1)
+
+    def test_timer_flushes_on_next_frame(self):
+        self.scheduler.schedule(self.spin_boxes[0], 12)
+        self.assertTrue(self.scheduler._timer.isActive())
+        self.scheduler._timer.timeout.emit()
+        self.assertEqual(self.spin_boxes[0].value(), 12)
+
+    def test_held_updates_wait_for_release(self):
+        self.scheduler.hold()
+        self.scheduler.schedule(self.spin_boxes[0], 3)
+        self.scheduler.schedule(self.spin_boxes[1], 4)
+        self.assertFalse(self.scheduler._timer.isActive())
+        self.assertEqual(self.scheduler.stats().pending, 2)
+        self.scheduler.release()
+        self.assertFalse(self.scheduler.held)
+        self.assertTrue(self.scheduler._timer.isActive())
+        self.scheduler._timer.timeout.emit()
+        self.assertEqual([box.value() for box in self.spin_boxes], [3, 4])
+        self.assertEqual(self.scheduler.stats().batches, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()